@@ -1,4 +1,7 @@
 import os
+from time import perf_counter
+
+start__load_dependencies = perf_counter()
 
 if os.getenv('AWS_REGION'):  # only execute if we are not running inside an AWS Lambda function
 
@@ -15,24 +18,45 @@ if os.getenv('AWS_REGION'):  # only execute if we are not running inside an AWS
 
     clear_osbot_modules()
 
+seconds__load_dependencies = perf_counter() - start__load_dependencies
+
 error   = None          # pin these variables
 handler = None
 app     = None
 
 try:
-
-    from mgraph_ai_service_html_graph.fast_api.Html_Graph__Service__Fast_API import Html_Graph__Service__Fast_API
-    with Html_Graph__Service__Fast_API() as _:
-        _.setup()
-        handler = _.handler()
-        app     = _.app()
+    from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Startup import html_graph_startup, STEP__LOAD_DEPENDENCIES, STEP__IMPORT, STEP__SETUP
+
+    with html_graph_startup as startup:                     # startup timings (exposed at GET /metrics/startup)
+        startup.add_step(STEP__LOAD_DEPENDENCIES, seconds__load_dependencies)
+        with startup.import_timer():
+            with startup.step(STEP__IMPORT):
+                from mgraph_ai_service_html_graph.fast_api.Html_Graph__Service__Fast_API import Html_Graph__Service__Fast_API
+            with startup.step(STEP__SETUP):
+                with Html_Graph__Service__Fast_API() as _:
+                    _.setup()
+                    handler = _.handler()
+                    app     = _.app()
 except Exception as exc:
     if os.getenv("AWS_LAMBDA_FUNCTION_NAME") is None:       # raise exception when not running inside a lambda function
         raise
     error = (f"CRITICAL ERROR: Failed to start service with:\n\n"
              f"{type(exc).__name__}: {exc}")
 
+if error is None:
+    try:
+        with html_graph_startup as startup:                 # first request work (schemas, registries, a tiny parse) done during init, which is not billed
+            with startup.import_timer():
+                if startup.pre_warm_on:
+                    startup.pre_warm()
+            if startup.print_report:
+                print(startup.report_text())
+    except Exception as exc:                                # a failed pre-warm only costs the first request its warm-up
+        if os.getenv("AWS_LAMBDA_FUNCTION_NAME") is None:
+            raise
+        print(f"pre-warm failed: {type(exc).__name__}: {exc}")
+
 def run(event, context=None):
     if error:
         return error
-    return handler(event, context)
\ No newline at end of file
+    return handler(event, context)
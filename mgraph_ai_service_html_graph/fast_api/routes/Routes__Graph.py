@@ -5,15 +5,17 @@
 # New URL pattern: /graph/from/{source}/to/{engine}/{transformation}
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from enum                                                                                import Enum
-from osbot_fast_api.api.decorators.route_path                                            import route_path
-from osbot_fast_api.api.routes.Fast_API__Routes                                          import Fast_API__Routes
-from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__From_Html__Request       import Schema__Graph__From_Html__Request
-from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__From_Url__Request        import Schema__Graph__From_Url__Request
-from mgraph_ai_service_html_graph.schemas.routes.Schema__Html__From_Url__Request         import Schema__Html__From_Url__Request
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas import  Schema__Graph__Dot__Response, Schema__Graph__Response__Base
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service import Html_Graph__Export__Service
-from mgraph_ai_service_html_graph.service.html_url.Html__Url__Fetcher                    import Html__Url__Fetcher
+from enum                                                                                 import Enum
+from osbot_fast_api.api.decorators.route_path                                             import route_path
+from osbot_fast_api.api.routes.Fast_API__Routes                                           import Fast_API__Routes
+from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__From_Html__Request        import Schema__Graph__From_Html__Request
+from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__From_Url__Request         import Schema__Graph__From_Url__Request
+from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__Subtree__Request          import Schema__Graph__Subtree__Request
+from mgraph_ai_service_html_graph.schemas.routes.Schema__Html__From_Url__Request          import Schema__Html__From_Url__Request
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas  import  Schema__Graph__Dot__Response, Schema__Graph__Response__Base, Schema__Graph__Subtree__Response
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service  import Html_Graph__Export__Service
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Subtree__Service import Html_Graph__Subtree__Service
+from mgraph_ai_service_html_graph.service.html_url.Html__Url__Fetcher                     import Html__Url__Fetcher
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -45,12 +47,14 @@ ROUTES_PATHS__GRAPH = [
     f'/{TAG__ROUTES_GRAPH}/transformations',
     f'/{TAG__ROUTES_GRAPH}/from/html/to/{{engine}}/{{transformation}}' ,
     f'/{TAG__ROUTES_GRAPH}/from/url/to/{{engine}}/{{transformation}}' ,
+    f'/{TAG__ROUTES_GRAPH}/from/html/subtree/{{engine}}'              ,
 ]
 
 class Routes__Graph(Fast_API__Routes):                                                  # Routes for graph export with transformations
     tag           = TAG__ROUTES_GRAPH
-    graph_service : Html_Graph__Export__Service
-    url_fetcher   : Html__Url__Fetcher
+    graph_service   : Html_Graph__Export__Service
+    subtree_service : Html_Graph__Subtree__Service
+    url_fetcher     : Html__Url__Fetcher
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Transformation List Endpoint
@@ -94,6 +98,16 @@ class Routes__Graph(Fast_API__Routes):
         html_request = self._fetch_and_create_request(request)
         return self.from_html_to_transformation(engine=engine, transformation=transformation, request= html_request)
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Subtree (lazy expansion) Endpoint
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    @route_path("/from/html/subtree/{engine}")
+    def from_html_subtree(self, engine  : str                            ,     # engine: 'tree' or 'tree_text'
+                                request : Schema__Graph__Subtree__Request
+                         ) -> Schema__Graph__Subtree__Response:
+        return self.subtree_service.subtree(request, engine=engine)             # Children of request.node_id (to request.depth) from the cached document
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Helper Methods
     # ═══════════════════════════════════════════════════════════════════════════
@@ -108,7 +122,9 @@ class Routes__Graph(Fast_API__Routes):
                                                  show_tag_nodes  = request.show_tag_nodes ,
                                                  show_attr_nodes = request.show_attr_nodes,
                                                  show_text_nodes = request.show_text_nodes,
-                                                 color_scheme    = request.color_scheme   )
+                                                 color_scheme    = request.color_scheme   ,
+                                                 fixed_positions = request.fixed_positions,
+                                                 filter          = request.filter         )
 
     def setup_routes(self):
         # Transformation list endpoint
@@ -117,4 +133,7 @@ class Routes__Graph(Fast_API__Routes):
         # HTML to format with transformation endpoints
         self.add_route_post(self.from_html_to_transformation)
         self.add_route_post(self.from_url_to_transformation)
+
+        # Subtree endpoint (lazy expansion of cached documents)
+        self.add_route_post(self.from_html_subtree)
         return self
\ No newline at end of file
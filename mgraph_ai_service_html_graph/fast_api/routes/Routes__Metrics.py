@@ -0,0 +1,47 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# MGraph HTML Graph - Metrics Routes
+# Prometheus scrape endpoint for the export pipeline metrics
+#
+# URL: GET /metrics         (Prometheus text format, see Html_Graph__Metrics)
+#      GET /metrics/startup (cold start timing report, see Html_Graph__Startup)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_fast_api.api.decorators.route_path                                       import route_path
+from osbot_fast_api.api.routes.Fast_API__Routes                                     import Fast_API__Routes
+from starlette.responses                                                            import PlainTextResponse
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph__Cache            import html_mgraph_cache
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Graphviz import graphviz_renderer
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics       import Html_Graph__Metrics, html_graph_metrics, METRICS__CONTENT_TYPE
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Startup       import Html_Graph__Startup, html_graph_startup
+
+TAG__ROUTES_METRICS    = 'metrics'
+ROUTES_PATHS__METRICS  = [f'/{TAG__ROUTES_METRICS}'        ,
+                          f'/{TAG__ROUTES_METRICS}/startup']
+
+
+class Routes__Metrics(Fast_API__Routes):                                         # Routes for service metrics
+    tag     : str                 = TAG__ROUTES_METRICS
+    metrics : Html_Graph__Metrics = None
+    startup : Html_Graph__Startup = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.metrics is None:
+            self.metrics = html_graph_metrics                                    # shared registry (the one the pipeline records into)
+        if self.startup is None:
+            self.startup = html_graph_startup                                    # filled in by lambda_handler
+
+    @route_path("")
+    def metrics__prometheus(self) -> PlainTextResponse:                          # GET /metrics
+        cache_stats = { 'html_mgraph' : html_mgraph_cache.stats() ,
+                        'graphviz'    : graphviz_renderer.stats() }
+        return PlainTextResponse(self.metrics.render(cache_stats=cache_stats), media_type=METRICS__CONTENT_TYPE)
+
+    @route_path("/startup")
+    def metrics__startup(self) -> dict:                                          # GET /metrics/startup
+        return self.startup.report().json()
+
+    def setup_routes(self):
+        self.add_route_get(self.metrics__prometheus)
+        self.add_route_get(self.metrics__startup   )
+        return self
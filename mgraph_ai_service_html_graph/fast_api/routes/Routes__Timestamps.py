@@ -3,6 +3,15 @@
 # v1.0.0 - Routes for graph transformation with timestamp capture
 #
 # URL pattern: /timestamps/graph/from/html/to/{engine}/{transformation}/{format}
+#
+# Large pages: set trace_config.sample_rate (record 1 in N calls per method)
+# and/or trace_config.time_budget_ms (only record the first N ms) so the
+# collector does not dominate the run; the exported totals are then scaled up
+# to all calls made (see Timestamp_Collector__Sampled).
+#
+# Memory: /memory reports peak and retained memory per pipeline phase, the top
+# allocation sites and the bytes per element of the parsed graph (tracemalloc,
+# see Html_Graph__Memory_Profiler).
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from osbot_fast_api.api.decorators.route_path                                                            import route_path
@@ -16,9 +25,14 @@ from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Graph__With_Traces_
 from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Graph__With_Traces__Response__Full          import Schema__Graph__With_Traces__Response__Full
 from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Graph__With_Traces__Response__Summary       import Schema__Graph__With_Traces__Response__Summary
 from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Graph__With_Traces__Response__Speedscope    import Schema__Graph__With_Traces__Response__Speedscope
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Graph__With_Memory__Response                import Schema__Graph__With_Memory__Response
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Memory__Profile                             import Schema__Memory__Profile
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas                 import Schema__Graph__From_Html__Request, Schema__Graph__Response__Base
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service                 import Html_Graph__Export__Service
-from osbot_utils.helpers.timestamp_capture.decorators.timestamp                                          import timestamp
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation                    import timestamp, html_graph_instrumentation
+from mgraph_ai_service_html_graph.service.instrumentation.Timestamp_Collector__Sampled                   import Timestamp_Collector__Sampled, SAMPLE_RATE__ALL_CALLS
+from mgraph_ai_service_html_graph.service.instrumentation.Timestamp_Collector__Export__Sampled           import Timestamp_Collector__Export__Sampled
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Memory_Profiler                    import Html_Graph__Memory_Profiler
 from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Summary                         import Schema__Export_Summary
 
 TAG__ROUTES_TIMESTAMPS = 'timestamps'
@@ -27,6 +41,7 @@ ROUTES_PATHS__TIMESTAMPS = [
     f'/{TAG__ROUTES_TIMESTAMPS}/graph/from/html/to/{{engine}}/{{transformation}}/full',
     f'/{TAG__ROUTES_TIMESTAMPS}/graph/from/html/to/{{engine}}/{{transformation}}/summary',
     f'/{TAG__ROUTES_TIMESTAMPS}/graph/from/html/to/{{engine}}/{{transformation}}/speedscope',
+    f'/{TAG__ROUTES_TIMESTAMPS}/graph/from/html/to/{{engine}}/{{transformation}}/memory',
 ]
 
 
@@ -71,6 +86,18 @@ class Routes__Timestamps(Fast_API__Routes):
         # return Schema__Graph__With_Traces__Response__Speedscope(graph  = graph_response,
         #                                                         traces = traces        )
 
+    @route_path("/graph/from/html/to/{engine}/{transformation}/memory")
+    def from_html_with_memory(self, engine        : str                                         ,
+                                    transformation: str                                         ,
+                                    request       : Schema__Graph__With_Traces__Request
+                             ) -> Schema__Graph__With_Memory__Response:
+        profiler = Html_Graph__Memory_Profiler(name=f"{transformation}.{engine}")
+        with profiler.profile():
+            graph_response = self._execute_pipeline(engine, transformation, request.graph_request)
+        memory   = profiler.to_profile(request.graph_request.html)
+        response = self.create_response__memory(graph_response, request.trace_config, memory)
+        return response
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Internal Methods
     # ═══════════════════════════════════════════════════════════════════════════
@@ -119,19 +146,47 @@ class Routes__Timestamps(Fast_API__Routes):
                                                                     traces        = traces)
         return response
 
+    def create_response__memory(self                                         ,
+                                graph_response: Schema__Graph__Response__Base,
+                                trace_config  : Schema__Trace_Config         ,
+                                memory        : Schema__Memory__Profile
+                           ) -> Schema__Graph__With_Memory__Response:
+        if trace_config.output == Enum__Trace_Output.traces_only:
+            graph = None
+        else:
+            graph = graph_response
+        return Schema__Graph__With_Memory__Response(graph         = graph                               ,
+                                                    response_type = Schema__Trace__Response__Type.MEMORY,
+                                                    memory        = memory                              )
+
     def _execute_with_timestamps(self, engine        : str                              ,
                                        transformation: str                              ,
                                        request       : Schema__Graph__With_Traces__Request
                                 ) -> tuple[Schema__Graph__Response__Base, Timestamp_Collector__Export]:
         collector_name         = f"{transformation}.{engine}"
-        _timestamp_collector_  = Timestamp_Collector(name=collector_name)
+        _timestamp_collector_  = self._create_collector(collector_name, request.trace_config)
 
-        with _timestamp_collector_:
-            graph_response = self._execute_pipeline(engine, transformation, request.graph_request)
+        with html_graph_instrumentation.active():                              # only traced requests pay for the instrumentation
+            with _timestamp_collector_:
+                graph_response = self._execute_pipeline(engine, transformation, request.graph_request)
 
-        export = Timestamp_Collector__Export(collector=_timestamp_collector_)
+        export = self._create_export(_timestamp_collector_)
         return graph_response, export
 
+    def _create_collector(self, collector_name: str                 ,
+                                trace_config  : Schema__Trace_Config
+                         ) -> Timestamp_Collector:
+        if trace_config.sample_rate == SAMPLE_RATE__ALL_CALLS and not trace_config.time_budget_ms:
+            return Timestamp_Collector(name=collector_name)                      # full capture
+        return Timestamp_Collector__Sampled(name           = collector_name             ,
+                                            sample_rate    = trace_config.sample_rate   ,
+                                            time_budget_ms = trace_config.time_budget_ms)
+
+    def _create_export(self, collector: Timestamp_Collector) -> Timestamp_Collector__Export:
+        if isinstance(collector, Timestamp_Collector__Sampled):
+            return Timestamp_Collector__Export__Sampled(collector=collector)     # totals scaled to all calls made
+        return Timestamp_Collector__Export(collector=collector)
+
     @timestamp(name='routes.timestamsps.execute_pipeline')
     def _execute_pipeline(self, engine        : str                          ,
                                 transformation: str                          ,
@@ -160,4 +215,5 @@ class Routes__Timestamps(Fast_API__Routes):
         self.add_route_post(self.from_html_with_traces_full)
         self.add_route_post(self.from_html_with_traces_summary)
         self.add_route_post(self.from_html_with_traces_speedscope)
+        self.add_route_post(self.from_html_with_memory)
         return self
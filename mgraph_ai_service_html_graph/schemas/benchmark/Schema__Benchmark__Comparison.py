@@ -0,0 +1,19 @@
+"""
+Schema for a benchmark comparison (current run vs stored baseline)
+"""
+
+from typing                                                                                 import List
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Comparison__Row      import Schema__Benchmark__Comparison__Row
+from mgraph_ai_service_html_graph.schemas.benchmark.enums.Enum__Benchmark__Status           import Enum__Benchmark__Status
+
+
+class Schema__Benchmark__Comparison(Type_Safe):                                  # One row per measurement in either run
+    baseline_name : str
+    current_name  : str
+    threshold     : float                                                        # Allowed slowdown (0.25 = 25%)
+    min_ms        : float                                                        # Noise floor: medians below this are never flagged
+    rows          : List[Schema__Benchmark__Comparison__Row]
+
+    def regressions(self) -> List[Schema__Benchmark__Comparison__Row]:
+        return [row for row in self.rows if row.status == Enum__Benchmark__Status.regression]
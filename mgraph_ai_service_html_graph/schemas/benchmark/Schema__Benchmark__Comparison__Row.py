@@ -0,0 +1,14 @@
+"""
+Schema for one row of a benchmark comparison
+"""
+
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+from mgraph_ai_service_html_graph.schemas.benchmark.enums.Enum__Benchmark__Status import Enum__Benchmark__Status
+
+
+class Schema__Benchmark__Comparison__Row(Type_Safe):                             # Baseline vs current median of one measurement
+    key         : str                                                            # Schema__Benchmark__Result.key()
+    baseline_ms : float
+    current_ms  : float
+    ratio       : float                                                          # current / baseline (0 when either side is missing)
+    status      : Enum__Benchmark__Status
@@ -0,0 +1,19 @@
+"""
+Schema for one benchmark measurement (one phase, for one document and engine)
+"""
+
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+
+
+class Schema__Benchmark__Result(Type_Safe):                                      # Timings of one phase over the repeats
+    shape         : str                                                          # Corpus shape (wide, deep, attributes, text, scripts)
+    element_count : int
+    html_bytes    : int
+    engine        : str                                                          # '' for the engine independent phases (parse, select, transform)
+    phase         : str                                                          # parse, select, transform, render, post_process
+    min_ms        : float
+    median_ms     : float
+    max_ms        : float
+
+    def key(self) -> str:                                                        # Identifies the same measurement across runs
+        return f'{self.shape}.{self.element_count}.{self.engine or "pipeline"}.{self.phase}'
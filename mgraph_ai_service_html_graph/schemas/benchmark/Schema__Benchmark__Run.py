@@ -0,0 +1,18 @@
+"""
+Schema for a benchmark run (the json result file)
+"""
+
+from typing                                                                      import List
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Result    import Schema__Benchmark__Result
+
+
+class Schema__Benchmark__Run(Type_Safe):                                         # All results of one run, plus where they were measured
+    name           : str
+    timestamp      : str                                                         # UTC, iso format
+    python_version : str
+    platform       : str
+    transformation : str
+    repeats        : int
+    seed           : int                                                         # Corpus seed
+    results        : List[Schema__Benchmark__Result]
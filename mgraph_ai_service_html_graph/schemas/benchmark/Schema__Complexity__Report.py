@@ -0,0 +1,16 @@
+"""
+Schema for a scaling complexity check (see Html_Graph__Complexity)
+"""
+
+from typing                                                                         import List
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Complexity__Result      import Schema__Complexity__Result
+
+
+class Schema__Complexity__Report(Type_Safe):                                     # All measurements of one check
+    max_exponent : float                                                         # Highest growth exponent allowed
+    min_ms       : float                                                         # Noise floor (for the largest size)
+    results      : List[Schema__Complexity__Result]
+
+    def failures(self) -> List[Schema__Complexity__Result]:
+        return [result for result in self.results if not result.passed]
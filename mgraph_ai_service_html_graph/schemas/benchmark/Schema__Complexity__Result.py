@@ -0,0 +1,16 @@
+"""
+Schema for the growth of one measurement across input sizes
+"""
+
+from typing                                                                      import List
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+
+
+class Schema__Complexity__Result(Type_Safe):                                     # Durations per size and the fitted growth exponent
+    name         : str                                                           # e.g. 'default.dot.render' or 'Html_MGraph__Data__Extractor.extract'
+    shape        : str                                                           # Corpus shape
+    sizes        : List[int]                                                     # Elements per document (geometric)
+    durations_ms : List[float]                                                   # Fastest of the repeats, per size
+    exponent     : float                                                         # k in duration ~ n^k (least squares on log / log)
+    checked      : bool                                                          # False when below the noise floor (exponent not meaningful)
+    passed       : bool
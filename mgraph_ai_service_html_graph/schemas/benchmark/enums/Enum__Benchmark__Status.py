@@ -0,0 +1,13 @@
+"""
+Enum for the outcome of comparing one benchmark result with its baseline
+"""
+
+from enum import Enum
+
+
+class Enum__Benchmark__Status(str, Enum):
+    ok          = 'ok'                                                           # Within the threshold (or below the noise floor)
+    regression  = 'regression'                                                   # Slower than the baseline by more than the threshold
+    improvement = 'improvement'                                                  # Faster than the baseline by more than the threshold
+    new         = 'new'                                                          # Not in the baseline
+    missing     = 'missing'                                                      # In the baseline, not in the current run
@@ -1,7 +1,7 @@
 from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html         import Safe_Str__Html
 from osbot_utils.type_safe.Type_Safe                                              import Type_Safe
-from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Config import Enum__Html_Render__Preset
-from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors import Enum__Html_Render__Color_Scheme
+from mgraph_ai_service_html_graph.schemas.enums.Enum__Html_Render__Preset         import Enum__Html_Render__Preset
+from mgraph_ai_service_html_graph.schemas.enums.Enum__Html_Render__Color_Scheme   import Enum__Html_Render__Color_Scheme
 
 
 class Schema__Graph__From_Html__Request(Type_Safe):                                               # Request schema for HTML to graph conversion
@@ -10,4 +10,6 @@ class Schema__Graph__From_Html__Request(Type_Safe):
     show_tag_nodes  : bool                            = True                                      # Show tag value nodes
     show_attr_nodes : bool                            = True                                      # Show attribute value nodes
     show_text_nodes : bool                            = True                                      # Show text value nodes
-    color_scheme    : Enum__Html_Render__Color_Scheme = Enum__Html_Render__Color_Scheme.DEFAULT   # Color scheme
\ No newline at end of file
+    color_scheme    : Enum__Html_Render__Color_Scheme = Enum__Html_Render__Color_Scheme.DEFAULT   # Color scheme
+    fixed_positions : bool                            = False                                     # Server-side tree layout (x, y) for the visjs and d3 engines
+    filter          : str                             = ''                                        # Graph filter expression (see Graph_Filter__Parser), e.g. 'drop depth>4'
\ No newline at end of file
@@ -0,0 +1,11 @@
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html         import Safe_Str__Html
+from osbot_utils.type_safe.Type_Safe                                              import Type_Safe
+
+
+class Schema__Graph__Subtree__Request(Type_Safe):                                                 # Request schema for paged sub-tree expansion
+    html            : Safe_Str__Html                  = ''                                        # HTML content (only needed when cache_key is not known, or was evicted)
+    cache_key       : str                             = ''                                        # Key of an already parsed document (returned by previous calls)
+    node_id         : str                             = ''                                        # Node to expand (empty for the <html> root)
+    depth           : int                             = 1                                         # How many levels below node_id to include
+    offset          : int                             = 0                                         # First direct child to return (for paging large sibling lists)
+    limit           : int                             = 0                                         # Max direct children to return (0 for all)
@@ -0,0 +1,14 @@
+"""
+Schema for the cold start timing report (see Html_Graph__Startup)
+"""
+
+from typing                                                                         import Dict
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+
+
+class Schema__Startup__Report(Type_Safe):                                        # Where the cold start time went
+    total_ms     : float                                                         # Sum of the steps
+    steps        : Dict[str, float]                                              # step -> ms (load_dependencies, import, setup, pre_warm.*)
+    packages     : Dict[str, float]                                              # top level package -> self ms of its module imports (the top_n slowest)
+    modules      : Dict[str, float]                                              # module -> self ms of its import (the top_n slowest)
+    module_count : int                                                           # Modules imported while the import timer was on
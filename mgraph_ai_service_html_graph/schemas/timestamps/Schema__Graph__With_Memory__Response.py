@@ -0,0 +1,14 @@
+"""
+Schema for graph response with a memory profile
+"""
+
+from osbot_utils.type_safe.Type_Safe                                                     import Type_Safe
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas import Schema__Graph__Response__Base
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Memory__Profile             import Schema__Memory__Profile
+from mgraph_ai_service_html_graph.schemas.timestamps.enums.Schema__Trace__Response__Type import Schema__Trace__Response__Type
+
+
+class Schema__Graph__With_Memory__Response(Type_Safe):                           # Response with memory profile data
+    graph         : Schema__Graph__Response__Base                                # The graph output
+    response_type : Schema__Trace__Response__Type
+    memory        : Schema__Memory__Profile                                      # Per phase peak / retained memory
@@ -0,0 +1,12 @@
+"""
+Schema for one allocation site (file:line) in a memory profile
+"""
+
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+
+
+class Schema__Memory__Allocation_Site(Type_Safe):                                # Memory still allocated from one line at the end of the run
+    file       : str
+    line       : int
+    size_bytes : int                                                             # Bytes allocated from this line (net of frees)
+    count      : int                                                             # Memory blocks allocated from this line (net of frees)
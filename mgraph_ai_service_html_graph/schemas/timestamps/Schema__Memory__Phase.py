@@ -0,0 +1,12 @@
+"""
+Schema for the memory used by one pipeline phase
+"""
+
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+
+
+class Schema__Memory__Phase(Type_Safe):                                          # tracemalloc numbers around one phase
+    phase          : str                                                         # parse, select, transform, render, post_process
+    duration_ms    : float                                                       # (slower than untraced, tracemalloc hooks every allocation)
+    peak_bytes     : int                                                         # Highest traced memory during the phase, above its start
+    retained_bytes : int                                                         # Traced memory at the end minus at the start (can be negative)
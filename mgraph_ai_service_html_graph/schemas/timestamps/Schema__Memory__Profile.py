@@ -0,0 +1,20 @@
+"""
+Schema for a memory profile of one graph export (see Html_Graph__Memory_Profiler)
+"""
+
+from typing                                                                              import List
+from osbot_utils.type_safe.Type_Safe                                                     import Type_Safe
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Memory__Phase               import Schema__Memory__Phase
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Memory__Allocation_Site     import Schema__Memory__Allocation_Site
+
+
+class Schema__Memory__Profile(Type_Safe):                                        # Peak / retained memory per phase + top allocation sites
+    name                : str
+    html_bytes          : int                                                    # Size of the html (utf-8)
+    element_count       : int                                                    # Elements in the html (start tags)
+    peak_bytes          : int                                                    # Highest traced memory during the run, above its start
+    retained_bytes      : int                                                    # Traced memory at the end minus at the start
+    parse_bytes         : int                                                    # Retained by the parse phase (the Html_MGraph)
+    bytes_per_element   : float                                                  # parse_bytes / element_count
+    phases              : List[Schema__Memory__Phase]                            # In execution order
+    top_allocations     : List[Schema__Memory__Allocation_Site]                  # Largest first
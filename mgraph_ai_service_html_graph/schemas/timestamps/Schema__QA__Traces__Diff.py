@@ -0,0 +1,18 @@
+from typing                                                                             import List
+from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__QA__Traces__Diff__Method   import Schema__QA__Traces__Diff__Method
+
+
+class Schema__QA__Traces__Diff(Type_Safe):                                       # Per method self time deltas between two stored runs
+    html_type          : str
+    baseline_label     : str
+    current_label      : str
+    baseline_total_ms  : float                                                   # Total traced duration of each run
+    current_total_ms   : float
+    methods            : List[Schema__QA__Traces__Diff__Method]                  # Largest delta first
+
+    def top_regressions(self, top_n: int = 10) -> List[Schema__QA__Traces__Diff__Method]:
+        return [method for method in self.methods if method.delta_ms > 0][:top_n]
+
+    def top_improvements(self, top_n: int = 10) -> List[Schema__QA__Traces__Diff__Method]:
+        return [method for method in reversed(self.methods) if method.delta_ms < 0][:top_n]
@@ -0,0 +1,11 @@
+from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
+
+
+class Schema__QA__Traces__Diff__Method(Type_Safe):                               # Self time of one traced method in two runs
+    name             : str
+    baseline_self_ms : float
+    current_self_ms  : float
+    delta_ms         : float                                                     # current - baseline (positive = slower)
+    ratio            : float                                                     # current / baseline (0 when the method is missing from either run)
+    baseline_calls   : int
+    current_calls    : int
@@ -7,4 +7,6 @@ from mgraph_ai_service_html_graph.schemas.timestamps.enums.Enum__Trace_Output
 
 
 class Schema__Trace_Config(Type_Safe):                                           # Configuration for trace capture
-    output : Enum__Trace_Output = Enum__Trace_Output.both                        # Where to send trace data
+    output         : Enum__Trace_Output = Enum__Trace_Output.both                # Where to send trace data
+    sample_rate    : int                = 1                                      # Record 1 in N calls per method name (1 = every call)
+    time_budget_ms : float              = 0.0                                    # Only record calls made in the first N ms (0 = no budget)
@@ -3,6 +3,7 @@ from enum import Enum
 
 class Schema__Trace__Response__Type(str, Enum):
     FULL       = 'full'
+    MEMORY     = 'memory'
     SPEEDSCOPE = 'speedscope'
     SUMMARY    = 'summary'
 
@@ -15,6 +15,8 @@ from osbot_utils.type_safe.Type_Safe     import Type_Safe
 class Schema__Graph__From_Html__Request(Type_Safe):                              # Request to convert HTML to graph
     html           : str  = ''                                                   # HTML content to parse
     transformation : str  = 'default'                                            # Transformation name to apply
+    fixed_positions: bool = False                                                # Server-side tree layout (visjs and d3 engines)
+    filter         : str  = ''                                                   # Graph filter expression (see Graph_Filter__Parser), e.g. 'drop depth>4'
 
 
 class Schema__Graph__Export__Request(Type_Safe):                                 # Request for graph export
@@ -27,12 +29,25 @@ class Schema__Graph__Export__Request(Type_Safe):
 # Response Schemas - Base
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
+class Schema__Graph__Timings(Type_Safe):                                         # Per-phase breakdown of a response's duration
+    parse_ms        : float = 0.0                                                # Phase 1: html → Html_MGraph
+    graph_select_ms : float = 0.0                                                # Phase 2: Html_MGraph → MGraph
+    transform_ms    : float = 0.0                                                # Phase 3: MGraph → MGraph
+    render_ms       : float = 0.0                                                # Phase 4: MGraph → engine output
+    post_ms         : float = 0.0                                                # Phase 5: engine output post-processing
+    serialize_ms    : float = 0.0                                                # Building the response object
+    html_bytes      : int   = 0                                                  # Size of the input html (utf-8)
+    nodes           : int   = 0                                                  # Nodes rendered
+    edges           : int   = 0                                                  # Edges rendered
+
+
 class Schema__Graph__Response__Base(Type_Safe):                                  # Base response fields
-    duration       : float = 0.0                                                 # Export duration in seconds
-    transformation : str   = 'default'                                           # Transformation applied
-    engine         : str   = ''                                                  # Engine used
-    node_count     : int   = 0                                                   # Number of nodes
-    edge_count     : int   = 0                                                   # Number of edges
+    duration       : float                  = 0.0                                # Export duration in seconds
+    transformation : str                    = 'default'                          # Transformation applied
+    engine         : str                    = ''                                 # Engine used
+    node_count     : int                    = 0                                  # Number of nodes
+    edge_count     : int                    = 0                                  # Number of edges
+    timings        : Schema__Graph__Timings = None                               # Per-phase timings (set by Html_Graph__Export__Service)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -90,6 +105,18 @@ class Schema__Graph__Tree__Response(Schema__Graph__Response__Base):
     output_format  : str   = 'text'                                              # 'text', 'json', or 'nested_dict'
 
 
+class Schema__Graph__Subtree__Response(Schema__Graph__Response__Base):           # Paged sub-tree response (lazy expansion)
+    cache_key      : str   = ''                                                  # Key to use in follow-up requests
+    node_id        : str   = ''                                                  # Node that was expanded
+    depth          : int   = 1                                                   # Levels included below node_id
+    offset         : int   = 0                                                   # First direct child returned
+    limit          : int   = 0                                                   # Max direct children returned (0 = all)
+    total_children : int   = 0                                                   # Total direct children of node_id
+    has_more       : bool  = False                                               # True if there are more direct children after this page
+    tree           : Any   = None                                                # Sub-tree data (dict or str)
+    output_format  : str   = 'nested_dict'                                       # 'text' or 'nested_dict'
+
+
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # Transformation Info Schema
 # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -9,7 +9,15 @@
 #   Phase 3: MGraph → MGraph (transformation filters/styles)
 #   Phase 4: MGraph → Output (engine renders with configured config)
 #   Phase 5: Output → Output (transformation post-processes)
+#
+# Each phase, and each whole request, is recorded in html_graph_metrics
+# (exposed at GET /metrics), labeled by engine and transformation.
+#
+# Engines and engine configs are registered by module path and imported on
+# first use (see utils.Lazy_Import), so a cold start that only serves `dot`
+# does not load the other engines.
 
+from time                                                                                                import perf_counter
 from typing                                                                                              import Any, Dict, List, Literal
 from osbot_utils.helpers.duration.decorators.capture_duration                                            import capture_duration
 from osbot_utils.type_safe.Type_Safe                                                                     import Type_Safe
@@ -22,24 +30,24 @@ from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export_
                                                                                                                  Schema__Graph__VisJs__Response     ,
                                                                                                                  Schema__Graph__Mermaid__Response   ,
                                                                                                                  Schema__Graph__Tree__Response      ,
+                                                                                                                 Schema__Graph__Response__Base      ,
+                                                                                                                 Schema__Graph__Timings             ,
                                                                                                                  Schema__Engines__List__Response    ,
                                                                                                                  Schema__Engine__Info               )
-from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Dot                           import MGraph__Engine__Dot
-from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__D3                            import MGraph__Engine__D3
-from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Cytoscape                     import MGraph__Engine__Cytoscape
-from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__VisJs                         import MGraph__Engine__VisJs
-from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Mermaid                       import MGraph__Engine__Mermaid
-from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Tree                          import MGraph__Engine__Tree
-from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__Dot           import MGraph__Engine__Config__Dot
-from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__D3            import MGraph__Engine__Config__D3
-from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__Cytoscape     import MGraph__Engine__Config__Cytoscape
-from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__VisJs         import MGraph__Engine__Config__VisJs
-from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__Mermaid       import MGraph__Engine__Config__Mermaid
-from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__Tree          import MGraph__Engine__Config__Tree
+from mgraph_ai_service_html_graph.utils.Lazy_Import                                                      import resolve_class
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics                           import (html_graph_metrics  ,
+                                                                                                                 PHASE__PARSE        ,
+                                                                                                                 PHASE__SELECT       ,
+                                                                                                                 PHASE__TRANSFORM    ,
+                                                                                                                 PHASE__RENDER       ,
+                                                                                                                 PHASE__POST_PROCESS )
 
 
 EngineType = Literal['dot', 'd3', 'cytoscape', 'visjs', 'mermaid', 'tree']
 
+ENGINES__PACKAGE        = 'mgraph_ai_service_html_graph.service.mgraph__engines'
+ENGINE_CONFIGS__PACKAGE = 'mgraph_ai_service_html_graph.service.mgraph__engines.schemas'
+
 
 class Html_Graph__Export__Service(Type_Safe):                                                   # Unified export service
 
@@ -47,22 +55,22 @@ class Html_Graph__Export__Service(Type_Safe):
     # Engine Registry
     # ═══════════════════════════════════════════════════════════════════════════════════════════
 
-    ENGINES = {                                                                                 # Engine class registry
-        'dot'      : MGraph__Engine__Dot      ,
-        'd3'       : MGraph__Engine__D3       ,
-        'cytoscape': MGraph__Engine__Cytoscape,
-        'visjs'    : MGraph__Engine__VisJs    ,
-        'mermaid'  : MGraph__Engine__Mermaid  ,
-        'tree'     : MGraph__Engine__Tree     ,
+    ENGINES = {                                                                                 # Engine registry: name -> module path (imported on first use)
+        'dot'      : f'{ENGINES__PACKAGE}.MGraph__Engine__Dot'      ,
+        'd3'       : f'{ENGINES__PACKAGE}.MGraph__Engine__D3'       ,
+        'cytoscape': f'{ENGINES__PACKAGE}.MGraph__Engine__Cytoscape',
+        'visjs'    : f'{ENGINES__PACKAGE}.MGraph__Engine__VisJs'    ,
+        'mermaid'  : f'{ENGINES__PACKAGE}.MGraph__Engine__Mermaid'  ,
+        'tree'     : f'{ENGINES__PACKAGE}.MGraph__Engine__Tree'     ,
     }
 
-    ENGINE_CONFIGS = {                                                                          # Engine config registry
-        'dot'      : MGraph__Engine__Config__Dot      ,
-        'd3'       : MGraph__Engine__Config__D3       ,
-        'cytoscape': MGraph__Engine__Config__Cytoscape,
-        'visjs'    : MGraph__Engine__Config__VisJs    ,
-        'mermaid'  : MGraph__Engine__Config__Mermaid  ,
-        'tree'     : MGraph__Engine__Config__Tree     ,
+    ENGINE_CONFIGS = {                                                                          # Engine config registry: name -> module path (imported on first use)
+        'dot'      : f'{ENGINE_CONFIGS__PACKAGE}.MGraph__Engine__Config__Dot'      ,
+        'd3'       : f'{ENGINE_CONFIGS__PACKAGE}.MGraph__Engine__Config__D3'       ,
+        'cytoscape': f'{ENGINE_CONFIGS__PACKAGE}.MGraph__Engine__Config__Cytoscape',
+        'visjs'    : f'{ENGINE_CONFIGS__PACKAGE}.MGraph__Engine__Config__VisJs'    ,
+        'mermaid'  : f'{ENGINE_CONFIGS__PACKAGE}.MGraph__Engine__Config__Mermaid'  ,
+        'tree'     : f'{ENGINE_CONFIGS__PACKAGE}.MGraph__Engine__Config__Tree'     ,
     }
 
     CONFIG_METHODS = {                                                                          # Transformation config methods
@@ -112,28 +120,45 @@ class Html_Graph__Export__Service(Type_Safe):
             count   = len(engines) ,
         )
 
-    def get_transformation(self, name: str) -> Graph_Transformation__Base:                      # Get transformation by name
-        return transformation_registry.get(name)
+    def get_transformation(self, name: str, filter_expression: str = '') -> Graph_Transformation__Base:    # Get transformation by name (see transformation_registry.release)
+        return transformation_registry.get(name, filter_expression)
+
+    def engine_class(self, engine_name: str):                                                   # Engine class by name (imported on first use), None if unknown
+        target = self.ENGINES.get(engine_name)
+        return resolve_class(target) if target else None
+
+    def engine_config_class(self, engine_name: str):                                            # Engine config class by name (imported on first use), None if unknown
+        target = self.ENGINE_CONFIGS.get(engine_name)
+        return resolve_class(target) if target else None
 
     # ═══════════════════════════════════════════════════════════════════════════════════════════
     # Core Pipeline Execution
     # ═══════════════════════════════════════════════════════════════════════════════════════════
 
     def execute_pipeline(self, html: str,                                                       # Execute phases 1-3
-                               transformation_name: str = 'default'):
-        transformation = self.get_transformation(transformation_name)
-
-        html_mgraph = transformation.html__to__html_mgraph(html)                                # Phase 1: HTML → Html_MGraph
-        mgraph      = transformation.html_mgraph__to__mgraph(html_mgraph)                       # Phase 2: Html_MGraph → MGraph
-        mgraph      = transformation.transform_mgraph(mgraph)                                   # Phase 3: MGraph → MGraph
+                               transformation_name: str = 'default',
+                               engine_name        : str = '',                                   # only used as a metrics label
+                               timings            : dict = None,                                # optional dict: phase -> seconds
+                               filter_expression  : str  = ''):                                 # graph filter (see Graph_Filter__Parser)
+        transformation = self.get_transformation(transformation_name, filter_expression)
+        labels         = dict(engine=engine_name, transformation=transformation.metrics_name(), timings=timings)
+
+        with html_graph_metrics.phase(PHASE__PARSE, **labels):
+            html_mgraph = transformation.html__to__html_mgraph(html)                            # Phase 1: HTML → Html_MGraph
+        with html_graph_metrics.phase(PHASE__SELECT, **labels):
+            mgraph      = transformation.html_mgraph__to__mgraph(html_mgraph)                   # Phase 2: Html_MGraph → MGraph
+        with html_graph_metrics.phase(PHASE__TRANSFORM, **labels):
+            mgraph      = transformation.transform_mgraph(mgraph)                               # Phase 3: MGraph → MGraph
 
         return mgraph, transformation
 
     def render_with_engine(self, mgraph, engine_name: str,                                      # Execute phase 4
-                                 transformation: Graph_Transformation__Base) -> Any:
+                                 transformation : Graph_Transformation__Base,
+                                 fixed_positions: bool = False,
+                                 timings        : dict = None) -> Any:                          # optional dict: phase -> seconds
 
-        engine_class  = self.ENGINES.get(engine_name)
-        config_class  = self.ENGINE_CONFIGS.get(engine_name)
+        engine_class  = self.engine_class       (engine_name)
+        config_class  = self.engine_config_class(engine_name)
         config_method = self.CONFIG_METHODS.get(engine_name)
 
         if not engine_class or not config_class:
@@ -145,9 +170,15 @@ class Html_Graph__Export__Service(Type_Safe):
             configure_fn = getattr(transformation, config_method)
             config = configure_fn(config)
 
+        if fixed_positions and hasattr(config, 'fixed_positions'):                              # Request asked for server-side layout
+            config.fixed_positions = True
+
+        labels = dict(engine=engine_name, transformation=transformation.metrics_name(), timings=timings)
         engine = engine_class(mgraph=mgraph, config=config)                                     # Create engine
-        output = engine.export()                                                                # Render
-        output = transformation.transform_export(output)                                        # Phase 5: Post-process
+        with html_graph_metrics.phase(PHASE__RENDER, **labels):
+            output = engine.export()                                                            # Phase 4: Render
+        with html_graph_metrics.phase(PHASE__POST_PROCESS, **labels):
+            output = transformation.transform_export(output)                                    # Phase 5: Post-process
 
         return output, engine
 
@@ -157,6 +188,23 @@ class Html_Graph__Export__Service(Type_Safe):
             'edge_count': len(engine.edges()),
         }
 
+    def add_timings(self, response        : Schema__Graph__Response__Base,                       # Attach the per-phase timings block
+                          timings         : Dict[str, float]             ,                       # phase -> seconds (from html_graph_metrics.phase)
+                          html            : str                          ,
+                          stats           : Dict[str, int]               ,
+                          serialize_start : float                                                # perf_counter() before the response was built
+                   ) -> Schema__Graph__Response__Base:
+        response.timings = Schema__Graph__Timings(parse_ms        = timings.get(PHASE__PARSE       , 0.0) * 1000 ,
+                                                  graph_select_ms = timings.get(PHASE__SELECT      , 0.0) * 1000 ,
+                                                  transform_ms    = timings.get(PHASE__TRANSFORM   , 0.0) * 1000 ,
+                                                  render_ms       = timings.get(PHASE__RENDER      , 0.0) * 1000 ,
+                                                  post_ms         = timings.get(PHASE__POST_PROCESS, 0.0) * 1000 ,
+                                                  serialize_ms    = (perf_counter() - serialize_start)    * 1000 ,
+                                                  html_bytes      = len(str(html).encode('utf-8'))               ,
+                                                  nodes           = stats['node_count']                          ,
+                                                  edges           = stats['edge_count']                          )
+        return response
+
     # ═══════════════════════════════════════════════════════════════════════════════════════════
     # Engine Export Methods
     # ═══════════════════════════════════════════════════════════════════════════════════════════
@@ -166,12 +214,16 @@ class Html_Graph__Export__Service(Type_Safe):
               ) -> Schema__Graph__Dot__Response:
         trans_name = transformation or request.transformation or 'default'
 
+        timings = {}
         with capture_duration() as duration:
-            mgraph, trans = self.execute_pipeline(request.html, trans_name)
-            output, engine = self.render_with_engine(mgraph, 'dot', trans)
+            mgraph, trans = self.execute_pipeline(request.html, trans_name, 'dot', timings, request.filter)
+            output, engine = self.render_with_engine(mgraph, 'dot', trans, timings=timings)
             stats = self.get_graph_stats(engine)
+        html_graph_metrics.record_request('dot', trans.metrics_name(), duration.seconds, stats)
+        transformation_registry.release(trans)                                                  # back to the pool (the response does not use it)
 
-        return Schema__Graph__Dot__Response(
+        serialize_start = perf_counter()
+        response        = Schema__Graph__Dot__Response(
             dot            = output               ,
             dot_size       = len(output)          ,
             duration       = duration.seconds     ,
@@ -180,18 +232,23 @@ class Html_Graph__Export__Service(Type_Safe):
             node_count     = stats['node_count']  ,
             edge_count     = stats['edge_count']  ,
         )
+        return self.add_timings(response, timings, request.html, stats, serialize_start)
 
     def to_d3(self, request: Schema__Graph__From_Html__Request,                                 # Export to D3.js format
                     transformation: str = None
              ) -> Schema__Graph__D3__Response:
         trans_name = transformation or request.transformation or 'default'
 
+        timings = {}
         with capture_duration() as duration:
-            mgraph, trans = self.execute_pipeline(request.html, trans_name)
-            output, engine = self.render_with_engine(mgraph, 'd3', trans)
+            mgraph, trans = self.execute_pipeline(request.html, trans_name, 'd3', timings, request.filter)
+            output, engine = self.render_with_engine(mgraph, 'd3', trans, fixed_positions=request.fixed_positions, timings=timings)
             stats = self.get_graph_stats(engine)
+        html_graph_metrics.record_request('d3', trans.metrics_name(), duration.seconds, stats)
+        transformation_registry.release(trans)                                                  # back to the pool (the response does not use it)
 
-        return Schema__Graph__D3__Response(
+        serialize_start = perf_counter()
+        response        = Schema__Graph__D3__Response(
             nodes          = output.get('nodes' , [])  ,
             links          = output.get('links' , [])  ,
             config         = output.get('config', {})  ,
@@ -201,18 +258,23 @@ class Html_Graph__Export__Service(Type_Safe):
             node_count     = stats['node_count']       ,
             edge_count     = stats['edge_count']       ,
         )
+        return self.add_timings(response, timings, request.html, stats, serialize_start)
 
     def to_cytoscape(self, request: Schema__Graph__From_Html__Request,                          # Export to Cytoscape.js format
                            transformation: str = None
                     ) -> Schema__Graph__Cytoscape__Response:
         trans_name = transformation or request.transformation or 'default'
 
+        timings = {}
         with capture_duration() as duration:
-            mgraph, trans = self.execute_pipeline(request.html, trans_name)
-            output, engine = self.render_with_engine(mgraph, 'cytoscape', trans)
+            mgraph, trans = self.execute_pipeline(request.html, trans_name, 'cytoscape', timings, request.filter)
+            output, engine = self.render_with_engine(mgraph, 'cytoscape', trans, timings=timings)
             stats = self.get_graph_stats(engine)
+        html_graph_metrics.record_request('cytoscape', trans.metrics_name(), duration.seconds, stats)
+        transformation_registry.release(trans)                                                  # back to the pool (the response does not use it)
 
-        return Schema__Graph__Cytoscape__Response(
+        serialize_start = perf_counter()
+        response        = Schema__Graph__Cytoscape__Response(
             elements       = output.get('elements', {'nodes': [], 'edges': []}),
             layout         = output.get('layout'  , {})  ,
             style          = output.get('style'   , [])  ,
@@ -222,18 +284,23 @@ class Html_Graph__Export__Service(Type_Safe):
             node_count     = stats['node_count']         ,
             edge_count     = stats['edge_count']         ,
         )
+        return self.add_timings(response, timings, request.html, stats, serialize_start)
 
     def to_visjs(self, request: Schema__Graph__From_Html__Request,                              # Export to vis.js format
                        transformation: str = None
                 ) -> Schema__Graph__VisJs__Response:
         trans_name = transformation or request.transformation or 'default'
 
+        timings = {}
         with capture_duration() as duration:
-            mgraph, trans = self.execute_pipeline(request.html, trans_name)
-            output, engine = self.render_with_engine(mgraph, 'visjs', trans)
+            mgraph, trans = self.execute_pipeline(request.html, trans_name, 'visjs', timings, request.filter)
+            output, engine = self.render_with_engine(mgraph, 'visjs', trans, fixed_positions=request.fixed_positions, timings=timings)
             stats = self.get_graph_stats(engine)
+        html_graph_metrics.record_request('visjs', trans.metrics_name(), duration.seconds, stats)
+        transformation_registry.release(trans)                                                  # back to the pool (the response does not use it)
 
-        return Schema__Graph__VisJs__Response(
+        serialize_start = perf_counter()
+        response        = Schema__Graph__VisJs__Response(
             nodes          = output.get('nodes'  , [])  ,
             edges          = output.get('edges'  , [])  ,
             options        = output.get('options', {})  ,
@@ -243,18 +310,23 @@ class Html_Graph__Export__Service(Type_Safe):
             node_count     = stats['node_count']        ,
             edge_count     = stats['edge_count']        ,
         )
+        return self.add_timings(response, timings, request.html, stats, serialize_start)
 
     def to_mermaid(self, request: Schema__Graph__From_Html__Request,                            # Export to Mermaid format
                          transformation: str = None
                   ) -> Schema__Graph__Mermaid__Response:
         trans_name = transformation or request.transformation or 'default'
 
+        timings = {}
         with capture_duration() as duration:
-            mgraph, trans = self.execute_pipeline(request.html, trans_name)
-            output, engine = self.render_with_engine(mgraph, 'mermaid', trans)
+            mgraph, trans = self.execute_pipeline(request.html, trans_name, 'mermaid', timings, request.filter)
+            output, engine = self.render_with_engine(mgraph, 'mermaid', trans, timings=timings)
             stats = self.get_graph_stats(engine)
+        html_graph_metrics.record_request('mermaid', trans.metrics_name(), duration.seconds, stats)
+        transformation_registry.release(trans)                                                  # back to the pool (the response does not use it)
 
-        return Schema__Graph__Mermaid__Response(
+        serialize_start = perf_counter()
+        response        = Schema__Graph__Mermaid__Response(
             mermaid        = output               ,
             mermaid_size   = len(output)          ,
             duration       = duration.seconds     ,
@@ -263,6 +335,7 @@ class Html_Graph__Export__Service(Type_Safe):
             node_count     = stats['node_count']  ,
             edge_count     = stats['edge_count']  ,
         )
+        return self.add_timings(response, timings, request.html, stats, serialize_start)
 
     def to_tree(self, request: Schema__Graph__From_Html__Request,                               # Export to Tree format
                       transformation: str = None,
@@ -270,18 +343,25 @@ class Html_Graph__Export__Service(Type_Safe):
                ) -> Schema__Graph__Tree__Response:
         trans_name = transformation or request.transformation or 'default'
 
+        timings = {}
         with capture_duration() as duration:
-            mgraph, trans = self.execute_pipeline(request.html, trans_name)
+            mgraph, trans = self.execute_pipeline(request.html, trans_name, 'tree', timings, request.filter)
 
-            config = MGraph__Engine__Config__Tree(output_format=output_format)                  # Set output format
+            config = self.engine_config_class('tree')(output_format=output_format)              # Set output format
             trans.configure_tree(config)
 
-            engine = MGraph__Engine__Tree(mgraph=mgraph, config=config)
-            output = engine.export()
-            output = trans.transform_export(output)
+            labels = dict(engine='tree', transformation=trans.metrics_name(), timings=timings)
+            engine = self.engine_class('tree')(mgraph=mgraph, config=config)
+            with html_graph_metrics.phase(PHASE__RENDER, **labels):
+                output = engine.export()
+            with html_graph_metrics.phase(PHASE__POST_PROCESS, **labels):
+                output = trans.transform_export(output)
             stats  = self.get_graph_stats(engine)
+        html_graph_metrics.record_request('tree', trans.metrics_name(), duration.seconds, stats)
+        transformation_registry.release(trans)                                                  # back to the pool (the response does not use it)
 
-        return Schema__Graph__Tree__Response(
+        serialize_start = perf_counter()
+        response        = Schema__Graph__Tree__Response(
             tree           = output               ,
             output_format  = output_format        ,
             duration       = duration.seconds     ,
@@ -290,6 +370,7 @@ class Html_Graph__Export__Service(Type_Safe):
             node_count     = stats['node_count']  ,
             edge_count     = stats['edge_count']  ,
         )
+        return self.add_timings(response, timings, request.html, stats, serialize_start)
 
     # ═══════════════════════════════════════════════════════════════════════════════════════════
     # Generic Export Method
@@ -0,0 +1,213 @@
+# Html Graph Subtree Service
+#
+# Returns a bounded slice of a (cached) Html_MGraph document: the children of a
+# single node, down to a given depth, with optional paging over the direct
+# children. This allows the tree / tree_text renderers to expand huge DOMs
+# incrementally instead of requesting the whole graph up front.
+#
+# Flow:
+#   1st request : html               → parse + cache → subtree + cache_key
+#   next requests: cache_key + node_id → cache hit    → subtree
+#
+# Only the body and head graphs are walked (plus the <html> root, whose
+# children are the <head> and <body> elements). Tags and attributes come from
+# the attributes graph via the shared node ids.
+
+from typing                                                                                    import Any, Dict, List, Optional, Tuple
+from osbot_utils.helpers.duration.decorators.capture_duration                                  import capture_duration
+from osbot_utils.type_safe.Type_Safe                                                           import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id                              import Node_Id
+from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__Subtree__Request               import Schema__Graph__Subtree__Request
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas       import Schema__Graph__Subtree__Response
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                              import Html_MGraph
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph__Cache                       import Html_MGraph__Cache, html_mgraph_cache
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Base                 import Html_MGraph__Base
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Body                 import Html_MGraph__Body
+from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__Tree import MGraph__Engine__Config__Tree
+
+
+SUBTREE__OUTPUT_FORMATS = { 'tree'      : 'nested_dict' ,                       # engine -> output format
+                            'tree_text' : 'text'        }
+
+
+class Html_Graph__Subtree__Service(Type_Safe):                                  # Paged sub-tree extraction for lazy expansion
+    cache       : Html_MGraph__Cache           = None                           # Parse cache (defaults to the shared global cache)
+    tree_config : MGraph__Engine__Config__Tree                                  # Tree characters and label truncation for 'text' output
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.cache is None: self.cache = html_mgraph_cache
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Main entry point
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def subtree(self, request : Schema__Graph__Subtree__Request,                # Expand node_id to request.depth levels
+                      engine  : str = 'tree'
+               ) -> Schema__Graph__Subtree__Response:
+        output_format = SUBTREE__OUTPUT_FORMATS.get(engine)
+        if output_format is None:
+            raise ValueError(f"Unknown subtree engine: {engine} (supported: {', '.join(SUBTREE__OUTPUT_FORMATS)})")
+
+        with capture_duration() as duration:
+            cache_key, html_mgraph = self.resolve_document(request)
+            node_id, graph         = self.resolve_node(html_mgraph, request.node_id)
+            depth                  = max(request.depth , 0)
+            offset                 = max(request.offset, 0)
+            limit                  = max(request.limit , 0)
+
+            children       = self.ordered_children(html_mgraph, graph, node_id)
+            page_end       = offset + limit if limit else len(children)
+            page           = children[offset:page_end]
+            tree_node      = self.element_record(html_mgraph, node_id, len(children))
+            if depth > 0:
+                tree_node['children'] = [self.build_record(html_mgraph, child_type, child_id, child_graph, depth - 1)
+                                         for child_type, child_id, child_graph in page]
+            node_count = self.count_records(tree_node)
+
+            if output_format == 'text':
+                tree = self.render_text(tree_node)
+            else:
+                tree = tree_node
+
+        return Schema__Graph__Subtree__Response(cache_key      = cache_key                    ,
+                                                node_id        = str(node_id)                 ,
+                                                depth          = depth                        ,
+                                                offset         = offset                       ,
+                                                limit          = limit                        ,
+                                                total_children = len(children)                ,
+                                                has_more       = page_end < len(children)     ,
+                                                tree           = tree                         ,
+                                                output_format  = output_format                ,
+                                                duration       = duration.seconds             ,
+                                                transformation = 'subtree'                    ,
+                                                engine         = engine                       ,
+                                                node_count     = node_count                   ,
+                                                edge_count     = max(node_count - 1, 0)       )
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Document and node resolution
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def resolve_document(self, request: Schema__Graph__Subtree__Request         # Get document from cache (or parse request.html)
+                        ) -> Tuple[str, Html_MGraph]:
+        if request.cache_key:
+            html_mgraph = self.cache.get(request.cache_key)
+            if html_mgraph is not None:
+                return request.cache_key, html_mgraph
+        if request.html:
+            return self.cache.get_or_parse(str(request.html))
+        if request.cache_key:
+            raise ValueError(f"Document not found in cache (key: {request.cache_key}), please resend the html")
+        raise ValueError("Either html or cache_key must be provided")
+
+    def resolve_node(self, html_mgraph : Html_MGraph,                           # Find which graph holds node_id
+                           node_id     : str
+                    ) -> Tuple[Node_Id, Optional[Html_MGraph__Base]]:
+        document = html_mgraph.document
+        if not node_id or node_id == str(document.root_id):                     # <html> root lives in the document graph
+            return document.root_id, None
+        for graph in (document.body_graph, document.head_graph):
+            if graph.node(node_id) is not None:
+                return Node_Id(node_id), graph
+        raise ValueError(f"Node not found in body or head graphs: {node_id}")
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Tree building
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def ordered_children(self, html_mgraph : Html_MGraph              ,         # (type, id, graph) of children, in DOM order
+                               graph       : Optional[Html_MGraph__Base],
+                               node_id     : Node_Id
+                        ) -> List[Tuple[str, Node_Id, Html_MGraph__Base]]:
+        document = html_mgraph.document
+        if graph is None:                                                       # <html> root: head then body
+            return [('element', document.head_graph.root_id, document.head_graph),
+                    ('element', document.body_graph.root_id, document.body_graph)]
+
+        children = []
+        for edge in graph.outgoing_edges(node_id):
+            predicate = graph.edge_predicate(edge)
+            if predicate == Html_MGraph__Body.PREDICATE_CHILD:
+                child_type = 'element'
+            elif predicate == Html_MGraph__Body.PREDICATE_TEXT:
+                child_type = 'text'
+            else:
+                continue
+            edge_path = graph.edge_path(edge)
+            position  = int(str(edge_path)) if edge_path else 0
+            children.append((position, child_type, edge.edge.data.to_node_id))
+
+        children.sort(key=lambda x: x[0])
+        return [(child_type, child_id, graph) for _, child_type, child_id in children]
+
+    def build_record(self, html_mgraph : Html_MGraph      ,                     # Build record for a child, recursing while depth > 0
+                           child_type  : str              ,
+                           node_id     : Node_Id          ,
+                           graph       : Html_MGraph__Base,
+                           depth       : int
+                    ) -> Dict[str, Any]:
+        if child_type == 'text':
+            return { 'id'   : str(node_id)                   ,
+                     'type' : 'text'                         ,
+                     'text' : graph.node_value(node_id) or '' }
+
+        children = self.ordered_children(html_mgraph, graph, node_id)
+        record   = self.element_record(html_mgraph, node_id, len(children))
+        if children and depth > 0:
+            record['children'] = [self.build_record(html_mgraph, grand_type, grand_id, grand_graph, depth - 1)
+                                  for grand_type, grand_id, grand_graph in children]
+        return record
+
+    def element_record(self, html_mgraph : Html_MGraph,                         # Element record (without children)
+                             node_id     : Node_Id    ,
+                             child_count : int
+                      ) -> Dict[str, Any]:
+        document = html_mgraph.document
+        return { 'id'          : str(node_id)                       ,
+                 'type'        : 'element'                          ,
+                 'tag'         : document.get_tag(node_id)          ,
+                 'attrs'       : document.get_attributes(node_id)   ,
+                 'child_count' : child_count                        }
+
+    def count_records(self, record: Dict[str, Any]) -> int:                     # Number of records in a (sub)tree
+        return 1 + sum(self.count_records(child) for child in record.get('children', []))
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Text rendering
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def render_text(self, record: Dict[str, Any]) -> str:                       # Render records as a tree_text view
+        lines = [self.record_label(record)]
+        children = record.get('children', [])
+        for i, child in enumerate(children):
+            self.render_text_record(child, '', i == len(children) - 1, lines)
+        return '\n'.join(lines)
+
+    def render_text_record(self, record  : Dict[str, Any],
+                                 prefix  : str           ,
+                                 is_last : bool          ,
+                                 lines   : List[str]
+                          ) -> None:
+        cfg       = self.tree_config
+        connector = cfg.prefix_leaf if is_last else cfg.prefix_branch
+        lines.append(f'{prefix}{connector}{self.record_label(record)}')
+
+        children     = record.get('children', [])
+        child_prefix = prefix + (cfg.prefix_space if is_last else cfg.prefix_pipe)
+        for i, child in enumerate(children):
+            self.render_text_record(child, child_prefix, i == len(children) - 1, lines)
+
+    def record_label(self, record: Dict[str, Any]) -> str:                      # "tag" / "tag [+N]" (collapsed) / "text"
+        max_len = self.tree_config.max_label_len
+        if record.get('type') == 'text':
+            text = ' '.join(record.get('text', '').split())
+            if len(text) > max_len:
+                text = text[:max_len - 3] + '...'
+            return f'"{text}"'
+
+        label       = record.get('tag') or record.get('id', '')[:8]
+        child_count = record.get('child_count', 0)
+        if child_count and 'children' not in record:
+            label += f' [+{child_count}]'
+        return label
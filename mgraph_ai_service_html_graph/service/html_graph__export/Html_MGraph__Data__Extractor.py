@@ -8,6 +8,13 @@
 # - Attributes graph (tags + attributes)
 # - Scripts graph (script content)
 # - Styles graph (style content)
+#
+# Single pass per graph over the raw node / edge stores (no domain objects, no
+# per-element edge walks: tags come from one pass over the attrs graph), building
+# lightweight __slots__ records (node_records / edge_records). The Type_Safe
+# Extracted__Node / Extracted__Edge objects (nodes / edges) are only created at the
+# API boundary: internal consumers (the exporters and Graph_Transform__Full_Document)
+# use records_only=True and read the records directly.
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from typing                                                                               import List, Optional, Set
@@ -17,6 +24,8 @@ from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Confi
 from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors         import Html_MGraph__Render__Colors
 from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Labels         import Html_MGraph__Render__Labels
 
+EDGE_PREDICATES__DASHED = {'tag', 'attr', 'script', 'style', 'name', 'value'}                # Non-structural edges are dashed
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Data Classes for Extracted Nodes and Edges
@@ -48,6 +57,64 @@ class Extracted__Edge(Type_Safe):
     dashed       : bool             = False                                               # Whether edge is dashed
 
 
+class Extracted__Node__Record:                                                            # Lightweight node record (same fields as Extracted__Node, no validation or __dict__)
+    __slots__ = ('id', 'label', 'node_type', 'dom_path', 'value', 'depth', 'category',
+                 'graph_source', 'fill_color', 'font_color', 'border_color', 'shape')
+
+    def __init__(self, id, label, node_type, dom_path, graph_source, fill_color, font_color, border_color, shape,
+                       value=None, depth=0, category=''):
+        self.id           = id
+        self.label        = label
+        self.node_type    = node_type
+        self.dom_path     = dom_path
+        self.value        = value
+        self.depth        = depth
+        self.category     = category
+        self.graph_source = graph_source
+        self.fill_color   = fill_color
+        self.font_color   = font_color
+        self.border_color = border_color
+        self.shape        = shape
+
+    def to_node(self) -> Extracted__Node:                                                 # Type_Safe version (API boundary)
+        return Extracted__Node(id           = self.id           ,
+                               label        = self.label        ,
+                               node_type    = self.node_type    ,
+                               dom_path     = self.dom_path     ,
+                               value        = self.value        ,
+                               depth        = self.depth        ,
+                               category     = self.category     ,
+                               graph_source = self.graph_source ,
+                               fill_color   = self.fill_color   ,
+                               font_color   = self.font_color   ,
+                               border_color = self.border_color ,
+                               shape        = self.shape        )
+
+
+class Extracted__Edge__Record:                                                            # Lightweight edge record (same fields as Extracted__Edge, no validation or __dict__)
+    __slots__ = ('id', 'source', 'target', 'predicate', 'position', 'graph_source', 'color', 'dashed')
+
+    def __init__(self, id, source, target, predicate, position, graph_source, color, dashed):
+        self.id           = id
+        self.source       = source
+        self.target       = target
+        self.predicate    = predicate
+        self.position     = position
+        self.graph_source = graph_source
+        self.color        = color
+        self.dashed       = dashed
+
+    def to_edge(self) -> Extracted__Edge:                                                 # Type_Safe version (API boundary)
+        return Extracted__Edge(id           = self.id           ,
+                               source       = self.source       ,
+                               target       = self.target       ,
+                               predicate    = self.predicate    ,
+                               position     = self.position     ,
+                               graph_source = self.graph_source ,
+                               color        = self.color        ,
+                               dashed       = self.dashed       )
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Main Extractor Class - Updated for Multi-Graph Architecture
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -58,14 +125,22 @@ class Html_MGraph__Data__Extractor(Type_Safe):
     colors          : Html_MGraph__Render__Colors   = None                               # Color scheme
     labels          : Html_MGraph__Render__Labels   = None                               # Label utilities
 
+    records_only    : bool                          = False                              # Skip the Type_Safe nodes / edges (only node_records / edge_records)
+
     # Results
-    nodes           : List[Extracted__Node]         = None
+    nodes           : List[Extracted__Node]         = None                               # Type_Safe results (API boundary)
     edges           : List[Extracted__Edge]         = None
+    node_records    : list                                                               # Extracted__Node__Record per included node
+    edge_records    : list                                                               # Extracted__Edge__Record per included edge
     root_id         : Optional[str]                 = None
 
     # Internal state
     _extracted_ids  : Set[str]                      = None                               # Track extracted node IDs
     _excluded_nodes : Set[str]                      = None                               # Node IDs to exclude from edges
+    _tags           : dict                                                               # element node_id → tag (from the attrs graph)
+    _edge_colors    : dict                                                               # predicate → edge color
+    _hidden_types   : set                                                                # node types hidden by config
+    _hidden_edges   : set                                                                # edge predicates hidden by config
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -96,430 +171,195 @@ class Html_MGraph__Data__Extractor(Type_Safe):
         self.edges           = []
         self._extracted_ids  = set()
         self._excluded_nodes = set()
+        self.node_records    = []
+        self.edge_records    = []
 
         if self.html_mgraph is None:
             return self
 
-        self._extract_from_body_graph()                                                   # Extract body structure
-        self._extract_from_head_graph()                                                   # Extract head structure
-        self._extract_from_attrs_graph()                                                  # Extract tags and attributes
-        self._extract_from_scripts_graph()                                                # Extract script content
-        self._extract_from_styles_graph()                                                 # Extract style content
-        self._find_root()                                                                 # Find root node
+        self._prepare_lookups()
+        for graph_source, graph, create_node in self._graph_sources():                    # body, head, attrs, scripts, styles (in this order)
+            if graph and graph.mgraph:
+                self._extract_nodes(graph, graph_source, create_node)
+                self._extract_edges(graph, graph_source)
 
+        self._find_root()                                                                 # Find root node
+        if not self.records_only:
+            self.materialize()
         return self
 
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Body Graph Extraction
-    # ═══════════════════════════════════════════════════════════════════════════
-
-    def _extract_from_body_graph(self):                                                   # Extract elements and text from body graph
-        body_graph = self.html_mgraph.body_graph
-        if not body_graph or not body_graph.mgraph:
-            return
-
-        for node_id in body_graph.nodes_ids():
-            if str(node_id) in self._extracted_ids:
-                continue
-
-            node_path = body_graph.node_path(node_id)
-            path_str  = str(node_path) if node_path else ''
-
-            if path_str == 'text' or path_str.startswith('text:'):                        # Text node
-                value = body_graph.node_value(node_id)
-                extracted = self._create_text_node(str(node_id), value, 'body')
-            else:                                                                         # Element node
-                tag = self.html_mgraph.get_tag(node_id) or self._extract_tag(path_str)
-                extracted = self._create_element_node(str(node_id), path_str, tag, 'body')
-
-            if extracted and self._should_include_node(extracted):
-                self.nodes.append(extracted)
-                self._extracted_ids.add(str(node_id))
-            elif extracted:
-                self._excluded_nodes.add(str(node_id))
-
-        self._extract_edges_from_graph(body_graph, 'body')                                # Extract body edges
-
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Head Graph Extraction
-    # ═══════════════════════════════════════════════════════════════════════════
-
-    def _extract_from_head_graph(self):                                                   # Extract elements and text from head graph
-        head_graph = self.html_mgraph.head_graph
-        if not head_graph or not head_graph.mgraph:
-            return
-
-        for node_id in head_graph.nodes_ids():
-            if str(node_id) in self._extracted_ids:
-                continue
-
-            node_path = head_graph.node_path(node_id)
-            path_str  = str(node_path) if node_path else ''
-
-            if path_str == 'text' or path_str.startswith('text:'):                        # Text node
-                value = head_graph.node_value(node_id)
-                extracted = self._create_text_node(str(node_id), value, 'head')
-            else:                                                                         # Element node
-                tag = self.html_mgraph.get_tag(node_id) or self._extract_tag(path_str)
-                extracted = self._create_element_node(str(node_id), path_str, tag, 'head')
-
-            if extracted and self._should_include_node(extracted):
-                self.nodes.append(extracted)
-                self._extracted_ids.add(str(node_id))
-            elif extracted:
-                self._excluded_nodes.add(str(node_id))
-
-        self._extract_edges_from_graph(head_graph, 'head')                                # Extract head edges
-
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Attributes Graph Extraction
-    # ═══════════════════════════════════════════════════════════════════════════
+    def materialize(self) -> 'Html_MGraph__Data__Extractor':                              # Type_Safe nodes / edges from the records
+        self.nodes = [record.to_node() for record in self.node_records]
+        self.edges = [record.to_edge() for record in self.edge_records]
+        return self
 
-    def _extract_from_attrs_graph(self):
-        """Extract from attrs graph using three-node model."""
+    def _graph_sources(self) -> list:                                                     # (graph_source, graph, node record factory)
+        return [('body'   , self.html_mgraph.body_graph   , self._create_dom_node    ),
+                ('head'   , self.html_mgraph.head_graph   , self._create_dom_node    ),
+                ('attrs'  , self.html_mgraph.attrs_graph  , self._create_attrs_node  ),
+                ('scripts', self.html_mgraph.scripts_graph, self._create_script_node ),
+                ('styles' , self.html_mgraph.styles_graph , self._create_style_node  )]
+
+    def _prepare_lookups(self):                                                           # Per-extract lookup tables (tags, colors, config)
+        self._tags         = self._build_tag_index()
+        self._edge_colors  = {}
+        self._hidden_types = {node_type for node_type, shown in (('tag' , self.config.show_tag_nodes ),
+                                                                 ('attr', self.config.show_attr_nodes),
+                                                                 ('text', self.config.show_text_nodes)) if not shown}
+        self._hidden_edges = {predicate for predicate, shown in (('child', self.config.show_child_edges),
+                                                                 ('tag'  , self.config.show_tag_edges  ),
+                                                                 ('attr' , self.config.show_attr_edges ),
+                                                                 ('text' , self.config.show_text_edges )) if not shown}
+
+    def _build_tag_index(self) -> dict:                                                   # element node_id → tag, one pass over the attrs graph edges
+        tags        = {}
         attrs_graph = self.html_mgraph.attrs_graph
         if not attrs_graph or not attrs_graph.mgraph:
-            return
-
-        for node_id in attrs_graph.nodes_ids():
-            if str(node_id) in self._extracted_ids:
-                continue
-
-            node_path = attrs_graph.node_path(node_id)
-            path_str  = str(node_path) if node_path else ''
-
-            # Tag nodes (unchanged)
-            if path_str.startswith('tag:'):
-                value = attrs_graph.node_value(node_id)
-                extracted = self._create_tag_node(str(node_id), path_str, value, 'attrs')
-                if extracted and self._should_include_node(extracted):
-                    self.nodes.append(extracted)
-                    self._extracted_ids.add(str(node_id))
-
-            # NEW: Name nodes (path = 'name')
-            elif path_str == 'name':
-                value = attrs_graph.node_value(node_id)  # e.g., "class", "required"
-                extracted = self._create_attr_name_node(str(node_id), value, 'attrs')
-                if extracted and self._should_include_node(extracted):
-                    self.nodes.append(extracted)
-                    self._extracted_ids.add(str(node_id))
-
-            # NEW: Value nodes (path = 'value')
-            elif path_str == 'value':
-                value = attrs_graph.node_value(node_id)  # e.g., "container", "text"
-                extracted = self._create_attr_value_node(str(node_id), value, 'attrs')
-                if extracted and self._should_include_node(extracted):
-                    self.nodes.append(extracted)
-                    self._extracted_ids.add(str(node_id))
-
-            # NEW: Instance nodes (path = position like "0", "1", "2")
-            elif path_str.isdigit():
-                extracted = self._create_attr_instance_node(str(node_id), path_str, 'attrs')
-                if extracted and self._should_include_node(extracted):
-                    self.nodes.append(extracted)
-                    self._extracted_ids.add(str(node_id))
-
-        self._extract_edges_from_graph(attrs_graph, 'attrs')
-
-    def _create_attr_name_node(self, node_id: str, value: str, graph_source: str) -> Extracted__Node:
-        """Create node for attribute name (e.g., 'class', 'required')."""
-        fill_color = self.colors.get_attr_color() if self.colors else '#B39DDB'
-        font_color = '#FFFFFF'
-
-        return Extracted__Node(
-            id           = node_id,
-            label        = value,           # Show the attr name directly
-            node_type    = 'attr',
-            dom_path     = f'name:{value}',
-            value        = value,
-            graph_source = graph_source,
-            fill_color   = fill_color,
-            font_color   = font_color,
-            border_color = self._darken(fill_color),
-            shape        = 'ellipse'
-        )
-
-
-    def _create_attr_value_node(self, node_id: str, value: str, graph_source: str) -> Extracted__Node:
-        """Create node for attribute value."""
-        fill_color = '#E1BEE7'  # Lighter purple for values
-        font_color = '#333333'
-        label = value[:30] + '...' if len(value) > 30 else value
-
-        return Extracted__Node(
-            id           = node_id,
-            label        = label,
-            node_type    = 'attr',
-            dom_path     = f'value:{value[:20]}',
-            value        = value,
-            graph_source = graph_source,
-            fill_color   = fill_color,
-            font_color   = font_color,
-            border_color = self._darken(fill_color),
-            shape        = 'box'
-        )
-
-
-    def _create_attr_instance_node(self, node_id: str, position: str, graph_source: str) -> Extracted__Node:
-        """Create node for attribute instance (links name and optionally value)."""
-        fill_color = '#F3E5F5'  # Very light purple
-        font_color = '#333333'
-
-        return Extracted__Node(
-            id           = node_id,
-            label        = f'attr[{position}]',
-            node_type    = 'attr',
-            dom_path     = f'instance:{position}',
-            value        = None,
-            graph_source = graph_source,
-            fill_color   = fill_color,
-            font_color   = font_color,
-            border_color = self._darken(fill_color),
-            shape        = 'box'
-        )
+            return tags
+        nodes = attrs_graph.mgraph.graph.model.data.nodes
+        for edge in attrs_graph.edge_schemas():                                           # tag → element edges
+            if edge.edge_label and edge.edge_label.predicate == attrs_graph.PREDICATE_ELEMENT:
+                tags[str(edge.to_node_id)] = self._node_value(nodes.get(edge.from_node_id))
+        return tags
 
     # ═══════════════════════════════════════════════════════════════════════════
-    # Scripts Graph Extraction
+    # Node Extraction (raw node schemas, no domain objects)
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def _extract_from_scripts_graph(self):                                                # Extract script content from scripts graph
-        scripts_graph = self.html_mgraph.scripts_graph
-        if not scripts_graph or not scripts_graph.mgraph:
-            return
-
-        for node_id in scripts_graph.nodes_ids():
-            if str(node_id) in self._extracted_ids:
+    def _extract_nodes(self, graph, graph_source: str, create_node):                      # One pass over the graph's node store
+        excludes = graph_source in ('body', 'head')                                       # Hidden body / head nodes also hide their edges
+        for node in graph.node_schemas():
+            node_id = str(node.node_id)
+            if node_id in self._extracted_ids:
                 continue
-
-            node_path = scripts_graph.node_path(node_id)
-            path_str  = str(node_path) if node_path else ''
-            value     = scripts_graph.node_value(node_id)
-
-            if path_str.startswith('content:'):                                           # Script content node
-                extracted = self._create_script_node(str(node_id), value, 'scripts')
-                if extracted and self._should_include_node(extracted):
-                    self.nodes.append(extracted)
-                    self._extracted_ids.add(str(node_id))
-
-        self._extract_edges_from_graph(scripts_graph, 'scripts')
-
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Styles Graph Extraction
-    # ═══════════════════════════════════════════════════════════════════════════
-
-    def _extract_from_styles_graph(self):                                                 # Extract style content from styles graph
-        styles_graph = self.html_mgraph.styles_graph
-        if not styles_graph or not styles_graph.mgraph:
-            return
-
-        for node_id in styles_graph.nodes_ids():
-            if str(node_id) in self._extracted_ids:
+            path_str = str(node.node_path) if node.node_path else ''
+            record   = create_node(node_id, path_str, node, graph_source)
+            if record is None:
                 continue
+            if self._should_include_node(record):
+                self.node_records.append(record)
+                self._extracted_ids.add(node_id)
+            elif excludes:
+                self._excluded_nodes.add(node_id)
+
+    def _create_dom_node(self, node_id: str, path_str: str, node, graph_source: str) -> Extracted__Node__Record:     # Body / head: elements and text
+        if path_str == 'text' or path_str.startswith('text:'):
+            return self._create_text_node(node_id, self._node_value(node), graph_source)
+        tag = self._tags.get(node_id) or self._extract_tag(path_str)
+        return self._create_element_node(node_id, path_str, tag, graph_source)
+
+    def _create_attrs_node(self, node_id: str, path_str: str, node, graph_source: str) -> Optional[Extracted__Node__Record]:   # Three-node model: tag, name, value, instance
+        if path_str.startswith('tag:'):
+            return self._create_tag_node(node_id, path_str, self._node_value(node), graph_source)
+        if path_str == 'name':
+            return self._create_attr_name_node(node_id, self._node_value(node), graph_source)
+        if path_str == 'value':
+            return self._create_attr_value_node(node_id, self._node_value(node), graph_source)
+        if path_str.isdigit():
+            return self._create_attr_instance_node(node_id, path_str, graph_source)
+        return None                                                                       # root and element anchors
+
+    def _create_script_node(self, node_id: str, path_str: str, node, graph_source: str) -> Optional[Extracted__Node__Record]:
+        if not path_str.startswith('content:'):
+            return None
+        value = self._node_value(node)
+        label = value[:30] + '...' if value and len(value) > 30 else (value or '')
+        return self._record(node_id, f'script: {label}', 'script', 'script', graph_source, '#FCE4EC', '#333333', 'box', value=value)   # Light pink for scripts
 
-            node_path = styles_graph.node_path(node_id)
-            path_str  = str(node_path) if node_path else ''
-            value     = styles_graph.node_value(node_id)
+    def _create_style_node(self, node_id: str, path_str: str, node, graph_source: str) -> Optional[Extracted__Node__Record]:
+        if not path_str.startswith('content:'):
+            return None
+        value = self._node_value(node)
+        label = value[:30] + '...' if value and len(value) > 30 else (value or '')
+        return self._record(node_id, f'style: {label}', 'style', 'style', graph_source, '#F3E5F5', '#333333', 'box', value=value)     # Light purple for styles
 
-            if path_str.startswith('content:'):                                           # Style content node
-                extracted = self._create_style_node(str(node_id), value, 'styles')
-                if extracted and self._should_include_node(extracted):
-                    self.nodes.append(extracted)
-                    self._extracted_ids.add(str(node_id))
+    def _node_value(self, node) -> Optional[str]:                                         # Value of a raw value node schema
+        return getattr(getattr(node, 'node_data', None), 'value', None)
 
-        self._extract_edges_from_graph(styles_graph, 'styles')
+    def _should_include_node(self, node: Extracted__Node__Record) -> bool:                # Check visibility config
+        return node.node_type not in self._hidden_types
 
     # ═══════════════════════════════════════════════════════════════════════════
-    # Edge Extraction
+    # Edge Extraction (raw edge schemas, no domain objects)
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def _extract_edges_from_graph(self, graph, graph_source: str):                        # Extract edges from a specific graph
-        if not graph or not graph.mgraph:
-            return
-
-        mgraph_data = graph.mgraph.data()
-        for edge_id in mgraph_data.edges_ids():
-            domain_edge = mgraph_data.edge(edge_id)
-            if not domain_edge:
+    def _extract_edges(self, graph, graph_source: str):                                   # One pass over the graph's edge store
+        excluded = self._excluded_nodes
+        for edge in graph.edge_schemas():
+            source    = str(edge.from_node_id)
+            target    = str(edge.to_node_id)
+            predicate = str(edge.edge_label.predicate) if edge.edge_label and edge.edge_label.predicate else ''
+            if source in excluded or target in excluded or predicate in self._hidden_edges:
                 continue
-
-            extracted = self._extract_single_edge(domain_edge, edge_id, graph_source)
-            if extracted and self._should_include_edge(extracted):
-                self.edges.append(extracted)
-
-    def _extract_single_edge(self, domain_edge, edge_id, graph_source: str) -> Optional[Extracted__Edge]:
-        try:
-            edge_data = domain_edge.edge.data
-
-            edge_id_str = str(edge_id)
-            source      = str(edge_data.from_node_id)
-            target      = str(edge_data.to_node_id)
-            predicate   = self._get_edge_predicate(edge_data)
-            position    = self._get_edge_position(edge_data)
-            color       = self.colors.get_edge_color(predicate) if self.colors else '#888888'
-            dashed      = predicate in ('tag', 'attr', 'script', 'style', 'name', 'value')
-                # Non-structural edges are dashed
-
-            return Extracted__Edge(id           = edge_id_str   ,
-                                   source       = source        ,
-                                   target       = target        ,
-                                   predicate    = predicate     ,
-                                   position     = position      ,
-                                   graph_source = graph_source  ,
-                                   color        = color         ,
-                                   dashed       = dashed        )
-        except Exception:
-            return None
-
-    def _get_edge_predicate(self, edge_data) -> str:                                      # Extract predicate from edge_label
-        try:
-            if hasattr(edge_data, 'edge_label') and edge_data.edge_label:
-                label = edge_data.edge_label
-                if hasattr(label, 'predicate') and label.predicate:
-                    return str(label.predicate)
-        except Exception:
-            pass
-        return ''
-
-    def _get_edge_position(self, edge_data) -> Optional[int]:                             # Extract position from edge_path
-        try:
-            if hasattr(edge_data, 'edge_path') and edge_data.edge_path:
-                return int(edge_data.edge_path)
-        except (ValueError, TypeError):
-            pass
+            self.edge_records.append(Extracted__Edge__Record(id           = str(edge.edge_id)                   ,
+                                                              source       = source                              ,
+                                                              target       = target                              ,
+                                                              predicate    = predicate                           ,
+                                                              position     = self._edge_position(edge.edge_path) ,
+                                                              graph_source = graph_source                        ,
+                                                              color        = self._edge_color(predicate)         ,
+                                                              dashed       = predicate in EDGE_PREDICATES__DASHED))
+
+    def _edge_position(self, edge_path) -> Optional[int]:                                 # Position from edge_path
+        if edge_path:
+            try:
+                return int(edge_path)
+            except (ValueError, TypeError):
+                pass
         return None
 
-    def _should_include_edge(self, edge: Extracted__Edge) -> bool:                        # Check if edge should be included
-        if edge.source in self._excluded_nodes or edge.target in self._excluded_nodes:
-            return False
-
-        predicate = edge.predicate
-        if predicate == 'child' and not self.config.show_child_edges:
-            return False
-        if predicate == 'tag' and not self.config.show_tag_edges:
-            return False
-        if predicate == 'attr' and not self.config.show_attr_edges:
-            return False
-        if predicate == 'text' and not self.config.show_text_edges:
-            return False
-
-        return True
+    def _edge_color(self, predicate: str) -> str:
+        color = self._edge_colors.get(predicate)
+        if color is None:
+            color = self._edge_colors[predicate] = self.colors.get_edge_color(predicate)
+        return color
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Node Creation Methods
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def _create_element_node(self, node_id: str, node_path: str, tag: str, graph_source: str) -> Extracted__Node:
-        depth      = self._calculate_depth(node_path)
-        category   = self.colors.get_tag_category(tag) if self.colors and tag else ''
-        fill_color = self.colors.get_element_color(depth) if self.colors else '#E8E8E8'
-        font_color = self.colors.get_font_color('element') if self.colors else '#333333'
-        label      = self.labels.label_for_element_node(node_path) if self.labels else (tag or node_path)
-
-        return Extracted__Node(id           = node_id                     ,
-                               label        = label                       ,
-                               node_type    = 'element'                   ,
-                               dom_path     = node_path                   ,
-                               depth        = depth                       ,
-                               category     = category                    ,
-                               graph_source = graph_source                ,
-                               fill_color   = fill_color                  ,
-                               font_color   = font_color                  ,
-                               border_color = self._darken(fill_color)    ,
-                               shape        = self.config.element_shape if self.config else 'box')
-
-    def _create_tag_node(self, node_id: str, node_path: str, value: Optional[str], graph_source: str) -> Extracted__Node:
-        tag_name   = node_path[4:] if node_path.startswith('tag:') else ''
-        category   = self.colors.get_tag_category(tag_name) if self.colors else ''
-        fill_color = self.colors.get_tag_color(tag_name) if self.colors else '#4A90D9'
-        font_color = self.colors.get_font_color('tag') if self.colors else '#FFFFFF'
-        label      = self.labels.label_for_tag_node(node_path, value) if self.labels else f'<{tag_name}>'
-
-        return Extracted__Node(id           = node_id                     ,
-                               label        = label                       ,
-                               node_type    = 'tag'                       ,
-                               dom_path     = node_path                   ,
-                               value        = value                       ,
-                               category     = category                    ,
-                               graph_source = graph_source                ,
-                               fill_color   = fill_color                  ,
-                               font_color   = font_color                  ,
-                               border_color = self._darken(fill_color)    ,
-                               shape        = self.config.tag_shape if self.config else 'ellipse')
-
-    def _create_attr_node(self, node_id: str, node_path: str, value: Optional[str], graph_source: str) -> Extracted__Node:
-        fill_color = self.colors.get_attr_color() if self.colors else '#B39DDB'
-        font_color = self.colors.get_font_color('attr') if self.colors else '#333333'
-        label      = self.labels.label_for_attr_node(node_path, value) if self.labels else (value or node_path)
-
-        return Extracted__Node(id           = node_id                     ,
-                               label        = label                       ,
-                               node_type    = 'attr'                      ,
-                               dom_path     = node_path                   ,
-                               value        = value                       ,
-                               graph_source = graph_source                ,
-                               fill_color   = fill_color                  ,
-                               font_color   = font_color                  ,
-                               border_color = self._darken(fill_color)    ,
-                               shape        = self.config.attr_shape if self.config else 'box')
-
-    def _create_text_node(self, node_id: str, value: Optional[str], graph_source: str) -> Extracted__Node:
-        fill_color = self.colors.get_text_color() if self.colors else '#FFFACD'
-        font_color = self.colors.get_font_color('text') if self.colors else '#333333'
-        label      = self.labels.label_for_text_node(value) if self.labels else (value or '')
-
-        return Extracted__Node(id           = node_id                     ,
-                               label        = label                       ,
-                               node_type    = 'text'                      ,
-                               dom_path     = 'text'                      ,
-                               value        = value                       ,
-                               graph_source = graph_source                ,
-                               fill_color   = fill_color                  ,
-                               font_color   = font_color                  ,
-                               border_color = self._darken(fill_color)    ,
-                               shape        = self.config.text_shape if self.config else 'box')
-
-    def _create_script_node(self, node_id: str, value: Optional[str], graph_source: str) -> Extracted__Node:
-        fill_color = '#FCE4EC'                                                            # Light pink for scripts
-        font_color = '#333333'
-        label      = (value or '')[:30] + '...' if value and len(value) > 30 else (value or '')
-
-        return Extracted__Node(id           = node_id                     ,
-                               label        = f'script: {label}'          ,
-                               node_type    = 'script'                    ,
-                               dom_path     = 'script'                    ,
-                               value        = value                       ,
-                               graph_source = graph_source                ,
-                               fill_color   = fill_color                  ,
-                               font_color   = font_color                  ,
-                               border_color = self._darken(fill_color)    ,
-                               shape        = 'box'                       )
-
-    def _create_style_node(self, node_id: str, value: Optional[str], graph_source: str) -> Extracted__Node:
-        fill_color = '#F3E5F5'                                                            # Light purple for styles
-        font_color = '#333333'
-        label      = (value or '')[:30] + '...' if value and len(value) > 30 else (value or '')
-
-        return Extracted__Node(id           = node_id                     ,
-                               label        = f'style: {label}'           ,
-                               node_type    = 'style'                     ,
-                               dom_path     = 'style'                     ,
-                               value        = value                       ,
-                               graph_source = graph_source                ,
-                               fill_color   = fill_color                  ,
-                               font_color   = font_color                  ,
-                               border_color = self._darken(fill_color)    ,
-                               shape        = 'box'                       )
-
-    def _should_include_node(self, node: Extracted__Node) -> bool:                        # Check visibility config
-        if not self.config:
-            return True
-        if node.node_type == 'tag'  and not self.config.show_tag_nodes:
-            return False
-        if node.node_type == 'attr' and not self.config.show_attr_nodes:
-            return False
-        if node.node_type == 'text' and not self.config.show_text_nodes:
-            return False
-        return True
+    def _record(self, node_id: str, label: str, node_type: str, dom_path: str, graph_source: str,
+                      fill_color: str, font_color: str, shape: str, **kwargs) -> Extracted__Node__Record:
+        return Extracted__Node__Record(id           = node_id                           ,
+                                       label        = label                             ,
+                                       node_type    = node_type                         ,
+                                       dom_path     = dom_path                          ,
+                                       graph_source = graph_source                      ,
+                                       fill_color   = fill_color                        ,
+                                       font_color   = font_color                        ,
+                                       border_color = self.colors.border_color(fill_color),
+                                       shape        = shape                             ,
+                                       **kwargs                                         )
+
+    def _create_element_node(self, node_id: str, node_path: str, tag: str, graph_source: str) -> Extracted__Node__Record:
+        depth = self._calculate_depth(node_path)
+        return self._record(node_id, self.labels.label_for_element_node(node_path), 'element', node_path, graph_source,
+                            self.colors.get_element_color(depth), self.colors.get_font_color('element'), self.config.element_shape,
+                            depth=depth, category=self.colors.tag_style(tag)[0] if tag else '')
+
+    def _create_tag_node(self, node_id: str, node_path: str, value: Optional[str], graph_source: str) -> Extracted__Node__Record:
+        tag_name                = node_path[4:] if node_path.startswith('tag:') else ''
+        category, fill, _, font = self.colors.tag_style(tag_name)                     # precomputed per color scheme
+        return self._record(node_id, self.labels.label_for_tag_node(node_path, value), 'tag', node_path, graph_source,
+                            fill, font, self.config.tag_shape, value=value, category=category)
+
+    def _create_text_node(self, node_id: str, value: Optional[str], graph_source: str) -> Extracted__Node__Record:
+        return self._record(node_id, self.labels.label_for_text_node(value), 'text', 'text', graph_source,
+                            self.colors.get_text_color(), self.colors.get_font_color('text'), self.config.text_shape,
+                            value=value)
+
+    def _create_attr_name_node(self, node_id: str, value: str, graph_source: str) -> Extracted__Node__Record:       # Attribute name (e.g., 'class', 'required')
+        return self._record(node_id, value, 'attr', f'name:{value}', graph_source,                                   # Show the attr name directly
+                            self.colors.get_attr_color(), '#FFFFFF', 'ellipse', value=value)
+
+    def _create_attr_value_node(self, node_id: str, value: str, graph_source: str) -> Extracted__Node__Record:      # Attribute value
+        label = value[:30] + '...' if len(value) > 30 else value
+        return self._record(node_id, label, 'attr', f'value:{value[:20]}', graph_source,
+                            '#E1BEE7', '#333333', 'box', value=value)                                                # Lighter purple for values
+
+    def _create_attr_instance_node(self, node_id: str, position: str, graph_source: str) -> Extracted__Node__Record:  # Attribute instance (links name and optionally value)
+        return self._record(node_id, f'attr[{position}]', 'attr', f'instance:{position}', graph_source,
+                            '#F3E5F5', '#333333', 'box')                                                             # Very light purple
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Root Detection
@@ -532,7 +372,7 @@ class Html_MGraph__Data__Extractor(Type_Safe):
                 self.root_id = str(root)
                 return
 
-        for node in self.nodes:                                                           # Fallback: find by depth
+        for node in self.node_records:                                                    # Fallback: find by depth
             if node.node_type == 'element' and node.depth == 1:
                 self.root_id = node.id
                 break
@@ -553,29 +393,3 @@ class Html_MGraph__Data__Extractor(Type_Safe):
         if '[' in last_part:
             last_part = last_part[:last_part.index('[')]
         return last_part
-
-    def _get_tag_category(self, tag: str) -> str:                                         # Get tag category
-        categories = {
-            'structural' : ['html', 'head', 'body', 'div', 'span', 'section', 'article', 'header', 'footer', 'nav', 'aside', 'main'],
-            'text'       : ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a', 'strong', 'em', 'b', 'i', 'u', 'br', 'hr'],
-            'form'       : ['form', 'input', 'button', 'select', 'textarea', 'label', 'option'],
-            'media'      : ['img', 'video', 'audio', 'canvas', 'svg', 'picture'],
-            'list'       : ['ul', 'ol', 'li', 'dl', 'dt', 'dd'],
-            'table'      : ['table', 'tr', 'td', 'th', 'thead', 'tbody', 'tfoot'],
-            'meta'       : ['meta', 'link', 'title', 'style', 'script']
-        }
-        for category, tags in categories.items():
-            if tag.lower() in tags:
-                return category
-        return 'other'
-
-    def _darken(self, hex_color: str) -> str:                                             # Darken a hex color for borders
-        if not hex_color or not hex_color.startswith('#') or len(hex_color) != 7:
-            return '#CCCCCC'
-        try:
-            r = max(0, int(hex_color[1:3], 16) - 30)
-            g = max(0, int(hex_color[3:5], 16) - 30)
-            b = max(0, int(hex_color[5:7], 16) - 30)
-            return f'#{r:02x}{g:02x}{b:02x}'
-        except ValueError:
-            return '#CCCCCC'
\ No newline at end of file
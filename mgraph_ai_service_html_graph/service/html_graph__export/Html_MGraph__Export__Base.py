@@ -4,7 +4,9 @@
 # Provides common functionality:
 # - Html_MGraph input (facade)
 # - Config management
-# - Extractor access
+# - Extractor access (records only: nodes / edges are the extractor's
+#   Extracted__Node__Record / Extracted__Edge__Record, same fields as the
+#   Type_Safe Extracted__Node / Extracted__Edge, without their construction cost)
 # - Common conversion utilities
 # ═══════════════════════════════════════════════════════════════════════════════
 
@@ -13,6 +15,7 @@ from osbot_utils.type_safe.Type_Safe
 from osbot_utils.decorators.methods.cache_on_self                                         import cache_on_self
 from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                         import Html_MGraph
 from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Config         import Html_MGraph__Render__Config
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors         import darken_hex, lighten_hex
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Html_MGraph__Data__Extractor
 
 
@@ -26,18 +29,19 @@ class Html_MGraph__Export__Base(Type_Safe):
 
     @cache_on_self
     def extractor(self) -> Html_MGraph__Data__Extractor:                                  # Get or create the data extractor
-        extractor = Html_MGraph__Data__Extractor(html_mgraph = self.html_mgraph ,
-                                                  config      = self.config      )
+        extractor = Html_MGraph__Data__Extractor(html_mgraph  = self.html_mgraph ,
+                                                  config       = self.config      ,
+                                                  records_only = True             )
         extractor.extract()
         return extractor
 
     @property
-    def nodes(self) -> List:                                                              # Shortcut to extracted nodes
-        return self.extractor().nodes
+    def nodes(self) -> List:                                                              # Shortcut to extracted nodes (records)
+        return self.extractor().node_records
 
     @property
-    def edges(self) -> List:                                                              # Shortcut to extracted edges
-        return self.extractor().edges
+    def edges(self) -> List:                                                              # Shortcut to extracted edges (records)
+        return self.extractor().edge_records
 
     @property
     def root_id(self) -> Optional[str]:                                                   # Shortcut to root node ID
@@ -55,26 +59,10 @@ class Html_MGraph__Export__Base(Type_Safe):
     # ═══════════════════════════════════════════════════════════════════════════
 
     def lighten_color(self, hex_color: str, amount: int = 30) -> str:                     # Lighten a hex color
-        if not hex_color or len(hex_color) != 7 or not hex_color.startswith('#'):
-            return '#FFFFFF'
-        try:
-            r = min(255, int(hex_color[1:3], 16) + amount)
-            g = min(255, int(hex_color[3:5], 16) + amount)
-            b = min(255, int(hex_color[5:7], 16) + amount)
-            return f'#{r:02x}{g:02x}{b:02x}'
-        except ValueError:
-            return '#FFFFFF'
+        return lighten_hex(hex_color, amount)
 
     def darken_color(self, hex_color: str, amount: int = 30) -> str:                      # Darken a hex color
-        if not hex_color or len(hex_color) != 7 or not hex_color.startswith('#'):
-            return '#CCCCCC'
-        try:
-            r = max(0, int(hex_color[1:3], 16) - amount)
-            g = max(0, int(hex_color[3:5], 16) - amount)
-            b = max(0, int(hex_color[5:7], 16) - amount)
-            return f'#{r:02x}{g:02x}{b:02x}'
-        except ValueError:
-            return '#CCCCCC'
+        return darken_hex(hex_color, amount)
 
     def escape_label(self, label: str, max_length: int = 30) -> str:                      # Escape and truncate label
         if not label:
@@ -6,7 +6,7 @@
 
 from typing                                                                               import List, Dict, Any
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Export__Base    import Html_MGraph__Export__Base
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node, Extracted__Edge
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node__Record, Extracted__Edge__Record
 
 
 class Html_MGraph__To__Cytoscape(Html_MGraph__Export__Base):                              # Converts Html_MGraph to Cytoscape format
@@ -16,7 +16,7 @@ class Html_MGraph__To__Cytoscape(Html_MGraph__Export__Base):
                                 'edges' : self._convert_edges(self.edges) },
                  'rootId'   : self.root_id                                 }
 
-    def _convert_nodes(self, nodes: List[Extracted__Node]) -> List[Dict]:                 # Convert to Cytoscape node format
+    def _convert_nodes(self, nodes: List[Extracted__Node__Record]) -> List[Dict]:         # Convert to Cytoscape node format
         result = []
         for node in nodes:
             cy_node = {
@@ -39,7 +39,7 @@ class Html_MGraph__To__Cytoscape(Html_MGraph__Export__Base):
             result.append(cy_node)
         return result
 
-    def _convert_edges(self, edges: List[Extracted__Edge]) -> List[Dict]:                 # Convert to Cytoscape edge format
+    def _convert_edges(self, edges: List[Extracted__Edge__Record]) -> List[Dict]:         # Convert to Cytoscape edge format
         result = []
         for edge in edges:
             cy_edge = {
@@ -6,7 +6,7 @@
 
 from typing                                                                               import List, Dict, Any
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Export__Base    import Html_MGraph__Export__Base
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node, Extracted__Edge
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node__Record, Extracted__Edge__Record
 
 
 class Html_MGraph__To__D3(Html_MGraph__Export__Base):                                     # Converts Html_MGraph to D3.js format
@@ -16,7 +16,7 @@ class Html_MGraph__To__D3(Html_MGraph__Export__Base):
                  'links'  : self._convert_links(self.edges)  ,                            # D3 uses 'links' not 'edges'
                  'rootId' : self.root_id                     }
 
-    def _convert_nodes(self, nodes: List[Extracted__Node]) -> List[Dict]:                 # Convert to D3 node format
+    def _convert_nodes(self, nodes: List[Extracted__Node__Record]) -> List[Dict]:         # Convert to D3 node format
         result = []
         for node in nodes:
             d3_node = {
@@ -36,7 +36,7 @@ class Html_MGraph__To__D3(Html_MGraph__Export__Base):
             result.append(d3_node)
         return result
 
-    def _convert_links(self, edges: List[Extracted__Edge]) -> List[Dict]:                 # Convert to D3 link format
+    def _convert_links(self, edges: List[Extracted__Edge__Record]) -> List[Dict]:         # Convert to D3 link format
         result = []
         for edge in edges:
             d3_link = {
@@ -53,6 +53,6 @@ class Html_MGraph__To__D3(Html_MGraph__Export__Base):
             result.append(d3_link)
         return result
 
-    def _calculate_radius(self, node: Extracted__Node) -> int:                            # Calculate node radius
+    def _calculate_radius(self, node: Extracted__Node__Record) -> int:                    # Calculate node radius
         base = {'element': 25, 'tag': 20, 'attr': 18, 'text': 22, 'script': 20, 'style': 20}.get(node.node_type, 20)
         return base + min(len(node.label) // 5, 10)
\ No newline at end of file
@@ -6,7 +6,7 @@
 
 from typing                                                                               import List, Dict
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Export__Base    import Html_MGraph__Export__Base
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node, Extracted__Edge
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node__Record, Extracted__Edge__Record
 
 
 class Html_MGraph__To__Mermaid(Html_MGraph__Export__Base):                                 # Converts Html_MGraph to Mermaid flowchart
@@ -44,7 +44,7 @@ class Html_MGraph__To__Mermaid(Html_MGraph__Export__Base):
             self._id_counter += 1
         return self._id_map[long_id]
 
-    def _format_node(self, node: Extracted__Node) -> str:                                 # Format node as Mermaid syntax
+    def _format_node(self, node: Extracted__Node__Record) -> str:                         # Format node as Mermaid syntax
         short_id = self._get_short_id(node.id)
         label    = self.escape_label(node.label)
 
@@ -58,7 +58,7 @@ class Html_MGraph__To__Mermaid(Html_MGraph__Export__Base):
         }
         return shapes.get(node.node_type, f'{short_id}["{label}"]')
 
-    def _format_edge(self, edge: Extracted__Edge) -> str:                                 # Format edge as Mermaid syntax
+    def _format_edge(self, edge: Extracted__Edge__Record) -> str:                         # Format edge as Mermaid syntax
         source_id = self._get_short_id(edge.source)
         target_id = self._get_short_id(edge.target)
 
@@ -68,7 +68,7 @@ class Html_MGraph__To__Mermaid(Html_MGraph__Export__Base):
         arrow = '-.->' if edge.dashed else '-->'
         return f'{source_id} {arrow} {target_id}'
 
-    def _format_styles(self, nodes: List[Extracted__Node]) -> List[str]:                  # Generate Mermaid style definitions
+    def _format_styles(self, nodes: List[Extracted__Node__Record]) -> List[str]:          # Generate Mermaid style definitions
         by_type: Dict[str, List[str]] = {'element': [], 'tag': [], 'attr': [], 'text': [], 'script': [], 'style': []}
 
         for node in nodes:
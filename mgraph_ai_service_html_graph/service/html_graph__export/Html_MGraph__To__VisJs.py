@@ -6,7 +6,7 @@
 
 from typing                                                                               import List, Dict, Any
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Export__Base    import Html_MGraph__Export__Base
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node, Extracted__Edge
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node__Record, Extracted__Edge__Record
 
 
 class Html_MGraph__To__VisJs(Html_MGraph__Export__Base):                                  # Converts Html_MGraph to vis.js format
@@ -16,7 +16,7 @@ class Html_MGraph__To__VisJs(Html_MGraph__Export__Base):
                  'edges'  : self._convert_edges(self.edges)  ,
                  'rootId' : self.root_id                     }
 
-    def _convert_nodes(self, nodes: List[Extracted__Node]) -> List[Dict]:                 # Convert to vis.js node format
+    def _convert_nodes(self, nodes: List[Extracted__Node__Record]) -> List[Dict]:         # Convert to vis.js node format
         result = []
         for node in nodes:
             vis_node = {
@@ -45,7 +45,7 @@ class Html_MGraph__To__VisJs(Html_MGraph__Export__Base):
             result.append(vis_node)
         return result
 
-    def _convert_edges(self, edges: List[Extracted__Edge]) -> List[Dict]:                 # Convert to vis.js edge format
+    def _convert_edges(self, edges: List[Extracted__Edge__Record]) -> List[Dict]:         # Convert to vis.js edge format
         result = []
         for edge in edges:
             vis_edge = {
@@ -27,6 +27,9 @@ class Graph_Transformation__Base(Type_Safe):
     label       : str = 'Default'                                                        # Human-readable label
     description : str = 'Standard body graph visualization'                              # Description
 
+    def metrics_name(self) -> str:                                                       # transformation label in html_graph_metrics (one of a fixed set of names)
+        return self.name
+
     # ═══════════════════════════════════════════════════════════════════════════════════
     # Phase 1: HTML → Html_MGraph
     # ═══════════════════════════════════════════════════════════════════════════════════
@@ -55,6 +58,9 @@ class Graph_Transformation__Base(Type_Safe):
     def transform_mgraph(self, mgraph):                                                  # Transform the graph
         return mgraph                                                                    # Default: no-op passthrough
 
+    def mutates_mgraph(self) -> bool:                                                    # Does transform_mgraph edit its input in place?
+        return type(self).transform_mgraph is not Graph_Transformation__Base.transform_mgraph    # Default: overrides might (use Graph_Transformation__View instead, and return False)
+
     # ═══════════════════════════════════════════════════════════════════════════════════
     # Phase 4: Engine Configuration Callbacks
     # ═══════════════════════════════════════════════════════════════════════════════════
@@ -2,20 +2,39 @@
 #
 # Central registry for all available graph transformations.
 # Provides lookup by name and listing functionality.
+#
+# Transformations are registered by module path and only imported when first
+# used by name (see utils.Lazy_Import), so importing the registry (and the
+# export service) does not pull in every use case. names() never imports;
+# the first list_all() imports all of them.
+#
+# Metadata (name / label / description) is read from the class defaults when a
+# class is first resolved (or registered) and cached, so list_all() does not
+# construct any transformation (and, after the first call, is a copy of the
+# cached list). Transformation instances hold per-request state (dot_code, the
+# Full_Document extractor, ...), so get() still hands out one instance per
+# request, but from a pool: release() resets an instance to its class defaults
+# (a __dict__ swap, instead of a new Type_Safe construction) and keeps it for
+# the next get(). Only classes whose default field values are all immutable are
+# pooled; the others are constructed on every get(), as before.
+#
+# Names that contain PIPELINE__SEPARATOR are pipeline specs (a transformation
+# followed by graph filter steps, e.g. 'body_only+strip_inline'): get() returns
+# a new Graph_Transform__Pipeline for them (see pipeline/, imported on first use),
+# as it does for any name when a filter expression is given.
+
+from enum                                                                                        import Enum
+from typing                                                                                      import Dict, List, Type, Union
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Base import Graph_Transformation__Base
+from mgraph_ai_service_html_graph.utils.Lazy_Import                                              import resolve_class
 
-from typing                                                                                                                 import Dict, List, Type
-from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Base                            import Graph_Transformation__Base
-from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Attributes      import Graph_Transform__Attributes
-from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Body_Only       import Graph_Transform__Body_Only
-from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Default         import Graph_Transform__Default
-from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Full_Document   import Graph_Transform__Full_Document
-from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Head_Only       import Graph_Transform__Head_Only
-from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Scripts         import Graph_Transform__Scripts
-from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Styles          import Graph_Transform__Styles
-from mgraph_ai_service_html_graph.service.html_graph__transformations.html_use_cases.Html_Use_Case__1                       import Html_Use_Case__1
-from mgraph_ai_service_html_graph.service.html_graph__transformations.html_use_cases.Html_Use_Case__2                       import Html_Use_Case__2
-from mgraph_ai_service_html_graph.service.html_graph__transformations.html_use_cases.Html_Use_Case__3                       import Html_Use_Case__3
-from mgraph_ai_service_html_graph.service.html_graph__transformations.html_use_cases.Html_Use_Case__Performance_Stats import Html_Use_Case__Performance_Stats
+TRANSFORMATIONS__CORE      = 'mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations'
+TRANSFORMATIONS__USE_CASES = 'mgraph_ai_service_html_graph.service.html_graph__transformations.html_use_cases'
+TRANSFORMATION__PIPELINE   = 'mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Transform__Pipeline'
+PIPELINE__SEPARATOR        = '+'
+TRANSFORMATION__DEFAULT    = 'default'
+TRANSFORMATIONS__POOL_SIZE = 8                                                               # Idle instances kept per transformation
+IMMUTABLE_TYPES            = (str, int, float, bool, bytes, tuple, frozenset, Enum, type(None))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════════════════
@@ -24,35 +43,70 @@ from mgraph_ai_service_html_graph.service.html_graph__transformations.html_use_c
 
 class Graph_Transformation__Registry:                                                    # Transformation registry
 
-    _transformations: Dict[str, Type[Graph_Transformation__Base]] = {
-        'html-use-case-1': Html_Use_Case__1                ,
-        'html-use-case-2': Html_Use_Case__2                ,
-        'html-use-case-3': Html_Use_Case__3                ,
-        'html-use-case-performance-stats' : Html_Use_Case__Performance_Stats,
-        'default'        : Graph_Transform__Default        ,                            # Built-in transformations
-        'body_only'      : Graph_Transform__Body_Only      ,
-        'head_only'      : Graph_Transform__Head_Only      ,
-        'full-document'  : Graph_Transform__Full_Document  ,
-        'attributes'     : Graph_Transform__Attributes     ,
-        'scripts'        : Graph_Transform__Scripts        ,
-        'styles'         : Graph_Transform__Styles         ,
+    _transformations: Dict[str, Union[str, Type[Graph_Transformation__Base]]] = {        # name -> module path (imported on first use) or class
+        'html-use-case-1'                 : f'{TRANSFORMATIONS__USE_CASES}.Html_Use_Case__1'                ,
+        'html-use-case-2'                 : f'{TRANSFORMATIONS__USE_CASES}.Html_Use_Case__2'                ,
+        'html-use-case-3'                 : f'{TRANSFORMATIONS__USE_CASES}.Html_Use_Case__3'                ,
+        'html-use-case-performance-stats' : f'{TRANSFORMATIONS__USE_CASES}.Html_Use_Case__Performance_Stats',
+        'default'                         : f'{TRANSFORMATIONS__CORE}.Graph_Transform__Default'             ,   # Built-in transformations
+        'body_only'                       : f'{TRANSFORMATIONS__CORE}.Graph_Transform__Body_Only'           ,
+        'head_only'                       : f'{TRANSFORMATIONS__CORE}.Graph_Transform__Head_Only'           ,
+        'full-document'                   : f'{TRANSFORMATIONS__CORE}.Graph_Transform__Full_Document'       ,
+        'attributes'                      : f'{TRANSFORMATIONS__CORE}.Graph_Transform__Attributes'          ,
+        'scripts'                         : f'{TRANSFORMATIONS__CORE}.Graph_Transform__Scripts'             ,
+        'styles'                          : f'{TRANSFORMATIONS__CORE}.Graph_Transform__Styles'              ,
     }
 
-    def get(self, name: str) -> Graph_Transformation__Base:                              # Get transformation by name
-        transform_class = self._transformations.get(name)
-        if transform_class:
-            return transform_class()
-        return Graph_Transform__Default()                                                # Fallback to default
+    def __init__(self):
+        self._metadata = {}                                                              # name -> {'name', 'label', 'description'}
+        self._defaults = {}                                                              # name -> __dict__ of a new instance (None: not poolable)
+        self._pool     = {}                                                              # name -> idle (reset) instances
+
+    def get(self, name: str, filter_expression: str = '') -> Graph_Transformation__Base: # Get transformation by name (pooled instance, see release)
+        if PIPELINE__SEPARATOR in name or filter_expression:
+            return resolve_class(TRANSFORMATION__PIPELINE)().setup(name, filter_expression)   # ValueError for unknown names in the spec / invalid filters
+        if name not in self._transformations:
+            name = TRANSFORMATION__DEFAULT                                               # Fallback to default
+        try:
+            return self._pool[name].pop()
+        except (KeyError, IndexError):
+            return self.get_class(name)()
+
+    def get_class(self, name: str) -> Type[Graph_Transformation__Base]:                  # Transformation class by name (imports it on first use), None if unknown
+        target = self._transformations.get(name)
+        if target:
+            transform_class = resolve_class(target)
+            if name not in self._metadata:
+                self.add_metadata(name, transform_class())
+            return transform_class
+        return None
+
+    def release(self, transformation: Graph_Transformation__Base) -> None:              # Return an instance from get() (once the request is done with it)
+        name     = transformation.name
+        defaults = self._defaults.get(name)
+        if defaults is None or type(transformation) is not self.get_class(name):        # not poolable (or not the registered class)
+            return
+        pool = self._pool.setdefault(name, [])
+        if len(pool) < TRANSFORMATIONS__POOL_SIZE:
+            transformation.__dict__.clear()                                              # back to the class defaults (all immutable)
+            transformation.__dict__.update(defaults)
+            pool.append(transformation)
+
+    def add_metadata(self, name: str, instance: Graph_Transformation__Base) -> None:     # Cache the metadata (and the pool defaults) of a new instance
+        defaults = dict(instance.__dict__)
+        self._metadata[name] = { 'name'       : instance.name       ,
+                                 'label'      : instance.label      ,
+                                 'description': instance.description}
+        poolable = all(isinstance(value, IMMUTABLE_TYPES) for value in defaults.values())
+        self._defaults[name] = defaults if poolable else None
+        self._pool.pop(name, None)                                                       # (re)registered: drop instances of the previous class
 
-    def list_all(self) -> List[Dict[str, str]]:                                          # List all transformations
+    def list_all(self) -> List[Dict[str, str]]:                                          # List all transformations (cached metadata)
         result = []
-        for name, transform_class in self._transformations.items():
-            instance = transform_class()
-            result.append({
-                'name'       : instance.name       ,
-                'label'      : instance.label      ,
-                'description': instance.description,
-            })
+        for name in self._transformations:
+            if name not in self._metadata:
+                self.get_class(name)
+            result.append(dict(self._metadata[name]))
         return result
 
     def names(self) -> List[str]:                                                        # Get all transformation names
@@ -61,6 +115,7 @@ class Graph_Transformation__Registry:
     def register(self, transform_class: Type[Graph_Transformation__Base]) -> None:      # Register custom transformation
         instance = transform_class()
         self._transformations[instance.name] = transform_class
+        self.add_metadata(instance.name, instance)
 
 
 # Global registry instance
@@ -0,0 +1,140 @@
+# Graph Transformation View
+#
+# Copy-on-write view of the MGraph a transformation receives in phase 3.
+#
+# The MGraph returned by html_mgraph__to__mgraph is the parsed document's own
+# graph (or, in a pipeline, a graph shared through Graph_Pipeline__Cache), so
+# transform_mgraph must not edit it in place. Instead, the changes are recorded
+# in a delta layer over the (unchanged) source:
+#
+#   relabel(node_id, value)     : new node_data.value
+#   restyle(node_id, **style)   : style properties (kept in the view, for the
+#                                 transformation's own export, see style())
+#   hide(node_id)               : node (and its edges) left out
+#   add_node(...) / add_edge()  : new nodes / edges
+#
+# and mgraph() builds the graph to render: a new MGraph that shares the source
+# node and edge schemas that did not change, with copies (shallow, plus a new
+# node_data) only for the relabeled nodes. Without changes it is the source.
+#
+#   view = Graph_Transformation__View(source=mgraph)
+#   for node in view.nodes():
+#       view.relabel(node.node_id, str(node.node_path))
+#   return view.mgraph()
+
+import copy
+from typing                                                                    import Dict, List, Optional
+from mgraph_db.mgraph.MGraph                                                   import MGraph
+from mgraph_db.mgraph.schemas.Schema__MGraph__Node                             import Schema__MGraph__Node
+from mgraph_db.mgraph.schemas.Schema__MGraph__Node__Data                       import Schema__MGraph__Node__Data
+from osbot_utils.type_safe.Type_Safe                                           import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Edge_Id              import Edge_Id
+from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id              import Node_Id
+from osbot_utils.type_safe.primitives.domains.identifiers.Obj_Id               import Obj_Id
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Base import Html_MGraph__Base
+
+
+class Graph_Transformation__View(Type_Safe):                                    # Delta layer over a read-only MGraph
+    source       : MGraph = None                                                # Graph being viewed (never modified)
+    _values      : dict                                                         # node_id -> new value       (relabel)
+    _styles      : dict                                                         # node_id -> {name: value}   (restyle)
+    _hidden      : set                                                          # node ids                   (hide)
+    _added_nodes : dict                                                         # node_id -> restore_node kwargs (add_node)
+    _added_edges : dict                                                         # edge_id -> restore_edge kwargs (add_edge)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Read (source + delta)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def nodes(self) -> List[Schema__MGraph__Node]:                              # Visible source node schemas (read-only: use relabel)
+        return [node for node_id, node in self.source.graph.model.data.nodes.items()
+                     if node_id not in self._hidden]
+
+    def node_value(self, node_id: Node_Id) -> Optional[str]:                    # Value after relabel (None: no value)
+        if node_id in self._values:
+            return self._values[node_id]
+        node      = self.source.graph.model.data.nodes.get(node_id)
+        node_data = node.node_data if node else None
+        return getattr(node_data, 'value', None)
+
+    def style(self, node_id: Node_Id) -> Dict[str, str]:                        # Style properties set by restyle
+        return dict(self._styles.get(node_id, {}))
+
+    def is_hidden(self, node_id: Node_Id) -> bool:
+        return node_id in self._hidden
+
+    def changed(self) -> bool:                                                  # Any change that mgraph() has to apply
+        return bool(self._values or self._hidden or self._added_nodes or self._added_edges)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Write (delta only)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def relabel(self, node_id: Node_Id, value: str) -> 'Graph_Transformation__View':
+        self._values[node_id] = value
+        return self
+
+    def restyle(self, node_id: Node_Id, **style) -> 'Graph_Transformation__View':
+        self._styles.setdefault(node_id, {}).update(style)
+        return self
+
+    def hide(self, node_id: Node_Id) -> 'Graph_Transformation__View':
+        self._hidden.add(node_id)
+        return self
+
+    def add_node(self, node_path : Optional[str] = None ,                       # New element node (value node when value is set)
+                       value     : Optional[str] = None
+                ) -> Node_Id:
+        node_id = Node_Id(Obj_Id())
+        self._added_nodes[node_id] = dict(node_id   = str(node_id)      ,
+                                          node_path = node_path         ,
+                                          value     = value             ,
+                                          is_value  = value is not None )
+        return node_id
+
+    def add_edge(self, from_node_id : Node_Id              ,
+                       to_node_id   : Node_Id              ,
+                       predicate    : Optional[str] = None ,
+                       edge_path    : Optional[str] = None
+                ) -> Edge_Id:
+        edge_id = Edge_Id(Obj_Id())
+        self._added_edges[edge_id] = dict(edge_id      = str(edge_id)      ,
+                                          from_node_id = str(from_node_id) ,
+                                          to_node_id   = str(to_node_id)   ,
+                                          predicate    = predicate         ,
+                                          edge_path    = edge_path         )
+        return edge_id
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Materialize
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def mgraph(self) -> MGraph:                                                 # Graph to render (the source itself when nothing changed)
+        if not self.changed():
+            return self.source
+        data   = self.source.graph.model.data
+        target = Html_MGraph__Base(index_on=False).setup__for_restore(None)     # index: built on first use
+        for node_id, node in data.nodes.items():
+            if node_id in self._hidden:
+                continue
+            if node_id in self._values:
+                node = self.relabeled(node, self._values[node_id])
+            target.add_node_schema(node)
+        for edge in data.edges.values():
+            if edge.from_node_id not in self._hidden and edge.to_node_id not in self._hidden:
+                target.add_edge_schema(edge)
+        for kwargs in self._added_nodes.values():
+            node = target.restore_node(**kwargs)
+            if node.node_id in self._values:
+                target.add_node_schema(self.relabeled(node, self._values[node.node_id]))
+        for kwargs in self._added_edges.values():
+            target.restore_edge(**kwargs)
+        return target.mgraph
+
+    @staticmethod
+    def relabeled(node: Schema__MGraph__Node, value: str) -> Schema__MGraph__Node:  # Copy of the node with a new node_data.value
+        node_data       = copy.copy(node.node_data) if node.node_data is not None else Schema__MGraph__Node__Data()
+        node_data.value = value
+        node            = copy.copy(node)
+        node.node_data  = node_data
+        return node
@@ -9,11 +9,13 @@
 #
 # Uses Html_MGraph__Data__Extractor to combine all subgraphs and generate
 # a clustered DOT output with cross-reference edges shown as dashed lines.
+# Only the extractor's lightweight records are used (records_only), the DOT
+# output never needs the Type_Safe Extracted__Node / Extracted__Edge objects.
 
 from typing                                                                                       import Any, Dict, List, Optional
 from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Base  import Graph_Transformation__Base
 from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                                 import Html_MGraph
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor         import Html_MGraph__Data__Extractor, Extracted__Node, Extracted__Edge
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor         import Html_MGraph__Data__Extractor, Extracted__Node__Record, Extracted__Edge__Record
 from mgraph_db.mgraph.MGraph                                                                      import MGraph
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                                    import type_safe
 
@@ -54,8 +56,8 @@ class Graph_Transform__Full_Document(Graph_Transformation__Base):
     # Internal state - populated during pipeline
     _html_mgraph     : Html_MGraph                   = None
     _extractor       : Html_MGraph__Data__Extractor  = None
-    _extracted_nodes : List[Extracted__Node]         = None
-    _extracted_edges : List[Extracted__Edge]         = None
+    _extracted_nodes : list                          = None                                      # Extracted__Node__Record
+    _extracted_edges : list                          = None                                      # Extracted__Edge__Record
 
     @type_safe
     def html__to__html_mgraph(self, html: str) -> Html_MGraph:
@@ -73,10 +75,10 @@ class Graph_Transform__Full_Document(Graph_Transformation__Base):
         self._html_mgraph = html_mgraph
 
         # Use extractor to get combined nodes/edges from all subgraphs
-        self._extractor = Html_MGraph__Data__Extractor(html_mgraph=html_mgraph)
+        self._extractor = Html_MGraph__Data__Extractor(html_mgraph=html_mgraph, records_only=True)
         self._extractor.extract()
-        self._extracted_nodes = self._extractor.nodes
-        self._extracted_edges = self._extractor.edges
+        self._extracted_nodes = self._extractor.node_records
+        self._extracted_edges = self._extractor.edge_records
 
         # Return document MGraph for compatibility with pipeline
         if html_mgraph.document and html_mgraph.document.mgraph:
@@ -126,9 +128,9 @@ class Graph_Transform__Full_Document(Graph_Transformation__Base):
         lines.append('}')
         return '\n'.join(lines)
 
-    def _group_nodes_by_cluster(self) -> Dict[str, List[Extracted__Node]]:
+    def _group_nodes_by_cluster(self) -> Dict[str, List[Extracted__Node__Record]]:
         """Group extracted nodes by their graph_source."""
-        groups: Dict[str, List[Extracted__Node]] = {}
+        groups: Dict[str, List[Extracted__Node__Record]] = {}
         for node in (self._extracted_nodes or []):
             cluster = node.graph_source or 'unknown'
             if cluster not in groups:
@@ -138,7 +140,7 @@ class Graph_Transform__Full_Document(Graph_Transformation__Base):
 
     def _generate_cluster(self, cluster_name: str,
                                 cluster_cfg : Dict,
-                                nodes       : List[Extracted__Node]) -> List[str]:
+                                nodes       : List[Extracted__Node__Record]) -> List[str]:
         """Generate DOT subgraph cluster."""
         lines = []
         lines.append(f'  subgraph cluster_{cluster_name} {{')
@@ -157,7 +159,7 @@ class Graph_Transform__Full_Document(Graph_Transformation__Base):
         lines.append('  }')
         return lines
 
-    def _format_node(self, node: Extracted__Node) -> str:
+    def _format_node(self, node: Extracted__Node__Record) -> str:
         """Format extracted node as DOT node definition."""
         node_id = self._safe_id(node.id)
         label   = self._escape_label(node.label)
@@ -184,7 +186,7 @@ class Graph_Transform__Full_Document(Graph_Transformation__Base):
                 lines.append(f'  {edge_def}')
         return lines
 
-    def _format_edge(self, edge: Extracted__Edge) -> Optional[str]:
+    def _format_edge(self, edge: Extracted__Edge__Record) -> Optional[str]:
         """Format extracted edge as DOT edge definition."""
         source = self._safe_id(edge.source)
         target = self._safe_id(edge.target)
@@ -34,7 +34,7 @@ class Html_Use_Case__n(Graph_Transformation__Base):
     # Phase 3: MGraph → MGraph (transformation)
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def transform_mgraph(self, mgraph: MGraph) -> MGraph:
+    def transform_mgraph(self, mgraph: MGraph) -> MGraph:                           # to change the graph, use a Graph_Transformation__View (the input may be shared)
         return mgraph                                                               # Default: no-op passthrough
 
     # ═══════════════════════════════════════════════════════════════════════════
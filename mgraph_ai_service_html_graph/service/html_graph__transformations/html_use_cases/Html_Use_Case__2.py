@@ -1,7 +1,7 @@
 from typing                                                                                         import Any
 from mgraph_db.mgraph.MGraph                                                                        import MGraph
 from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Base    import Graph_Transformation__Base
-from mgraph_db.mgraph.schemas.Schema__MGraph__Node__Data                                            import Schema__MGraph__Node__Data
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__View    import Graph_Transformation__View
 from mgraph_db.utils.testing.mgraph_test_ids import mgraph_test_ids
 from osbot_utils.utils.Json                                                                         import json_to_str
 
@@ -37,17 +37,20 @@ class Html_Use_Case__2(Graph_Transformation__Base):
 
     def transform_mgraph(self, mgraph: MGraph) -> MGraph:
 
-        for domain_node in mgraph.data().nodes():
-            if domain_node.node_data is None:                               # make sure there is an node_data
-                domain_node.node_data = Schema__MGraph__Node__Data()
-
-            node_json = domain_node.node.data.json()                        # get the json value of the current data
+        view = Graph_Transformation__View(source=mgraph)                    # the parsed graph is shared (cache), so only the view changes
+        for node in view.nodes():
+            node_json = node.json()                                         # get the json value of the current data
             del node_json['node_type']                                      # remove this field which doesn't add much value
+            if node_json.get('node_data') is None:                          # make sure there is an node_data
+                node_json['node_data'] = {}
 
             value = json_to_str(node_json).replace('"', '\'').replace('\n', '\l') + '\l'    # format the json data (using \l so that it shows left aligned)
-            domain_node.node_data.value = f"{value}"                                        # overwrite the value of node_data
+            view.relabel(node.node_id, f"{value}")                                          # overwrite the value of node_data (in the view)
+
+        self.dot_code = self.create_dot_code(view.mgraph())
 
-        self.dot_code = self.create_dot_code(mgraph)
+    def mutates_mgraph(self) -> bool:                                       # changes go to a Graph_Transformation__View
+        return False
 
 
     def create_dot_code(self, mgraph: MGraph) -> str:
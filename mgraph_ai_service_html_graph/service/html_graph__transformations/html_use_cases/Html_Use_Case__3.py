@@ -1,7 +1,7 @@
 from typing                                                                                         import Any
 from mgraph_db.mgraph.MGraph                                                                        import MGraph
 from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Base    import Graph_Transformation__Base
-from mgraph_db.mgraph.schemas.Schema__MGraph__Node__Data                                            import Schema__MGraph__Node__Data
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__View    import Graph_Transformation__View
 
 TEXT_NODE_COLOR    = '#FFF9C4'
 ELEMENT_NODE_COLOR = '#E8F4F8'
@@ -15,23 +15,25 @@ class Html_Use_Case__3(Graph_Transformation__Base):
     dot_code    : str    = None
 
     def transform_mgraph(self, mgraph: MGraph) -> MGraph:
-        # Simplify node labels to just show path or text value
-        for domain_node in mgraph.data().nodes():
-            if domain_node.node_data is None:
-                domain_node.node_data = Schema__MGraph__Node__Data()
-
-            node_path = domain_node.node.data.node_path
+        # Simplify node labels to just show path or text value (in a view: the parsed graph is not changed)
+        view = Graph_Transformation__View(source=mgraph)
+        for node in view.nodes():
+            node_path = node.node_path
             if node_path == 'text':
                 # For text nodes, show the actual text content
-                value = getattr(domain_node.node.data.node_data, 'value', '') or ''
-                domain_node.node_data.value = value[:40] + '...' if len(value) > 40 else value
+                value = getattr(node.node_data, 'value', '') or ''
+                view.relabel(node.node_id, value[:40] + '...' if len(value) > 40 else value)
             else:
                 # For element nodes, show just the path
-                domain_node.node_data.value = str(node_path) if node_path else '[element]'
+                view.relabel(node.node_id, str(node_path) if node_path else '[element]')
 
+        mgraph        = view.mgraph()
         self.dot_code = self.create_dot_code(mgraph)
         return mgraph
 
+    def mutates_mgraph(self) -> bool:                                       # changes go to a Graph_Transformation__View
+        return False
+
     def create_dot_code(self, mgraph: MGraph) -> str:
         with mgraph.export().export_dot() as dot:
             dot.set_graph__splines__polyline()
@@ -6,7 +6,7 @@ from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html__To__Html_
 from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                                      import Timestamp_Collector
 from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Analysis import Timestamp_Collector__Analysis
 
-from osbot_utils.helpers.timestamp_capture.context_managers.timestamp_block import timestamp_block
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation import timestamp_block, html_graph_instrumentation
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Color Configuration
@@ -51,10 +51,11 @@ class Html_Use_Case__Performance_Stats(Graph_Transformation__Base):
         """
         self.collector        = Timestamp_Collector(name="html_mgraph_parsing")
         _timestamp_collector_ = self.collector
-        with self.collector:
-            with timestamp_block("phase.html-to-html_mgraph"):
-                with Html__To__Html_MGraph__Document() as converter:
-                    converter.convert(html)
+        with html_graph_instrumentation.active():                              # instrumentation is off by default
+            with self.collector:
+                with timestamp_block("phase.html-to-html_mgraph"):
+                    with Html__To__Html_MGraph__Document() as converter:
+                        converter.convert(html)
 
         return None  # Signal: skip normal html_mgraph processing
 
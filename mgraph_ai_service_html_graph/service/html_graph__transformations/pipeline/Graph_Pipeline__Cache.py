@@ -0,0 +1,95 @@
+# Graph Pipeline Cache
+#
+# Bounded, in-memory cache of pipeline intermediate results (see
+# Graph_Transform__Pipeline), keyed by (document, prefix of the pipeline):
+#
+#   document  : sha256 of the HTML
+#   prefix    : tuple of the pipeline names up to that point, starting with the
+#               transformation (('body_only',) is the selected graph,
+#               ('body_only', 'strip_inline') that graph after strip_inline)
+#
+# so that 'body_only+strip_inline+collapse_text' after 'body_only+strip_inline'
+# (same document) only runs collapse_text, and any pipeline that starts with
+# body_only skips the parse.
+#
+# Eviction is least-recently-used, based on dict insertion order. The cache is
+# shared by concurrent requests (FastAPI runs the sync routes in a threadpool),
+# so the lookups, reorders and evictions run under a lock.
+#
+# Note: cached MGraphs are shared between requests (and with the graphs built
+#       from them by Graph_Pipeline__Plan), so they must be treated as read-only
+
+from threading                                                    import Lock
+from typing                                                       import Dict, Optional, Tuple
+from mgraph_db.mgraph.MGraph                                      import MGraph
+from osbot_utils.type_safe.Type_Safe                              import Type_Safe
+from osbot_utils.utils.Misc                                       import str_sha256
+
+GRAPH_PIPELINE__CACHE__MAX_ENTRIES = 16                                         # Default number of intermediate graphs kept in memory
+
+
+class Graph_Pipeline__Cache(Type_Safe):                                         # LRU cache of (document, pipeline prefix) -> MGraph
+    max_entries : int  = GRAPH_PIPELINE__CACHE__MAX_ENTRIES
+    entries     : dict                                                          # (document_key, prefix) -> MGraph (oldest first)
+    hits        : int  = 0
+    misses      : int  = 0
+    _lock       : object = None                                                 # Guards entries, hits and misses (threading.Lock)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = Lock()
+
+    def cache_key(self, html: str) -> str:                                      # Deterministic key for an HTML document
+        return str_sha256(str(html))                                            # str(): str_sha256 returns None for str subclasses (Safe_Str__Html)
+
+    def get(self, document_key: str, prefix: Tuple[str, ...]) -> Optional[MGraph]:     # Get cached graph (and mark it as recently used)
+        with self._lock:
+            return self._get(document_key, prefix)
+
+    def _get(self, document_key: str, prefix: Tuple[str, ...]) -> Optional[MGraph]:    # get, with the lock already held
+        mgraph = self.entries.pop((document_key, prefix), None)
+        if mgraph is None:
+            return None
+        self.entries[(document_key, prefix)] = mgraph                           # Re-insert to move it to the most recent position
+        return mgraph
+
+    def longest_prefix(self, document_key : str,                                # Longest cached prefix of the pipeline
+                             pipeline     : Tuple[str, ...],
+                             min_length   : int = 1                             # Shorter prefixes are not usable (e.g. before a step that needs the document)
+                      ) -> Tuple[int, Optional[MGraph]]:                        # (prefix length, graph), (0, None) on a miss
+        with self._lock:
+            for length in range(len(pipeline), max(min_length, 1) - 1, -1):
+                mgraph = self._get(document_key, pipeline[:length])
+                if mgraph is not None:
+                    self.hits += 1
+                    return length, mgraph
+            self.misses += 1
+            return 0, None
+
+    def add(self, document_key: str, prefix: Tuple[str, ...], mgraph: MGraph) -> MGraph:  # Store graph, evicting the least recently used ones
+        with self._lock:
+            self.entries.pop((document_key, prefix), None)
+            self.entries[(document_key, prefix)] = mgraph
+            while len(self.entries) > self.max_entries:
+                oldest_key = next(iter(self.entries))
+                del self.entries[oldest_key]
+        return mgraph
+
+    def clear(self) -> 'Graph_Pipeline__Cache':
+        with self._lock:
+            self.entries.clear()
+            self.hits   = 0
+            self.misses = 0
+        return self
+
+    def size(self) -> int:
+        return len(self.entries)
+
+    def stats(self) -> Dict[str, int]:
+        return { 'size'        : self.size()      ,
+                 'max_entries' : self.max_entries ,
+                 'hits'        : self.hits        ,
+                 'misses'      : self.misses      }
+
+
+graph_pipeline_cache = Graph_Pipeline__Cache()                                  # Global cache instance (shared across requests)
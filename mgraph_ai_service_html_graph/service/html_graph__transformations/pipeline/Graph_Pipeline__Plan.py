@@ -0,0 +1,171 @@
+# Graph Pipeline Plan
+#
+# Fused execution of the filter steps of a pipeline (Graph_Pipeline__Step):
+# instead of one full pass over the graph per step, the steps are compiled into
+# a single per node_path action table (DROP wins over UNWRAP, UNWRAP over KEEP,
+# built lazily, once per distinct node_path), the per_node steps (checked for
+# each element) and the chain of text steps, and the graph is walked once
+# (depth first from the nodes without incoming edges, children in edge_path
+# order).
+#
+# run() does not modify its input: it returns a new MGraph that shares the node
+# and edge schemas that did not change (kept as they are) and only creates new
+# ones for changed text values and re-parented / re-numbered edges. This is what
+# makes it safe to keep the input in Graph_Pipeline__Cache (as long as nobody
+# mutates the output in place).
+#
+# Nodes:
+#   element node  : node without value, tag = last segment of its node_path
+#                   without the sibling index (body.div[1].p -> p, body.div[1]
+#                   -> div); the roots are always kept
+#   text node     : value node with node_path 'text'
+#   other values  : kept as they are
+#
+# Numeric edge paths (the body graph child / text positions) are re-numbered
+# per parent, so that they stay contiguous when nodes are dropped or unwrapped.
+
+from typing                                                                                          import List, Optional
+from mgraph_db.mgraph.MGraph                                                                         import MGraph
+from mgraph_db.mgraph.schemas.Schema__MGraph__Edge                                                   import Schema__MGraph__Edge
+from mgraph_db.mgraph.schemas.Schema__MGraph__Node__Value                                            import Schema__MGraph__Node__Value
+from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id                                    import Node_Id
+from osbot_utils.type_safe.Type_Safe                                                                 import Type_Safe
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Step import Graph_Pipeline__Step, STEP__KEEP, STEP__UNWRAP, STEP__DROP
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Base                       import Html_MGraph__Base
+
+PIPELINE__PATH_TEXT = 'text'                                                    # node_path of text value nodes (Html_MGraph__Body.PATH_TEXT)
+
+
+class Graph_Pipeline__Plan(Type_Safe):                                          # Steps compiled into a single traversal
+    steps       : List[Graph_Pipeline__Step]
+    _actions    : dict                                                          # node_path -> fused action (filled on first use)
+    _path_steps : list                                                          # steps that decide by node_path
+    _node_steps : list                                                          # steps that decide per node
+    _text_steps : list                                                          # steps that change text values
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._path_steps = [step for step in self.steps if not step.per_node]
+        self._node_steps = [step for step in self.steps if     step.per_node]
+        self._text_steps = [step for step in self.steps
+                                 if type(step).text_value is not Graph_Pipeline__Step.text_value]
+
+    def element_action(self, node_path: str) -> str:                            # Fused action of the path steps for a node_path
+        action = self._actions.get(node_path)
+        if action is None:
+            tag    = self.node_tag(node_path)
+            action = self.fuse({step.path_action(node_path, tag) for step in self._path_steps})
+            self._actions[node_path] = action
+        return action
+
+    def node_action(self, node_id: Node_Id, node_path: str) -> str:             # Fused action of all steps for an element node
+        action = self.element_action(node_path)
+        if self._node_steps and action != STEP__DROP:
+            tag     = self.node_tag(node_path)
+            actions = {step.node_action(node_id, node_path, tag) for step in self._node_steps}
+            action  = self.fuse(actions | {action})
+        return action
+
+    @staticmethod
+    def node_tag(node_path: str) -> str:                                        # body.div[1].p -> p, body.div[1] -> div
+        return node_path.rsplit('.', 1)[-1].split('[', 1)[0]
+
+    @staticmethod
+    def fuse(actions: set) -> str:                                              # DROP wins over UNWRAP, UNWRAP over KEEP
+        if STEP__DROP   in actions: return STEP__DROP
+        if STEP__UNWRAP in actions: return STEP__UNWRAP
+        return STEP__KEEP
+
+    def text_value(self, text: str) -> Optional[str]:                           # Text after all text steps (None: dropped)
+        for step in self._text_steps:
+            text = step.text_value(text)
+            if text is None:
+                return None
+        return text
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Execution
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def run(self, mgraph: MGraph) -> MGraph:                                    # Single traversal, returns a new MGraph
+        data       = mgraph.graph.model.data
+        children   = {}                                                         # node_id -> outgoing edges
+        has_parent = set()
+        for edge in data.edges.values():
+            children.setdefault(edge.from_node_id, []).append(edge)
+            has_parent.add(edge.to_node_id)
+        roots  = [node_id for node_id in data.nodes if node_id not in has_parent]
+        target = Html_MGraph__Base(index_on=False).setup__for_restore(str(roots[0]) if roots else None)  # index: built on first use
+
+        visited   = set()
+        positions = {}                                                          # output parent -> next edge position
+        stack     = [(root_id, None, None) for root_id in reversed(roots)]      # (node_id, output parent_id, source edge)
+        while stack:
+            node_id, parent_id, edge = stack.pop()
+            node = data.nodes.get(node_id)
+            if node is None:
+                continue
+            if node_id in visited:                                              # shared node (already in the output): only the edge
+                if node_id in target.mgraph.graph.model.data.nodes:
+                    self.add_edge(target, edge, parent_id, positions)
+                continue
+            visited.add(node_id)
+
+            output_id = node_id
+            if isinstance(node, Schema__MGraph__Node__Value):
+                if str(node.node_path) == PIPELINE__PATH_TEXT and self._text_steps:
+                    value = node.node_data.value
+                    text  = self.text_value(value)
+                    if text is None:
+                        continue
+                    if text != value:
+                        target.restore_node(node_id   = str(node_id)        ,
+                                            node_path = str(node.node_path) ,
+                                            value     = text                ,
+                                            key       = node.node_data.key  ,
+                                            is_value  = True                )
+                    else:
+                        target.add_node_schema(node)
+                else:
+                    target.add_node_schema(node)
+            else:
+                action = self.node_action(node_id, str(node.node_path or '')) if parent_id else STEP__KEEP
+                if action == STEP__DROP:
+                    continue
+                if action == STEP__UNWRAP:
+                    output_id = parent_id                                       # children move up to the output parent
+                else:
+                    target.add_node_schema(node)
+            if parent_id and output_id == node_id:
+                self.add_edge(target, edge, parent_id, positions)
+
+            child_edges = children.get(node_id, [])
+            child_edges.sort(key=self.edge_position)
+            for child_edge in reversed(child_edges):
+                stack.append((child_edge.to_node_id, output_id, child_edge))
+        return target.mgraph
+
+    def add_edge(self, target    : Html_MGraph__Base   ,                        # Source edge, under the (kept) output parent
+                       edge      : Schema__MGraph__Edge,
+                       parent_id : Node_Id             ,
+                       positions : dict
+                ) -> None:
+        edge_path = edge.edge_path
+        if edge_path is not None and str(edge_path).isdigit():
+            position             = positions.get(parent_id, 0)
+            positions[parent_id] = position + 1
+            edge_path            = str(position)
+        if edge.from_node_id == parent_id and str(edge_path) == str(edge.edge_path):
+            target.add_edge_schema(edge)
+            return
+        predicate = edge.edge_label.predicate if edge.edge_label else None
+        target.restore_edge(edge_id      = str(edge.edge_id)                                 ,
+                            from_node_id = str(parent_id)                                    ,
+                            to_node_id   = str(edge.to_node_id)                              ,
+                            predicate    = str(predicate) if predicate else None             ,
+                            edge_path    = str(edge_path) if edge_path is not None else None )
+
+    @staticmethod
+    def edge_position(edge: Schema__MGraph__Edge) -> int:                       # Sort key: numeric edge_path (others first, in edge order)
+        edge_path = str(edge.edge_path) if edge.edge_path is not None else ''
+        return int(edge_path) if edge_path.isdigit() else -1
@@ -0,0 +1,52 @@
+# Graph Pipeline Step
+#
+# Base class for the graph level filters that can be chained after a
+# transformation in a pipeline spec (see Graph_Transform__Pipeline).
+#
+# A step does not walk the graph itself, it only answers per node questions,
+# so that Graph_Pipeline__Plan can run every step of a pipeline in the same
+# traversal:
+#
+#   element_action(tag)             : what to do with an element node (by tag)
+#                                     STEP__KEEP   - keep it
+#                                     STEP__UNWRAP - drop the node, keep its children
+#                                                    (re-attached to the nearest kept ancestor)
+#                                     STEP__DROP   - drop the node and its whole subtree
+#   path_action(node_path, tag)     : same, by node_path (default: element_action);
+#                                     called once per distinct node_path
+#   node_action(node_id, path, tag) : same, per node (only called for per_node steps,
+#                                     like attribute filters)
+#   text_value(text)                : new value for a text node (None drops it)
+#
+# Steps that need the parsed document (needs_document, e.g. to look up
+# attributes) get it via bind(html_mgraph) before the traversal.
+
+from typing                                                                     import Optional
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id               import Node_Id
+
+STEP__KEEP   = 'keep'
+STEP__UNWRAP = 'unwrap'
+STEP__DROP   = 'drop'
+
+
+class Graph_Pipeline__Step(Type_Safe):                                          # Graph filter step (default: keeps everything)
+    name           : str  = 'step'                                              # Step identifier (as used in the pipeline spec)
+    description    : str  = 'Keeps all nodes'
+    per_node       : bool = False                                               # node_action is called for every element node
+    needs_document : bool = False                                               # bind(html_mgraph) before the traversal
+
+    def bind(self, html_mgraph) -> 'Graph_Pipeline__Step':                      # Per document setup (for needs_document steps)
+        return self
+
+    def element_action(self, tag: str) -> str:                                  # STEP__KEEP / STEP__UNWRAP / STEP__DROP
+        return STEP__KEEP
+
+    def path_action(self, node_path: str, tag: str) -> str:
+        return self.element_action(tag)
+
+    def node_action(self, node_id: Node_Id, node_path: str, tag: str) -> str:
+        return self.path_action(node_path, tag)
+
+    def text_value(self, text: str) -> Optional[str]:                           # New text (None: drop the text node)
+        return text
@@ -0,0 +1,178 @@
+# Graph Transform Pipeline
+#
+# Composes a transformation and graph filter steps from a pipeline spec, so
+# that combinations like "body only, without inline elements, with collapsed
+# text" do not need a new transformation class:
+#
+#   body_only+strip_inline+collapse_text
+#
+# The first name can be a registered transformation (it parses, selects the
+# graph, configures the engines and post-processes the output); when it is a
+# step, the pipeline starts from 'default'. The other names are the
+# PIPELINE__STEPS, which are compiled into one Graph_Pipeline__Plan (a single
+# traversal for all of them, instead of one pass per step). The spec is
+# accepted anywhere a transformation name is (the registry resolves names that
+# contain PIPELINE__SEPARATOR to this class), e.g.
+#
+#   POST /graph/from/html/to/dot/body_only+strip_inline+collapse_text
+#
+# Phases:
+#   1 : the transformation's parse, skipped when a prefix of the pipeline is
+#       in graph_pipeline_cache for this document
+#   2 : the transformation's graph selection (or the cached prefix)
+#   3 : the remaining steps (fused), then the transformation's own
+#       transform_mgraph (so use cases see the filtered graph)
+#   4,5 : delegated to the transformation
+#
+# Each step can appear once (so a spec has at most PIPELINE__MAX_STEPS steps),
+# and the metrics are labeled with the transformation's name only
+# (metrics_name): the spec and the filter expression come from the request, and
+# must not create new metric series.
+#
+# A filter expression (Graph_Pipeline__Step__Filter, the 'filter' request
+# parameter) is added as the last step. Filters with attr / class matchers need
+# the parsed document, so for those only a cached prefix that already includes
+# the filter skips the parse.
+#
+# Only transformations that keep no per-request state from phases 1-2 (their
+# fields are unchanged after the selection) and whose transform_mgraph does not
+# edit the graph in place (mutates_mgraph(), see Graph_Transformation__View) are
+# cached; the others run every phase on every request, as they would on their
+# own.
+
+from typing                                                                                                     import Any, Tuple
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Base                import Graph_Transformation__Base
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Registry            import transformation_registry, TRANSFORMATION__DEFAULT, PIPELINE__SEPARATOR
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Cache            import Graph_Pipeline__Cache, graph_pipeline_cache
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Plan             import Graph_Pipeline__Plan
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Collapse_Text import Graph_Pipeline__Step__Collapse_Text
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Filter        import Graph_Pipeline__Step__Filter
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Strip_Inline  import Graph_Pipeline__Step__Strip_Inline
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Strip_Scripts import Graph_Pipeline__Step__Strip_Scripts
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Strip_Text    import Graph_Pipeline__Step__Strip_Text
+
+PIPELINE__STEPS = { 'collapse_text' : Graph_Pipeline__Step__Collapse_Text ,     # step name -> class
+                    'strip_inline'  : Graph_Pipeline__Step__Strip_Inline  ,
+                    'strip_scripts' : Graph_Pipeline__Step__Strip_Scripts ,
+                    'strip_text'    : Graph_Pipeline__Step__Strip_Text    }
+PIPELINE__MAX_STEPS = len(PIPELINE__STEPS)                                      # each step at most once
+
+
+class Graph_Transform__Pipeline(Graph_Transformation__Base):                    # Transformation + fused graph filter steps
+    name            : str                        = 'pipeline'                   # the canonical spec, once setup() ran
+    label           : str                        = 'Pipeline'
+    description     : str                        = 'Transformation followed by graph filter steps'
+    transformation  : Graph_Transformation__Base = None                         # First item of the spec
+    steps           : list                                                      # Graph_Pipeline__Step instances, in spec order
+    cache           : Graph_Pipeline__Cache      = None                         # default: graph_pipeline_cache
+    cache_on        : bool                       = True
+    _defaults       : dict                                                      # transformation.__dict__ before phase 1
+    _document_key   : str                        = ''
+    _prefix_length  : int                        = 0                            # Pipeline items already applied to the phase 2 graph
+    _prefix_mgraph  : object                     = None                         # Cached prefix graph (phase 1 hit)
+
+    def setup(self, spec            : str,                                      # Parse the spec (ValueError on unknown / misplaced names)
+                    filter_expression : str = ''                                # Graph_Filter__Parser expression (added as the last step)
+             ) -> 'Graph_Transform__Pipeline':
+        names = [name.strip() for name in spec.split(PIPELINE__SEPARATOR) if name.strip()]
+        if not names:
+            raise ValueError(f"Empty pipeline spec: '{spec}'")
+        if names[0] in PIPELINE__STEPS:
+            names.insert(0, TRANSFORMATION__DEFAULT)
+        transformation_class = transformation_registry.get_class(names[0])
+        if transformation_class is None:
+            raise ValueError(f"Unknown transformation in pipeline '{spec}': {names[0]}")
+        if len(names) - 1 > PIPELINE__MAX_STEPS:
+            raise ValueError(f"Too many steps in pipeline '{spec}' (max: {PIPELINE__MAX_STEPS})")
+        for index, name in enumerate(names[1:], start=1):
+            if name not in PIPELINE__STEPS:
+                raise ValueError(f"Unknown pipeline step in '{spec}': {name} (steps: {', '.join(PIPELINE__STEPS)})")
+            if name in names[1:index]:
+                raise ValueError(f"Repeated pipeline step in '{spec}': {name}")
+
+        self.transformation = transformation_class()
+        self.steps          = [PIPELINE__STEPS[name]() for name in names[1:]]
+        if filter_expression.strip():
+            self.steps.append(Graph_Pipeline__Step__Filter(expression=filter_expression))
+        self.name           = PIPELINE__SEPARATOR.join(self.pipeline())
+        self.label          = ' + '.join([self.transformation.label] + [step.name for step in self.steps])
+        self.description    = '; '.join([self.transformation.description] + [step.description for step in self.steps])
+        self.cache          = self.cache or graph_pipeline_cache
+        self.cache_on       = self.cache_on and not self.transformation.mutates_mgraph()
+        self._defaults      = dict(self.transformation.__dict__)
+        return self
+
+    def pipeline(self) -> Tuple[str, ...]:                                      # The cache prefixes are slices of this
+        return (self.transformation.name,) + tuple(step.name for step in self.steps)
+
+    def metrics_name(self) -> str:                                              # the transformation only (the spec and filter are request text)
+        return self.transformation.name
+
+    def min_prefix_length(self) -> int:                                         # Shortest usable cached prefix (must include the needs_document steps)
+        lengths = [index + 2 for index, step in enumerate(self.steps) if step.needs_document]
+        return max(lengths, default=1)
+
+    def stateless(self) -> bool:                                                # transformation kept nothing from phases 1-2
+        state = self.transformation.__dict__
+        return state.keys() == self._defaults.keys() and all(state[key] is value for key, value in self._defaults.items())
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Phases 1-3
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def html__to__html_mgraph(self, html: str):                                 # Parse (None when a cached prefix is used)
+        if self.cache_on:
+            self._document_key = self.cache.cache_key(html)
+            self._prefix_length, self._prefix_mgraph = self.cache.longest_prefix(self._document_key, self.pipeline(), self.min_prefix_length())
+            if self._prefix_mgraph is not None:
+                return None
+        return self.transformation.html__to__html_mgraph(html)
+
+    def html_mgraph__to__mgraph(self, html_mgraph):                             # Select (or the cached prefix)
+        if self._prefix_mgraph is not None:
+            return self._prefix_mgraph
+        mgraph              = self.transformation.html_mgraph__to__mgraph(html_mgraph)
+        self._prefix_length = 1
+        for step in self.steps:
+            if step.needs_document:
+                step.bind(html_mgraph)
+        self.cache_on       = self.cache_on and mgraph is not None and self.stateless()
+        if self.cache_on:
+            self.cache.add(self._document_key, self.pipeline()[:1], mgraph)
+        return mgraph
+
+    def transform_mgraph(self, mgraph):                                         # Remaining steps in one traversal, then the transformation's own
+        steps = self.steps[self._prefix_length - 1:]
+        if steps and mgraph is not None:
+            mgraph = Graph_Pipeline__Plan(steps=steps).run(mgraph)
+            if self.cache_on:
+                self.cache.add(self._document_key, self.pipeline(), mgraph)
+        return self.transformation.transform_mgraph(mgraph)
+
+    def mutates_mgraph(self) -> bool:                                           # the steps build new graphs (Graph_Pipeline__Plan)
+        return self.transformation.mutates_mgraph()
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Phases 4-5 (delegated)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def configure_dot(self, config):
+        return self.transformation.configure_dot(config)
+
+    def configure_d3(self, config):
+        return self.transformation.configure_d3(config)
+
+    def configure_cytoscape(self, config):
+        return self.transformation.configure_cytoscape(config)
+
+    def configure_visjs(self, config):
+        return self.transformation.configure_visjs(config)
+
+    def configure_mermaid(self, config):
+        return self.transformation.configure_mermaid(config)
+
+    def configure_tree(self, config):
+        return self.transformation.configure_tree(config)
+
+    def transform_export(self, output: Any) -> Any:
+        return self.transformation.transform_export(output)
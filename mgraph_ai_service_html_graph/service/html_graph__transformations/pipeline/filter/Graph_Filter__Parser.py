@@ -0,0 +1,86 @@
+# Graph Filter Parser
+#
+# Parses a graph filter expression into Graph_Filter__Rule objects:
+#
+#   expression : rule ( ';' rule )*
+#   rule       : action matcher*             (no matchers: every element)
+#   action     : keep | unwrap | drop        (see Graph_Pipeline__Step)
+#   matcher    : tag=div,span                tag is one of
+#                category=text,list          tag is in one of the Html_MGraph__Render__Colors.TAG_CATEGORIES
+#                path=body.div*.p,*.nav*     node_path matches one of the (fnmatch) patterns
+#                                            (node_paths have sibling indexes: body.div[1].p)
+#                depth>2 depth>=2 depth<4    depth of the node_path (body: 0, body.div: 1, ...)
+#                depth<=4 depth=3
+#                attr=id,role:main           has all the attributes (with that value)
+#                class=nav,open              has all the classes (tokens of the class attribute)
+#
+# e.g.  'drop tag=script,style; unwrap category=text; drop depth>6'
+#
+# The rules of an expression are checked in order and the first one whose
+# matchers all match decides the action; an element that no rule matches is
+# kept. So 'keep tag=a; unwrap category=text' unwraps the text elements
+# (p, h1, b, ...) except the links.
+#
+# Errors (unknown action / matcher / category, bad depth) raise ValueError.
+
+import re
+from typing                                                                                              import List
+from osbot_utils.type_safe.Type_Safe                                                                     import Type_Safe
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Step      import STEP__KEEP, STEP__UNWRAP, STEP__DROP
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.filter.Graph_Filter__Rule import Graph_Filter__Rule
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors                        import Html_MGraph__Render__Colors
+
+FILTER__RULE_SEPARATOR = ';'
+FILTER__ACTIONS        = (STEP__KEEP, STEP__UNWRAP, STEP__DROP)
+FILTER__DEPTH          = re.compile(r'^depth(>=|<=|>|<|=)(\d+)$')
+
+
+class Graph_Filter__Parser(Type_Safe):                                          # expression -> rules
+
+    def parse(self, expression: str) -> List[Graph_Filter__Rule]:
+        rules = []
+        for rule_text in expression.split(FILTER__RULE_SEPARATOR):
+            if rule_text.strip():
+                rules.append(self.parse_rule(rule_text))
+        if not rules:
+            raise ValueError(f"Empty filter expression: '{expression}'")
+        return rules
+
+    def parse_rule(self, rule_text: str) -> Graph_Filter__Rule:
+        action, *matchers = rule_text.split()
+        if action not in FILTER__ACTIONS:
+            raise ValueError(f"Unknown filter action '{action}' in '{rule_text.strip()}' (actions: {', '.join(FILTER__ACTIONS)})")
+        rule = Graph_Filter__Rule(action=action)
+        for matcher in matchers:
+            self.parse_matcher(rule, matcher)
+        return rule
+
+    def parse_matcher(self, rule: Graph_Filter__Rule, matcher: str) -> None:
+        depth = FILTER__DEPTH.match(matcher)
+        if depth:
+            operator, value = depth.group(1), int(depth.group(2))
+            if operator in ('>', '>=', '='): rule.depth_min = value + 1 if operator == '>' else value
+            if operator in ('<', '<=', '='): rule.depth_max = value - 1 if operator == '<' else value
+            return
+        name, separator, values = matcher.partition('=')
+        if not separator or not values:
+            raise ValueError(f"Invalid filter matcher: '{matcher}'")
+        values = [value for value in values.split(',') if value]
+        if name == 'tag':
+            rule.tags.update(value.lower() for value in values)
+        elif name == 'category':
+            for category in values:
+                tags = Html_MGraph__Render__Colors.TAG_CATEGORIES.get(category)
+                if tags is None:
+                    raise ValueError(f"Unknown tag category '{category}' (categories: {', '.join(Html_MGraph__Render__Colors.TAG_CATEGORIES)})")
+                rule.category_tags.update(tags)
+        elif name == 'path':
+            rule.paths.extend(values)
+        elif name == 'attr':
+            for value in values:
+                attr_name, separator, attr_value = value.partition(':')
+                rule.attrs.append((attr_name, attr_value if separator else None))
+        elif name == 'class':
+            rule.classes.extend(values)
+        else:
+            raise ValueError(f"Unknown filter matcher '{name}' in '{matcher}' (matchers: tag, category, path, depth, attr, class)")
@@ -0,0 +1,48 @@
+# Graph Filter Rule
+#
+# One compiled rule of a graph filter expression (see Graph_Filter__Parser).
+
+from fnmatch                                                                    import fnmatchcase
+from typing                                                                     import List, Optional, Set
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+
+class Graph_Filter__Rule(Type_Safe):                                            # action + matchers (all must match)
+    action        : str                                                         # STEP__KEEP / STEP__UNWRAP / STEP__DROP
+    tags          : Set[str]                                                    # tag=     (empty: any tag)
+    category_tags : Set[str]                                                    # category= (the tags of those categories)
+    paths         : List[str]                                                   # path=    (fnmatch patterns, any of them)
+    depth_min     : int           = 0                                           # depth>, depth>=, depth=
+    depth_max     : Optional[int] = None                                        # depth<, depth<=, depth=
+    attrs         : list                                                        # attr=    [(name, value or None)]
+    classes       : List[str]                                                   # class=   (class token)
+    _node_ids     : Optional[set] = None                                        # elements matching attrs / classes (set by bind)
+
+    def uses_attributes(self) -> bool:
+        return bool(self.attrs or self.classes)
+
+    def matches_path(self, node_path: str, tag: str) -> bool:                   # tag / category / path / depth matchers
+        if self.tags          and tag not in self.tags         : return False
+        if self.category_tags and tag not in self.category_tags: return False
+        if self.paths         and not any(fnmatchcase(node_path, pattern) for pattern in self.paths):
+            return False
+        depth = node_path.count('.')                                            # body: 0, body.div: 1, ...
+        if depth < self.depth_min:
+            return False
+        return self.depth_max is None or depth <= self.depth_max
+
+    def bind(self, attrs_graph) -> 'Graph_Filter__Rule':                        # Resolve attr / class matchers to node id sets (one scan each)
+        node_ids = None
+        for attr_name, attr_value in self.attrs:
+            matches  = set(attrs_graph.get_elements_with_attribute(attr_name, attr_value))
+            node_ids = matches if node_ids is None else node_ids & matches
+        for class_name in self.classes:
+            matches  = set(attrs_graph.get_elements_with_class(class_name))
+            node_ids = matches if node_ids is None else node_ids & matches
+        self._node_ids = node_ids
+        return self
+
+    def matches_node(self, node_id) -> bool:                                    # attr / class matchers (no match before bind)
+        if not self.uses_attributes():
+            return True
+        return self._node_ids is not None and node_id in self._node_ids
@@ -0,0 +1,10 @@
+from typing                                                                                          import Optional
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Step import Graph_Pipeline__Step
+
+
+class Graph_Pipeline__Step__Collapse_Text(Graph_Pipeline__Step):                # Collapses whitespace in text nodes
+    name        : str = 'collapse_text'
+    description : str = 'Collapses whitespace in text nodes, removes whitespace-only ones'
+
+    def text_value(self, text: str) -> Optional[str]:
+        return ' '.join(text.split()) or None
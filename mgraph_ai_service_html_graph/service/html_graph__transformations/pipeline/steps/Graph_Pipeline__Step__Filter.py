@@ -0,0 +1,75 @@
+# Graph Pipeline Step - Filter
+#
+# Declarative filter step: a Graph_Filter__Parser expression compiled into
+# rules, so that ad-hoc filters do not need a step (or transformation) class:
+#
+#   drop tag=script,style; unwrap category=text; drop depth>6
+#
+# The tag / category / path / depth matchers only depend on the node_path, so
+# they are evaluated once per distinct node_path (Graph_Pipeline__Plan caches
+# the action). The attr / class matchers are resolved to sets of element ids
+# in bind() (one scan of the interned attribute columns per matcher), which
+# makes the step per_node and needs_document.
+#
+# Used in a pipeline (the 'filter' request parameter, see
+# Graph_Transform__Pipeline) or directly from a transformation's
+# transform_mgraph:
+#
+#   return Graph_Pipeline__Step__Filter(expression='drop depth>4').apply(mgraph)
+
+from typing                                                                                               import List
+from mgraph_db.mgraph.MGraph                                                                              import MGraph
+from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id                                         import Node_Id
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Plan       import Graph_Pipeline__Plan
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Step       import Graph_Pipeline__Step, STEP__KEEP
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.filter.Graph_Filter__Parser import Graph_Filter__Parser
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.filter.Graph_Filter__Rule   import Graph_Filter__Rule
+
+
+class Graph_Pipeline__Step__Filter(Graph_Pipeline__Step):                       # Rules from a filter expression (first match wins)
+    name        : str                      = 'filter'                           # filter(<expression>), once parsed (a cache key, never a metrics label: see metrics_name)
+    description : str                      = 'Keeps, unwraps or drops the elements matched by a filter expression'
+    expression  : str
+    rules       : List[Graph_Filter__Rule]
+    _path_rules : dict                                                          # node_path -> rules whose path matchers match
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.expression and not self.rules:
+            self.rules = Graph_Filter__Parser().parse(self.expression)          # ValueError on invalid expressions
+        if self.expression:
+            self.expression = '; '.join(rule.strip() for rule in self.expression.split(';') if rule.strip())
+            self.name       = f'filter({self.expression})'
+        self.per_node       = any(rule.uses_attributes() for rule in self.rules)
+        self.needs_document = self.per_node
+
+    def bind(self, html_mgraph) -> 'Graph_Pipeline__Step__Filter':              # Resolve the attr / class matchers for this document
+        if self.needs_document:
+            for rule in self.rules:
+                if rule.uses_attributes():
+                    rule.bind(html_mgraph.attrs_graph)
+        return self
+
+    def matching_rules(self, node_path: str, tag: str) -> list:                 # Rules whose path matchers match (cached per node_path)
+        rules = self._path_rules.get(node_path)
+        if rules is None:
+            rules = [rule for rule in self.rules if rule.matches_path(node_path, tag)]
+            self._path_rules[node_path] = rules
+        return rules
+
+    def path_action(self, node_path: str, tag: str) -> str:
+        rules = self.matching_rules(node_path, tag)
+        return rules[0].action if rules else STEP__KEEP
+
+    def node_action(self, node_id: Node_Id, node_path: str, tag: str) -> str:
+        for rule in self.matching_rules(node_path, tag):
+            if rule.matches_node(node_id):
+                return rule.action
+        return STEP__KEEP
+
+    def apply(self, mgraph: MGraph, html_mgraph=None) -> MGraph:                # Filter an MGraph (returns a new one, see Graph_Pipeline__Plan)
+        if self.needs_document:
+            if html_mgraph is None:
+                raise ValueError(f"Filter '{self.expression}' uses attr / class matchers: apply() needs the html_mgraph")
+            self.bind(html_mgraph)
+        return Graph_Pipeline__Plan(steps=[self]).run(mgraph)
@@ -0,0 +1,20 @@
+from typing                                                                                          import Set
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Step import Graph_Pipeline__Step, STEP__KEEP, STEP__UNWRAP
+
+INLINE_TAGS = {'a'   , 'abbr', 'b'  , 'bdi' , 'bdo'  , 'cite', 'code'  , 'data', 'del', 'dfn' ,
+               'em'  , 'font', 'i'  , 'ins' , 'kbd'  , 'mark', 'q'     , 's'   , 'samp', 'small',
+               'span', 'sub' , 'sup', 'time', 'u'    , 'var' , 'strong'}
+
+
+class Graph_Pipeline__Step__Strip_Inline(Graph_Pipeline__Step):                 # Unwraps inline elements (their text stays with the parent)
+    name        : str      = 'strip_inline'
+    description : str      = 'Removes inline elements (span, b, a, ...), keeping their children'
+    tags        : Set[str]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.tags:
+            self.tags = set(INLINE_TAGS)
+
+    def element_action(self, tag: str) -> str:
+        return STEP__UNWRAP if tag in self.tags else STEP__KEEP
@@ -0,0 +1,18 @@
+from typing                                                                                          import Set
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Step import Graph_Pipeline__Step, STEP__KEEP, STEP__DROP
+
+SCRIPT_TAGS = {'script', 'style', 'noscript', 'template'}
+
+
+class Graph_Pipeline__Step__Strip_Scripts(Graph_Pipeline__Step):                # Drops script / style elements (and their content)
+    name        : str      = 'strip_scripts'
+    description : str      = 'Removes script, style, noscript and template elements'
+    tags        : Set[str]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.tags:
+            self.tags = set(SCRIPT_TAGS)
+
+    def element_action(self, tag: str) -> str:
+        return STEP__DROP if tag in self.tags else STEP__KEEP
@@ -0,0 +1,10 @@
+from typing                                                                                          import Optional
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Step import Graph_Pipeline__Step
+
+
+class Graph_Pipeline__Step__Strip_Text(Graph_Pipeline__Step):                   # Structure only
+    name        : str = 'strip_text'
+    description : str = 'Removes all text nodes'
+
+    def text_value(self, text: str) -> Optional[str]:
+        return None
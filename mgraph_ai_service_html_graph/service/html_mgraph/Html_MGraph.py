@@ -1,4 +1,4 @@
-from typing                                                                                            import Dict, Any, List, Optional
+from typing                                                                                            import Dict, Any, List, Optional, Union
 from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Document                     import Html_MGraph__Document
 from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html__To__Html_MGraph__Document       import Html__To__Html_MGraph__Document
 from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html_MGraph__Document__To__Html       import Html_MGraph__Document__To__Html
@@ -7,6 +7,7 @@ from mgraph_ai_service_html_graph.schemas.html.Schema__Html_MGraph
 from mgraph_ai_service_html_graph.schemas.html.Schema__Html_MGraph                                     import Schema__Html_MGraph__Element_Info
 from osbot_utils.helpers.html.transformers.Html_Dict__To__Html                                         import Html_Dict__To__Html
 from osbot_utils.type_safe.Type_Safe                                                                   import Type_Safe
+from osbot_utils.utils.Files                                                                           import file_create_from_bytes
 from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id                                      import Node_Id
 
 
@@ -54,6 +55,25 @@ class Html_MGraph(Type_Safe):
         document = Html__To__Html_MGraph__Document().convert(html)
         return cls(document=document)
 
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Html_MGraph':                  # Restore from to_json() output (no HTML re-parse)
+        document = Html_MGraph__Document().restore_from_json(data)
+        return cls(document=document)
+
+    @classmethod
+    def from_snapshot(cls, source: Union[str, bytes]) -> 'Html_MGraph':         # Load a read-only (frozen) document from a binary snapshot (file path is memory-mapped)
+        from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph__Snapshot import html_mgraph__snapshot__reader
+        with html_mgraph__snapshot__reader(source) as reader:
+            return cls(document=reader.load_document())
+
+    def freeze(self) -> 'Html_MGraph':                                          # Read-only from now on (safe to share, see Html_MGraph__Base.freeze)
+        self.document.freeze()
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return self.document.frozen
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Export Methods
     # ═══════════════════════════════════════════════════════════════════════════
@@ -67,6 +87,13 @@ class Html_MGraph(Type_Safe):
     def to_json(self) -> Dict[str, Any]:                                        # Export document structure as JSON
         return self.document.to_json()
 
+    def to_snapshot(self, path: str = None) -> bytes:                           # Export to binary snapshot (and save to path, if provided)
+        from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph__Snapshot import html_mgraph__snapshot__write
+        snapshot = html_mgraph__snapshot__write(self.document)
+        if path:
+            file_create_from_bytes(path, snapshot)
+        return snapshot
+
     def to_dot(self, graph: str = 'all') -> str:                                  # Convert to DOT format for visualization
         from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html_MGraph__To__Dot import Html_MGraph__To__Dot
         converter = Html_MGraph__To__Dot()
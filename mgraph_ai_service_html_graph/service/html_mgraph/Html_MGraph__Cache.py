@@ -0,0 +1,86 @@
+# Html_MGraph Cache
+#
+# Bounded, in-memory parse cache for Html_MGraph documents.
+# Documents are keyed by the sha256 of their HTML, so that a client that has
+# already sent a document once can refer to it by key in follow-up requests
+# (for example when lazily expanding sub-trees in the render UI).
+#
+# Eviction is least-recently-used, based on dict insertion order. The cache is
+# shared by concurrent requests, so the reorder / evict steps (and the hit /
+# miss counters) run under a lock; parsing on a miss does not (two requests
+# for the same new document may both parse it, the last one is kept).
+#
+# Note: cached Html_MGraph objects are shared between requests, so get_or_parse
+#       freezes them (read-only, writes raise ValueError). Transformations that
+#       mutate graphs in place should keep using a freshly parsed Html_MGraph
+
+from threading                                                    import Lock
+from typing                                                       import Dict, Optional, Tuple
+from osbot_utils.type_safe.Type_Safe                              import Type_Safe
+from osbot_utils.utils.Misc                                       import str_sha256
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph import Html_MGraph
+
+HTML_MGRAPH__CACHE__MAX_ENTRIES = 32                                            # Default number of parsed documents kept in memory
+
+
+class Html_MGraph__Cache(Type_Safe):                                            # LRU cache of parsed Html_MGraph documents
+    max_entries : int                    = HTML_MGRAPH__CACHE__MAX_ENTRIES
+    entries     : Dict[str, Html_MGraph]                                        # cache_key -> Html_MGraph (oldest first)
+    hits        : int                    = 0
+    misses      : int                    = 0
+    _lock       : object                 = None                                 # Guards entries, hits and misses (threading.Lock)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = Lock()
+
+    def cache_key(self, html: str) -> str:                                      # Deterministic key for an HTML document
+        return str_sha256(str(html))                                            # str(): str_sha256 returns None for str subclasses (Safe_Str__Html)
+
+    def get(self, cache_key: str) -> Optional[Html_MGraph]:                     # Get cached document (and mark it as recently used)
+        with self._lock:
+            html_mgraph = self.entries.pop(cache_key, None)
+            if html_mgraph is None:
+                self.misses += 1
+                return None
+            self.entries[cache_key] = html_mgraph                               # Re-insert to move it to the most recent position
+            self.hits += 1
+            return html_mgraph
+
+    def add(self, cache_key: str, html_mgraph: Html_MGraph) -> Html_MGraph:     # Store document, evicting the least recently used ones
+        with self._lock:
+            self.entries.pop(cache_key, None)
+            self.entries[cache_key] = html_mgraph
+            while len(self.entries) > self.max_entries:
+                oldest_key = next(iter(self.entries))
+                del self.entries[oldest_key]
+        return html_mgraph
+
+    def get_or_parse(self, html: str) -> Tuple[str, Html_MGraph]:               # Get document from cache, parsing it on a miss
+        cache_key   = self.cache_key(html)
+        html_mgraph = self.get(cache_key)
+        if html_mgraph is None:
+            html_mgraph = self.add(cache_key, Html_MGraph.from_html(html).freeze())
+        return cache_key, html_mgraph
+
+    def contains(self, cache_key: str) -> bool:
+        return cache_key in self.entries
+
+    def clear(self) -> 'Html_MGraph__Cache':
+        with self._lock:
+            self.entries.clear()
+            self.hits   = 0
+            self.misses = 0
+        return self
+
+    def size(self) -> int:
+        return len(self.entries)
+
+    def stats(self) -> Dict[str, int]:
+        return { 'size'        : self.size()      ,
+                 'max_entries' : self.max_entries ,
+                 'hits'        : self.hits        ,
+                 'misses'      : self.misses      }
+
+
+html_mgraph_cache = Html_MGraph__Cache()                                        # Global cache instance (shared across routes)
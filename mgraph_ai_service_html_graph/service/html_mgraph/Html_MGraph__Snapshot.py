@@ -0,0 +1,305 @@
+# Html_MGraph Snapshot
+#
+# Compact binary snapshot of an Html_MGraph__Document (all six graphs), written in
+# a single pass and read back via mmap, so large documents can be reloaded without
+# re-parsing the HTML and individual records can be read without materializing
+# the whole graph.
+#
+# load_document() returns a read-only (frozen) document served from the decoded
+# records: the strings and records are decoded in one pass each (struct.iter_unpack),
+# the frozen read maps and the attributes columnar store are built from them, and
+# no node / edge schema is created until something asks for a graph's .mgraph
+# (see Html_MGraph__Base.restore_records).
+#
+# Layout (little-endian):
+#
+#   header        : magic 'HMGS' | u16 version | u16 graph_count | u32 string_count | u32 string_data_size
+#   string index  : u32 offset * (string_count + 1)         (string i = data[offset[i-1]:offset[i]])
+#   string data   : utf-8 bytes of all unique strings
+#   per graph     : u32 name | u32 root_id | u32 node_count | u32 edge_count
+#                   node records : u32 node_id | u32 node_path | u32 value | u32 key | u8 flags | 3 pad
+#                   edge records : u32 edge_id | u32 from_node_id | u32 to_node_id | u32 predicate | u32 edge_path
+#   attributes    : u32 entry_count
+#                   entry records : u32 element_id | u32 position | u32 name | u32 value   (the attributes graph's columnar store)
+#
+# String reference 0 means None; strings are deduplicated (ids are shared between
+# the body/head and attributes graphs, and tag/attribute values repeat a lot).
+
+import mmap
+import struct
+from typing                                                                         import Any, Dict, Iterator, List, Optional, Tuple, Union
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Edge_Id                   import Edge_Id
+from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id                   import Node_Id
+from mgraph_db.mgraph.schemas.Schema__MGraph__Node__Value                           import Schema__MGraph__Node__Value
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Base      import Html_MGraph__Base
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Document  import Html_MGraph__Document
+
+SNAPSHOT__MAGIC          = b'HMGS'
+SNAPSHOT__VERSION        = 2                                                    # 2: attributes columnar store
+SNAPSHOT__HEADER         = struct.Struct('<4sHHII')
+SNAPSHOT__OFFSET         = struct.Struct('<I')
+SNAPSHOT__GRAPH_HEADER   = struct.Struct('<IIII')
+SNAPSHOT__NODE_RECORD    = struct.Struct('<IIIIBxxx')                           # 20 bytes
+SNAPSHOT__EDGE_RECORD    = struct.Struct('<IIIII')                              # 20 bytes
+SNAPSHOT__COUNT          = struct.Struct('<I')
+SNAPSHOT__COLUMN_RECORD  = struct.Struct('<IIII')                               # 16 bytes
+SNAPSHOT__FLAG__VALUE    = 0x01                                                 # Node is a value node (has value / key)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Writer
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Html_MGraph__Snapshot__Writer(Type_Safe):                                 # Html_MGraph__Document -> snapshot bytes
+    strings       : Dict[str, int]                                              # string -> index (1-based, 0 = None)
+    string_values : List[str]
+
+    def write(self, document: Html_MGraph__Document) -> bytes:                  # Single pass over the raw node/edge schemas
+        self.strings       = {}
+        self.string_values = []
+        sections           = []
+        for name, graph in document.graphs().items():
+            sections.append(self.graph_section(name, graph))
+        columns            = self.columns_section(document)
+
+        string_data = bytearray()
+        offsets     = [0]
+        for value in self.string_values:
+            string_data += value.encode('utf-8')
+            offsets.append(len(string_data))
+
+        output  = bytearray(SNAPSHOT__HEADER.pack(SNAPSHOT__MAGIC, SNAPSHOT__VERSION, len(sections), len(self.string_values), len(string_data)))
+        output += struct.pack(f'<{len(offsets)}I', *offsets)
+        output += string_data
+        for section in sections:
+            output += section
+        output += columns
+        return bytes(output)
+
+    def graph_section(self, name: str, graph: Html_MGraph__Base) -> bytes:      # Graph header + node records + edge records
+        string_ref   = self.string_ref
+        node_schemas = graph.node_schemas()
+        edge_schemas = graph.edge_schemas()
+        section      = bytearray(SNAPSHOT__GRAPH_HEADER.pack(string_ref(name), string_ref(graph.root_id), len(node_schemas), len(edge_schemas)))
+
+        for node in node_schemas:
+            if isinstance(node, Schema__MGraph__Node__Value):
+                value = node.node_data.value
+                key   = node.node_data.key
+                flags = SNAPSHOT__FLAG__VALUE
+            else:
+                value = None
+                key   = None
+                flags = 0
+            section += SNAPSHOT__NODE_RECORD.pack(string_ref(node.node_id), string_ref(node.node_path), string_ref(value), string_ref(key), flags)
+
+        for edge in edge_schemas:
+            predicate = edge.edge_label.predicate if edge.edge_label else None
+            section  += SNAPSHOT__EDGE_RECORD.pack(string_ref(edge.edge_id), string_ref(edge.from_node_id), string_ref(edge.to_node_id),
+                                                   string_ref(predicate)   , string_ref(edge.edge_path)    )
+        return bytes(section)
+
+    def columns_section(self, document: Html_MGraph__Document) -> bytes:        # Entry count + the attributes graph's columnar store
+        string_ref = self.string_ref
+        entries    = list(document.attrs_graph.columns_entries())
+        section    = bytearray(SNAPSHOT__COUNT.pack(len(entries)))
+        for element_id, position, attr_name, attr_value in entries:
+            section += SNAPSHOT__COLUMN_RECORD.pack(string_ref(element_id), position, string_ref(attr_name), string_ref(attr_value))
+        return bytes(section)
+
+    def string_ref(self, value: Any) -> int:                                    # Intern string, 0 for None
+        if value is None:
+            return 0
+        value = str(value)
+        index = self.strings.get(value)
+        if index is None:
+            self.string_values.append(value)
+            index = len(self.string_values)
+            self.strings[value] = index
+        return index
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Reader
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Html_MGraph__Snapshot__Reader(Type_Safe):                                 # Lazy reader over snapshot bytes (or an mmap)
+    buffer        : Any            = None                                       # bytes / mmap.mmap
+    string_count  : int            = 0
+    offsets_start : int            = 0
+    data_start    : int            = 0
+    graphs_index  : Dict[str, Tuple[int, int, int, int]]                        # name -> (root_ref, node_count, edge_count, records_start)
+    columns_start : int            = 0                                          # attributes columnar store section
+    string_cache  : Dict[int, str]                                              # Strings decoded so far
+    _mmap         : Any            = None
+    _file         : Any            = None
+
+    @classmethod
+    def from_file(cls, path: str) -> 'Html_MGraph__Snapshot__Reader':           # Memory-map a snapshot file (nothing is read up front)
+        file   = open(path, 'rb')
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        reader = cls(buffer=buffer)
+        reader._mmap = buffer
+        reader._file = file
+        return reader.read_index()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Html_MGraph__Snapshot__Reader':
+        return cls(buffer=data).read_index()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = None
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def read_index(self) -> 'Html_MGraph__Snapshot__Reader':                    # Header + graph headers (records are not touched)
+        magic, version, graph_count, string_count, data_size = SNAPSHOT__HEADER.unpack_from(self.buffer, 0)
+        if magic != SNAPSHOT__MAGIC:
+            raise ValueError(f"Not an Html_MGraph snapshot (magic: {magic!r})")
+        if version != SNAPSHOT__VERSION:
+            raise ValueError(f"Unsupported Html_MGraph snapshot version: {version}")
+
+        self.string_count  = string_count
+        self.offsets_start = SNAPSHOT__HEADER.size
+        self.data_start    = self.offsets_start + (string_count + 1) * SNAPSHOT__OFFSET.size
+        position           = self.data_start + data_size
+        for _ in range(graph_count):
+            name_ref, root_ref, node_count, edge_count = SNAPSHOT__GRAPH_HEADER.unpack_from(self.buffer, position)
+            records_start = position + SNAPSHOT__GRAPH_HEADER.size
+            self.graphs_index[self.string(name_ref)] = (root_ref, node_count, edge_count, records_start)
+            position = records_start + node_count * SNAPSHOT__NODE_RECORD.size + edge_count * SNAPSHOT__EDGE_RECORD.size
+        self.columns_start = position
+        return self
+
+    def string(self, index: int) -> Optional[str]:                              # Decode string on first use
+        if index == 0:
+            return None
+        value = self.string_cache.get(index)
+        if value is None:
+            start = SNAPSHOT__OFFSET.unpack_from(self.buffer, self.offsets_start + (index - 1) * SNAPSHOT__OFFSET.size)[0]
+            end   = SNAPSHOT__OFFSET.unpack_from(self.buffer, self.offsets_start +  index      * SNAPSHOT__OFFSET.size)[0]
+            value = bytes(self.buffer[self.data_start + start:self.data_start + end]).decode('utf-8')
+            self.string_cache[index] = value
+        return value
+
+    def strings(self) -> List[Optional[str]]:                                   # All strings, decoded in one pass (index = string ref, 0 = None)
+        count   = self.string_count
+        offsets = struct.unpack_from(f'<{count + 1}I', self.buffer, self.offsets_start)
+        data    = bytes(self.buffer[self.data_start:self.data_start + offsets[-1]])
+        strings = [None] * (count + 1)
+        for index in range(count):
+            strings[index + 1] = data[offsets[index]:offsets[index + 1]].decode('utf-8')
+        return strings
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Record access
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def graph_names(self) -> List[str]:
+        return list(self.graphs_index)
+
+    def root_id(self, graph: str) -> Optional[str]:
+        return self.string(self.graph_info(graph)[0])
+
+    def node_count(self, graph: str) -> int:
+        return self.graph_info(graph)[1]
+
+    def edge_count(self, graph: str) -> int:
+        return self.graph_info(graph)[2]
+
+    def graph_info(self, graph: str) -> Tuple[int, int, int, int]:
+        info = self.graphs_index.get(graph)
+        if info is None:
+            raise ValueError(f"Graph not found in snapshot: {graph}")
+        return info
+
+    def node_record(self, graph: str, index: int) -> Dict[str, Any]:            # Decode one node record
+        _, node_count, _, records_start = self.graph_info(graph)
+        if not 0 <= index < node_count:
+            raise IndexError(f"Node index {index} out of range for graph '{graph}' ({node_count} nodes)")
+        node_id, node_path, value, key, flags = SNAPSHOT__NODE_RECORD.unpack_from(self.buffer, records_start + index * SNAPSHOT__NODE_RECORD.size)
+        return { 'node_id'   : self.string(node_id)                  ,
+                 'node_path' : self.string(node_path)                ,
+                 'value'     : self.string(value)                    ,
+                 'key'       : self.string(key)                      ,
+                 'is_value'  : bool(flags & SNAPSHOT__FLAG__VALUE)   }
+
+    def edge_record(self, graph: str, index: int) -> Dict[str, Any]:            # Decode one edge record
+        _, node_count, edge_count, records_start = self.graph_info(graph)
+        if not 0 <= index < edge_count:
+            raise IndexError(f"Edge index {index} out of range for graph '{graph}' ({edge_count} edges)")
+        edges_start = records_start + node_count * SNAPSHOT__NODE_RECORD.size
+        edge_id, from_id, to_id, predicate, edge_path = SNAPSHOT__EDGE_RECORD.unpack_from(self.buffer, edges_start + index * SNAPSHOT__EDGE_RECORD.size)
+        return { 'edge_id'      : self.string(edge_id)   ,
+                 'from_node_id' : self.string(from_id)   ,
+                 'to_node_id'   : self.string(to_id)     ,
+                 'predicate'    : self.string(predicate) ,
+                 'edge_path'    : self.string(edge_path) }
+
+    def iter_nodes(self, graph: str) -> Iterator[Dict[str, Any]]:
+        for index in range(self.node_count(graph)):
+            yield self.node_record(graph, index)
+
+    def iter_edges(self, graph: str) -> Iterator[Dict[str, Any]]:
+        for index in range(self.edge_count(graph)):
+            yield self.edge_record(graph, index)
+
+    def column_count(self) -> int:
+        return SNAPSHOT__COUNT.unpack_from(self.buffer, self.columns_start)[0]
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Document (read-only, served from the records)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def load_document(self) -> Html_MGraph__Document:                           # Frozen Html_MGraph__Document, no node / edge schemas are created
+        strings  = self.strings()
+        node_ids = [None] * len(strings)                                        # string ref -> Node_Id (ids are shared between graphs)
+
+        def node_id(ref: int) -> Node_Id:
+            value = node_ids[ref]
+            if value is None:
+                value = node_ids[ref] = Node_Id(strings[ref])
+            return value
+
+        root_ids = {name: self.root_id(name) for name in self.graph_names()}
+        document = Html_MGraph__Document().setup__for_restore(root_ids, with_mgraph=False)
+        graphs   = document.graphs()
+        for name, (_, node_count, edge_count, records_start) in self.graphs_index.items():
+            graph = graphs.get(name)
+            if graph is None:
+                raise ValueError(f"Unknown graph in snapshot: {name}")
+            edges_start  = records_start + node_count * SNAPSHOT__NODE_RECORD.size
+            edges_end    = edges_start   + edge_count * SNAPSHOT__EDGE_RECORD.size
+            node_records = {node_id(node_ref): (strings[path_ref], strings[value_ref], strings[key_ref], bool(flags & SNAPSHOT__FLAG__VALUE))
+                            for node_ref, path_ref, value_ref, key_ref, flags in SNAPSHOT__NODE_RECORD.iter_unpack(self.buffer[records_start:edges_start])}
+            edge_records = [(Edge_Id(strings[edge_ref]), node_id(from_ref), node_id(to_ref), strings[predicate_ref], strings[path_ref])
+                            for edge_ref, from_ref, to_ref, predicate_ref, path_ref in SNAPSHOT__EDGE_RECORD.iter_unpack(self.buffer[edges_start:edges_end])]
+            graph.restore_records(node_records, edge_records)
+
+        columns_start = self.columns_start + SNAPSHOT__COUNT.size
+        columns_end   = columns_start + self.column_count() * SNAPSHOT__COLUMN_RECORD.size
+        document.attrs_graph.restore_columns((node_id(element_ref), position, strings[name_ref], strings[value_ref])
+                                             for element_ref, position, name_ref, value_ref in SNAPSHOT__COLUMN_RECORD.iter_unpack(self.buffer[columns_start:columns_end]))
+        return document
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Helpers
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def html_mgraph__snapshot__write(document: Html_MGraph__Document) -> bytes:
+    return Html_MGraph__Snapshot__Writer().write(document)
+
+def html_mgraph__snapshot__reader(source: Union[str, bytes]) -> Html_MGraph__Snapshot__Reader:  # bytes are read in place, str is a file path (mmap)
+    if isinstance(source, (bytes, bytearray)):
+        return Html_MGraph__Snapshot__Reader.from_bytes(bytes(source))
+    return Html_MGraph__Snapshot__Reader.from_file(source)
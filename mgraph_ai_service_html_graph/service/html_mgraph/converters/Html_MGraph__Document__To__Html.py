@@ -1,24 +1,176 @@
+from typing                                                                                             import Dict, Iterator, List, Optional, Tuple
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Base                          import Html_MGraph__Base
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Body                          import Html_MGraph__Body
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Attributes                    import Html_MGraph__Attributes
 from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Document                      import Html_MGraph__Document
-from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html_MGraph__Document__To__Html_Dict   import Html_MGraph__Document__To__Html_Dict
-from osbot_utils.helpers.html.transformers.Html_Dict__To__Html                                          import Html_Dict__To__Html
-from osbot_utils.helpers.timestamp_capture.decorators.timestamp                                         import timestamp
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Scripts                       import Html_MGraph__Scripts
+from osbot_utils.helpers.html.transformers.Html_Dict__To__Html                                          import HTML_SELF_CLOSING_TAGS, HTML_DEFAULT_DOCTYPE_VALUE
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation                   import timestamp
 from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
 
+INDENT = '    '
+
 
 class Html_MGraph__Document__To__Html(Type_Safe):                               # Convert Html_MGraph__Document to HTML string
     """Converts Html_MGraph__Document to HTML string.
 
     Pipeline:
         Html_MGraph__Document
-            → Html_MGraph__Document__To__Html_Dict → Html_Dict
-            → Html_Dict__To__Html → HTML String
+            → one pass over the raw nodes/edges of each graph to build lookup indexes
+              (children in position order, text values, tags, script/style content; attributes
+              are read from the attributes graph's columnar store)
+            → single ordered traversal from the <html> root, writing HTML chunks as it goes
+
+    There is no intermediate Html_Dict tree, and no per-element graph queries,
+    so the cost is linear in the size of the document. The output is identical
+    to Html_MGraph__Document__To__Html_Dict → Html_Dict__To__Html (same
+    indentation, mixed content and void element rules).
 
-    This class composes existing converters for simplicity.
+    Use iter_chunks() to stream the HTML (e.g. into a response), or convert()
+    to get it as a single string.
     """
+    include_doctype : bool = True
+    children        : dict                                                      # parent_id -> [(position, 'text'|'element', child_id)] (body and head)
+    text_values     : dict                                                      # node_id   -> text (body and head value nodes)
+    tags            : dict                                                      # element_id -> tag
+    attrs_graph     : Html_MGraph__Attributes = None                            # Attributes graph (get_attributes reads its columnar store)
+    contents        : dict                                                      # element_id -> script / style content
 
     @timestamp(name="html_mgraph.convert.to-html")
     def convert(self, document: Html_MGraph__Document) -> str:                  # Convert Document to HTML string
-        html_dict = Html_MGraph__Document__To__Html_Dict().convert(document)    # Document → Html_Dict
-        html_str  = Html_Dict__To__Html(root=html_dict).convert()          # Html_Dict → HTML
+        return ''.join(self.iter_chunks(document))
+
+    def iter_chunks(self, document: Html_MGraph__Document) -> Iterator[str]:    # Stream Document as HTML chunks
+        self.build_indexes(document)
+        if self.include_doctype:
+            yield HTML_DEFAULT_DOCTYPE_VALUE
+        root_children = []
+        for graph in (document.head_graph, document.body_graph):
+            if graph.root_id and self.tags.get(graph.root_id):
+                root_children.append(('element', graph.root_id, 'head' if graph is document.head_graph else 'body'))
+        yield from self.write_element('html', self.element_attrs(document.root_id), root_children, 0, True)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Indexes (single pass over each graph's raw nodes and edges)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def build_indexes(self, document: Html_MGraph__Document) -> None:
+        self.children    = {}
+        self.text_values = {}
+        self.tags        = {}
+        self.contents    = {}
+        for graph in (document.head_graph, document.body_graph):
+            self.index_tree_graph(graph)
+        for items in self.children.values():
+            items.sort(key=lambda x: x[0])                                      # stable, so equal positions keep edge order
+        self.index_attributes_graph(document.attrs_graph)
+        for graph in (document.scripts_graph, document.styles_graph):
+            self.index_content_graph(graph)
+
+    def index_tree_graph(self, graph: Html_MGraph__Base) -> None:               # Body/Head: ordered children + text values
+        self.text_values.update(graph.node_values())
+        for _, from_node_id, to_node_id, predicate, edge_path in graph.edge_records():
+            if predicate == Html_MGraph__Body.PREDICATE_CHILD:
+                child_type = 'element'
+            elif predicate == Html_MGraph__Body.PREDICATE_TEXT:
+                child_type = 'text'
+            else:
+                continue
+            position = int(str(edge_path)) if edge_path else 0
+            self.children.setdefault(from_node_id, []).append((position, child_type, to_node_id))
+
+    def index_attributes_graph(self, graph: Html_MGraph__Attributes) -> None:   # Tags (attributes come from the graph's columnar store)
+        values = graph.node_values()
+        for _, from_node_id, to_node_id, predicate, _ in graph.edge_records():
+            if predicate == Html_MGraph__Attributes.PREDICATE_ELEMENT:
+                self.tags.setdefault(to_node_id, values.get(from_node_id))
+        self.attrs_graph = graph
+
+    def index_content_graph(self, graph: Html_MGraph__Base) -> None:            # Scripts/Styles: element -> content
+        values = graph.node_values()
+        for _, from_node_id, to_node_id, predicate, _ in graph.edge_records():
+            if predicate == Html_MGraph__Scripts.PREDICATE_CONTENT:
+                self.contents.setdefault(from_node_id, values.get(to_node_id))
+
+    def element_attrs(self, node_id) -> Dict[str, Optional[str]]:
+        return self.attrs_graph.get_attributes(node_id)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Traversal
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def element_nodes(self, node_id, mode: str) -> List[Tuple]:                 # Child nodes, in the same shape as the Html_Dict 'nodes' list
+        if mode in ('script', 'style'):
+            content = self.contents.get(node_id)
+            return [('text', content)] if content else []
+
+        nodes = []
+        for _, child_type, child_id in self.children.get(node_id, []):
+            if child_type == 'text':
+                text = self.text_values.get(child_id)
+                if text:
+                    nodes.append(('text', text))
+                continue
+            child_tag = self.tags.get(child_id)
+            if child_tag == 'script':
+                nodes.append(('element', child_id, 'script'))
+            elif child_tag == 'style' and mode == 'head':
+                nodes.append(('element', child_id, 'style'))
+            elif child_tag:                                                     # elements without a tag are skipped
+                nodes.append(('element', child_id, mode))
+        return nodes
+
+    def write_child(self, node: Tuple, indent_level: int, newline: bool) -> Iterator[str]:
+        _, node_id, mode = node
+        tag = mode if mode in ('script', 'style') else self.tags.get(node_id)
+        yield from self.write_element(tag, self.element_attrs(node_id), self.element_nodes(node_id, mode), indent_level, newline)
+
+    def write_element(self, tag          : str  ,                               # Same formatting rules as Html_Dict__To__Html.convert_element
+                            attrs        : Dict ,
+                            nodes        : List ,
+                            indent_level : int  ,
+                            newline      : bool                                 # False inside mixed content (trailing newline is dropped)
+                     ) -> Iterator[str]:
+        indent    = INDENT * indent_level
+        attrs_str = self.attrs_to_html(attrs)
+        end       = '\n' if newline else ''
+
+        if tag in HTML_SELF_CLOSING_TAGS:
+            yield f'{indent}<{tag}{attrs_str} />{end}'
+            return
+
+        yield f'{indent}<{tag}{attrs_str}>'
+        has_text     = any(node[0] == 'text'    for node in nodes)
+        has_elements = any(node[0] == 'element' for node in nodes)
+
+        if has_elements and not has_text:                                       # Only element children
+            yield '\n'
+            for node in nodes:
+                yield from self.write_child(node, indent_level + 1, True)
+            yield f'{indent}</{tag}>{end}'
+            return
+
+        for node in nodes:                                                      # Empty, text only, or mixed content
+            if node[0] == 'text':
+                yield node[1]
+            else:
+                yield from self.write_child(node, 0, False)
+        yield f'</{tag}>{end}'
 
-        return html_str
\ No newline at end of file
+    def attrs_to_html(self, attrs: Dict[str, Optional[str]]) -> str:            # Same quoting rules as Html_Dict__To__Html.convert_attrs
+        if not attrs:
+            return ''
+        parts = []
+        for key, value in attrs.items():
+            if value is None:
+                parts.append(f'{key}')
+            elif value == '':
+                parts.append(f'{key}=""')
+            elif '"' in value and "'" in value:                                 # Both quotes present
+                escaped_value = value.replace('"', '&quot;')
+                parts.append(f'{key}="{escaped_value}"')
+            elif '"' in value:                                                  # Use single quotes if double quotes present
+                parts.append(f"{key}='{value}'")
+            else:
+                parts.append(f'{key}="{value}"')
+        return ' ' + ' '.join(parts)
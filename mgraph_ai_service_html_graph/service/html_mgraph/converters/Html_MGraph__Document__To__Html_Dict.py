@@ -163,16 +163,9 @@ class Html_MGraph__Document__To__Html_Dict(Type_Safe):
         graph = document.head_graph if in_head else document.body_graph
 
         all_children = []
-        for edge in graph.outgoing_edges(node_id):
-            predicate = graph.edge_predicate(edge)
-            edge_path = graph.edge_path(edge)
-            position  = int(str(edge_path)) if edge_path else 0
-            target_id = edge.edge.data.to_node_id
-
+        for position, (predicate, target_id) in enumerate(graph.children_by_position(node_id)):   # already in position order
             if predicate == graph.PREDICATE_TEXT:
                 all_children.append(('text', target_id, position))
             elif predicate == graph.PREDICATE_CHILD:
                 all_children.append(('element', target_id, position))
-
-        all_children.sort(key=lambda x: x[2])                                   # Sort by position
         return all_children
\ No newline at end of file
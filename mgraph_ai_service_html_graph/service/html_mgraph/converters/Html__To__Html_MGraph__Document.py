@@ -23,7 +23,7 @@ Converts raw HTML to Html_MGraph__Document with 5 component graphs.
 from typing                                                                         import Dict, Any, List, Optional, Tuple, Set
 from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Document  import Html_MGraph__Document
 from mgraph_db.mgraph.schemas.identifiers.Node_Path                                 import Node_Path
-from osbot_utils.helpers.timestamp_capture.decorators.timestamp                     import timestamp
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation import timestamp
 from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
 from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id                   import Node_Id
 from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                      import Html__To__Html_Dict
@@ -1,9 +1,8 @@
-from typing                                                                     import Dict, Any, List, Optional
+from typing                                                                     import Dict, Any, Iterable, Iterator, List, Optional
 from mgraph_ai_service_html_graph.schemas.html.Schema__Html_MGraph              import Schema__Html_MGraph__Stats__Attributes
 from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Base  import Html_MGraph__Base
 from mgraph_db.mgraph.schemas.identifiers.Node_Path                             import Node_Path
-from osbot_utils.helpers.timestamp_capture.context_managers.timestamp_block     import timestamp_block
-from osbot_utils.helpers.timestamp_capture.decorators.timestamp                 import timestamp
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation import timestamp_block, timestamp
 from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id               import Node_Id
 from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id               import Safe_Id
 
@@ -30,6 +29,13 @@ class Html_MGraph__Attributes(Html_MGraph__Base):
     - root → tag: predicate = 'tag'
     - tag → element: predicate = 'element'
     - element → attr: predicate = 'attr', edge_path = attr_name
+
+    Columnar side-store (hot reads):
+    - attr_columns: element_id → [(position, name_id, value_id)] kept in position order
+    - attr_strings: interned attribute names and values (name_id/value_id index into it,
+      value_id is None for boolean attributes)
+    - kept in sync by add_attribute (and rebuilt from the graph by restore_caches), so
+      get_attributes / get_attribute never have to walk the three-node model
     """
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -53,6 +59,10 @@ class Html_MGraph__Attributes(Html_MGraph__Base):
     tag_node_cache   : Dict                                                 # Cache: tag_name → tag_node_id
     value_node_cache : Dict                                                 # Cache: attr_value → node_id
     name_node_cache  : Dict
+    attr_columns     : dict                                                 # Columnar store: element_id → [(position, name_id, value_id)]
+    attr_strings     : list                                                 # Interned attribute names and values
+    attr_string_ids  : dict                                                 # string → index in attr_strings
+    _tags            : dict                                                 # frozen: element_id → tag
 
     def setup(self) -> 'Html_MGraph__Attributes':                               # Initialize the graph with root node
         super().setup()
@@ -112,6 +122,7 @@ class Html_MGraph__Attributes(Html_MGraph__Base):
                               to_node_id   = value_node.node_id   ,
                               predicate    = self.PREDICATE_VALUE )
 
+        self._columns_add(node_id, position, attr_name, attr_value)                        # 6. Keep the columnar store in sync
         return instance_node.node_id
 
 
@@ -180,11 +191,104 @@ class Html_MGraph__Attributes(Html_MGraph__Base):
         self.tag_node_cache[tag] = tag_node_id
         return tag_node_id
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Columnar Attribute Store
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def _intern(self, value: str) -> int:                                       # Get (or add) id of an attribute name / value
+        string_id = self.attr_string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.attr_strings)
+            self.attr_strings.append(value)
+            self.attr_string_ids[value] = string_id
+        return string_id
+
+    def _columns_add(self, node_id    : Node_Id       ,                         # Add attribute to the columnar store (position order)
+                           position   : int           ,
+                           attr_name  : str           ,
+                           attr_value : Optional[str]
+                    ) -> None:
+        name_id  = self._intern(attr_name)
+        value_id = None if attr_value is None else self._intern(attr_value)
+        entry    = (position, name_id, value_id)
+        columns  = self.attr_columns.get(node_id)
+        if columns is None:
+            self.attr_columns[node_id] = [entry]
+        else:
+            columns.append(entry)
+            if columns[-2][0] > position:                                       # Attributes normally arrive in order
+                columns.sort(key=lambda x: x[0])
+
+    def _columns_rebuild(self) -> None:                                         # Rebuild the columnar store from the three-node model
+        self.attr_columns    = {}
+        self.attr_strings    = []
+        self.attr_string_ids = {}
+        for edge in self.edge_schemas():
+            predicate = edge.edge_label.predicate if edge.edge_label else None
+            if predicate == self.PREDICATE_ATTR:
+                for position, attr_name, attr_value in self._attributes_from_instance(edge.to_node_id):
+                    self._columns_add(edge.from_node_id, position, attr_name, attr_value)
+
+    def restore_caches(self) -> None:                                           # Rebuild lookup caches after a restore (from snapshot / json)
+        self._columns_rebuild()
+        self.tag_node_cache  .clear()
+        self.value_node_cache.clear()
+        self.name_node_cache .clear()
+        for node in self.node_schemas():
+            node_path = str(node.node_path) if node.node_path else ''
+            if node_path.startswith('tag:'):
+                self.tag_node_cache[node_path[4:]] = node.node_id
+            elif node_path == self.NODE_PATH_NAME:
+                self.name_node_cache[node.node_data.value] = node.node_id
+            elif node_path == self.NODE_PATH_VALUE:
+                self.value_node_cache[node.node_data.value] = node.node_id
+
+    def freeze(self) -> 'Html_MGraph__Attributes':                              # Read-only: element → tag map, column tuples, no build caches
+        if self.frozen:
+            return self
+        super().freeze()
+        self.freeze__tags()
+        self.attr_columns = {node_id: tuple(columns) for node_id, columns in self.attr_columns.items()}
+        self.value_node_cache.clear()                                           # only used by add_attribute
+        self.name_node_cache .clear()
+        return self
+
+    def freeze__tags(self) -> None:                                             # element → tag map (from the tag nodes' children)
+        self._tags = {element_id: self.node_value(tag_node_id)
+                      for tag_node_id in self.tag_node_cache.values()
+                      for _, element_id in self._children.get(tag_node_id, ())}
+
+    def restore_records(self, node_records : Dict[Node_Id, tuple] ,             # Snapshot-backed (frozen) graph, see Html_MGraph__Base.restore_records
+                              edge_records : List[tuple]
+                       ) -> 'Html_MGraph__Attributes':
+        super().restore_records(node_records, edge_records)
+        self.tag_node_cache = {node_path[4:]: node_id for node_id, (node_path, *_) in node_records.items()
+                                                      if node_path and node_path.startswith('tag:')}
+        self.freeze__tags()
+        return self
+
+    def restore_columns(self, entries: Iterable[tuple]) -> None:                # Columnar store from (element_id, position, name, value) entries (as written to snapshots)
+        self.attr_columns    = {}
+        self.attr_strings    = []
+        self.attr_string_ids = {}
+        for element_id, position, attr_name, attr_value in entries:
+            self._columns_add(element_id, position, attr_name, attr_value)
+        if self.frozen:
+            self.attr_columns = {node_id: tuple(columns) for node_id, columns in self.attr_columns.items()}
+
+    def columns_entries(self) -> Iterator[tuple]:                               # (element_id, position, name, value) entries of the columnar store
+        strings = self.attr_strings
+        for element_id, columns in self.attr_columns.items():
+            for position, name_id, value_id in columns:
+                yield element_id, position, strings[name_id], (None if value_id is None else strings[value_id])
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Query Methods - Tag Lookups
     # ═══════════════════════════════════════════════════════════════════════════
 
     def get_tag(self, node_id: Node_Id) -> Optional[str]:                       # Get HTML tag for an element node
+        if self.frozen:
+            return self._tags.get(node_id)
         edges = self.incoming_edges(node_id)                                    # Find incoming edge from tag node
         for edge in edges:
             if self.edge_predicate(edge) == self.PREDICATE_ELEMENT:
@@ -219,57 +323,71 @@ class Html_MGraph__Attributes(Html_MGraph__Base):
     # ═══════════════════════════════════════════════════════════════════════════
 
     def get_attributes(self, node_id: Node_Id) -> Dict[str, Optional[str]]:         # Get all attributes for an element (ordered). Returns None for boolean attrs.
+        columns = self.attr_columns.get(node_id)
+        if not columns:
+            return {}
+        strings = self.attr_strings
+        return {strings[name_id]: (None if value_id is None else strings[value_id])
+                for _, name_id, value_id in columns if strings[name_id]}
+
+    def get_attributes__from_graph(self, node_id: Node_Id) -> Dict[str, Optional[str]]:   # Same as get_attributes, but walking the three-node model
         attrs = []
-
         for edge in self.outgoing_edges(node_id):
             if self.edge_predicate(edge) == self.PREDICATE_ATTR:
-                instance_id = edge.edge.data.to_node_id
-
-                # Get position from instance node's path
-                position_path = self.node_path(instance_id)
-                position = int(str(position_path)) if position_path else 0
-
-                # Find name and value from instance's outgoing edges
-                attr_name = None
-                attr_value = None  # Will stay None for boolean attrs
-
-                for inner_edge in self.outgoing_edges(instance_id):
-                    inner_pred = self.edge_predicate(inner_edge)
-                    inner_target = inner_edge.edge.data.to_node_id
-
-                    if inner_pred == self.PREDICATE_NAME:
-                        attr_name = self.node_value(inner_target)
-                    elif inner_pred == self.PREDICATE_VALUE:
-                        attr_value = self.node_value(inner_target)
-
-                if attr_name:
-                    attrs.append((position, attr_name, attr_value))
-
+                attrs.extend(self._attributes_from_instance(edge.edge.data.to_node_id))
         attrs.sort(key=lambda x: x[0])
-        return {name: value for _, name, value in attrs}
+        return {name: value for _, name, value in attrs if name}
+
+    def _attributes_from_instance(self, instance_id: Node_Id) -> List[tuple]:   # (position, name, value) of an attr instance node
+        position_path = self.node_path(instance_id)                             # Get position from instance node's path
+        position      = int(str(position_path)) if position_path else 0
+
+        attr_name  = None                                                       # Find name and value from instance's outgoing edges
+        attr_value = None                                                       # Will stay None for boolean attrs
+        for inner_edge in self.outgoing_edges(instance_id):
+            inner_pred   = self.edge_predicate(inner_edge)
+            inner_target = inner_edge.edge.data.to_node_id
+            if inner_pred == self.PREDICATE_NAME:
+                attr_name = self.node_value(inner_target)
+            elif inner_pred == self.PREDICATE_VALUE:
+                attr_value = self.node_value(inner_target)
+
+        if attr_name is None:
+            return []
+        return [(position, attr_name, attr_value)]
 
     def get_attribute(self, node_id  : Node_Id ,                                # Get specific attribute value
                         attr_name: str
                  ) -> Optional[str]:
-        return self.get_attributes(node_id).get(attr_name)
+        name_id = self.attr_string_ids.get(attr_name)
+        if name_id is None:
+            return None
+        for _, entry_name_id, value_id in reversed(self.attr_columns.get(node_id, ())):   # last one wins (same as get_attributes)
+            if entry_name_id == name_id:
+                return None if value_id is None else self.attr_strings[value_id]
+        return None
 
     def get_elements_with_attribute(self, attr_name: str, attr_value: Optional[str] = None) -> List[Node_Id]:   # Find all elements that have a specific attribute (optionally with specific value).
-        result = []
-
-        # Get all element nodes (those that have been registered via register_element)
-        for node_id in self.nodes_ids():
-            # Check if this node has attributes
-            attrs = self.get_attributes(node_id)
-
-            if attr_name in attrs:
-                if attr_value is None:
-                    # Just checking for presence of attribute
-                    result.append(node_id)
-                elif attrs[attr_name] == attr_value:
-                    # Checking for specific value
-                    result.append(node_id)
-
-        return result
+        name_id = self.attr_string_ids.get(attr_name)                           # compared as interned ids, over the columnar store
+        if name_id is None:
+            return []
+        if attr_value is None:
+            return [node_id for node_id, columns in self.attr_columns.items()
+                            if any(column_name_id == name_id for _, column_name_id, _ in columns)]
+        value_id = self.attr_string_ids.get(attr_value)
+        if value_id is None:
+            return []
+        return [node_id for node_id, columns in self.attr_columns.items()
+                        if any(column_name_id == name_id and column_value_id == value_id for _, column_name_id, column_value_id in columns)]
+
+    def get_elements_with_class(self, class_name: str) -> List[Node_Id]:        # Elements whose class attribute contains class_name (as a token)
+        name_id = self.attr_string_ids.get('class')
+        if name_id is None:
+            return []
+        strings = self.attr_strings
+        matches = {value_id for value_id, value in enumerate(strings) if class_name in value.split()}  # interned values that contain the token
+        return [node_id for node_id, columns in self.attr_columns.items()
+                        if any(column_name_id == name_id and column_value_id in matches for _, column_name_id, column_value_id in columns)]
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Helper Methods
@@ -1,23 +1,80 @@
-from typing                                                                         import Dict, Any, List, Optional, Type
+import sys
+from threading                                                                      import Lock
+from typing                                                                         import Dict, Any, Iterable, List, Optional, Tuple, Type
 from mgraph_ai_service_html_graph.schemas.html.Schema__Html_MGraph                  import Schema__Html_MGraph__Stats__Base, Schema__Html_MGraph__Json__Base
 from mgraph_db.mgraph.MGraph                                                        import MGraph
+from mgraph_db.mgraph.domain.Domain__MGraph__Graph                                  import Domain__MGraph__Graph
+from mgraph_db.mgraph.schemas.Schema__MGraph__Edge                                  import Schema__MGraph__Edge
 from mgraph_db.mgraph.schemas.Schema__MGraph__Node                                  import Schema__MGraph__Node
+from mgraph_db.mgraph.schemas.Schema__MGraph__Node__Value                           import Schema__MGraph__Node__Value
+from mgraph_db.mgraph.schemas.Schema__MGraph__Node__Value__Data                     import Schema__MGraph__Node__Value__Data
 from mgraph_db.mgraph.schemas.Schema__MGraph__Edge__Label                           import Schema__MGraph__Edge__Label
 from mgraph_db.mgraph.schemas.identifiers.Node_Path                                 import Node_Path
 from mgraph_db.mgraph.schemas.identifiers.Edge_Path                                 import Edge_Path
 from mgraph_db.mgraph.domain.Domain__MGraph__Edge                                   import Domain__MGraph__Edge
 from mgraph_db.mgraph.domain.Domain__MGraph__Node                                   import Domain__MGraph__Node
-from osbot_utils.helpers.timestamp_capture.decorators.timestamp                     import timestamp
-from osbot_utils.helpers.timestamp_capture.decorators.timestamp_args import timestamp_args
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation import timestamp, timestamp_args
 from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Edge_Id                   import Edge_Id
 from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id                   import Node_Id
 from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id                   import Safe_Id
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                      import type_safe
 
+NODE_TYPE__JSON__VALUE     = '@schema_mgraph_node_value'                        # node_type of value nodes in to_json() output
+MGRAPH__FROM_RECORDS__LOCK = Lock()                                             # Guards the first (lazy) build of a snapshot-backed graph's MGraph
+
+# Frozen graphs (see freeze)
+#
+# Once a graph is fully built (and about to be shared, e.g. in html_mgraph_cache)
+# freeze() makes it read-only (every write method raises ValueError) and compacts
+# it for reads. One pass over the edges and nodes builds plain adjacency maps:
+#
+#   _children   : node_id   -> ((predicate, child_id), ...) in edge_path order
+#   _out_edges  : node_id   -> (edge_id, ...)               in edge_path order
+#   _in_edges   : node_id   -> (edge_id, ...)
+#   _parents    : node_id   -> parent id (first incoming edge)
+#   _path_nodes : node_path -> (node_id, ...)
+#
+# (predicates and node_paths are interned strings), and the MGraph index (and the
+# MGraph__Edit that holds it) is released: it is the write-side structure, several
+# times larger than these maps, and nothing reads it once the graph is frozen (the
+# query methods read the maps and the raw node / edge schemas, the exporters and
+# engines read the schemas). The schemas themselves are kept, the engines walk
+# them. Net, freeze() lowers the memory of a document, and subclasses drop their
+# build caches too (see Html_MGraph__Attributes.freeze).
+#
+# Graphs loaded from a snapshot are frozen from the start (see restore_records):
+# the same maps are built from the decoded records (plain tuples), and node_value /
+# node_path read those records, so no node / edge schema is created on load. The
+# MGraph is built from the records on first access to .mgraph (e.g. by an engine,
+# an exporter or to_json).
+
 
 class Html_MGraph__Base(Type_Safe):                                             # Base class for all Html_MGraph specialized graphs
-    mgraph  : MGraph  = None                                                    # The underlying MGraph
-    root_id : Node_Id = None                                                    # Root node ID for this graph
+    _mgraph       : MGraph  = None                                              # The underlying MGraph (see the mgraph property)
+    root_id       : Node_Id = None                                              # Root node ID for this graph
+    index_on      : bool    = True                                              # Restore methods update the MGraph index (off: the index is built from the data on first use)
+    frozen        : bool    = False                                             # Read-only, see freeze()
+    _children     : dict                                                        # frozen: node_id -> ((predicate, child_id), ...) in edge_path order
+    _out_edges    : dict                                                        # frozen: node_id -> (edge_id, ...) in edge_path order
+    _in_edges     : dict                                                        # frozen: node_id -> (edge_id, ...)
+    _parents      : dict                                                        # frozen: node_id -> parent id
+    _path_nodes   : dict                                                        # frozen: node_path -> (node_id, ...)
+    _node_records : dict                                                        # snapshot-backed: node_id -> (node_path, value, key, is_value)
+    _edge_records : list                                                        # snapshot-backed: [(edge_id, from_node_id, to_node_id, predicate, edge_path), ...]
+    _from_records : bool    = False                                             # snapshot-backed: the MGraph is built from the records on first use
+
+    @property
+    def mgraph(self) -> MGraph:                                                 # The underlying MGraph
+        if self._from_records and self._mgraph is None:
+            with MGRAPH__FROM_RECORDS__LOCK:
+                if self._mgraph is None:
+                    self._mgraph = self.mgraph__from_records()
+        return self._mgraph
+
+    @mgraph.setter
+    def mgraph(self, value: MGraph) -> None:
+        self._mgraph = value
 
     @timestamp_args(name="html_mgraph.{self.__class__.__name__}.setup")
     def setup(self) -> 'Html_MGraph__Base':                                     # Initialize the graph with a fresh MGraph instance
@@ -34,6 +91,7 @@ class Html_MGraph__Base(Type_Safe):
     def new_element_node(self, node_path : Node_Path         ,                  # DOM path for element
                                node_id   : Node_Id    = None                    # Optional specific node_id
                         ) -> Domain__MGraph__Node:                              # Create element node with path
+        self.raise_if_frozen()
         if node_id:
             return self.mgraph.edit().new_node(node_type = Schema__MGraph__Node ,
                                                node_path = node_path            ,
@@ -46,6 +104,7 @@ class Html_MGraph__Base(Type_Safe):
                              node_path : Node_Path   = None ,                   # Optional path
                              key       : str         = ''                       # Optional unique key
                       ) -> Domain__MGraph__Node:                                # Create value node
+        self.raise_if_frozen()
         return self.mgraph.edit().new_value(value     = value     ,
                                             node_path = node_path ,
                                             key       = key       )
@@ -60,6 +119,7 @@ class Html_MGraph__Base(Type_Safe):
                        predicate    : Safe_Id      = None ,                     # Semantic relationship type
                        edge_path    : Edge_Path    = None                       # Optional position/path
                 ) -> Domain__MGraph__Edge:                                      # Create edge with optional predicate
+        self.raise_if_frozen()
         edge = self.mgraph.edit().new_edge(from_node_id = from_node_id ,
                                            to_node_id   = to_node_id   ,
                                            edge_path    = edge_path    )
@@ -75,6 +135,12 @@ class Html_MGraph__Base(Type_Safe):
         return self.mgraph.data().node(str(node_id))
 
     def node_value(self, node_id: Node_Id) -> Optional[str]:                    # Get value from a value node
+        if self._from_records:
+            record = self._node_records.get(node_id)
+            return record[1] if record else None
+        if self.frozen:
+            node = self.mgraph.graph.model.data.nodes.get(node_id)
+            return getattr(node.node_data, 'value', None) if node else None
         node = self.node(node_id)
         if node and hasattr(node.node, 'data'):
             node_data = node.node.data
@@ -83,6 +149,12 @@ class Html_MGraph__Base(Type_Safe):
         return None
 
     def node_path(self, node_id: Node_Id) -> Optional[Node_Path]:               # Get path from a node
+        if self._from_records:
+            record = self._node_records.get(node_id)
+            return record[0] if record else None
+        if self.frozen:
+            node = self.mgraph.graph.model.data.nodes.get(node_id)
+            return node.node_path if node else None
         node = self.node(node_id)
         if node and hasattr(node.node, 'data'):
             return node.node.data.node_path
@@ -92,6 +164,8 @@ class Html_MGraph__Base(Type_Safe):
         return list(self.mgraph.data().nodes_ids())
 
     def nodes_by_path(self, path: Node_Path) -> List[Node_Id]:                  # Get nodes by path
+        if self.frozen:
+            return list(self._path_nodes.get(str(path), ()))
         node_ids = self.mgraph.index().get_nodes_by_path(path)
         return list(node_ids) if node_ids else []
 
@@ -100,7 +174,10 @@ class Html_MGraph__Base(Type_Safe):
     # ═══════════════════════════════════════════════════════════════════════════
 
     def outgoing_edges(self, node_id: Node_Id) -> List[Domain__MGraph__Edge]:   # Get outgoing edges from a node
-        edge_ids = self.mgraph.index().get_node_id_outgoing_edges(str(node_id))
+        if self.frozen:
+            edge_ids = self._out_edges.get(node_id)
+        else:
+            edge_ids = self.mgraph.index().get_node_id_outgoing_edges(str(node_id))
         edges    = []
         for edge_id in (edge_ids or []):
             edge = self.mgraph.data().edge(edge_id)
@@ -109,7 +186,10 @@ class Html_MGraph__Base(Type_Safe):
         return edges
 
     def incoming_edges(self, node_id: Node_Id) -> List[Domain__MGraph__Edge]:   # Get incoming edges to a node
-        edge_ids = self.mgraph.index().get_node_id_incoming_edges(str(node_id))
+        if self.frozen:
+            edge_ids = self._in_edges.get(node_id)
+        else:
+            edge_ids = self.mgraph.index().get_node_id_incoming_edges(str(node_id))
         edges    = []
         for edge_id in (edge_ids or []):
             edge = self.mgraph.data().edge(edge_id)
@@ -134,6 +214,8 @@ class Html_MGraph__Base(Type_Safe):
     # ═══════════════════════════════════════════════════════════════════════════
 
     def get_parent(self, node_id: Node_Id) -> Optional[Node_Id]:                # Get parent node ID (first incoming edge source)
+        if self.frozen:
+            return self._parents.get(node_id)
         edges = self.incoming_edges(node_id)
         if edges:
             return edges[0].edge.data.from_node_id
@@ -142,6 +224,9 @@ class Html_MGraph__Base(Type_Safe):
     def get_children(self, node_id  : Node_Id             ,                     # Get child node IDs with optional predicate filter
                            predicate: Safe_Id      = None
                     ) -> List[Node_Id]:
+        if self.frozen:
+            return [child_id for child_predicate, child_id in self._children.get(node_id, ())
+                             if predicate is None or child_predicate == predicate]
         children = []
         edges    = self.outgoing_edges(node_id)
         for edge in edges:
@@ -152,17 +237,197 @@ class Html_MGraph__Base(Type_Safe):
     def get_children_ordered(self, node_id  : Node_Id             ,             # Get children ordered by edge_path (position)
                                    predicate: Safe_Id      = None
                             ) -> List[Node_Id]:
+        return [child_id for child_predicate, child_id in self.children_by_position(node_id)
+                         if predicate is None or child_predicate == predicate]
+
+    def children_by_position(self, node_id: Node_Id) -> Tuple[Tuple[Optional[str], Node_Id], ...]:    # ((predicate, child_id), ...) ordered by edge_path (position)
+        if self.frozen:
+            return self._children.get(node_id, ())
         children_with_pos = []
-        edges             = self.outgoing_edges(node_id)
+        for edge in self.outgoing_edges(node_id):
+            edge_path = self.edge_path(edge)
+            position  = int(str(edge_path)) if edge_path else 0
+            predicate = self.edge_predicate(edge)
+            children_with_pos.append((position, str(predicate) if predicate else None, edge.edge.data.to_node_id))
+        children_with_pos.sort(key=lambda x: x[0])
+        return tuple((predicate, child_id) for _, predicate, child_id in children_with_pos)
 
-        for edge in edges:
-            if predicate is None or self.edge_predicate(edge) == predicate:
-                edge_path = self.edge_path(edge)
-                position  = int(str(edge_path)) if edge_path else 0
-                children_with_pos.append((position, edge.edge.data.to_node_id))
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Restore Methods (rebuild a graph from serialized node/edge records)
+    # ═══════════════════════════════════════════════════════════════════════════
 
-        children_with_pos.sort(key=lambda x: x[0])
-        return [child_id for _, child_id in children_with_pos]
+    def setup__for_restore(self, root_id     : str         ,                    # Empty graph (no root node created, it comes from the records)
+                                 with_mgraph : bool = True                      # False: for restore_records (the MGraph is built on first use)
+                          ) -> 'Html_MGraph__Base':
+        if with_mgraph:
+            self.mgraph = MGraph()
+        self.root_id = Node_Id(root_id) if root_id else None
+        return self
+
+    def restore_node(self, node_id   : str                  ,                   # Re-create a node with its original id
+                           node_path : Optional[str] = None ,                   # (schema is added directly to the graph data + index,
+                           value     : Optional[str] = None ,                   #  skipping the domain/model wrappers of edit().new_node)
+                           key       : Optional[str] = None ,
+                           is_value  : bool          = False
+                    ) -> Schema__MGraph__Node:
+        return self.add_node_schema(self.node_schema(node_id, node_path, value, key, is_value))
+
+    def restore_edge(self, edge_id      : str                  ,                # Re-create an edge with its original id
+                           from_node_id : str                  ,
+                           to_node_id   : str                  ,
+                           predicate    : Optional[str] = None ,
+                           edge_path    : Optional[str] = None
+                    ) -> Schema__MGraph__Edge:
+        return self.add_edge_schema(self.edge_schema(edge_id, from_node_id, to_node_id, predicate, edge_path))
+
+    def node_schema(self, node_id   : str                  ,                    # Node schema for a serialized node record
+                          node_path : Optional[str] = None ,
+                          value     : Optional[str] = None ,
+                          key       : Optional[str] = None ,
+                          is_value  : bool          = False
+                   ) -> Schema__MGraph__Node:
+        kwargs = dict(node_id = Node_Id(node_id))
+        if node_path is not None:
+            kwargs['node_path'] = Node_Path(node_path)
+        if is_value:
+            node_data = Schema__MGraph__Node__Value__Data(value=value, key=key or '', value_type=str)
+            node      = Schema__MGraph__Node__Value(node_type=Schema__MGraph__Node__Value, node_data=node_data, **kwargs)
+        else:
+            node      = Schema__MGraph__Node       (node_type=Schema__MGraph__Node, **kwargs)
+        return node
+
+    def edge_schema(self, edge_id      : str                  ,                 # Edge schema for a serialized edge record
+                          from_node_id : str                  ,
+                          to_node_id   : str                  ,
+                          predicate    : Optional[str] = None ,
+                          edge_path    : Optional[str] = None
+                   ) -> Schema__MGraph__Edge:
+        kwargs = dict(edge_id      = Edge_Id(edge_id)      ,
+                      from_node_id = Node_Id(from_node_id) ,
+                      to_node_id   = Node_Id(to_node_id)   ,
+                      edge_type    = Schema__MGraph__Edge  )
+        if predicate:
+            kwargs['edge_label'] = Schema__MGraph__Edge__Label(predicate=Safe_Id(predicate))
+        if edge_path is not None:
+            kwargs['edge_path'] = Edge_Path(edge_path)
+        return Schema__MGraph__Edge(**kwargs)
+
+    def add_node_schema(self, node: Schema__MGraph__Node) -> Schema__MGraph__Node: # Add an existing node schema (shared with its source graph, not copied)
+        self.raise_if_frozen()
+        self.mgraph.graph.model.data.nodes[node.node_id] = node
+        if self.index_on:
+            self.mgraph.index().add_node(node)
+        return node
+
+    def add_edge_schema(self, edge: Schema__MGraph__Edge) -> Schema__MGraph__Edge: # Add an existing edge schema (shared with its source graph, not copied)
+        self.raise_if_frozen()
+        self.mgraph.graph.model.data.edges[edge.edge_id] = edge
+        if self.index_on:
+            self.mgraph.index().add_edge(edge)
+        return edge
+
+    def restore_graph_json(self, graph_json: Dict[str, Any]) -> 'Html_MGraph__Base': # Rebuild nodes and edges from to_json() output
+        for node_json in graph_json.get('nodes', {}).values():
+            node_data = node_json.get('node_data') or {}
+            self.restore_node(node_id   = node_json.get('node_id')                             ,
+                              node_path = node_json.get('node_path')                           ,
+                              value     = node_data.get('value')                               ,
+                              key       = node_data.get('key')                                 ,
+                              is_value  = node_json.get('node_type') == NODE_TYPE__JSON__VALUE )
+        for edge_json in graph_json.get('edges', {}).values():
+            edge_label = edge_json.get('edge_label') or {}
+            self.restore_edge(edge_id      = edge_json.get('edge_id')      ,
+                              from_node_id = edge_json.get('from_node_id') ,
+                              to_node_id   = edge_json.get('to_node_id')   ,
+                              predicate    = edge_label.get('predicate')   ,
+                              edge_path    = edge_json.get('edge_path')    )
+        self.restore_caches()
+        return self
+
+    def restore_caches(self) -> None:                                           # Hook for graphs that keep lookup caches
+        pass
+
+    def restore_records(self, node_records : Dict[Node_Id, tuple] ,             # Frozen graph served from decoded snapshot records
+                              edge_records : List[tuple]                        # node_id -> (node_path, value, key, is_value) / (edge_id, from_node_id, to_node_id, predicate, edge_path)
+                       ) -> 'Html_MGraph__Base':
+        self._node_records = node_records
+        self._edge_records = edge_records
+        self.freeze__maps(((node_id, record[0]) for node_id, record in node_records.items()), edge_records)
+        self._mgraph       = None                                               # built by mgraph__from_records, on first use
+        self._from_records = True
+        self.frozen        = True
+        return self
+
+    def mgraph__from_records(self) -> MGraph:                                   # Build the MGraph of a snapshot-backed graph (no index, the graph is frozen)
+        mgraph = MGraph()
+        data   = mgraph.graph.model.data
+        for node_id, (node_path, value, key, is_value) in self._node_records.items():
+            node = self.node_schema(node_id, node_path, value, key, is_value)
+            data.nodes[node.node_id] = node
+        for record in self._edge_records:
+            edge = self.edge_schema(*record)
+            data.edges[edge.edge_id] = edge
+        return mgraph
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Freeze (read-only mode, see the notes at the top)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def freeze(self) -> 'Html_MGraph__Base':                                    # Compact into read structures, release the index and block writes
+        if self.frozen:
+            return self
+        model = self.mgraph.graph.model
+        self.freeze__maps(((node_id, node.node_path) for node_id, node in model.data.nodes.items()), self.edge_records())
+        self.mgraph = MGraph(graph=Domain__MGraph__Graph(model=model))          # same schemas, without the cached MGraph__Edit / MGraph__Index
+        self.frozen = True
+        return self
+
+    def freeze__maps(self, nodes : Iterable[tuple] ,                            # (node_id, node_path)
+                           edges : Iterable[tuple]                              # (edge_id, from_node_id, to_node_id, predicate, edge_path)
+                    ) -> None:                                                  # Build the frozen read maps (see the notes at the top)
+        children  = {}
+        in_edges  = {}
+        parents   = {}
+        for edge_id, from_node_id, to_node_id, predicate, edge_path in edges:
+            edge_path = str(edge_path) if edge_path is not None else ''
+            position  = int(edge_path) if edge_path.isdigit() else 0
+            children.setdefault(from_node_id, []).append((position, sys.intern(str(predicate)) if predicate else None, to_node_id, edge_id))
+            in_edges.setdefault(to_node_id  , []).append(edge_id)
+            parents .setdefault(to_node_id  , from_node_id)
+        path_nodes = {}
+        for node_id, node_path in nodes:
+            if node_path is not None:
+                path_nodes.setdefault(sys.intern(str(node_path)), []).append(node_id)
+
+        for items in children.values():
+            items.sort(key=lambda x: x[0])
+        self._children   = {node_id: tuple((predicate, child_id) for _, predicate, child_id, _ in items) for node_id, items in children.items()}
+        self._out_edges  = {node_id: tuple(edge_id for *_, edge_id in items)                             for node_id, items in children.items()}
+        self._in_edges   = {node_id: tuple(edge_ids)  for node_id, edge_ids  in in_edges  .items()}
+        self._parents    = parents
+        self._path_nodes = {node_path: tuple(node_ids) for node_path, node_ids in path_nodes.items()}
+
+    def raise_if_frozen(self) -> None:
+        if self.frozen:
+            raise ValueError(f"{type(self).__name__} is frozen (read-only), it can't be modified")
+
+    def node_schemas(self) -> List[Schema__MGraph__Node]:                       # Raw node schemas (no domain wrappers, used by serializers)
+        return list(self.mgraph.graph.model.data.nodes.values())
+
+    def edge_schemas(self) -> List[Schema__MGraph__Edge]:                       # Raw edge schemas (no domain wrappers, used by serializers)
+        return list(self.mgraph.graph.model.data.edges.values())
+
+    def edge_records(self) -> Iterable[tuple]:                                  # (edge_id, from_node_id, to_node_id, predicate, edge_path) per edge
+        if self._from_records:                                                  # (snapshot-backed graphs don't build their MGraph for this)
+            return self._edge_records
+        return ((edge.edge_id, edge.from_node_id, edge.to_node_id, edge.edge_label.predicate if edge.edge_label else None, edge.edge_path)
+                for edge in self.mgraph.graph.model.data.edges.values())
+
+    def node_values(self) -> Dict[Node_Id, str]:                                # node_id -> value, for every value node
+        if self._from_records:
+            return {node_id: record[1] for node_id, record in self._node_records.items() if record[3]}
+        return {node.node_id: node.node_data.value for node in self.mgraph.graph.model.data.nodes.values()
+                                                   if isinstance(node, Schema__MGraph__Node__Value)}
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Stats Methods - Returns Type_Safe Schema
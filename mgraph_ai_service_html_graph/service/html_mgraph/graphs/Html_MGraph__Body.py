@@ -97,27 +97,13 @@ class Html_MGraph__Body(Html_MGraph__Base):
         return ''.join(texts)
 
     def get_all_text_recursive(self, node_id: Node_Id) -> str:                  # Get all text content including descendants
-        items = []
-
-        text_ids  = self.get_text_nodes(node_id)                                # Get direct text nodes
-        child_ids = self.get_element_children(node_id)                          # Get child elements
-
-        all_items = []                                                          # Combine with positions for ordering
-        for edge in self.outgoing_edges(node_id):
-            predicate = self.edge_predicate(edge)
-            edge_path = self.edge_path(edge)
-            position  = int(str(edge_path)) if edge_path else 0
-            target_id = edge.edge.data.to_node_id
-
+        all_items = []                                                          # Text and child elements, in position order
+        for predicate, target_id in self.children_by_position(node_id):
             if predicate == self.PREDICATE_TEXT:
-                value = self.node_value(target_id)
-                all_items.append((position, value or ''))
+                all_items.append(self.node_value(target_id) or '')
             elif predicate == self.PREDICATE_CHILD:
-                child_text = self.get_all_text_recursive(target_id)
-                all_items.append((position, child_text))
-
-        all_items.sort(key=lambda x: x[0])
-        return ''.join(item[1] for item in all_items)
+                all_items.append(self.get_all_text_recursive(target_id))
+        return ''.join(all_items)
 
     def is_text_node(self, node_id: Node_Id) -> bool:                           # Check if node is a text value node
         path = self.node_path(node_id)
@@ -9,7 +9,7 @@ from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Styles
 from mgraph_db.mgraph.MGraph                                                            import MGraph
 from mgraph_db.mgraph.schemas.identifiers.Node_Path                                     import Node_Path
 from mgraph_db.mgraph.schemas.identifiers.Edge_Path                                     import Edge_Path
-from osbot_utils.helpers.timestamp_capture.decorators.timestamp                         import timestamp
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation   import timestamp
 from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id                       import Node_Id
 from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id                       import Safe_Id
 
@@ -81,6 +81,43 @@ class Html_MGraph__Document(Html_MGraph__Base):
 
         return self
 
+    def setup__for_restore(self, root_ids    : Dict[str, str] ,                 # Empty document + component graphs (filled by restore_node/restore_edge,
+                                 with_mgraph : bool = True                      #  or by restore_records with with_mgraph=False)
+                          ) -> 'Html_MGraph__Document':
+        super().setup__for_restore(root_ids.get('document'), with_mgraph)
+        self.head_graph    = Html_MGraph__Head      ().setup__for_restore(root_ids.get('head'      ), with_mgraph)
+        self.body_graph    = Html_MGraph__Body      ().setup__for_restore(root_ids.get('body'      ), with_mgraph)
+        self.attrs_graph   = Html_MGraph__Attributes().setup__for_restore(root_ids.get('attributes'), with_mgraph)
+        self.scripts_graph = Html_MGraph__Scripts   ().setup__for_restore(root_ids.get('scripts'   ), with_mgraph)
+        self.styles_graph  = Html_MGraph__Styles    ().setup__for_restore(root_ids.get('styles'    ), with_mgraph)
+        return self
+
+    def restore_from_json(self, data: Dict[str, Any]) -> 'Html_MGraph__Document':   # Rebuild all graphs from to_json() output (node ids are kept)
+        root_ids = {name: (graph_json or {}).get('root_id') for name, graph_json in data.items()}
+        self.setup__for_restore(root_ids)
+        for name, graph in self.graphs().items():
+            graph_json = data.get(name)
+            if graph_json is None:
+                raise ValueError(f"Missing graph in Html_MGraph json: {name}")
+            graph.restore_graph_json(graph_json)
+        return self
+
+    def graphs(self) -> Dict[str, Html_MGraph__Base]:                           # All graphs, keyed as in to_json()
+        return { 'document'   : self               ,
+                 'head'       : self.head_graph    ,
+                 'body'       : self.body_graph    ,
+                 'attributes' : self.attrs_graph   ,
+                 'scripts'    : self.scripts_graph ,
+                 'styles'     : self.styles_graph  }
+
+    def freeze(self) -> 'Html_MGraph__Document':                                # Read-only document: freeze this graph and all component graphs
+        for graph in self.graphs().values():
+            if graph is self:
+                super().freeze()
+            else:
+                graph.freeze()
+        return self
+
     def _link_component_graph(self, name: str, component_root_id: Node_Id) -> None:  # Create edge from document root to component graph root
         ref_node = self.new_value_node(value     = str(component_root_id) ,
                                        node_path = Node_Path(f"graph:{name}"))
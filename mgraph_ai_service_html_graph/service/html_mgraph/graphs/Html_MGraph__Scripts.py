@@ -93,11 +93,8 @@ class Html_MGraph__Scripts(Html_MGraph__Base):
     # ═══════════════════════════════════════════════════════════════════════════
 
     def get_script_content(self, node_id: Node_Id) -> Optional[str]:            # Get JavaScript content for a script element
-        edges = self.outgoing_edges(node_id)
-        for edge in edges:
-            if self.edge_predicate(edge) == self.PREDICATE_CONTENT:
-                content_node_id = edge.edge.data.to_node_id
-                return self.node_value(content_node_id)
+        for content_node_id in self.get_children(node_id, self.PREDICATE_CONTENT):   # (frozen graphs: read from the frozen maps)
+            return self.node_value(content_node_id)
         return None                                                             # External script or no content
 
     def is_inline_script(self, node_id: Node_Id) -> bool:                       # Check if script has inline content
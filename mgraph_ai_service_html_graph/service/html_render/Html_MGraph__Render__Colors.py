@@ -1,3 +1,4 @@
+from functools                                                                  import lru_cache
 from typing                                                                     import Dict
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
 from mgraph_ai_service_html_graph.schemas.enums.Enum__Html_Render__Color_Scheme import Enum__Html_Render__Color_Scheme
@@ -137,13 +138,18 @@ class Html_MGraph__Render__Colors(Type_Safe):
         return colors[index]
 
     def get_tag_color(self, tag_name: str) -> str:                                          # Get color for tag value node based on tag category
-        category = self._get_tag_category(tag_name.lower())
-        colors   = self._get_tag_category_colors()
-        return colors.get(category, colors['unknown'])
+        return self.tag_style(tag_name)[1]
 
     def get_tag_category(self, tag_name: str) -> str:                                       # Get the category name for a tag
         return self._get_tag_category(tag_name.lower())
 
+    def tag_style(self, tag_name: str) -> tuple:                                            # (category, fill, border, font) for a tag node: one dict lookup
+        styles = TAG_STYLES[self.scheme]
+        return styles.get(tag_name) or styles.get(tag_name.lower()) or styles[TAG_CATEGORY__UNKNOWN]
+
+    def border_color(self, fill_color: str) -> str:                                         # Border for a fill color (precomputed for the scheme colors)
+        return BORDER_COLORS.get(fill_color) or darken_hex(fill_color)
+
     def get_attr_color(self) -> str:                                                        # Get color for attribute value nodes
         return self.ATTR_COLORS.get(self.scheme.value, self.ATTR_COLORS['default'])
 
@@ -184,7 +190,64 @@ class Html_MGraph__Render__Colors(Type_Safe):
         return self.EDGE_COLORS_DEFAULT
 
     def _get_tag_category(self, tag_name: str) -> str:                                      # Determine which category a tag belongs to
-        for category, tags in self.TAG_CATEGORIES.items():
-            if tag_name in tags:
-                return category
-        return 'unknown'
+        return TAG_CATEGORY_LOOKUP.get(tag_name, TAG_CATEGORY__UNKNOWN)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# Precomputed lookup tables (built once, at import time)
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+TAG_CATEGORY__UNKNOWN = 'unknown'
+
+@lru_cache(maxsize=1024)
+def darken_hex(hex_color: str, amount: int = 30) -> str:                                     # Darker '#rrggbb' (border colors), '#CCCCCC' if not a valid hex color
+    if not hex_color or not hex_color.startswith('#') or len(hex_color) != 7:
+        return '#CCCCCC'
+    try:
+        r = max(0, int(hex_color[1:3], 16) - amount)
+        g = max(0, int(hex_color[3:5], 16) - amount)
+        b = max(0, int(hex_color[5:7], 16) - amount)
+        return f'#{r:02x}{g:02x}{b:02x}'
+    except ValueError:
+        return '#CCCCCC'
+
+@lru_cache(maxsize=1024)
+def lighten_hex(hex_color: str, amount: int = 30) -> str:                                    # Lighter '#rrggbb', '#FFFFFF' if not a valid hex color
+    if not hex_color or len(hex_color) != 7 or not hex_color.startswith('#'):
+        return '#FFFFFF'
+    try:
+        r = min(255, int(hex_color[1:3], 16) + amount)
+        g = min(255, int(hex_color[3:5], 16) + amount)
+        b = min(255, int(hex_color[5:7], 16) + amount)
+        return f'#{r:02x}{g:02x}{b:02x}'
+    except ValueError:
+        return '#FFFFFF'
+
+def build_tag_category_lookup() -> Dict[str, str]:                                           # tag → category (first category listing the tag wins)
+    lookup = {}
+    for category, tags in Html_MGraph__Render__Colors.TAG_CATEGORIES.items():
+        for tag in tags:
+            lookup.setdefault(tag, category)
+    return lookup
+
+def build_tag_styles(scheme: Enum__Html_Render__Color_Scheme) -> Dict[str, tuple]:          # tag → (category, fill, border, font), plus the 'unknown' fallback
+    colors          = Html_MGraph__Render__Colors(scheme=scheme)
+    category_colors = colors._get_tag_category_colors()
+    font            = colors.get_font_color('tag')
+    styles          = {}
+    for tag, category in list(TAG_CATEGORY_LOOKUP.items()) + [(TAG_CATEGORY__UNKNOWN, TAG_CATEGORY__UNKNOWN)]:
+        fill         = category_colors.get(category, category_colors[TAG_CATEGORY__UNKNOWN])
+        styles[tag]  = (category, fill, darken_hex(fill), font)
+    return styles
+
+def build_border_colors() -> Dict[str, str]:                                                 # fill → border, for the node fill colors of every scheme
+    colors = Html_MGraph__Render__Colors
+    fills  = [*colors.ELEMENT_COLORS_DEFAULT                      , *colors.ELEMENT_COLORS_MONOCHROME                   ,
+              *colors.ELEMENT_COLORS_HIGH_CONTRAST                , *colors.TAG_CATEGORY_COLORS_DEFAULT      .values() ,
+              *colors.TAG_CATEGORY_COLORS_MONOCHROME   .values()  , *colors.TAG_CATEGORY_COLORS_HIGH_CONTRAST.values() ,
+              *colors.ATTR_COLORS                      .values()  , *colors.TEXT_COLORS                      .values() ]
+    return {fill: darken_hex(fill) for fill in fills}
+
+TAG_CATEGORY_LOOKUP = build_tag_category_lookup()
+TAG_STYLES          = {scheme: build_tag_styles(scheme) for scheme in Enum__Html_Render__Color_Scheme}
+BORDER_COLORS       = build_border_colors()
@@ -0,0 +1,144 @@
+# Html_MGraph Render - Graphviz
+#
+# Local Graphviz rendering service (used by Html_MGraph__Screenshot when the
+# graphviz binaries are installed, instead of a remote render call per request)
+#
+#   - bounded pool : at most max_workers `dot`/`sfdp` subprocesses run at the same time
+#   - render queue : callers wait up to queue_timeout for a free slot, renders are killed after render_timeout
+#   - layout engine: `dot` for normal graphs, `sfdp` for graphs with more than sfdp_threshold nodes
+#   - output cache : LRU keyed by sha256(engine, format, dot_code), so repeated renders are free
+#   - formats      : png and svg (svg avoids the rasterization cost when the output is shown in a browser)
+
+import shutil
+import subprocess
+from threading                                  import BoundedSemaphore, Lock
+from typing                                     import Dict, Literal, Optional
+from osbot_utils.type_safe.Type_Safe            import Type_Safe
+from osbot_utils.utils.Misc                     import str_sha256
+
+GRAPHVIZ__ENGINE__DOT            = 'dot'
+GRAPHVIZ__ENGINE__SFDP           = 'sfdp'
+GRAPHVIZ__OUTPUT_FORMATS         = ('png', 'svg')
+GRAPHVIZ__DEFAULT__MAX_WORKERS   = 2                                            # Concurrent subprocesses (lambda has few cores)
+GRAPHVIZ__DEFAULT__SFDP_NODES    = 500                                          # Above this, dot's layout cost explodes
+
+
+class Html_MGraph__Render__Graphviz(Type_Safe):                                 # Pooled, cached Graphviz renderer
+    max_workers       : int             = GRAPHVIZ__DEFAULT__MAX_WORKERS        # Max concurrent render subprocesses
+    queue_timeout     : float           = 10.0                                  # Seconds to wait for a free render slot
+    render_timeout    : float           = 30.0                                  # Seconds before a render subprocess is killed
+    sfdp_threshold    : int             = GRAPHVIZ__DEFAULT__SFDP_NODES         # Node count above which sfdp is used
+    cache_max_entries : int             = 64                                    # Rendered outputs kept in memory
+    cache             : Dict[str, bytes]                                        # cache_key -> rendered bytes (oldest first)
+    hits              : int             = 0
+    misses            : int             = 0
+    _slots            : BoundedSemaphore = None                                 # Bounded worker pool
+    _lock             : object           = None                                 # Guards the cache (threading.Lock)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._slots = BoundedSemaphore(self.max_workers)
+        self._lock  = Lock()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Rendering
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def is_available(self, engine: str = GRAPHVIZ__ENGINE__DOT) -> bool:        # Is the graphviz binary installed?
+        return shutil.which(engine) is not None
+
+    def layout_engine(self, node_count: int) -> str:                            # dot for normal graphs, sfdp for big ones
+        if node_count > self.sfdp_threshold:
+            return GRAPHVIZ__ENGINE__SFDP
+        return GRAPHVIZ__ENGINE__DOT
+
+    def render(self, dot_code      : str                   ,                    # Render DOT code (cached)
+                     output_format : Literal['png', 'svg'] = 'png',
+                     node_count    : Optional[int]         = None
+              ) -> bytes:
+        if output_format not in GRAPHVIZ__OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported graphviz output format: {output_format}")
+        if node_count is None:
+            node_count = self.estimate_node_count(dot_code)
+
+        engine    = self.layout_engine(node_count)
+        cache_key = self.cache_key(engine, output_format, dot_code)
+        output    = self.cache_get(cache_key)
+        if output is None:
+            output = self.execute(engine, output_format, dot_code)
+            self.cache_add(cache_key, output)
+        return output
+
+    def render_png(self, dot_code: str, node_count: Optional[int] = None) -> bytes:
+        return self.render(dot_code, output_format='png', node_count=node_count)
+
+    def render_svg(self, dot_code: str, node_count: Optional[int] = None) -> str:
+        return self.render(dot_code, output_format='svg', node_count=node_count).decode('utf-8')
+
+    def execute(self, engine        : str,                                      # Run one graphviz subprocess (inside the pool)
+                      output_format : str,
+                      dot_code      : str
+               ) -> bytes:
+        if not self.is_available(engine):
+            raise RuntimeError(f"graphviz '{engine}' binary not found in PATH")
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise TimeoutError(f"graphviz render queue is full (waited {self.queue_timeout}s for one of {self.max_workers} workers)")
+        try:
+            result = subprocess.run([engine, f'-T{output_format}'],
+                                    input          = dot_code.encode('utf-8') ,
+                                    capture_output = True                     ,
+                                    timeout        = self.render_timeout      )
+        except subprocess.TimeoutExpired:
+            raise TimeoutError(f"graphviz '{engine}' render timed out after {self.render_timeout}s") from None
+        finally:
+            self._slots.release()
+        if result.returncode != 0:
+            raise RuntimeError(f"graphviz '{engine}' failed: {result.stderr.decode('utf-8', errors='replace').strip()}")
+        return result.stdout
+
+    def estimate_node_count(self, dot_code: str) -> int:                        # Node statements in DOT code (lines with attributes but no edge)
+        count = 0
+        for line in dot_code.splitlines():
+            line = line.strip()
+            if '[' in line and '->' not in line and '--' not in line and not line.startswith(('graph', 'node', 'edge')):
+                count += 1
+        return count
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Output Cache
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def cache_key(self, engine: str, output_format: str, dot_code: str) -> str:
+        return str_sha256(f'{engine}:{output_format}:{dot_code}')
+
+    def cache_get(self, cache_key: str) -> Optional[bytes]:
+        with self._lock:
+            output = self.cache.pop(cache_key, None)
+            if output is None:
+                self.misses += 1
+                return None
+            self.cache[cache_key] = output                                      # Move to most recently used
+            self.hits += 1
+            return output
+
+    def cache_add(self, cache_key: str, output: bytes) -> None:
+        with self._lock:
+            self.cache[cache_key] = output
+            while len(self.cache) > self.cache_max_entries:
+                del self.cache[next(iter(self.cache))]
+
+    def cache_clear(self) -> 'Html_MGraph__Render__Graphviz':
+        with self._lock:
+            self.cache.clear()
+            self.hits   = 0
+            self.misses = 0
+        return self
+
+    def stats(self) -> Dict[str, int]:
+        return { 'cache_size'  : len(self.cache)  ,
+                 'hits'        : self.hits        ,
+                 'misses'      : self.misses      ,
+                 'max_workers' : self.max_workers }
+
+
+graphviz_renderer = Html_MGraph__Render__Graphviz()                             # Shared instance (one pool per process)
@@ -1,8 +1,10 @@
-from osbot_utils.type_safe.Type_Safe                                              import Type_Safe
-from mgraph_db.mgraph.actions.MGraph__Screenshot                                  import MGraph__Screenshot
-from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                 import Html_MGraph
-from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Config import Html_MGraph__Render__Config, Enum__Html_Render__Preset
-from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors import Enum__Html_Render__Color_Scheme
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.utils.Files                                                        import file_create_from_bytes
+from mgraph_db.mgraph.actions.MGraph__Screenshot                                    import MGraph__Screenshot
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                   import Html_MGraph
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Config   import Html_MGraph__Render__Config, Enum__Html_Render__Preset
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors   import Enum__Html_Render__Color_Scheme
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Graphviz import Html_MGraph__Render__Graphviz, graphviz_renderer
 
 
 class Html_MGraph__Screenshot(Type_Safe):                                                   # Screenshot generation for HTML MGraph with semantic styling
@@ -11,6 +13,7 @@ class Html_MGraph__Screenshot(Type_Safe):
     screenshot  : MGraph__Screenshot           = None                                       # The underlying screenshot instance
     target_file : str                          = None                                       # Target file path for saving
     png_bytes   : bytes                        = None                                       # Generated PNG bytes
+    renderer    : Html_MGraph__Render__Graphviz = None                                      # Local graphviz renderer (defaults to the shared pool)
 
     def setup(self) -> 'Html_MGraph__Screenshot':                                           # Initialize the screenshot with HTML-aware configuration
         if self.html_mgraph is None:
@@ -77,12 +80,33 @@ class Html_MGraph__Screenshot(Type_Safe):
     def render(self, print_dot_code: bool = False) -> bytes:                                # Render the graph and return PNG bytes
         self.setup()                                                                        # Ensure setup is done
 
-        if self.target_file:
+        if self.graphviz().is_available():                                                  # Local graphviz pool (cached by DOT hash)
+            dot_code = self.screenshot.export().to__dot()
+            if print_dot_code:
+                print()
+                print(dot_code)
+            self.png_bytes = self.graphviz().render_png(dot_code, node_count=self.node_count())
+            if self.target_file:
+                file_create_from_bytes(self.target_file, self.png_bytes)
+            return self.png_bytes
+
+        if self.target_file:                                                                # Fallback: remote render server
             self.screenshot.save_to(self.target_file)
 
         self.png_bytes = self.screenshot.dot(print_dot_code=print_dot_code)
         return self.png_bytes
 
+    def render_svg(self) -> str:                                                            # Render the graph as SVG (needs local graphviz)
+        self.setup()
+        dot_code = self.screenshot.export().to__dot()
+        return self.graphviz().render_svg(dot_code, node_count=self.node_count())
+
+    def graphviz(self) -> Html_MGraph__Render__Graphviz:                                    # Renderer in use (shared pool by default)
+        return self.renderer or graphviz_renderer
+
+    def node_count(self) -> int:                                                            # Used to pick the layout engine (dot vs sfdp)
+        return len(self.html_mgraph.body_graph.nodes_ids())
+
     def save_to(self, path: str) -> 'Html_MGraph__Screenshot':                              # Set save path and return self for chaining
         self.target_file = path
         return self
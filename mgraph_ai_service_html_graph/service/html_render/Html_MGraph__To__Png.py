@@ -30,6 +30,10 @@ class Html_MGraph__To__Png(Type_Safe):
         self.setup__style()
         self.html_mgraph__screenshot().dot()
 
+    def to_svg(self):
+        self.setup__style()
+        return self.html_mgraph__screenshot().render_svg()
+
     def to_dot_code(self):
         self.setup__style()
         return self.html_mgraph__screenshot().dot_code()
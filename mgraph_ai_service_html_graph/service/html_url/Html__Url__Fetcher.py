@@ -1,7 +1,9 @@
 import requests
+from time                                                                           import perf_counter
 from mgraph_ai_service_html_graph.schemas.routes.Schema__Html__From_Url__Request    import Schema__Html__From_Url__Request
 from mgraph_ai_service_html_graph.schemas.routes.Schema__Html__From_Url__Response   import Schema__Html__From_Url__Response
 from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics       import html_graph_metrics, METRIC__URL_FETCH_DURATION, METRIC__URL_FETCH_ERRORS
 
 
 DEFAULT_USER_AGENT = 'Mozilla/5.0 (compatible; MGraph-AI/1.0; +https://github.com/owasp-sbot/MGraph-AI)'
@@ -21,6 +23,7 @@ class Html__Url__Fetcher(Type_Safe):
             'Accept-Language' : 'en-US,en;q=0.9'                              ,
         }
 
+        start = perf_counter()
         try:
             response = requests.get(url                    ,
                                     headers = headers      ,
@@ -38,10 +41,16 @@ class Html__Url__Fetcher(Type_Safe):
                                                     status_code  = response.status_code )
 
         except requests.exceptions.Timeout:
+            html_graph_metrics.inc(METRIC__URL_FETCH_ERRORS, reason='timeout')
             raise ValueError(f"Request timed out after {timeout} seconds")
         except requests.exceptions.ConnectionError as e:
+            html_graph_metrics.inc(METRIC__URL_FETCH_ERRORS, reason='connection')
             raise ValueError(f"Connection error: {str(e)}")
         except requests.exceptions.HTTPError as e:
+            html_graph_metrics.inc(METRIC__URL_FETCH_ERRORS, reason='http')
             raise ValueError(f"HTTP error: {e.response.status_code} - {e.response.reason}")
         except Exception as e:
-            raise ValueError(f"Failed to fetch URL: {str(e)}")
\ No newline at end of file
+            html_graph_metrics.inc(METRIC__URL_FETCH_ERRORS, reason='other')
+            raise ValueError(f"Failed to fetch URL: {str(e)}")
+        finally:
+            html_graph_metrics.observe(METRIC__URL_FETCH_DURATION, perf_counter() - start)
\ No newline at end of file
@@ -0,0 +1,114 @@
+# Html Graph Instrumentation
+#
+# Global switch for the timestamp instrumentation used across the service
+# (@timestamp, @timestamp_args and timestamp_block from osbot_utils).
+#
+# The osbot_utils versions look for an active Timestamp_Collector by walking the
+# call stack on every call, and timestamp_block allocates a generator based
+# context manager each time, even when nothing is being collected. In hot paths
+# (e.g. Html_MGraph__Attributes.add_attribute, called once per attribute) that
+# cost adds up, so the drop-in replacements in this module check a single flag
+# first:
+#
+#   off (default) : decorators call the wrapped function directly, and
+#                   timestamp_block returns a shared no-op context manager
+#                   (no frame inspection, no allocation)
+#   on            : same behaviour as the osbot_utils versions
+#
+# Instrumentation is switched on either globally (enable / disable, or the
+# HTML_GRAPH__INSTRUMENTATION env var), or for the duration of a block with
+# `with html_graph_instrumentation.active():` (used by the timestamps routes,
+# so only traced requests pay for it). active() sets a ContextVar, so it is
+# per request: other threads (and other asyncio tasks) running at the same time
+# stay on the no-op path.
+
+from contextlib                                                                 import contextmanager, nullcontext
+from contextvars                                                                import ContextVar
+from functools                                                                  import wraps
+from typing                                                                     import Callable
+from osbot_utils.helpers.timestamp_capture.context_managers.timestamp_block     import timestamp_block as osbot__timestamp_block
+from osbot_utils.helpers.timestamp_capture.decorators.timestamp                 import timestamp      as osbot__timestamp
+from osbot_utils.helpers.timestamp_capture.decorators.timestamp_args            import timestamp_args as osbot__timestamp_args
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Env                                                      import get_env
+
+ENV_NAME__HTML_GRAPH__INSTRUMENTATION = 'HTML_GRAPH__INSTRUMENTATION'
+
+
+class Html_Graph__Instrumentation(Type_Safe):                                   # On/off switch for timestamp instrumentation
+    enabled : bool   = False                                                    # Global switch (all requests)
+    _active : object = None                                                     # Per request switch (ContextVar[bool], set by active())
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._active = ContextVar('html_graph_instrumentation__active', default=False)
+        if get_env(ENV_NAME__HTML_GRAPH__INSTRUMENTATION, '').lower() in ('1', 'true', 'yes'):
+            self.enabled = True
+
+    @property
+    def on(self) -> bool:                                                       # the only check made in hot paths
+        return self.enabled or self._active.get()
+
+    def enable(self) -> 'Html_Graph__Instrumentation':
+        self.enabled = True
+        return self
+
+    def disable(self) -> 'Html_Graph__Instrumentation':
+        self.enabled = False
+        return self
+
+    @contextmanager
+    def active(self):                                                           # Switch instrumentation on for this block (current context only)
+        token = self._active.set(True)
+        try:
+            yield self
+        finally:
+            self._active.reset(token)
+
+
+html_graph_instrumentation = Html_Graph__Instrumentation()                      # Shared switch (one per process)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Drop-in replacements for the osbot_utils timestamp helpers
+# ═══════════════════════════════════════════════════════════════════════════════
+
+TIMESTAMP_BLOCK__NO_OP = nullcontext()                                          # Shared (nullcontext is reusable and re-entrant)
+
+
+def timestamp(func: Callable = None, *, name: str = None):                      # @timestamp that is free when instrumentation is off
+    def decorator(fn: Callable) -> Callable:
+        traced = osbot__timestamp(fn, name=name)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if html_graph_instrumentation.on:
+                return traced(*args, **kwargs)
+            return fn(*args, **kwargs)
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def timestamp_args(*, name: str):                                               # @timestamp_args that is free when instrumentation is off
+    traced_decorator = osbot__timestamp_args(name=name)                         # (validates name at decoration time, like the original)
+
+    def decorator(fn: Callable) -> Callable:
+        traced = traced_decorator(fn)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if html_graph_instrumentation.on:
+                return traced(*args, **kwargs)
+            return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def timestamp_block(name: str):                                                 # timestamp_block that is free when instrumentation is off
+    if html_graph_instrumentation.on:
+        return osbot__timestamp_block(name)
+    return TIMESTAMP_BLOCK__NO_OP
@@ -0,0 +1,128 @@
+# Html Graph Memory Profiler
+#
+# Peak and retained memory per pipeline phase of one graph export, measured with
+# tracemalloc, so we can size the Lambda memory setting and catch memory
+# regressions in the graph model.
+#
+#   per phase       : peak bytes above the start of the phase, and bytes still
+#                     allocated at its end (retained)
+#   whole run       : peak / retained bytes, and the top allocation sites (file:
+#                     line) of the memory still allocated at the end (snapshot
+#                     diff)
+#   graph model     : bytes per element = bytes retained by the parse phase (the
+#                     Html_MGraph) / elements in the html
+#
+# The phases are the ones timed by html_graph_metrics.phase(): the profiler
+# registers itself as an observer for the duration of profile(), and ignores
+# phases run by other threads. tracemalloc traces the whole process, so memory
+# allocated by concurrent requests is included; profiles are serialized (one at a
+# time), and tracing is only switched on for the duration of a profile.
+
+import re
+import threading
+import tracemalloc
+from contextlib                                                                         import contextmanager
+from time                                                                               import perf_counter
+from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Memory__Allocation_Site    import Schema__Memory__Allocation_Site
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Memory__Phase              import Schema__Memory__Phase
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Memory__Profile            import Schema__Memory__Profile
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics           import Html_Graph__Metrics, html_graph_metrics, PHASE__PARSE
+
+MEMORY__TOP_N           = 10
+MEMORY__PROFILE_LOCK    = threading.Lock()                                      # tracemalloc is process wide: one profile at a time
+REGEX__HTML_START_TAG   = re.compile(r'<[A-Za-z]')
+
+
+class Html_Graph__Memory_Profiler(Type_Safe):                                   # tracemalloc snapshots around each pipeline phase
+    name            : str
+    top_n           : int = MEMORY__TOP_N                                       # Allocation sites to report
+    phases          : list                                                      # Schema__Memory__Phase, in execution order
+    top_allocations : list                                                      # Schema__Memory__Allocation_Site, largest first
+    start_bytes     : int                                                       # Traced memory when the profile started
+    end_bytes       : int                                                       # Traced memory when the profile ended
+    peak_bytes      : int                                                       # Highest traced memory during the profile (absolute)
+    _open_phase     : list                                                      # [start bytes, start perf_counter] of the current phase
+    _thread_id      : int                                                       # Only phases run by this thread are measured
+
+    @contextmanager
+    def profile(self, metrics: Html_Graph__Metrics = None):                     # Measure the phases run inside this block
+        metrics = metrics or html_graph_metrics
+        with MEMORY__PROFILE_LOCK:
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            try:
+                snapshot_start   = tracemalloc.take_snapshot()
+                tracemalloc.reset_peak()
+                self.start_bytes = tracemalloc.get_traced_memory()[0]
+                self.peak_bytes  = self.start_bytes
+                self._thread_id  = threading.get_ident()
+                metrics.observers.append(self)
+                try:
+                    yield self
+                finally:
+                    metrics.observers.remove(self)
+                    self.end_bytes, peak = tracemalloc.get_traced_memory()
+                    self.peak_bytes      = max(self.peak_bytes, peak)
+                    snapshot_end         = tracemalloc.take_snapshot()
+                    self.top_allocations = self.allocation_sites(snapshot_start, snapshot_end)
+            finally:
+                if started_tracing:
+                    tracemalloc.stop()
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Phase observer (called by Html_Graph__Metrics.phase)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def phase_start(self, phase: str) -> None:
+        if threading.get_ident() != self._thread_id:
+            return
+        current, peak    = tracemalloc.get_traced_memory()
+        self.peak_bytes  = max(self.peak_bytes, peak)                           # keep the peak seen so far, reset_peak() clears it
+        tracemalloc.reset_peak()
+        self._open_phase = [current, perf_counter()]
+
+    def phase_end(self, phase: str, duration: float) -> None:
+        if threading.get_ident() != self._thread_id or not self._open_phase:
+            return
+        current, peak             = tracemalloc.get_traced_memory()
+        start_bytes, start_time   = self._open_phase
+        self.peak_bytes           = max(self.peak_bytes, peak)
+        self._open_phase          = []
+        self.phases.append(Schema__Memory__Phase(phase          = phase                                   ,
+                                                 duration_ms    = (perf_counter() - start_time) * 1000    ,
+                                                 peak_bytes     = peak    - start_bytes                   ,
+                                                 retained_bytes = current - start_bytes                   ))
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Results
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def allocation_sites(self, snapshot_start: tracemalloc.Snapshot,            # Lines with the most memory still allocated (net of frees)
+                               snapshot_end  : tracemalloc.Snapshot) -> list:
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                   tracemalloc.Filter(False, __file__            )]
+        stats   = snapshot_end.filter_traces(filters).compare_to(snapshot_start.filter_traces(filters), 'lineno')
+        stats   = sorted((stat for stat in stats if stat.size_diff > 0), key=lambda stat: stat.size_diff, reverse=True)
+        return [Schema__Memory__Allocation_Site(file       = stat.traceback[0].filename ,
+                                                line       = stat.traceback[0].lineno   ,
+                                                size_bytes = stat.size_diff             ,
+                                                count      = stat.count_diff            )
+                for stat in stats[:self.top_n]]
+
+    def phase_retained_bytes(self, phase: str) -> int:
+        return sum(item.retained_bytes for item in self.phases if item.phase == phase)
+
+    def to_profile(self, html: str) -> Schema__Memory__Profile:                 # html: the profiled document (for the per element metric)
+        element_count = len(REGEX__HTML_START_TAG.findall(html or ''))
+        parse_bytes   = self.phase_retained_bytes(PHASE__PARSE)
+        return Schema__Memory__Profile(name              = self.name                                                    ,
+                                       html_bytes        = len((html or '').encode('utf-8'))                            ,
+                                       element_count     = element_count                                                ,
+                                       peak_bytes        = self.peak_bytes - self.start_bytes                           ,
+                                       retained_bytes    = self.end_bytes  - self.start_bytes                           ,
+                                       parse_bytes       = parse_bytes                                                  ,
+                                       bytes_per_element = round(parse_bytes / element_count, 1) if element_count else 0.0,
+                                       phases            = self.phases                                                  ,
+                                       top_allocations   = self.top_allocations                                         )
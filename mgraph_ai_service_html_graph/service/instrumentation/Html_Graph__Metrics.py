@@ -0,0 +1,177 @@
+# Html Graph Metrics
+#
+# In-process metrics for the export pipeline, exposed at GET /metrics in the
+# Prometheus text format (version 0.0.4), for SLO dashboards.
+#
+#   histograms : per-phase latency (parse, select, transform, render, post_process)
+#                and whole request latency, labeled by engine and transformation;
+#                URL fetch latency
+#   counters   : requests, rendered node / edge counts, errors (per phase), URL
+#                fetch errors (per reason)
+#   caches     : hits / misses / entries of the parse cache and the graphviz
+#                output cache (read from their stats() at scrape time)
+#
+# Labels only use the resolved transformation name (unknown names fall back to
+# 'default' in the registry, pipelines and filters use their base
+# transformation, see metrics_name) and the engine names, so the number of
+# series is bounded. Recording is a dict update under a lock; there is no dependency on
+# prometheus_client.
+
+from bisect                                                                     import bisect_left
+from contextlib                                                                 import contextmanager
+from threading                                                                  import Lock
+from time                                                                       import perf_counter
+from typing                                                                     import Dict, List, Tuple
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+METRICS__CONTENT_TYPE       = 'text/plain; version=0.0.4; charset=utf-8'
+METRICS__DEFAULT_BUCKETS    = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)       # seconds
+
+METRIC__PHASE_DURATION      = 'html_graph_phase_duration_seconds'
+METRIC__REQUEST_DURATION    = 'html_graph_request_duration_seconds'
+METRIC__REQUESTS            = 'html_graph_requests_total'
+METRIC__NODES               = 'html_graph_nodes_total'
+METRIC__EDGES               = 'html_graph_edges_total'
+METRIC__ERRORS              = 'html_graph_errors_total'
+METRIC__URL_FETCH_DURATION  = 'html_graph_url_fetch_duration_seconds'
+METRIC__URL_FETCH_ERRORS    = 'html_graph_url_fetch_errors_total'
+METRIC__CACHE_HITS          = 'html_graph_cache_hits_total'
+METRIC__CACHE_MISSES        = 'html_graph_cache_misses_total'
+METRIC__CACHE_ENTRIES       = 'html_graph_cache_entries'
+
+METRICS__DEFINITIONS = { METRIC__PHASE_DURATION     : ('histogram', 'Duration of each export pipeline phase'                     ),
+                         METRIC__REQUEST_DURATION   : ('histogram', 'Duration of a whole export request (all phases)'            ),
+                         METRIC__REQUESTS           : ('counter'  , 'Export requests completed'                                  ),
+                         METRIC__NODES              : ('counter'  , 'Nodes in the rendered graphs'                               ),
+                         METRIC__EDGES              : ('counter'  , 'Edges in the rendered graphs'                               ),
+                         METRIC__ERRORS             : ('counter'  , 'Errors raised by an export pipeline phase'                  ),
+                         METRIC__URL_FETCH_DURATION : ('histogram', 'Duration of fetching html from a url'                       ),
+                         METRIC__URL_FETCH_ERRORS   : ('counter'  , 'Failed url fetches'                                         ),
+                         METRIC__CACHE_HITS         : ('counter'  , 'Cache hits'                                                 ),
+                         METRIC__CACHE_MISSES       : ('counter'  , 'Cache misses'                                               ),
+                         METRIC__CACHE_ENTRIES      : ('gauge'    , 'Entries currently held in the cache'                        )}
+
+PHASE__PARSE        = 'parse'                                                   # Phase 1: html → Html_MGraph
+PHASE__SELECT       = 'select'                                                  # Phase 2: Html_MGraph → MGraph
+PHASE__TRANSFORM    = 'transform'                                               # Phase 3: MGraph → MGraph
+PHASE__RENDER       = 'render'                                                  # Phase 4: MGraph → Output
+PHASE__POST_PROCESS = 'post_process'                                            # Phase 5: Output → Output
+
+
+class Html_Graph__Metrics(Type_Safe):                                           # Histograms and counters, rendered in the Prometheus text format
+    buckets    : list                                                           # Histogram upper bounds in seconds (default: METRICS__DEFAULT_BUCKETS)
+    histograms : dict                                                           # (name, labels) -> [bucket counts, sum, count]
+    counters   : dict                                                           # (name, labels) -> value
+    observers  : list                                                           # Notified at each phase start / end (e.g. Html_Graph__Memory_Profiler)
+    _lock      : object = None                                                  # Guards histograms and counters (threading.Lock)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = Lock()
+        if not self.buckets:
+            self.buckets = list(METRICS__DEFAULT_BUCKETS)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Recording
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def observe(self, name: str, value: float, **labels) -> None:               # Add a value to a histogram
+        key = (name, tuple(labels.items()))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            histogram[0][bisect_left(self.buckets, value)] += 1                 # last slot is +Inf
+            histogram[1] += value
+            histogram[2] += 1
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:               # Increment a counter
+        key = (name, tuple(labels.items()))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def phase(self, phase: str, engine: str, transformation: str,               # Time a pipeline phase (and count its errors)
+                    timings: dict = None):                                      # optional per-request dict: phase -> seconds
+        for observer in self.observers:
+            observer.phase_start(phase)
+        start = perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc(METRIC__ERRORS, phase=phase, engine=engine, transformation=transformation)
+            raise
+        finally:
+            duration = perf_counter() - start
+            for observer in self.observers:
+                observer.phase_end(phase, duration)
+            self.observe(METRIC__PHASE_DURATION, duration, phase=phase, engine=engine, transformation=transformation)
+            if timings is not None:
+                timings[phase] = timings.get(phase, 0.0) + duration
+
+    def record_request(self, engine: str, transformation: str,                  # Request level metrics (after all phases)
+                             duration: float, stats: Dict[str, int]) -> None:
+        self.observe(METRIC__REQUEST_DURATION, duration                     , engine=engine, transformation=transformation)
+        self.inc    (METRIC__REQUESTS                                       , engine=engine, transformation=transformation)
+        self.inc    (METRIC__NODES           , stats.get('node_count', 0)   , engine=engine, transformation=transformation)
+        self.inc    (METRIC__EDGES           , stats.get('edge_count', 0)   , engine=engine, transformation=transformation)
+
+    def reset(self) -> 'Html_Graph__Metrics':
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+        return self
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Prometheus text format
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def render(self, cache_stats: Dict[str, Dict[str, int]] = None) -> str:     # cache_stats: cache name -> its stats() dict
+        with self._lock:
+            histograms = {key: (list(value[0]), value[1], value[2]) for key, value in self.histograms.items()}
+            counters   = dict(self.counters)
+        for cache_name, stats in (cache_stats or {}).items():
+            labels = (('cache', cache_name),)
+            counters[(METRIC__CACHE_HITS   , labels)] = stats.get('hits'  , 0)
+            counters[(METRIC__CACHE_MISSES , labels)] = stats.get('misses', 0)
+            counters[(METRIC__CACHE_ENTRIES, labels)] = stats.get('size'  , stats.get('cache_size', 0))
+
+        lines = []
+        for name, (metric_type, help_text) in METRICS__DEFINITIONS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            if metric_type == 'histogram':
+                for (_, labels), value in sorted(item for item in histograms.items() if item[0][0] == name):
+                    lines.extend(self.histogram_lines(name, labels, *value))
+            else:
+                for (_, labels), value in sorted(item for item in counters.items() if item[0][0] == name):
+                    lines.append(f'{name}{self.labels_text(labels)} {self.value_text(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def histogram_lines(self, name: str, labels: Tuple, bucket_counts: List[int], total: float, count: int) -> List[str]:
+        lines      = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, bucket_counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{self.labels_text(labels + (("le", self.value_text(bound)),))} {cumulative}')
+        lines.append(f'{name}_bucket{self.labels_text(labels + (("le", "+Inf"),))} {count}')
+        lines.append(f'{name}_sum{self.labels_text(labels)} {self.value_text(total)}')
+        lines.append(f'{name}_count{self.labels_text(labels)} {count}')
+        return lines
+
+    def labels_text(self, labels: Tuple) -> str:
+        if not labels:
+            return ''
+        items = []
+        for label, value in labels:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            items.append(f'{label}="{value}"')
+        return '{' + ','.join(items) + '}'
+
+    def value_text(self, value: float) -> str:                                  # 1 (not 1.0) for whole numbers, repr otherwise
+        if float(value).is_integer():
+            return str(int(value))
+        return repr(float(value))
+
+
+html_graph_metrics = Html_Graph__Metrics()                                      # Shared registry (one per process)
@@ -0,0 +1,185 @@
+# Html Graph Startup
+#
+# Cold start timing and pre-warm for the Lambda (see fast_api/lambda_handler.py).
+#
+#   steps       : wall time of each startup step (load_dependencies, import,
+#                 setup, and the pre_warm.* steps below)
+#   imports     : self time of each module imported while import_timer() is on
+#                 (builtins.__import__ is wrapped for the duration of the block;
+#                 the time of nested imports is charged to the nested module),
+#                 reported per module (top_n slowest) and per top level package
+#
+# pre_warm() runs, during init (which is not billed as part of a request), the
+# work that would otherwise land on the first request after a cold start:
+#
+#   pre_warm.schemas    : builds (and serializes) the route request and export
+#                         response schemas, so the Type_Safe class introspection
+#                         is cached
+#   pre_warm.registry   : resolves the pre-warm engine / transformation from the
+#                         (lazy) registries and builds the engine config
+#   pre_warm.parse      : runs a tiny document through every pipeline phase
+#
+# The pipeline phases are called directly (not via Html_Graph__Export__Service.to_*)
+# so the pre-warm request is not recorded in html_graph_metrics. The service and
+# schema imports happen inside pre_warm(), so this module can be imported (and
+# the import timer started) before the app is.
+#
+#   HTML_GRAPH__PRE_WARM        : set to 0 / false / no to skip the pre-warm
+#   HTML_GRAPH__STARTUP_REPORT  : set to 1 / true / yes to print report_text()
+#                                 at the end of init (to the Lambda logs)
+
+import builtins
+import sys
+from contextlib                                                                 import contextmanager
+from time                                                                       import perf_counter
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Env                                                      import get_env
+from mgraph_ai_service_html_graph.schemas.startup.Schema__Startup__Report       import Schema__Startup__Report
+
+ENV_NAME__HTML_GRAPH__PRE_WARM          = 'HTML_GRAPH__PRE_WARM'
+ENV_NAME__HTML_GRAPH__STARTUP_REPORT    = 'HTML_GRAPH__STARTUP_REPORT'
+
+STARTUP__TOP_N              = 20
+STARTUP__PRE_WARM__HTML     = '<html><head><title>pre-warm</title></head><body><div class="pre-warm"><p>pre-warm</p></div></body></html>'
+STEP__LOAD_DEPENDENCIES     = 'load_dependencies'
+STEP__IMPORT                = 'import'
+STEP__SETUP                 = 'setup'
+STEP__PRE_WARM__SCHEMAS     = 'pre_warm.schemas'
+STEP__PRE_WARM__REGISTRY    = 'pre_warm.registry'
+STEP__PRE_WARM__PARSE       = 'pre_warm.parse'
+
+
+class Html_Graph__Startup(Type_Safe):                                           # Startup step / module import timings, and the pre-warm
+    engine          : str    = 'dot'                                            # Engine and transformation warmed by pre_warm()
+    transformation  : str    = 'default'
+    top_n           : int    = STARTUP__TOP_N                                   # Modules listed in the report
+    pre_warm_on     : bool   = True                                             # Run pre_warm() during init (HTML_GRAPH__PRE_WARM)
+    print_report    : bool   = False                                            # Print report_text() at the end of init (HTML_GRAPH__STARTUP_REPORT)
+    steps           : dict                                                      # step -> seconds
+    imports         : dict                                                      # module -> self seconds
+    _children       : list                                                      # Stack: seconds spent in nested (new) imports, per open import
+    _builtin_import : object = None                                             # builtins.__import__ while import_timer() is on
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if get_env(ENV_NAME__HTML_GRAPH__PRE_WARM, '').lower() in ('0', 'false', 'no'):
+            self.pre_warm_on = False
+        if get_env(ENV_NAME__HTML_GRAPH__STARTUP_REPORT, '').lower() in ('1', 'true', 'yes'):
+            self.print_report = True
+
+    @contextmanager
+    def step(self, name: str):                                                  # Time a startup step
+        start = perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_step(name, perf_counter() - start)
+
+    def add_step(self, name: str, seconds: float) -> 'Html_Graph__Startup':     # For steps timed before this module could be imported (load_dependencies)
+        self.steps[name] = self.steps.get(name, 0.0) + seconds
+        return self
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Import timer
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    @contextmanager
+    def import_timer(self):                                                     # Time the module imports made inside this block
+        if self._builtin_import is not None:                                    # already on (nested block)
+            yield self
+            return
+        self._builtin_import = builtins.__import__
+        builtins.__import__  = self.timed_import
+        try:
+            yield self
+        finally:
+            builtins.__import__  = self._builtin_import
+            self._builtin_import = None
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module_count = len(sys.modules)
+        self._children.append(0.0)
+        start = perf_counter()
+        try:
+            return self._builtin_import(name, globals, locals, fromlist, level)
+        finally:
+            seconds  = perf_counter() - start
+            children = self._children.pop()
+            if len(sys.modules) > module_count:                                 # only imports that loaded something (not the sys.modules lookups)
+                module_name               = self.module_name(name, globals, level)
+                self.imports[module_name] = self.imports.get(module_name, 0.0) + seconds - children
+                if self._children:
+                    self._children[-1] += seconds
+
+    def module_name(self, name: str, globals: dict, level: int) -> str:         # Absolute name of a (possibly relative) import
+        if level and globals:
+            package = (globals.get('__package__') or '').rsplit('.', level - 1)[0]
+            return f'{package}.{name}' if name else package
+        return name
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Pre-warm
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def pre_warm(self) -> 'Html_Graph__Startup':                                # First request work, done during init
+        from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__From_Html__Request          import Schema__Graph__From_Html__Request
+        from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__From_Url__Request           import Schema__Graph__From_Url__Request
+        from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__Subtree__Request            import Schema__Graph__Subtree__Request
+        from mgraph_ai_service_html_graph.service.html_graph__export                                import Html_Graph__Export__Schemas as schemas
+        from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service    import Html_Graph__Export__Service
+
+        with self.step(STEP__PRE_WARM__SCHEMAS):
+            for schema_class in (Schema__Graph__From_Html__Request      , Schema__Graph__From_Url__Request     ,
+                                 Schema__Graph__Subtree__Request        , schemas.Schema__Graph__Timings       ,
+                                 schemas.Schema__Graph__Dot__Response   , schemas.Schema__Graph__D3__Response  ,
+                                 schemas.Schema__Graph__VisJs__Response , schemas.Schema__Graph__Tree__Response,
+                                 schemas.Schema__Graph__Subtree__Response):
+                schema_class().json()
+
+        with self.step(STEP__PRE_WARM__REGISTRY):
+            graph_service  = Html_Graph__Export__Service()
+            transformation = graph_service.get_transformation(self.transformation)
+            engine_class   = graph_service.engine_class(self.engine)
+            config         = graph_service.engine_config_class(self.engine)()
+            config         = getattr(transformation, graph_service.CONFIG_METHODS[self.engine])(config)
+
+        with self.step(STEP__PRE_WARM__PARSE):
+            html_mgraph = transformation.html__to__html_mgraph(STARTUP__PRE_WARM__HTML)
+            mgraph      = transformation.html_mgraph__to__mgraph(html_mgraph)
+            mgraph      = transformation.transform_mgraph(mgraph)
+            output      = engine_class(mgraph=mgraph, config=config).export()
+            transformation.transform_export(output)
+        return self
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Report
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def report(self) -> Schema__Startup__Report:
+        packages = {}
+        for module_name, seconds in self.imports.items():
+            package           = module_name.split('.', 1)[0]
+            packages[package] = packages.get(package, 0.0) + seconds
+        return Schema__Startup__Report(total_ms     = round(sum(self.steps.values()) * 1000, 3)     ,
+                                       steps        = self.milliseconds(self.steps.items())         ,
+                                       packages     = self.milliseconds(self.slowest(packages))     ,
+                                       modules      = self.milliseconds(self.slowest(self.imports)) ,
+                                       module_count = len(self.imports)                             )
+
+    def slowest(self, timings: dict) -> list:                                   # The top_n (name, seconds), slowest first
+        return sorted(timings.items(), key=lambda item: -item[1])[:self.top_n]
+
+    def milliseconds(self, timings) -> dict:                                    # (name, seconds) items -> {name: ms}
+        return {name: round(seconds * 1000, 3) for name, seconds in timings}
+
+    def report_text(self) -> str:                                               # One line per step, package and module (for the Lambda logs)
+        report = self.report()
+        lines  = [f'cold start: {report.total_ms:.1f}ms ({report.module_count} modules imported)']
+        for title, timings in (('steps', report.steps), ('packages', report.packages), ('modules', report.modules)):
+            lines.append(f'  {title}:')
+            for name, ms in timings.items():
+                lines.append(f'    {name:<70} {ms:>10.1f}ms')
+        return '\n'.join(lines)
+
+
+html_graph_startup = Html_Graph__Startup()                                      # Global instance (filled in by lambda_handler, read by GET /metrics/startup)
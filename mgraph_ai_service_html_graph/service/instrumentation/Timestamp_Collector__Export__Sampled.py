@@ -0,0 +1,147 @@
+# Timestamp Collector Export - Sampled
+#
+# Timestamp_Collector__Export for a Timestamp_Collector__Sampled. Same export
+# schemas (Schema__Export_Full, Schema__Export_Summary, speedscope json), but the
+# per-method numbers are scaled from the recorded calls up to all calls made:
+#
+#   call_count         = calls made (exact, every call is counted)
+#   total_ns / self_ns = recorded time * (calls made / calls recorded), where
+#                        self time excludes the time spent in unrecorded calls
+#   min_ns / max_ns    = as recorded (not scaled)
+#
+# The speedscope json keeps the evented profile of the recorded calls (real
+# timeline) and adds a 'sampled' profile whose weights are the scaled self times
+# (estimated totals, shown in speedscope's left heavy / sandwich views).
+
+from typing                                                                             import Dict, List
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Analysis        import Timestamp_Collector__Analysis
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Export          import Timestamp_Collector__Export
+from osbot_utils.helpers.timestamp_capture.schemas.capture.Schema__Method_Timing        import Schema__Method_Timing
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Call_Tree_Node        import Schema__Call_Tree_Node
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Full           import Schema__Export_Full
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Hotspot        import Schema__Export_Hotspot
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Method_Timing  import Schema__Export_Method_Timing
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Summary        import Schema__Export_Summary
+from osbot_utils.helpers.timestamp_capture.static_methods.timestamp_utils               import method_timing__total_ms, method_timing__self_ms, method_timing__avg_ms
+from osbot_utils.utils.Json                                                             import json_to_str
+from mgraph_ai_service_html_graph.service.instrumentation.Timestamp_Collector__Sampled  import Timestamp_Collector__Sampled, EXTRA__UNRECORDED_NS
+
+HOTSPOTS__TOP_N = 10
+
+
+class Timestamp_Collector__Export__Sampled(Timestamp_Collector__Export):        # Exports with per-method totals scaled to all calls
+    collector : Timestamp_Collector__Sampled = None
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Scaled timings
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def scaled_method_timings(self) -> List[Schema__Method_Timing]:             # Sorted by (scaled) total time
+        analysis   = Timestamp_Collector__Analysis(collector=self.collector)
+        unrecorded = self.unrecorded_ns__by_name()
+        timings    = []
+        for mt in analysis.get_method_timings().values():
+            scale   = self.collector.scale(mt.name)
+            self_ns = mt.self_ns - unrecorded.get(mt.name, 0)
+            timings.append(Schema__Method_Timing(name       = mt.name                                    ,
+                                                 call_count = self.collector.calls_seen.get(mt.name, 0)  ,
+                                                 total_ns   = int(mt.total_ns * scale)                   ,
+                                                 self_ns    = int(self_ns     * scale)                   ,
+                                                 min_ns     = mt.min_ns                                  ,
+                                                 max_ns     = mt.max_ns                                  ))
+        return sorted(timings, key=lambda t: t.total_ns, reverse=True)
+
+    def enter_entries(self) -> list:                                            # In call order (same order as Schema__Call_Tree_Node.call_index)
+        return [entry for entry in self.collector.entries if entry.event == 'enter']
+
+    def unrecorded_ns__by_name(self) -> Dict[str, int]:                         # Time spent in unrecorded calls, per recorded caller name
+        unrecorded = {}
+        for entry in self.enter_entries():
+            if entry.extra and EXTRA__UNRECORDED_NS in entry.extra:
+                unrecorded[entry.name] = unrecorded.get(entry.name, 0) + entry.extra[EXTRA__UNRECORDED_NS]
+        return unrecorded
+
+    def build_call_tree(self) -> List[Schema__Call_Tree_Node]:                  # Call tree with self times that exclude unrecorded calls
+        roots         = super().build_call_tree()
+        enter_entries = self.enter_entries()
+
+        def adjust(node: Schema__Call_Tree_Node):
+            extra = enter_entries[node.call_index].extra
+            if extra and EXTRA__UNRECORDED_NS in extra:
+                node.self_ns -= extra[EXTRA__UNRECORDED_NS]
+                node.self_ms  = node.self_ns / 1_000_000
+            for child in node.children:
+                adjust(child)
+
+        for root in roots:
+            adjust(root)
+        return roots
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Full / Summary Export
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def to_export_full(self) -> Schema__Export_Full:                            # Recorded entries + call tree, scaled method timings
+        export_full = super().to_export_full()
+        export_full.method_timings = [Schema__Export_Method_Timing(name       = mt.name                     ,
+                                                                   call_count = mt.call_count               ,
+                                                                   total_ns   = mt.total_ns                 ,
+                                                                   total_ms   = method_timing__total_ms(mt) ,
+                                                                   self_ns    = mt.self_ns                  ,
+                                                                   self_ms    = method_timing__self_ms(mt)  ,
+                                                                   avg_ms     = method_timing__avg_ms(mt)   ,
+                                                                   min_ns     = mt.min_ns                   ,
+                                                                   max_ns     = mt.max_ns                   )
+                                      for mt in self.scaled_method_timings()]
+        return export_full
+
+    def to_export_summary(self) -> Schema__Export_Summary:                      # Hotspots ranked by scaled self time
+        timings  = sorted(self.scaled_method_timings(), key=lambda t: t.self_ns, reverse=True)[:HOTSPOTS__TOP_N]
+        total_ns = self.collector.total_duration_ns()
+        hotspots = [Schema__Export_Hotspot(name       = mt.name                                                          ,
+                                           self_ms    = round(method_timing__self_ms(mt), 2)                             ,
+                                           percentage = round((mt.self_ns / total_ns * 100) if total_ns > 0 else 0, 1)   ,
+                                           calls      = mt.call_count                                                    )
+                    for mt in timings]
+        return Schema__Export_Summary(name              = self.collector.name                          ,
+                                      total_duration_ms = round(self.collector.total_duration_ms(), 2) ,
+                                      method_count      = len(self.collector.calls_seen)               ,
+                                      entry_count       = self.collector.entry_count()                 ,
+                                      hotspots          = hotspots                                     )
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Speedscope Format
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def to_speedscope_json(self) -> str:                                        # Evented profile (recorded calls) + sampled profile (scaled totals)
+        json_data = self.to_speedscope().json()
+        json_data['$schema'] = json_data.pop('schema')                          # Speedscope requires '$schema' key
+
+        frame_indexes = {frame['name']: index for index, frame in enumerate(json_data['shared']['frames'])}
+        samples, weights = self.scaled_samples(frame_indexes)
+        json_data['profiles'].append({'type'       : 'sampled'                           ,
+                                      'name'       : f'{self.collector.name} (scaled)'   ,
+                                      'unit'       : 'microseconds'                      ,
+                                      'startValue' : 0                                   ,
+                                      'endValue'   : sum(weights)                        ,
+                                      'samples'    : samples                             ,
+                                      'weights'    : weights                             })
+        json_data['activeProfileIndex'] = len(json_data['profiles']) - 1
+        return json_to_str(json_data)
+
+    def scaled_samples(self, frame_indexes: Dict[str, int]) -> tuple:           # One sample per call tree node: its stack, weighted by scaled self time (μs)
+        samples = []
+        weights = []
+
+        def traverse(node: Schema__Call_Tree_Node, stack: List[int]):
+            current_stack = stack + [frame_indexes[node.name]]
+            weight        = node.self_ns * self.collector.scale(node.name) / 1000
+            if weight > 0:
+                samples.append(current_stack)
+                weights.append(weight)
+            for child in node.children:
+                traverse(child, current_stack)
+
+        for root in self.build_call_tree():
+            traverse(root, [])
+        return samples, weights
@@ -0,0 +1,97 @@
+# Timestamp Collector - Sampled
+#
+# Timestamp_Collector that only records a subset of the @timestamp /
+# timestamp_block calls, so production-size documents can be traced without the
+# collector dominating the run (a full capture records two entries per call, and
+# pages with thousands of elements make hundreds of thousands of calls).
+#
+# Two sampling modes (they can be combined):
+#
+#   sample_rate    : record 1 in N calls, counted per method name (the first call
+#                    of each method is always recorded)
+#   time_budget_ms : record every call for the first N ms of the run, then only
+#                    count calls
+#
+# Every call is counted (calls_seen), so Timestamp_Collector__Export__Sampled can
+# scale the recorded timings back up to estimated totals. Calls that are not
+# recorded are still timed (two clock reads, no entry), and their time is stored
+# on the nearest recorded caller's enter entry (extra['unrecorded_ns']), so that
+# the caller's self time does not absorb it.
+
+import time
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                  import Timestamp_Collector
+
+SAMPLE_RATE__ALL_CALLS = 1
+EXTRA__UNRECORDED_NS   = 'unrecorded_ns'
+
+
+class Timestamp_Collector__Sampled(Timestamp_Collector):                        # Records 1-in-N calls per method and/or the first N ms
+    sample_rate      : int   = SAMPLE_RATE__ALL_CALLS                           # Record 1 in N calls per method name
+    time_budget_ms   : float = 0.0                                              # Stop recording after this many ms (0 = no budget)
+    calls_seen       : dict                                                     # method name -> calls made
+    calls_recorded   : dict                                                     # method name -> calls recorded
+    _frames          : list                                                     # One [recorded, start_ns, recorded_inside_ns] per open call
+    _budget_end_ns   : int   = 0                                                # perf_counter_ns after which nothing new is recorded
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.sample_rate < SAMPLE_RATE__ALL_CALLS:
+            raise ValueError(f"sample_rate must be >= 1, got: {self.sample_rate}")
+        if self.time_budget_ms < 0:
+            raise ValueError(f"time_budget_ms must be >= 0, got: {self.time_budget_ms}")
+
+    def __enter__(self):
+        super().__enter__()
+        if self.time_budget_ms:
+            self._budget_end_ns = self.start_time_ns + int(self.time_budget_ms * 1_000_000)
+        return self
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Recording API
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def enter(self, name: str, extra=None):                                     # Count the call, record it if sampled
+        seen                  = self.calls_seen.get(name, 0)
+        self.calls_seen[name] = seen + 1
+        recorded              = (seen % self.sample_rate == 0) and not self.budget_exceeded()
+        if recorded:
+            self.calls_recorded[name] = self.calls_recorded.get(name, 0) + 1
+            super().enter(name, extra)
+        self._frames.append([recorded, time.perf_counter_ns(), 0])
+
+    def exit(self, name: str, extra=None):                                      # Record the exit only if the enter was recorded
+        if not self._frames:
+            return
+        recorded, start_ns, recorded_inside_ns = self._frames.pop()
+        duration_ns = time.perf_counter_ns() - start_ns
+        if recorded:
+            super().exit(name, extra)
+        parent = self._frames[-1] if self._frames else None
+        if parent is None:
+            return
+        if not parent[0]:                                                       # unrecorded parent: pass up the recorded time inside it
+            parent[2] += duration_ns if recorded else recorded_inside_ns
+        elif not recorded and self._call_stack:                                 # recorded parent: store the time it spent in unrecorded calls
+            parent_entry       = self._call_stack[-1]
+            parent_entry.extra = parent_entry.extra or {}
+            unrecorded_ns      = parent_entry.extra.get(EXTRA__UNRECORDED_NS, 0)
+            parent_entry.extra[EXTRA__UNRECORDED_NS] = unrecorded_ns + duration_ns - recorded_inside_ns
+
+    def budget_exceeded(self) -> bool:
+        return self._budget_end_ns > 0 and time.perf_counter_ns() > self._budget_end_ns
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Accessors
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def scale(self, name: str) -> float:                                        # calls made / calls recorded (1.0 when every call was recorded)
+        recorded = self.calls_recorded.get(name, 0)
+        if recorded == 0:
+            return 1.0
+        return self.calls_seen.get(name, 0) / recorded
+
+    def total_calls_seen(self) -> int:
+        return sum(self.calls_seen.values())
+
+    def total_calls_recorded(self) -> int:
+        return sum(self.calls_recorded.values())
@@ -6,8 +6,9 @@
 # export logic.
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing                                                                                     import Any, List, Optional
+from typing                                                                                     import Any, Dict, List, Optional, Tuple
 from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__Base  import MGraph__Engine__Config__Base
+from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Layout                import MGraph__Engine__Layout
 from mgraph_db.mgraph.MGraph         import MGraph
 from osbot_utils.type_safe.Type_Safe import Type_Safe
 
@@ -92,6 +93,21 @@ class MGraph__Engine__Base(Type_Safe):                              # Base class
             return str(path) if path else None
         return None
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Layout Helpers
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def tree_layout(self, direction        : str = 'UD',                        # node_id -> (bfs depth, x, y)
+                          level_separation : int = 150 ,
+                          node_spacing     : int = 100
+                   ) -> Dict[str, Tuple[int, float, float]]:
+        node_ids = [self.node_id_str(node) for node in self.nodes()]
+        edges    = [(self.edge_from_id(edge), self.edge_to_id(edge), self.edge_path(edge)) for edge in self.edges()]
+        layout   = MGraph__Engine__Layout(direction        = direction        ,
+                                          level_separation = level_separation ,
+                                          node_spacing     = node_spacing     )
+        return layout.layout(node_ids, edges)
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Styling Metadata Access
     # ═══════════════════════════════════════════════════════════════════════════
@@ -27,10 +27,20 @@ class MGraph__Engine__D3(MGraph__Engine__Base):      # D3 JSON format exporter
     # ═══════════════════════════════════════════════════════════════════════════
 
     def _export_nodes(self) -> List[Dict[str, Any]]:                             # Convert all nodes to D3 format
+        cfg    = self.config
+        layout = {}
+        if cfg.fixed_positions:                                                  # Tidy tree layout computed server-side
+            layout = self.tree_layout(level_separation = cfg.level_separation ,
+                                      node_spacing     = cfg.node_spacing     )
         nodes = []
         for node in self.nodes():
             node_data = self._format_node(node)
             if node_data:
+                if layout:
+                    depth, x, y = layout[node_data['id']]
+                    node_data['depth'] = depth
+                    node_data['x'    ] = node_data['fx'] = x                    # fx/fy pin the node in the force simulation
+                    node_data['y'    ] = node_data['fy'] = y
                 nodes.append(node_data)
         return nodes
 
@@ -111,12 +121,15 @@ class MGraph__Engine__D3(MGraph__Engine__Base):      # D3 JSON format exporter
 
     def _export_config(self) -> Dict[str, Any]:                                  # Export D3 simulation config
         cfg = self.config
-        return {
+        config = {
             'chargeStrength' : cfg.charge_strength  ,
             'linkDistance'   : cfg.link_distance    ,
             'collisionRadius': cfg.collision_radius ,
             'centerStrength' : cfg.center_strength  ,
         }
+        if cfg.fixed_positions:
+            config['fixedPositions'] = True                                     # client can skip the simulation
+        return config
 
     def _build_stats(self) -> Dict[str, int]:                                    # Build graph statistics
         return {
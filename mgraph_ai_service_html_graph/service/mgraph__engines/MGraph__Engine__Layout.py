@@ -0,0 +1,117 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# MGraph Engine - Layout
+#
+# Server-side, deterministic tree layout for the client-side engines (VisJs, D3).
+#
+#   1) BFS from the root nodes (nodes without incoming edges) gives each node its
+#      real depth (and a spanning tree, first-discovery wins)
+#   2) Tidy tree layout over that spanning tree: leaves take consecutive slots,
+#      parents are centred over their first and last child
+#
+# Both passes are iterative and linear in nodes + edges (children are kept in
+# edge_path order, so siblings follow DOM order), which means large graphs can
+# be drawn with fixed positions and physics disabled.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                             import Dict, List, Literal, Optional, Tuple
+from osbot_utils.type_safe.Type_Safe    import Type_Safe
+
+
+class MGraph__Engine__Layout(Type_Safe):                                        # BFS depth + tidy tree (x, y) positions
+    direction        : Literal['UD', 'DU', 'LR', 'RL'] = 'UD'                   # Layout direction (same values as vis.js)
+    level_separation : int                             = 150                    # Distance between depth levels
+    node_spacing     : int                             = 100                    # Distance between sibling slots
+
+    def layout(self, node_ids : List[str]                                 ,     # Node ids (in graph order)
+                     edges    : List[Tuple[str, str, Optional[str]]]            # (from_id, to_id, edge_path)
+              ) -> Dict[str, Tuple[int, float, float]]:                         # node_id -> (depth, x, y)
+        children = self.children_map(node_ids, edges)
+        depths, tree_children, roots = self.bfs(node_ids, children, edges)
+        slots    = self.tidy_slots(roots, tree_children)
+
+        result = {}
+        for node_id in node_ids:
+            depth      = depths[node_id]
+            x, y       = self.position(slots[node_id], depth)
+            result[node_id] = (depth, x, y)
+        return result
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Pass 1: children map + BFS depth
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def children_map(self, node_ids : List[str]                            ,    # node_id -> children ids (edge_path order)
+                           edges    : List[Tuple[str, str, Optional[str]]]
+                    ) -> Dict[str, List[str]]:
+        ordered = {node_id: [] for node_id in node_ids}
+        for index, (from_id, to_id, edge_path) in enumerate(edges):
+            if from_id in ordered and to_id in ordered:
+                position = int(edge_path) if edge_path and edge_path.isdigit() else index
+                ordered[from_id].append((position, index, to_id))
+
+        children = {}
+        for node_id, items in ordered.items():
+            items.sort()
+            children[node_id] = [to_id for _, _, to_id in items]
+        return children
+
+    def bfs(self, node_ids : List[str]                            ,             # BFS from roots (and from any node not reached)
+                  children : Dict[str, List[str]]                 ,
+                  edges    : List[Tuple[str, str, Optional[str]]]
+           ) -> Tuple[Dict[str, int], Dict[str, List[str]], List[str]]:
+        has_parent = {to_id for _, to_id, _ in edges}
+        starts     = [node_id for node_id in node_ids if node_id not in has_parent]
+        starts    += node_ids                                                   # Fallback for cycles / unreachable nodes
+
+        depths        = {}
+        tree_children = {node_id: [] for node_id in node_ids}
+        roots         = []
+        for start in starts:
+            if start in depths:
+                continue
+            roots.append(start)
+            depths[start] = 0
+            queue = [start]
+            for current in queue:                                               # list grows while iterating (FIFO, no pops)
+                for child in children[current]:
+                    if child not in depths:
+                        depths[child] = depths[current] + 1
+                        tree_children[current].append(child)
+                        queue.append(child)
+        return depths, tree_children, roots
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Pass 2: tidy tree slots
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def tidy_slots(self, roots         : List[str]           ,                  # node_id -> horizontal slot (float)
+                         tree_children : Dict[str, List[str]]
+                  ) -> Dict[str, float]:
+        slots     = {}
+        next_slot = 0
+        for root in roots:                                                      # Iterative post-order (avoids recursion limits on deep DOMs)
+            stack = [(root, False)]
+            while stack:
+                node_id, visited = stack.pop()
+                kids = tree_children[node_id]
+                if not kids:
+                    slots[node_id] = float(next_slot)
+                    next_slot     += 1
+                elif visited:
+                    slots[node_id] = (slots[kids[0]] + slots[kids[-1]]) / 2
+                else:
+                    stack.append((node_id, True))
+                    for kid in reversed(kids):
+                        stack.append((kid, False))
+        return slots
+
+    def position(self, slot: float, depth: int) -> Tuple[float, float]:        # Slot/depth -> (x, y) for the configured direction
+        across = float(slot  * self.node_spacing    )
+        along  = float(depth * self.level_separation)
+        if self.direction == 'DU':
+            return across, -along
+        if self.direction == 'LR':
+            return along, across
+        if self.direction == 'RL':
+            return -along, across
+        return across, along
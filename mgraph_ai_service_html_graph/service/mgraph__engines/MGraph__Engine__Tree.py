@@ -11,10 +11,12 @@ from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Base
 
 
 class MGraph__Engine__Tree(MGraph__Engine__Base):      # Tree view exporter
-    config: MGraph__Engine__Config__Tree
+    config    : MGraph__Engine__Config__Tree
+    _children : dict = None                                                      # node_id -> [child nodes] (built once per export, see _get_children)
 
     def export(self) -> Any:                                                     # Export MGraph to tree format
-        output_format = self.config.output_format
+        self._children = None
+        output_format  = self.config.output_format
         if output_format == 'text':
             return self._export_text()
         elif output_format == 'json':
@@ -160,16 +162,16 @@ class MGraph__Engine__Tree(MGraph__Engine__Base):      # Tree view exporter
 
         return roots
 
-    def _get_children(self, node) -> List:                                       # Get child nodes
-        node_id  = self.node_id_str(node)
-        children = []
-        node_map = {self.node_id_str(n): n for n in self.nodes()}
+    def _get_children(self, node) -> List:                                       # Get child nodes (in edge order)
+        if self._children is None:
+            self._children = self._build_children_index()
+        return self._children.get(self.node_id_str(node), [])
 
+    def _build_children_index(self) -> Dict[str, List]:                          # One pass over nodes and edges (a scan per node made the export O(n²))
+        node_map = {self.node_id_str(node): node for node in self.nodes()}
+        children = {}
         for edge in self.edges():
-            from_id = self.edge_from_id(edge)
-            if from_id == node_id:
-                to_id = self.edge_to_id(edge)
-                if to_id in node_map:
-                    children.append(node_map[to_id])
-
-        return children
\ No newline at end of file
+            to_id = self.edge_to_id(edge)
+            if to_id in node_map:
+                children.setdefault(self.edge_from_id(edge), []).append(node_map[to_id])
+        return children
@@ -29,10 +29,20 @@ class MGraph__Engine__VisJs(MGraph__Engine__Base):   # VisJs JSON exporter
     # ═══════════════════════════════════════════════════════════════════════════
 
     def _export_nodes(self) -> List[Dict[str, Any]]:                             # Convert all nodes to VisJs format
+        cfg    = self.config
+        layout = {}
+        if cfg.hierarchical or cfg.fixed_positions:                              # BFS depth (and tidy tree x/y) computed server-side
+            layout = self.tree_layout(direction        = cfg.layout_direction ,
+                                      level_separation = cfg.level_separation ,
+                                      node_spacing     = cfg.node_spacing     )
         nodes = []
-        for level, node in enumerate(self.nodes()):
-            node_data = self._format_node(node, level)
+        for node in self.nodes():
+            level, x, y = layout.get(self.node_id_str(node), (0, 0.0, 0.0))
+            node_data   = self._format_node(node, level)
             if node_data:
+                if cfg.fixed_positions:
+                    node_data['x'] = x
+                    node_data['y'] = y
                 nodes.append(node_data)
         return nodes
 
@@ -133,7 +143,7 @@ class MGraph__Engine__VisJs(MGraph__Engine__Base):   # VisJs JSON exporter
         cfg = self.config
         options = {
             'physics': {
-                'enabled': cfg.physics_enabled,
+                'enabled': cfg.physics_enabled and not cfg.fixed_positions,     # positions are already computed
             },
             'interaction': {
                 'hover'           : True,
@@ -142,7 +152,9 @@ class MGraph__Engine__VisJs(MGraph__Engine__Base):   # VisJs JSON exporter
             },
         }
 
-        if cfg.hierarchical:
+        if cfg.fixed_positions:                                                  # vis.js hierarchical layout would override x/y
+            options['layout'] = {'hierarchical': {'enabled': False}}
+        elif cfg.hierarchical:
             options['layout'] = {
                 'hierarchical': {
                     'enabled'        : True               ,
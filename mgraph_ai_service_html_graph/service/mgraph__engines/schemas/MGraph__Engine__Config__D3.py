@@ -16,3 +16,6 @@ class MGraph__Engine__Config__D3(MGraph__Engine__Config__Base):
     include_stats    : bool  = True                                              # Include graph statistics in output
     include_types    : bool  = True                                              # Include node type information
     max_label_len    : int   = 50                                                # Maximum label length
+    fixed_positions  : bool  = False                                             # Emit server-side (x, y) tree layout as pinned positions (fx, fy)
+    level_separation : int   = 100                                               # Vertical separation between depths (fixed positions)
+    node_spacing     : int   = 60                                                # Horizontal separation between siblings (fixed positions)
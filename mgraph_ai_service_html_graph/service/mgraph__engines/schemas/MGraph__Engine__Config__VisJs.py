@@ -12,6 +12,7 @@ class MGraph__Engine__Config__VisJs(MGraph__Engine__Config__Base):
     layout_direction   : Literal['UD', 'DU', 'LR', 'RL'] = 'UD'                  # Hierarchical layout direction
     hierarchical       : bool  = True                                            # Use hierarchical layout
     physics_enabled    : bool  = False                                           # Enable physics simulation
+    fixed_positions    : bool  = False                                           # Emit server-side (x, y) tree layout (disables physics and client layout)
     node_shape         : str   = 'box'                                           # Default node shape
     node_color_bg      : str   = '#e8f4f8'                                       # Node background color
     node_color_border  : str   = '#666666'                                       # Node border color
@@ -0,0 +1,22 @@
+# Lazy Import
+#
+# Registries (engines, engine configs, transformations) map names to module
+# paths instead of classes, so that importing a registry does not import every
+# implementation. A cold Lambda that only serves `dot` / `default` then never
+# loads the Cytoscape, Mermaid or use-case code. Each module holds one class
+# with the module's name (the repo convention), which is what lazy_class returns.
+
+from functools  import lru_cache
+from importlib  import import_module
+
+
+@lru_cache(maxsize=None)
+def lazy_class(module_name: str) -> type:                                       # Import module_name (on first use) and return its class
+    class_name = module_name.rsplit('.', 1)[-1]
+    return getattr(import_module(module_name), class_name)
+
+
+def resolve_class(target) -> type:                                              # Registry values: a module path (lazy) or an already imported class
+    if isinstance(target, str):
+        return lazy_class(target)
+    return target
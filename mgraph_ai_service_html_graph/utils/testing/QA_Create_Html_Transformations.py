@@ -12,7 +12,7 @@ from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text
 from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path           import Safe_Str__File__Path
 from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id                           import Safe_Id
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                              import type_safe
-from osbot_utils.utils.Files                                                                import path_combine, file_create
+from osbot_utils.utils.Files                                                                import path_combine, file_create, folder_create
 from osbot_utils.utils.Json                                                                 import json_to_str
 from tests.unit.sample_html_files                                                           import generate__test_html, SIMPLE_HTML, HTML__WITH_SOME_TAGS, HTML__BOOTSTRAP_EXAMPLE
 
@@ -33,6 +33,7 @@ class QA_Create_Html_Transformations(Type_Safe):
     target_folder     : Safe_Str__File__Path    = None
     trace_output      : Enum__Trace_Output      = Enum__Trace_Output.traces_only
     save_data         : bool                    = True
+    run_label         : str                     = ''                            # Trace store: files go to target_folder/run_label (e.g. a commit id or config name), see QA_Html_Transformations__Trace_Diff
 
     def create__graph__from_html__request(self, html):
         graph__from_html_request = Schema__Graph__From_Html__Request(html           = html               ,
@@ -101,9 +102,14 @@ class QA_Create_Html_Transformations(Type_Safe):
     @type_safe
     def save_to_file(self, data: str, file_name: Safe_Id):
         if self.target_folder and file_name:
-            target_file = path_combine(self.target_folder, file_name)
+            target_file = path_combine(self.run_folder(), file_name)
             file_create(target_file, data)
 
+    def run_folder(self):
+        if self.run_label:
+            return folder_create(path_combine(self.target_folder, self.run_label))
+        return self.target_folder
+
     # helper methods
 
     def create__for__html__with_size(self, size):
@@ -0,0 +1,111 @@
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path           import Safe_Str__File__Path
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id                           import Safe_Id
+from osbot_utils.utils.Files                                                                import path_combine, file_create, file_contents, file_exists, folder_create
+from osbot_utils.utils.Json                                                                 import json_to_str, str_to_json
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__QA__Traces__Diff               import Schema__QA__Traces__Diff
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__QA__Traces__Diff__Method       import Schema__QA__Traces__Diff__Method
+from mgraph_ai_service_html_graph.utils.testing.QA_Create_Html_Transformations              import FILE_NAME__FORMAT__RESPONSE__FULL, FILE_NAME__FORMAT__SPEEDSCOPE
+
+FILE_NAME__FORMAT__DIFF              = 'diff_____________{type}.json'
+FILE_NAME__FORMAT__SPEEDSCOPE__DIFF  = 'speedscope__diff_{type}.json'
+FOLDER_NAME__FORMAT__DIFF            = '{baseline}__vs__{current}'
+
+
+class QA_Html_Transformations__Trace_Diff(Type_Safe):                           # Compares two runs stored by QA_Create_Html_Transformations (run_label)
+    target_folder : Safe_Str__File__Path = None                                 # same target_folder as the QA_Create_Html_Transformations runs
+    top_n         : int                  = 10
+
+    def compare(self, baseline_label: str, current_label: str, html_type: str) -> Schema__QA__Traces__Diff:     # Diff + merged speedscope, saved under target_folder/{baseline}__vs__{current}
+        diff        = self.diff(baseline_label, current_label, html_type)
+        speedscope  = self.merged_speedscope(baseline_label, current_label, html_type)
+        diff_folder = FOLDER_NAME__FORMAT__DIFF.format(baseline=baseline_label, current=current_label)
+        self.save_to_file(json_to_str(diff.json()), diff_folder, FILE_NAME__FORMAT__DIFF            .format(type=html_type))
+        self.save_to_file(speedscope              , diff_folder, FILE_NAME__FORMAT__SPEEDSCOPE__DIFF.format(type=html_type))
+        return diff
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Self time diff
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def diff(self, baseline_label: str, current_label: str, html_type: str) -> Schema__QA__Traces__Diff:
+        baseline = self.load_traces__full(baseline_label, html_type)
+        current  = self.load_traces__full(current_label , html_type)
+        baseline_timings = {timing['name']: timing for timing in baseline.get('method_timings', [])}
+        current_timings  = {timing['name']: timing for timing in current .get('method_timings', [])}
+        methods = []
+        for name in baseline_timings.keys() | current_timings.keys():
+            baseline_timing  = baseline_timings.get(name, {})
+            current_timing   = current_timings .get(name, {})
+            baseline_self_ms = baseline_timing.get('self_ms', 0.0)
+            current_self_ms  = current_timing .get('self_ms', 0.0)
+            ratio            = current_self_ms / baseline_self_ms if baseline_self_ms and current_timing else 0.0
+            methods.append(Schema__QA__Traces__Diff__Method(name             = name                                ,
+                                                            baseline_self_ms = baseline_self_ms                    ,
+                                                            current_self_ms  = current_self_ms                     ,
+                                                            delta_ms         = current_self_ms - baseline_self_ms  ,
+                                                            ratio            = ratio                               ,
+                                                            baseline_calls   = baseline_timing.get('call_count', 0),
+                                                            current_calls    = current_timing .get('call_count', 0)))
+        methods.sort(key=lambda method: (-method.delta_ms, method.name))
+        return Schema__QA__Traces__Diff(html_type         = html_type                                               ,
+                                        baseline_label    = baseline_label                                          ,
+                                        current_label     = current_label                                           ,
+                                        baseline_total_ms = baseline.get('metadata', {}).get('total_duration_ms', 0),
+                                        current_total_ms  = current .get('metadata', {}).get('total_duration_ms', 0),
+                                        methods           = methods                                                 )
+
+    def report(self, diff: Schema__QA__Traces__Diff) -> str:                    # Text summary: totals, top regressions and improvements
+        lines = [f'{diff.html_type}: {diff.current_label} vs {diff.baseline_label}',
+                 f'  total: {diff.baseline_total_ms:.2f}ms -> {diff.current_total_ms:.2f}ms '
+                 f'({diff.current_total_ms - diff.baseline_total_ms:+.2f}ms)'                   ]
+        for title, methods in (('top regressions' , diff.top_regressions (self.top_n)),
+                               ('top improvements', diff.top_improvements(self.top_n))):
+            lines.append(f'  {title}:')
+            for method in methods:
+                lines.append(f'    {method.name:<60} {method.baseline_self_ms:>10.2f}ms -> {method.current_self_ms:>10.2f}ms '
+                             f'({method.delta_ms:+.2f}ms, calls: {method.baseline_calls} -> {method.current_calls})')
+        return '\n'.join(lines)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Merged speedscope (both runs, one profile each, shared frames)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def merged_speedscope(self, baseline_label: str, current_label: str, html_type: str) -> str:
+        merged = None
+        frames = {}                                                             # frame name -> index in the merged frames
+        for label in (baseline_label, current_label):
+            speedscope = self.load_speedscope(label, html_type)
+            remap      = [frames.setdefault(frame['name'], len(frames)) for frame in speedscope['shared']['frames']]
+            if merged is None:
+                merged = dict(speedscope, name=f'{html_type}: {current_label} vs {baseline_label}', profiles=[], activeProfileIndex=0)
+            for profile in speedscope['profiles']:
+                profile = dict(profile, name=f"[{label}] {profile['name']}")
+                if 'events' in profile:
+                    profile['events' ] = [dict(event, frame=remap[event['frame']]) for event in profile['events']]
+                if 'samples' in profile:
+                    profile['samples'] = [[remap[frame] for frame in stack] for stack in profile['samples']]
+                merged['profiles'].append(profile)
+        merged['shared'] = {'frames': [{'name': name} for name in frames]}
+        return json_to_str(merged)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Trace store
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def load_traces__full(self, run_label: str, html_type: str) -> dict:
+        response = str_to_json(self.load_file(run_label, FILE_NAME__FORMAT__RESPONSE__FULL.format(type=html_type)))
+        return response.get('traces') or {}
+
+    def load_speedscope(self, run_label: str, html_type: str) -> dict:
+        return str_to_json(self.load_file(run_label, FILE_NAME__FORMAT__SPEEDSCOPE.format(type=html_type)))
+
+    def load_file(self, run_label: str, file_name: str) -> str:                 # file names as saved by QA_Create_Html_Transformations.save_to_file (a Safe_Id)
+        path = path_combine(path_combine(self.target_folder, run_label), Safe_Id(file_name))
+        if not file_exists(path):
+            raise ValueError(f"no stored trace for run '{run_label}': {path}")
+        return file_contents(path)
+
+    def save_to_file(self, data: str, folder_name: str, file_name: str) -> str:
+        folder = folder_create(path_combine(self.target_folder, folder_name))
+        return file_create(path_combine(folder, file_name), data)
@@ -0,0 +1,100 @@
+# Html Graph Benchmark
+#
+# Times each pipeline phase, for each engine, over the synthetic corpus
+# (Html__Synthetic__Corpus), and saves the results as a json file
+# (Schema__Benchmark__Run) that Html_Graph__Benchmark__Compare can diff against
+# a stored baseline.
+#
+# Per document and repeat, phases 1-3 (parse, select, transform) run once (they
+# do not depend on the engine) and the resulting MGraph is rendered by every
+# engine (render, post_process). Phase timings come from the same
+# html_graph_metrics.phase() timers that feed /metrics and the response
+# timings block. Each measurement reports min / median / max over the repeats;
+# comparisons use the median. A small warm-up document runs first (not
+# reported), so lazy imports and first-call caches are not charged to the first
+# document measured.
+
+import platform
+import statistics
+from datetime                                                                               import datetime, timezone
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Files                                                                import file_create, file_contents
+from osbot_utils.utils.Json                                                                 import json_to_str, str_to_json
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Result               import Schema__Benchmark__Result
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Run                  import Schema__Benchmark__Run
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service    import Html_Graph__Export__Service
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics               import PHASE__PARSE, PHASE__SELECT, PHASE__TRANSFORM, PHASE__RENDER, PHASE__POST_PROCESS
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html__Synthetic__Corpus           import Html__Synthetic__Corpus, CORPUS__SHAPE__WIDE
+
+BENCHMARK__REPEATS          = 3
+BENCHMARK__WARMUP_ELEMENTS  = 10
+BENCHMARK__PIPELINE_PHASES  = [PHASE__PARSE , PHASE__SELECT, PHASE__TRANSFORM]  # engine independent
+BENCHMARK__ENGINE_PHASES    = [PHASE__RENDER, PHASE__POST_PROCESS]
+
+
+class Html_Graph__Benchmark(Type_Safe):                                         # Runs the benchmark matrix (shapes x sizes x engines)
+    name           : str                           = 'html-graph-benchmark'
+    graph_service  : Html_Graph__Export__Service
+    corpus         : Html__Synthetic__Corpus
+    engines        : list                                                       # default: every engine in Html_Graph__Export__Service.ENGINES
+    transformation : str                           = 'default'
+    repeats        : int                           = BENCHMARK__REPEATS
+    warmup         : bool                          = True                      # Run (and discard) a small document first
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.engines:
+            self.engines = list(self.graph_service.ENGINES)
+        if self.repeats < 1:
+            raise ValueError(f"repeats must be >= 1, got: {self.repeats}")
+
+    def run(self, shapes: list = None, sizes: list = None) -> Schema__Benchmark__Run:
+        results = []
+        if self.warmup:
+            self.run_document(CORPUS__SHAPE__WIDE, BENCHMARK__WARMUP_ELEMENTS, self.corpus.html(CORPUS__SHAPE__WIDE, BENCHMARK__WARMUP_ELEMENTS))
+        for shape, element_count, html in self.corpus.documents(shapes, sizes):
+            results.extend(self.run_document(shape, element_count, html))
+        return Schema__Benchmark__Run(name           = self.name                                ,
+                                      timestamp      = datetime.now(timezone.utc).isoformat()   ,
+                                      python_version = platform.python_version()                ,
+                                      platform       = platform.platform()                      ,
+                                      transformation = self.transformation                      ,
+                                      repeats        = self.repeats                             ,
+                                      seed           = self.corpus.seed                         ,
+                                      results        = results                                  )
+
+    def run_document(self, shape: str, element_count: int, html: str) -> list:     # Schema__Benchmark__Result per phase (and engine)
+        samples = {}                                                                # (engine, phase) -> [seconds per repeat]
+        for _ in range(self.repeats):
+            timings = {}
+            mgraph, transformation = self.graph_service.execute_pipeline(html, self.transformation, timings=timings)
+            for phase in BENCHMARK__PIPELINE_PHASES:
+                samples.setdefault(('', phase), []).append(timings.get(phase, 0.0))
+            for engine in self.engines:
+                timings = {}
+                self.graph_service.render_with_engine(mgraph, engine, transformation, timings=timings)
+                for phase in BENCHMARK__ENGINE_PHASES:
+                    samples.setdefault((engine, phase), []).append(timings.get(phase, 0.0))
+
+        html_bytes = len(html.encode('utf-8'))
+        return [Schema__Benchmark__Result(shape         = shape                                  ,
+                                          element_count = element_count                          ,
+                                          html_bytes    = html_bytes                             ,
+                                          engine        = engine                                 ,
+                                          phase         = phase                                  ,
+                                          min_ms        = min              (seconds) * 1000      ,
+                                          median_ms     = statistics.median(seconds) * 1000      ,
+                                          max_ms        = max              (seconds) * 1000      )
+                for (engine, phase), seconds in samples.items()]
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Result files
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def save(run: Schema__Benchmark__Run, path: str) -> str:
+        return file_create(path, json_to_str(run.json()))
+
+    @staticmethod
+    def load(path: str) -> Schema__Benchmark__Run:
+        return Schema__Benchmark__Run.from_json(str_to_json(file_contents(path)))
@@ -0,0 +1,67 @@
+# Html Graph Benchmark Compare
+#
+# Compares a benchmark run with a stored baseline (both Schema__Benchmark__Run,
+# usually loaded from the json files written by Html_Graph__Benchmark.save) and
+# flags the measurements whose median got slower by more than `threshold`.
+#
+# Medians below `min_ms` (in both runs) are never flagged, since at that scale
+# the timer and scheduler noise is larger than any real change.
+
+from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Comparison       import Schema__Benchmark__Comparison
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Comparison__Row  import Schema__Benchmark__Comparison__Row
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Run              import Schema__Benchmark__Run
+from mgraph_ai_service_html_graph.schemas.benchmark.enums.Enum__Benchmark__Status       import Enum__Benchmark__Status
+
+BENCHMARK__THRESHOLD = 0.25                                                     # 25% slower than the baseline is a regression
+BENCHMARK__MIN_MS    = 1.0                                                      # Noise floor
+
+
+class Html_Graph__Benchmark__Compare(Type_Safe):                                # Flags regressions against a baseline run
+    threshold : float = BENCHMARK__THRESHOLD
+    min_ms    : float = BENCHMARK__MIN_MS
+
+    def compare(self, baseline: Schema__Benchmark__Run, current: Schema__Benchmark__Run) -> Schema__Benchmark__Comparison:
+        baseline_medians = {result.key(): result.median_ms for result in baseline.results}
+        current_medians  = {result.key(): result.median_ms for result in current .results}
+        rows             = []
+        for key in sorted(baseline_medians.keys() | current_medians.keys()):
+            baseline_ms = baseline_medians.get(key)
+            current_ms  = current_medians .get(key)
+            if baseline_ms is not None and current_ms is not None and baseline_ms > 0:
+                ratio = current_ms / baseline_ms
+            else:
+                ratio = 0.0
+            rows.append(Schema__Benchmark__Comparison__Row(key         = key                  ,
+                                                           baseline_ms = baseline_ms or 0.0   ,
+                                                           current_ms  = current_ms  or 0.0   ,
+                                                           ratio       = ratio                ,
+                                                           status      = self.status(baseline_ms, current_ms)))
+        return Schema__Benchmark__Comparison(baseline_name = baseline.name ,
+                                             current_name  = current.name  ,
+                                             threshold     = self.threshold,
+                                             min_ms        = self.min_ms   ,
+                                             rows          = rows          )
+
+    def status(self, baseline_ms: float, current_ms: float) -> Enum__Benchmark__Status:
+        if baseline_ms is None:
+            return Enum__Benchmark__Status.new
+        if current_ms is None:
+            return Enum__Benchmark__Status.missing
+        if max(baseline_ms, current_ms) < self.min_ms:
+            return Enum__Benchmark__Status.ok
+        if current_ms > baseline_ms * (1 + self.threshold):
+            return Enum__Benchmark__Status.regression
+        if current_ms < baseline_ms / (1 + self.threshold):
+            return Enum__Benchmark__Status.improvement
+        return Enum__Benchmark__Status.ok
+
+    def report(self, comparison: Schema__Benchmark__Comparison, all_rows: bool = False) -> str:    # Text table (only the flagged rows, unless all_rows)
+        lines = [f'{comparison.current_name} vs {comparison.baseline_name} '
+                 f'(threshold: {comparison.threshold:.0%}, noise floor: {comparison.min_ms}ms)',
+                 f'  {"measurement":<50} {"baseline":>12} {"current":>12} {"ratio":>7}  status']
+        for row in comparison.rows:
+            if all_rows or row.status != Enum__Benchmark__Status.ok:
+                lines.append(f'  {row.key:<50} {row.baseline_ms:>10.2f}ms {row.current_ms:>10.2f}ms {row.ratio:>6.2f}x  {row.status.value}')
+        lines.append(f'  {len(comparison.regressions())} regression(s) in {len(comparison.rows)} measurements')
+        return '\n'.join(lines)
@@ -0,0 +1,151 @@
+# Html Graph Complexity
+#
+# Scaling complexity guard: runs the pipeline components over geometric input
+# sizes (synthetic corpus), fits the growth exponent k in duration ~ n^k (least
+# squares on log / log) and fails the measurements that grow faster than
+# max_exponent. This catches O(n²) bugs (like the v1.4.8 attribute registration
+# one) long before pages time out.
+#
+# Measurements:
+#
+#   components    : Html__To__Html_MGraph__Document.convert,
+#                   Html_MGraph__Data__Extractor.extract,
+#                   Html_MGraph__Document__To__Html.convert
+#   pipeline      : every phase of each transformation / engine pair
+#                   ({transformation}.{phase} for parse / select / transform,
+#                   {transformation}.{engine}.{phase} for render / post_process;
+#                   the engines are the MGraph__Engine__* classes)
+#
+# Over a size range of 8x, O(n log n) fits to about 1.24 and O(n²) to 2.0, hence
+# the 1.3 default. Each duration is the fastest of `repeats` runs (each started
+# after a gc.collect(), so a full collection of unrelated garbage does not land
+# on one size), and measurements that take less than min_ms at the largest size
+# are not checked (fixed costs and timer noise dominate there).
+
+import gc
+import math
+from time                                                                                       import perf_counter
+from osbot_utils.type_safe.Type_Safe                                                            import Type_Safe
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Complexity__Report                  import Schema__Complexity__Report
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Complexity__Result                  import Schema__Complexity__Result
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service        import Html_Graph__Export__Service
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor       import Html_MGraph__Data__Extractor
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Registry import transformation_registry
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                               import Html_MGraph
+from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html_MGraph__Document__To__Html import Html_MGraph__Document__To__Html
+from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html__To__Html_MGraph__Document import Html__To__Html_MGraph__Document
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics                   import PHASE__PARSE, PHASE__SELECT, PHASE__TRANSFORM, PHASE__RENDER, PHASE__POST_PROCESS
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html__Synthetic__Corpus               import Html__Synthetic__Corpus, CORPUS__SHAPE__WIDE, CORPUS__SHAPE__ATTRIBUTES
+
+COMPLEXITY__SIZES        = [16, 32, 64, 128]                                    # geometric (x2), 8x range
+COMPLEXITY__SHAPES       = [CORPUS__SHAPE__WIDE, CORPUS__SHAPE__ATTRIBUTES]
+COMPLEXITY__MAX_EXPONENT = 1.3                                                  # ~O(n log n) over the default range
+COMPLEXITY__MIN_MS       = 10.0
+COMPLEXITY__REPEATS      = 2
+
+
+def fit_exponent(sizes: list, durations: list) -> float:                        # Slope of log(duration) over log(size)
+    xs     = [math.log(size)                for size     in sizes    ]
+    ys     = [math.log(max(duration, 1e-9)) for duration in durations]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx    = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+
+
+class Html_Graph__Complexity(Type_Safe):                                        # Fits growth exponents, flags super-linear phases
+    graph_service   : Html_Graph__Export__Service
+    corpus          : Html__Synthetic__Corpus
+    sizes           : list                                                      # default: COMPLEXITY__SIZES
+    shapes          : list                                                      # default: COMPLEXITY__SHAPES
+    transformations : list                                                      # default: every registered transformation
+    engines         : list                                                      # default: every engine in Html_Graph__Export__Service.ENGINES
+    repeats         : int   = COMPLEXITY__REPEATS
+    max_exponent    : float = COMPLEXITY__MAX_EXPONENT
+    min_ms          : float = COMPLEXITY__MIN_MS
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.sizes           = self.sizes           or list(COMPLEXITY__SIZES)
+        self.shapes          = self.shapes          or list(COMPLEXITY__SHAPES)
+        self.transformations = self.transformations or transformation_registry.names()
+        self.engines         = self.engines         or list(self.graph_service.ENGINES)
+        if len(self.sizes) < 2:
+            raise ValueError(f"at least two sizes are needed to fit an exponent, got: {self.sizes}")
+
+    def check(self) -> Schema__Complexity__Report:                              # Components + every transformation / engine pair
+        results = []
+        for shape in self.shapes:
+            results.extend(self.check_components(shape))
+            for transformation in self.transformations:
+                results.extend(self.check_pipeline(shape, transformation))
+        return self.report(results)
+
+    def report(self, results: list) -> Schema__Complexity__Report:
+        return Schema__Complexity__Report(max_exponent = self.max_exponent,
+                                          min_ms       = self.min_ms      ,
+                                          results      = results          )
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Measurements
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def check_components(self, shape: str) -> list:                             # Converters and extractor, called directly
+        components = { 'Html__To__Html_MGraph__Document.convert' : (lambda html: html                             ,
+                                                                    lambda html: Html__To__Html_MGraph__Document().convert(html)),
+                       'Html_MGraph__Data__Extractor.extract'    : (lambda html: Html_MGraph.from_html(html)      ,
+                                                                    lambda html_mgraph: Html_MGraph__Data__Extractor(html_mgraph=html_mgraph).extract()),
+                       'Html_MGraph__Document__To__Html.convert' : (lambda html: Html_MGraph.from_html(html).document,
+                                                                    lambda document: Html_MGraph__Document__To__Html().convert(document))}
+        results = []
+        for name, (prepare, operation) in components.items():
+            durations = []
+            for size in self.sizes:
+                target = prepare(self.corpus.html(shape, size))                 # not timed
+                durations.append(self.fastest(lambda: operation(target)))
+            results.append(self.result(name, shape, durations))
+        return results
+
+    def check_pipeline(self, shape: str, transformation: str) -> list:          # Every phase, for each engine (phases 1-3 run once per size and repeat)
+        samples = {}                                                            # name -> [fastest seconds per size]
+        for size in self.sizes:
+            html    = self.corpus.html(shape, size)
+            fastest = {}
+            for _ in range(self.repeats):
+                gc.collect()
+                timings = {}
+                mgraph, resolved = self.graph_service.execute_pipeline(html, transformation, timings=timings)
+                phases = {f'{transformation}.{phase}': timings.get(phase, 0.0) for phase in (PHASE__PARSE, PHASE__SELECT, PHASE__TRANSFORM)}
+                for engine in self.engines:
+                    timings = {}
+                    self.graph_service.render_with_engine(mgraph, engine, resolved, timings=timings)
+                    for phase in (PHASE__RENDER, PHASE__POST_PROCESS):
+                        phases[f'{transformation}.{engine}.{phase}'] = timings.get(phase, 0.0)
+                for name, seconds in phases.items():
+                    fastest[name] = min(seconds, fastest.get(name, seconds))
+            for name, seconds in fastest.items():
+                samples.setdefault(name, []).append(seconds)
+        return [self.result(name, shape, durations) for name, durations in samples.items()]
+
+    def fastest(self, operation) -> float:                                      # Fastest of the repeats, in seconds
+        durations = []
+        for _ in range(self.repeats):
+            gc.collect()
+            start = perf_counter()
+            operation()
+            durations.append(perf_counter() - start)
+        return min(durations)
+
+    def result(self, name: str, shape: str, durations: list) -> Schema__Complexity__Result:    # durations in seconds, one per size
+        durations_ms = [duration * 1000 for duration in durations]
+        exponent     = fit_exponent(self.sizes, durations_ms)
+        checked      = durations_ms[-1] >= self.min_ms
+        return Schema__Complexity__Result(name         = name                                          ,
+                                          shape        = shape                                         ,
+                                          sizes        = self.sizes                                    ,
+                                          durations_ms = [round(duration, 3) for duration in durations_ms],
+                                          exponent     = round(exponent, 3)                            ,
+                                          checked      = checked                                       ,
+                                          passed       = not checked or exponent <= self.max_exponent  )
@@ -0,0 +1,112 @@
+# Html Synthetic Corpus
+#
+# Deterministic synthetic html documents for the benchmark suite, in five shapes
+# that stress different parts of the pipeline:
+#
+#   wide       : one list with thousands of sibling items (fan-out)
+#   deep       : chains of nested divs (depth, DEEP__CHAIN_DEPTH per chain)
+#   attributes : elements with many attributes (id, class, data-*, aria-*, style)
+#   text       : paragraphs of text with inline b / i / a elements
+#   scripts    : script and style blocks with large text bodies
+#
+# Each document has exactly element_count elements (start tags, including html,
+# head, title and body), and the same (seed, shape, element_count) always gives
+# the same html, so results from different runs and machines are comparable.
+
+import random
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+CORPUS__SHAPE__WIDE        = 'wide'
+CORPUS__SHAPE__DEEP        = 'deep'
+CORPUS__SHAPE__ATTRIBUTES  = 'attributes'
+CORPUS__SHAPE__TEXT        = 'text'
+CORPUS__SHAPE__SCRIPTS     = 'scripts'
+CORPUS__SHAPES             = [CORPUS__SHAPE__WIDE, CORPUS__SHAPE__DEEP, CORPUS__SHAPE__ATTRIBUTES, CORPUS__SHAPE__TEXT, CORPUS__SHAPE__SCRIPTS]
+CORPUS__SIZES              = [100, 1_000, 10_000, 100_000]                      # elements per document
+CORPUS__DOCUMENT_ELEMENTS  = 4                                                  # html, head, title, body
+DEEP__CHAIN_DEPTH          = 50                                                 # nesting per chain (kept below the parser's recursion limits)
+
+WORDS = ('graph', 'node', 'edge', 'html', 'element', 'attribute', 'value', 'render', 'layout', 'style',
+         'tree', 'parse', 'select', 'filter', 'cluster', 'label', 'color', 'shape', 'engine', 'data')
+
+
+class Html__Synthetic__Corpus(Type_Safe):                                       # Generates the benchmark html documents
+    seed : int = 0
+
+    def html(self, shape: str, element_count: int) -> str:                      # One document with exactly element_count elements
+        builders = { CORPUS__SHAPE__WIDE       : self.body__wide       ,
+                     CORPUS__SHAPE__DEEP       : self.body__deep       ,
+                     CORPUS__SHAPE__ATTRIBUTES : self.body__attributes ,
+                     CORPUS__SHAPE__TEXT       : self.body__text       ,
+                     CORPUS__SHAPE__SCRIPTS    : self.body__scripts    }
+        if shape not in builders:
+            raise ValueError(f"Unknown corpus shape: {shape} (expected one of {CORPUS__SHAPES})")
+        if element_count < CORPUS__DOCUMENT_ELEMENTS:
+            raise ValueError(f"element_count must be >= {CORPUS__DOCUMENT_ELEMENTS}, got: {element_count}")
+        rng  = random.Random(f'{self.seed}:{shape}:{element_count}')
+        body = builders[shape](rng, element_count - CORPUS__DOCUMENT_ELEMENTS)
+        return (f'<html lang="en"><head><title>{shape} ({element_count} elements)</title></head>'
+                f'<body>{body}</body></html>')
+
+    def documents(self, shapes: list = None, sizes: list = None):               # (shape, element_count, html) for each combination
+        for shape in shapes or CORPUS__SHAPES:
+            for element_count in sizes or CORPUS__SIZES:
+                yield shape, element_count, self.html(shape, element_count)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Shapes (each returns the body content with exactly `budget` elements)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def body__wide(self, rng: random.Random, budget: int) -> str:
+        if budget == 0:
+            return ''
+        items = [f'<li class="item-{i % 10}">{self.words(rng, 2)}</li>' for i in range(budget - 1)]
+        return f'<ul class="items">{"".join(items)}</ul>'
+
+    def body__deep(self, rng: random.Random, budget: int) -> str:
+        chains = []
+        while budget > 0:
+            depth   = min(budget, DEEP__CHAIN_DEPTH)
+            budget -= depth
+            chains.append(''.join(f'<div class="level-{level}">' for level in range(depth)) +
+                          self.words(rng, 3)                                              +
+                          '</div>' * depth)
+        return ''.join(chains)
+
+    def body__attributes(self, rng: random.Random, budget: int) -> str:
+        elements = []
+        for i in range(budget):
+            data_attributes = ' '.join(f'data-{WORDS[(i + n) % len(WORDS)]}="{rng.randint(0, 9999)}"' for n in range(rng.randint(3, 6)))
+            elements.append(f'<div id="element-{i}" class="{self.words(rng, 3)}" {data_attributes} '
+                            f'aria-label="{self.words(rng, 2)}" title="{self.words(rng, 4)}" '
+                            f'style="color: #{rng.randint(0, 0xFFFFFF):06x}; margin: {rng.randint(0, 20)}px"></div>')
+        return ''.join(elements)
+
+    def body__text(self, rng: random.Random, budget: int) -> str:
+        paragraphs = []
+        while budget > 0:
+            inline  = min(budget - 1, rng.randint(0, 3))                        # b / i / a inside the paragraph
+            budget -= inline + 1
+            parts   = [self.words(rng, rng.randint(20, 40))]
+            for n in range(inline):
+                tag = ('b', 'i', 'a')[n % 3]
+                parts.append(f'<{tag}>{self.words(rng, 3)}</{tag}> {self.words(rng, rng.randint(10, 20))}')
+            paragraphs.append(f'<p>{" ".join(parts)}</p>')
+        return ''.join(paragraphs)
+
+    def body__scripts(self, rng: random.Random, budget: int) -> str:
+        blocks = []
+        for i in range(budget):
+            if i % 3 == 0:
+                blocks.append(f'<script>var {WORDS[i % len(WORDS)]}_{i} = [' +
+                              ', '.join(str(rng.randint(0, 999)) for _ in range(40)) +
+                              f']; function f_{i}(x) {{ return x * {rng.randint(1, 9)}; }}</script>')
+            elif i % 3 == 1:
+                blocks.append(f'<style>.{WORDS[i % len(WORDS)]}-{i} {{ color: #{rng.randint(0, 0xFFFFFF):06x}; '
+                              f'padding: {rng.randint(0, 20)}px; }} .x-{i} > .y {{ display: none; }}</style>')
+            else:
+                blocks.append(f'<div>{self.words(rng, 5)}</div>')
+        return ''.join(blocks)
+
+    def words(self, rng: random.Random, count: int) -> str:
+        return ' '.join(rng.choice(WORDS) for _ in range(count))
@@ -0,0 +1,67 @@
+"""
+Html Graph Benchmark Suite
+==========================
+
+Times each pipeline phase (parse, select, transform, render, post_process) for
+each engine over the deterministic synthetic corpus (wide, deep, attribute-heavy,
+text-heavy, script/style-heavy documents), writes the results as json, and
+flags regressions against a stored baseline.
+
+By default only a small matrix runs (so this stays part of the unit suite); the
+full matrix (1e2 ... 1e5 elements) is selected with environment variables:
+
+    BENCHMARK__SHAPES    comma separated shapes      (default: all shapes)
+    BENCHMARK__SIZES     comma separated sizes       (default: 20)
+    BENCHMARK__REPEATS   repeats per document        (default: 1)
+    BENCHMARK__OUTPUT    path of the json result file to write
+    BENCHMARK__BASELINE  path of a stored result file to compare with (fails on regressions)
+
+Run with: BENCHMARK__SIZES=100,1000,10000,100000 BENCHMARK__REPEATS=3 BENCHMARK__OUTPUT=benchmark.json \\
+          pytest tests/unit/_performance/test_perf__Html_Graph__Benchmark.py -s
+"""
+
+from unittest                                                                               import TestCase
+from osbot_utils.utils.Env                                                                  import get_env
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html_Graph__Benchmark             import Html_Graph__Benchmark
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html_Graph__Benchmark__Compare    import Html_Graph__Benchmark__Compare
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html__Synthetic__Corpus           import CORPUS__SHAPES
+
+ENV_NAME__BENCHMARK__SHAPES   = 'BENCHMARK__SHAPES'
+ENV_NAME__BENCHMARK__SIZES    = 'BENCHMARK__SIZES'
+ENV_NAME__BENCHMARK__REPEATS  = 'BENCHMARK__REPEATS'
+ENV_NAME__BENCHMARK__OUTPUT   = 'BENCHMARK__OUTPUT'
+ENV_NAME__BENCHMARK__BASELINE = 'BENCHMARK__BASELINE'
+
+
+def env_list(name, default):
+    value = get_env(name, '')
+    return [item.strip() for item in value.split(',') if item.strip()] if value else default
+
+
+class test_perf__Html_Graph__Benchmark(TestCase):
+
+    def test__benchmark(self):
+        shapes    = env_list(ENV_NAME__BENCHMARK__SHAPES, CORPUS__SHAPES)
+        sizes     = [int(size) for size in env_list(ENV_NAME__BENCHMARK__SIZES, ['20'])]
+        benchmark = Html_Graph__Benchmark(repeats=int(get_env(ENV_NAME__BENCHMARK__REPEATS, '1')))
+        run       = benchmark.run(shapes=shapes, sizes=sizes)
+
+        print()
+        print(f'{run.name} | {run.platform} | python {run.python_version} | {run.repeats} repeat(s)')
+        for result in run.results:
+            print(f'  {result.key():<45} median: {result.median_ms:>10.2f}ms   min: {result.min_ms:>10.2f}ms')
+
+        assert len(run.results) == len(shapes) * len(sizes) * (3 + 2 * len(benchmark.engines))
+
+        output = get_env(ENV_NAME__BENCHMARK__OUTPUT)
+        if output:
+            Html_Graph__Benchmark.save(run, output)
+            print(f'\nsaved to: {output}')
+
+        baseline = get_env(ENV_NAME__BENCHMARK__BASELINE)
+        if baseline:
+            compare    = Html_Graph__Benchmark__Compare()
+            comparison = compare.compare(Html_Graph__Benchmark.load(baseline), run)
+            print()
+            print(compare.report(comparison))
+            assert comparison.regressions() == []
@@ -0,0 +1,41 @@
+"""
+Html Graph Scaling Complexity Guard
+===================================
+
+Runs the pipeline components (Html__To__Html_MGraph__Document,
+Html_MGraph__Data__Extractor, the MGraph__Engine__* renderers,
+Html_MGraph__Document__To__Html) over geometric input sizes, fits the growth
+exponent of each phase and fails when any of them grows faster than ~O(n log n)
+(see Html_Graph__Complexity). This is the check that would have caught the
+v1.4.8 O(n²) attribute registration bug.
+
+By default the 'default' transformation (with every engine) runs on the 'wide'
+shape, so this stays part of the unit suite. Set COMPLEXITY__FULL=1 to check
+every transformation / engine pair on every complexity shape (takes minutes).
+
+Run with: COMPLEXITY__FULL=1 pytest tests/unit/_performance/test_perf__Html_Graph__Complexity.py -s
+"""
+
+from unittest                                                                       import TestCase
+from osbot_utils.utils.Env                                                          import get_env
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html_Graph__Complexity    import Html_Graph__Complexity
+
+ENV_NAME__COMPLEXITY__FULL = 'COMPLEXITY__FULL'
+
+
+class test_perf__Html_Graph__Complexity(TestCase):
+
+    def test__scaling_complexity(self):
+        if get_env(ENV_NAME__COMPLEXITY__FULL, '').lower() in ('1', 'true', 'yes'):
+            complexity = Html_Graph__Complexity()
+        else:
+            complexity = Html_Graph__Complexity(shapes=['wide'], transformations=['default'])
+        report = complexity.check()
+
+        print()
+        print(f'sizes: {complexity.sizes} | max exponent: {report.max_exponent} | noise floor: {report.min_ms}ms')
+        for result in report.results:
+            status = ('ok' if result.passed else 'FAIL') if result.checked else '-'
+            print(f'  {result.shape:<11} {result.name:<45} n^{result.exponent:<6} {result.durations_ms[-1]:>10.1f}ms  {status}')
+
+        assert [f'{result.shape}: {result.name} (n^{result.exponent})' for result in report.failures()] == []
@@ -0,0 +1,64 @@
+"""
+Html Graph Instrumentation Overhead Benchmark
+=============================================
+
+Measures the per-call cost of the timestamp helpers when instrumentation is
+off (the production default), compared with calling the code directly and with
+the osbot_utils helpers (which walk the call stack looking for a collector on
+every call, even when there is none).
+
+Run with: pytest tests/unit/_performance/test_perf__Html_Graph__Instrumentation.py -s
+"""
+
+from timeit                                                                             import timeit
+from unittest                                                                           import TestCase
+from osbot_utils.helpers.timestamp_capture.context_managers.timestamp_block             import timestamp_block as osbot__timestamp_block
+from osbot_utils.helpers.timestamp_capture.decorators.timestamp                         import timestamp       as osbot__timestamp
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation   import html_graph_instrumentation, timestamp, timestamp_block
+
+CALLS = 20_000
+
+
+def a_function(value):
+    return value
+
+def a_function__with_blocks(value):                                             # same shape as Html_MGraph__Attributes.add_attribute
+    for _ in range(5):
+        with timestamp_block('step'):
+            pass
+    return value
+
+def a_function__with_osbot_blocks(value):
+    for _ in range(5):
+        with osbot__timestamp_block('step'):
+            pass
+    return value
+
+a_function__timestamp       = timestamp      (name='a_function')(a_function)
+a_function__osbot_timestamp = osbot__timestamp(name='a_function')(a_function)
+
+
+class test_perf__Html_Graph__Instrumentation(TestCase):
+
+    def test__overhead_when_off(self):
+        assert html_graph_instrumentation.on is False
+
+        duration__direct          = timeit(lambda: a_function                   (1), number=CALLS)
+        duration__timestamp       = timeit(lambda: a_function__timestamp        (1), number=CALLS)
+        duration__osbot_timestamp = timeit(lambda: a_function__osbot_timestamp  (1), number=CALLS)
+        duration__blocks          = timeit(lambda: a_function__with_blocks      (1), number=CALLS)
+        duration__osbot_blocks    = timeit(lambda: a_function__with_osbot_blocks(1), number=CALLS)
+
+        def per_call(duration):
+            return f'{duration / CALLS * 1_000_000_000:>8.0f} ns'
+
+        print()
+        print(f'{CALLS} calls, instrumentation off')
+        print(f'  direct call                 : {per_call(duration__direct         )}')
+        print(f'  @timestamp                  : {per_call(duration__timestamp      )}')
+        print(f'  @timestamp (osbot_utils)    : {per_call(duration__osbot_timestamp)}')
+        print(f'  5 x timestamp_block         : {per_call(duration__blocks         )}')
+        print(f'  5 x timestamp_block (osbot) : {per_call(duration__osbot_blocks   )}')
+
+        assert duration__timestamp < duration__osbot_timestamp                  # no stack walk
+        assert duration__blocks    < duration__osbot_blocks                     # no stack walk, no context manager allocation
@@ -0,0 +1,53 @@
+"""
+Html_MGraph Load vs Re-Parse Benchmark
+======================================
+
+Compares the cost of restoring an Html_MGraph from its own serialized forms
+(to_json() output and binary snapshot) against re-parsing the original HTML,
+which is what a cross-process handoff (process pool, cache, queue) had to do
+before from_json / from_snapshot existed.
+
+Run with: pytest tests/unit/_performance/test_perf__Html_MGraph__from_json.py -s
+"""
+
+from unittest                                                       import TestCase
+from osbot_utils.helpers.duration.decorators.capture_duration       import capture_duration
+from osbot_utils.utils.Json                                         import json_dumps, json_loads
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph   import Html_MGraph
+from tests.unit.sample_html_files                                   import generate__test_html
+
+ELEMENT_COUNT = 100
+REPEATS       = 3
+
+
+class test_perf__Html_MGraph__from_json(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.html        = generate__test_html(ELEMENT_COUNT)
+        cls.html_mgraph = Html_MGraph.from_html(cls.html)
+        cls.json_str    = json_dumps(cls.html_mgraph.to_json())
+        cls.snapshot    = cls.html_mgraph.to_snapshot()
+
+    def test__load_vs_reparse(self):                                            # timings are reported (best of REPEATS), not asserted: wall clock is too noisy here
+        results   = {}                                                          # name -> loaded Html_MGraph
+        durations = {}                                                          # name -> best duration (seconds)
+        def timed(name, load):
+            for _ in range(REPEATS):
+                with capture_duration(precision=3) as duration:
+                    results[name] = load()
+                durations[name] = min(durations.get(name, duration.seconds), duration.seconds)
+        timed('parse'   , lambda: Html_MGraph.from_html    (self.html                 ))
+        timed('json'    , lambda: Html_MGraph.from_json    (json_loads(self.json_str) ))
+        timed('snapshot', lambda: Html_MGraph.from_snapshot(self.snapshot             ))
+
+        print()
+        print(f'{ELEMENT_COUNT} elements | json: {len(self.json_str):>8} bytes | snapshot: {len(self.snapshot):>8} bytes | best of {REPEATS}')
+        print(f'  re-parse (from_html)     : {durations["parse"   ]:.3f}s')
+        print(f'  load     (from_json)     : {durations["json"    ]:.3f}s  ({durations["json"    ] / durations["parse"]:.0%} of re-parse)')
+        print(f'  load     (from_snapshot) : {durations["snapshot"]:.3f}s  ({durations["snapshot"] / durations["parse"]:.0%} of re-parse)')
+
+        expected_html = results['parse'].to_html()
+        assert results['json'    ].to_html() == expected_html
+        assert results['snapshot'].to_html() == expected_html
+        assert len(self.snapshot)            <  len(self.json_str)              # strings are deduplicated in the snapshot
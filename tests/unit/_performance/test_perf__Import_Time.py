@@ -0,0 +1,70 @@
+"""
+Import Time Budget
+==================
+
+A cold Lambda serving only `dot` / `default` should not pay for the other
+engines, the use-case transformations or the screenshot code. The engine and
+transformation registries import their classes on first use by name (see
+utils.Lazy_Import); this test guards that, and the import time budget of the
+export service, in a fresh interpreter (so modules already imported by other
+tests do not hide a regression).
+
+    IMPORT__BUDGET_MS   max ms to import Html_Graph__Export__Service (default: 1500)
+
+Run with: pytest tests/unit/_performance/test_perf__Import_Time.py -s
+"""
+
+import json
+import subprocess
+import sys
+from unittest                                                   import TestCase
+from osbot_utils.utils.Env                                      import get_env
+
+ENV_NAME__IMPORT__BUDGET_MS = 'IMPORT__BUDGET_MS'
+IMPORT__BUDGET_MS           = 1500
+PACKAGE                     = 'mgraph_ai_service_html_graph'
+
+COLD_START__SCRIPT = f"""
+import json, sys
+from time import perf_counter
+start = perf_counter()
+from {PACKAGE}.service.html_graph__export.Html_Graph__Export__Service import Html_Graph__Export__Service
+import_ms = (perf_counter() - start) * 1000
+from {PACKAGE}.service.html_graph__export.Html_Graph__Export__Schemas import Schema__Graph__From_Html__Request
+Html_Graph__Export__Service().to_dot(Schema__Graph__From_Html__Request(html='<div><p>cold start</p></div>'))
+print(json.dumps(dict(import_ms=import_ms, modules=sorted(sys.modules))))
+"""
+
+LAZY_MODULES = [f'{PACKAGE}.service.mgraph__engines.MGraph__Engine__D3'                         ,
+                f'{PACKAGE}.service.mgraph__engines.MGraph__Engine__Cytoscape'                  ,
+                f'{PACKAGE}.service.mgraph__engines.MGraph__Engine__VisJs'                      ,
+                f'{PACKAGE}.service.mgraph__engines.MGraph__Engine__Mermaid'                    ,
+                f'{PACKAGE}.service.mgraph__engines.MGraph__Engine__Tree'                       ,
+                f'{PACKAGE}.service.html_graph__transformations.html_use_cases.Html_Use_Case__1',
+                f'{PACKAGE}.service.html_graph__transformations.html_use_cases.Html_Use_Case__2',
+                f'{PACKAGE}.service.html_graph__transformations.html_use_cases.Html_Use_Case__3',
+                f'{PACKAGE}.service.html_graph__transformations.html_use_cases.Html_Use_Case__Performance_Stats',
+                f'{PACKAGE}.service.html_graph__transformations.core_transformations.Graph_Transform__Full_Document',
+                f'{PACKAGE}.service.html_render.Html_MGraph__Screenshot'                        ,
+                f'{PACKAGE}.service.html_render.Html_MGraph__To__Png'                           ]
+
+
+class test_perf__Import_Time(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        result         = subprocess.run([sys.executable, '-c', COLD_START__SCRIPT], capture_output=True, text=True, check=True)
+        cold_start     = json.loads(result.stdout.strip().splitlines()[-1])
+        cls.import_ms  = cold_start['import_ms']
+        cls.modules    = set(cold_start['modules'])
+
+    def test__cold_start__dot_default__skips_lazy_modules(self):
+        assert f'{PACKAGE}.service.mgraph__engines.MGraph__Engine__Dot'                            in self.modules
+        assert f'{PACKAGE}.service.html_graph__transformations.core_transformations.Graph_Transform__Default' in self.modules
+        assert [module for module in LAZY_MODULES if module in self.modules] == []
+
+    def test__import_time__budget(self):
+        budget_ms = float(get_env(ENV_NAME__IMPORT__BUDGET_MS, IMPORT__BUDGET_MS))
+        print()
+        print(f'Html_Graph__Export__Service import: {self.import_ms:.1f}ms (budget: {budget_ms:.0f}ms, {len(self.modules)} modules after a dot request)')
+        assert self.import_ms < budget_ms
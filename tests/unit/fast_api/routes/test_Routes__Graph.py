@@ -7,7 +7,8 @@ from unittest
 from mgraph_ai_service_html_graph.fast_api.routes.Routes__Graph                          import Routes__Graph, TAG__ROUTES_GRAPH, ROUTES_PATHS__GRAPH
 #from mgraph_ai_service_html_graph.schemas.graph.Schema__Graph__Dot__Response             import Schema__Graph__Dot__Response
 from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__From_Html__Request       import Schema__Graph__From_Html__Request
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas import Schema__Graph__Tree__Response, Schema__Graph__Dot__Response
+from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__Subtree__Request        import Schema__Graph__Subtree__Request
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas import Schema__Graph__Tree__Response, Schema__Graph__Dot__Response, Schema__Graph__Subtree__Response, Schema__Graph__Timings
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service import Html_Graph__Export__Service
 from mgraph_db.utils.testing.mgraph_test_ids import mgraph_test_ids
 from osbot_utils.testing.__ import __, __SKIP__
@@ -110,7 +111,8 @@ class test_Routes__Graph(TestCase):
                                        transformation='default',
                                        engine='tree',
                                        node_count=5,
-                                       edge_count=3)
+                                       edge_count=3,
+                                       timings=__SKIP__)
 
     # ═══════════════════════════════════════════════════════════════════════════════════
     # from_html_to_transformation Tests (Tree Text engine)
@@ -209,6 +211,23 @@ class test_Routes__Graph(TestCase):
         assert type(result.dot) is str
         assert result.transformation == 'full_document'
 
+    def test__transformation__pipeline(self):
+        request = Schema__Graph__From_Html__Request(html='<html><body><p>Hello <b>big</b>  world</p></body></html>')
+        result  = self.to_dot(request, transformation='body_only+strip_inline+collapse_text')
+
+        assert result.transformation == 'body_only+strip_inline+collapse_text'
+        assert 'body.p.b'            not in result.dot
+        assert '"big"'               in result.dot
+
+    def test__filter(self):
+        request = Schema__Graph__From_Html__Request(html   = '<html><body><div class="nav"><p>Menu</p></div><p>Hello</p></body></html>',
+                                                    filter = 'drop class=nav')
+        result  = self.to_dot(request, transformation='body_only')
+
+        assert result.transformation == 'body_only'
+        assert '"Menu"'              not in result.dot
+        assert '"Hello"'             in     result.dot
+
     # ═══════════════════════════════════════════════════════════════════════════════════
     # Tree Transformation Tests
     # ═══════════════════════════════════════════════════════════════════════════════════
@@ -261,7 +280,8 @@ class test_Routes__Graph(TestCase):
                                    transformation='attributes_view',
                                    engine='tree',
                                    node_count=7,
-                                   edge_count=5)
+                                   edge_count=5,
+                                   timings=__SKIP__)
 
 
     # ═══════════════════════════════════════════════════════════════════════════════════
@@ -303,6 +323,37 @@ class test_Routes__Graph(TestCase):
     #     assert result.transformation  == 'semantic'
     #     assert type(result.tree_text) is str
 
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # Subtree (lazy expansion) Tests
+    # ═══════════════════════════════════════════════════════════════════════════════════
+
+    def test__from_html_subtree(self):
+        request  = Schema__Graph__Subtree__Request(html=self.complex_html, depth=1)
+        result   = self.routes_graph.from_html_subtree(engine='tree', request=request)
+        body_id  = result.tree['children'][1]['id']
+
+        assert type(result)        is Schema__Graph__Subtree__Response
+        assert result.engine       == 'tree'
+        assert result.tree['tag']  == 'html'
+        assert f'/{TAG__ROUTES_GRAPH}/from/html/subtree/{{engine}}' in ROUTES_PATHS__GRAPH
+
+        request  = Schema__Graph__Subtree__Request(cache_key=result.cache_key, node_id=body_id, depth=2)
+        result   = self.routes_graph.from_html_subtree(engine='tree_text', request=request)
+
+        assert result.tree == ('body\n'
+                               '└── div\n'
+                               '    ├── h1 [+1]\n'
+                               '    └── p [+1]')
+
+    def test__from_html_subtree__different_documents(self):                    # each document gets its own cache entry
+        result_1 = self.routes_graph.from_html_subtree(engine='tree_text', request=Schema__Graph__Subtree__Request(html='<html><body><p>one</p></body></html>'      , depth=3))
+        result_2 = self.routes_graph.from_html_subtree(engine='tree_text', request=Schema__Graph__Subtree__Request(html='<html><body><ul><li>two</li></ul></body></html>', depth=3))
+
+        assert result_1.cache_key != result_2.cache_key
+        assert result_1.tree      != result_2.tree
+        assert result_1.tree.endswith('└── body\n    └── p\n        └── "one"')
+        assert result_2.tree.endswith('└── body\n    └── ul\n        └── li [+1]')
+
     # ═══════════════════════════════════════════════════════════════════════════════════
     # Engine Type Tests
     # ═══════════════════════════════════════════════════════════════════════════════════
@@ -340,6 +391,33 @@ class test_Routes__Graph(TestCase):
                 if hasattr(result, 'format'):
                     assert result.format == expected_format, f"Engine {engine} returned wrong format"
 
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # Timings Tests
+    # ═══════════════════════════════════════════════════════════════════════════════════
+
+    def test__timings__all_engines(self):                                        # Every graph response carries the per-phase breakdown
+        request = Schema__Graph__From_Html__Request(html=self.complex_html)
+        for engine in ('dot', 'visjs', 'd3', 'cytoscape', 'mermaid', 'tree'):
+            result  = self.routes_graph.from_html_to_transformation(engine=engine, transformation='default', request=request)
+            timings = result.timings
+            assert type(timings)       is Schema__Graph__Timings, engine
+            assert timings.html_bytes  == len(self.complex_html)
+            assert timings.nodes       == result.node_count
+            assert timings.edges       == result.edge_count
+            assert timings.parse_ms    >  0
+            assert timings.render_ms   >  0
+            phases_ms = (timings.parse_ms + timings.graph_select_ms + timings.transform_ms +
+                         timings.render_ms + timings.post_ms)
+            assert phases_ms           <= result.duration * 1000 + 1                          # duration is rounded to ms
+
+    def test__timings__json(self):
+        request = Schema__Graph__From_Html__Request(html='<html><body><p>é</p></body></html>')
+        result  = self.to_dot(request)
+        timings = result.json().get('timings')
+        assert list(timings) == ['parse_ms', 'graph_select_ms', 'transform_ms', 'render_ms', 'post_ms',
+                                 'serialize_ms', 'html_bytes', 'nodes', 'edges']
+        assert timings['html_bytes'] == 35                                       # utf-8 bytes, not characters
+
     # ═══════════════════════════════════════════════════════════════════════════════════
     # setup_routes Tests
     # ═══════════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,69 @@
+from unittest                                                                                   import TestCase
+from osbot_fast_api.api.Fast_API                                                                import Fast_API
+from mgraph_ai_service_html_graph.fast_api.routes.Routes__Metrics                               import Routes__Metrics, TAG__ROUTES_METRICS, ROUTES_PATHS__METRICS
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas        import Schema__Graph__From_Html__Request
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service        import Html_Graph__Export__Service
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics                   import Html_Graph__Metrics, html_graph_metrics, METRICS__CONTENT_TYPE
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Startup                   import Html_Graph__Startup, html_graph_startup, STEP__IMPORT
+
+
+class test_Routes__Metrics(TestCase):
+
+    def test__init__(self):
+        with Routes__Metrics() as _:
+            assert _.tag     == TAG__ROUTES_METRICS
+            assert _.metrics is html_graph_metrics                                  # shared registry by default
+            assert _.startup is html_graph_startup
+
+    def test__routes_paths(self):
+        assert ROUTES_PATHS__METRICS == ['/metrics', '/metrics/startup']
+
+    def test_metrics__prometheus(self):
+        metrics = Html_Graph__Metrics()
+        metrics.inc('html_graph_requests_total', engine='dot', transformation='default')
+        with Routes__Metrics(metrics=metrics) as _:
+            response = _.metrics__prometheus()
+            text     = response.body.decode()
+            assert response.media_type                                          == METRICS__CONTENT_TYPE
+            assert 'html_graph_requests_total{engine="dot",transformation="default"} 1' in text
+            assert 'html_graph_cache_hits_total{cache="html_mgraph"}'                    in text
+            assert 'html_graph_cache_hits_total{cache="graphviz"}'                       in text
+
+    def test_metrics__prometheus__via_client(self):                                 # pipeline phases show up at GET /metrics
+        fast_api = Fast_API().setup()
+        fast_api.add_routes(Routes__Metrics)
+        Html_Graph__Export__Service().export('<html><body><p>metrics</p></body></html>', engine='mermaid', transformation='default')
+
+        response = fast_api.client().get('/metrics')
+        assert response.status_code             == 200
+        assert response.headers['content-type'] == METRICS__CONTENT_TYPE
+        for phase in ('parse', 'select', 'transform', 'render', 'post_process'):
+            assert f'html_graph_phase_duration_seconds_count{{phase="{phase}",engine="mermaid",transformation="default"}}' in response.text
+        assert 'html_graph_requests_total{engine="mermaid",transformation="default"}' in response.text
+
+    def test_metrics__filter__labels(self):                                        # filter expressions (request text) never become label values
+        def transformation_labels():
+            return {dict(labels).get('transformation') for _, labels in html_graph_metrics.counters}
+        html    = '<html><body><div><p>metrics</p><script>var a = 1</script></div></body></html>'
+        service = Html_Graph__Export__Service()
+        service.to_dot(Schema__Graph__From_Html__Request(html=html, filter='drop tag=script'), transformation='body_only')
+        labels  = transformation_labels()
+        service.to_dot(Schema__Graph__From_Html__Request(html=html, filter='drop depth>1'   ), transformation='body_only')
+        assert transformation_labels() == labels
+        assert 'body_only'             in labels
+        assert all('filter(' not in label for label in labels if label)
+
+    def test_metrics__startup(self):
+        startup = Html_Graph__Startup().add_step(STEP__IMPORT, 0.5)
+        with Routes__Metrics(startup=startup) as _:
+            report = _.metrics__startup()
+            assert report['total_ms'    ] == 500.0
+            assert report['steps'       ] == {STEP__IMPORT: 500.0}
+            assert report['module_count'] == 0
+
+    def test_metrics__startup__via_client(self):
+        fast_api = Fast_API().setup()
+        fast_api.add_routes(Routes__Metrics)
+        response = fast_api.client().get('/metrics/startup')
+        assert response.status_code == 200
+        assert set(response.json()) == {'total_ms', 'steps', 'packages', 'modules', 'module_count'}
@@ -14,6 +14,14 @@ from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Graph__With_Traces_
 from mgraph_ai_service_html_graph.schemas.timestamps.enums.Enum__Trace_Output                            import Enum__Trace_Output
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas                 import Schema__Graph__From_Html__Request, Schema__Graph__Response__Base, Schema__Graph__Dot__Response
 from osbot_utils.testing.__ import __
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                                           import Timestamp_Collector
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Export                           import Timestamp_Collector__Export
+from osbot_utils.utils.Json                                                                              import str_to_json
+from mgraph_ai_service_html_graph.service.instrumentation.Timestamp_Collector__Sampled                   import Timestamp_Collector__Sampled
+from mgraph_ai_service_html_graph.service.instrumentation.Timestamp_Collector__Export__Sampled           import Timestamp_Collector__Export__Sampled
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Graph__With_Memory__Response                import Schema__Graph__With_Memory__Response
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Memory__Profile                             import Schema__Memory__Profile
+from mgraph_ai_service_html_graph.schemas.timestamps.enums.Schema__Trace__Response__Type                 import Schema__Trace__Response__Type
 
 
 class test_Routes__Timestamps(TestCase):
@@ -35,10 +43,11 @@ class test_Routes__Timestamps(TestCase):
             assert _.graph_service == self.graph_service
 
     def test__routes_paths(self):                                                                    # Test route paths are defined
-        assert len(ROUTES_PATHS__TIMESTAMPS) == 3
+        assert len(ROUTES_PATHS__TIMESTAMPS) == 4
         assert '/timestamps/graph/from/html/to/{engine}/{transformation}/full'       in ROUTES_PATHS__TIMESTAMPS
         assert '/timestamps/graph/from/html/to/{engine}/{transformation}/summary'    in ROUTES_PATHS__TIMESTAMPS
         assert '/timestamps/graph/from/html/to/{engine}/{transformation}/speedscope' in ROUTES_PATHS__TIMESTAMPS
+        assert '/timestamps/graph/from/html/to/{engine}/{transformation}/memory'     in ROUTES_PATHS__TIMESTAMPS
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Route Handler Tests - Full Format
@@ -97,6 +106,46 @@ class test_Routes__Timestamps(TestCase):
         assert type(response)        is Schema__Graph__With_Traces__Response__Speedscope
         assert type(response.traces) is str
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Route Handler Tests - Memory
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test_from_html_with_memory(self):                                                            # Test memory profile route
+        request = Schema__Graph__With_Traces__Request(
+            graph_request = Schema__Graph__From_Html__Request(html           = '<html><body><div><p>a</p><p>b</p></div></body></html>',
+                                                              transformation = 'default'                                                ),
+            trace_config  = Schema__Trace_Config(output=Enum__Trace_Output.both)
+        )
+
+        response = self.routes.from_html_with_memory(engine         = 'dot'    ,
+                                                     transformation = 'default',
+                                                     request        = request  )
+
+        assert type(response)          is Schema__Graph__With_Memory__Response
+        assert type(response.graph)    is Schema__Graph__Dot__Response
+        assert type(response.memory)   is Schema__Memory__Profile
+        assert response.response_type  == Schema__Trace__Response__Type.MEMORY
+        with response.memory as _:
+            assert _.name                              == 'default.dot'
+            assert _.element_count                     == 5                      # html, body, div, p, p
+            assert [phase.phase for phase in _.phases] == ['parse', 'select', 'transform', 'render', 'post_process']
+            assert _.parse_bytes                       >  0
+            assert _.bytes_per_element                 >  0
+            assert _.peak_bytes                        >= _.retained_bytes
+            assert len(_.top_allocations)              >  0
+
+    def test_from_html_with_memory__traces_only(self):                                               # Graph omitted, memory still reported
+        request = Schema__Graph__With_Traces__Request(
+            graph_request = Schema__Graph__From_Html__Request(html='<p>Test</p>'),
+            trace_config  = Schema__Trace_Config(output=Enum__Trace_Output.traces_only)
+        )
+        response = self.routes.from_html_with_memory(engine='tree', transformation='default', request=request)
+
+        phases   = [phase.phase for phase in response.memory.phases]
+
+        assert response.graph is None
+        assert phases         == ['parse', 'select', 'transform', 'render', 'post_process']
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Engine Method Resolution Tests
     # ═══════════════════════════════════════════════════════════════════════════
@@ -146,3 +195,46 @@ class test_Routes__Timestamps(TestCase):
     # ═══════════════════════════════════════════════════════════════════════════
     # Tests with bigger HTML
     # ═══════════════════════════════════════════════════════════════════════════
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Sampling Tests
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def create_request__sampled(self, **trace_config):
+        html = '<html><body>' + ''.join(f'<div class="item-{i}"><p>text {i}</p></div>' for i in range(10)) + '</body></html>'
+        return Schema__Graph__With_Traces__Request(graph_request = Schema__Graph__From_Html__Request(html=html),
+                                                   trace_config  = Schema__Trace_Config(**trace_config)      )
+
+    def test__create_collector(self):
+        full    = self.routes._create_collector('an.collector', Schema__Trace_Config())
+        sampled = self.routes._create_collector('an.collector', Schema__Trace_Config(sample_rate=10))
+        budget  = self.routes._create_collector('an.collector', Schema__Trace_Config(time_budget_ms=5))
+        assert type(full)            is Timestamp_Collector
+        assert type(sampled)         is Timestamp_Collector__Sampled
+        assert sampled.sample_rate   == 10
+        assert type(budget)          is Timestamp_Collector__Sampled
+        assert budget.time_budget_ms == 5
+        assert type(self.routes._create_export(full   )) is Timestamp_Collector__Export
+        assert type(self.routes._create_export(sampled)) is Timestamp_Collector__Export__Sampled
+
+    def test_from_html_with_traces_summary__sampled(self):
+        response__full    = self.routes.from_html_with_traces_summary(engine='dot', transformation='default', request=self.create_request__sampled())
+        response__sampled = self.routes.from_html_with_traces_summary(engine='dot', transformation='default', request=self.create_request__sampled(sample_rate=10))
+        traces__full      = response__full   .traces
+        traces__sampled   = response__sampled.traces
+        calls__full       = {hotspot.name: hotspot.calls for hotspot in traces__full   .hotspots}
+        calls__sampled    = {hotspot.name: hotspot.calls for hotspot in traces__sampled.hotspots}
+        assert traces__sampled.entry_count < traces__full.entry_count / 2                           # far fewer entries recorded
+        for name in calls__sampled.keys() & calls__full.keys():
+            assert calls__sampled[name] == calls__full[name]                                        # call counts are exact (scaled to all calls)
+
+    def test_from_html_with_traces_speedscope__sampled(self):
+        response   = self.routes.from_html_with_traces_speedscope(engine='dot', transformation='default', request=self.create_request__sampled(sample_rate=5))
+        speedscope = str_to_json(response.traces)
+        assert [profile['type'] for profile in speedscope['profiles']] == ['evented', 'sampled']
+
+    def test_from_html_with_traces_full__time_budget(self):
+        response = self.routes.from_html_with_traces_full(engine='dot', transformation='default', request=self.create_request__sampled(time_budget_ms=0.000001))
+        assert type(response.traces)                is Schema__Export_Full
+        assert response.traces.metadata.entry_count == 0                                            # budget used up before the first call
+        assert response.graph.engine                == 'dot'
@@ -5,6 +5,7 @@ from osbot_fast_api.api.schemas.consts.consts__Fast_API                   import
 from osbot_fast_api_serverless.fast_api.routes.Routes__Info               import ROUTES_INFO__HEALTH__RETURN_VALUE, ROUTES_PATHS__INFO
 from mgraph_ai_service_html_graph.fast_api.routes.Routes__Graph           import ROUTES_PATHS__GRAPH
 from mgraph_ai_service_html_graph.fast_api.routes.Routes__Html            import ROUTES_PATHS__HTML
+from mgraph_ai_service_html_graph.fast_api.routes.Routes__Metrics         import ROUTES_PATHS__METRICS
 from mgraph_ai_service_html_graph.fast_api.routes.Routes__Timestamps import ROUTES_PATHS__TIMESTAMPS
 from osbot_utils.utils.Env                                                import get_env
 from starlette.testclient                                                 import TestClient
@@ -62,4 +63,5 @@ class test_Service__Fast_API__client(TestCase):
                                                       ROUTES_PATHS__CONSOLE       +
                                                       ROUTES_PATHS__GRAPH         +
                                                       ROUTES_PATHS__TIMESTAMPS    +
-                                                      ROUTES_PATHS__HTML          )
\ No newline at end of file
+                                                      ROUTES_PATHS__HTML          +
+                                                      ROUTES_PATHS__METRICS       )
\ No newline at end of file
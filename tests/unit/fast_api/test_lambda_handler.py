@@ -5,6 +5,8 @@ from unittest                                            import TestCase
 from osbot_utils.utils.Json                              import str_to_json
 #from tests.unit.Service__Fast_API__Test_Objs             import setup_local_stack
 from mgraph_ai_service_html_graph.fast_api.lambda_handler      import run
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Startup import (html_graph_startup, STEP__LOAD_DEPENDENCIES, STEP__IMPORT, STEP__SETUP,
+                                                                                       STEP__PRE_WARM__SCHEMAS, STEP__PRE_WARM__REGISTRY, STEP__PRE_WARM__PARSE)
 
 
 class test_lambda_handler(TestCase):
@@ -34,3 +36,9 @@ class test_lambda_handler(TestCase):
         assert response.get('statusCode') == 401
 
         assert str_to_json(response.get('body')).get('message') == 'Client API key is missing, you need to set it on a header or cookie'
+
+    def test__startup_report(self):                                                 # init steps (and the pre-warm) are timed by html_graph_startup
+        report = html_graph_startup.report()
+        assert list(report.steps) == [STEP__LOAD_DEPENDENCIES, STEP__IMPORT, STEP__SETUP,
+                                      STEP__PRE_WARM__SCHEMAS, STEP__PRE_WARM__REGISTRY, STEP__PRE_WARM__PARSE]
+        assert report.total_ms    > 0
@@ -13,7 +13,9 @@ class test_Schema__Trace_Config(TestCase):
         with Schema__Trace_Config() as _:
             assert type(_)         is Schema__Trace_Config
             assert base_classes(_) == [Type_Safe, object]
-            assert _.output        == Enum__Trace_Output.both                   # Default value
+            assert _.output         == Enum__Trace_Output.both                  # Default value
+            assert _.sample_rate    == 1                                        # Every call is recorded
+            assert _.time_budget_ms == 0.0                                      # No time budget
 
     def test__init__with_values(self):                                           # Test initialization with values
         with Schema__Trace_Config(output=Enum__Trace_Output.both) as _:
@@ -28,3 +30,9 @@ class test_Schema__Trace_Config(TestCase):
             json_str = _.json()
             restored = Schema__Trace_Config.from_json(json_str)
             assert restored.output == _.output
+
+    def test__json_roundtrip__sampling(self):                                    # Test sampling fields survive JSON
+        with Schema__Trace_Config(sample_rate=10, time_budget_ms=250.0) as _:
+            restored = Schema__Trace_Config.from_json(_.json())
+            assert restored.sample_rate    == 10
+            assert restored.time_budget_ms == 250.0
@@ -0,0 +1,110 @@
+from unittest                                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Objects                                                              import base_classes
+from mgraph_ai_service_html_graph.schemas.routes.Schema__Graph__Subtree__Request            import Schema__Graph__Subtree__Request
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas    import Schema__Graph__Subtree__Response
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Subtree__Service   import Html_Graph__Subtree__Service
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph__Cache                    import Html_MGraph__Cache, html_mgraph_cache
+
+
+class test_Html_Graph__Subtree__Service(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = Html_Graph__Subtree__Service(cache=Html_MGraph__Cache())
+        cls.html    = ('<html><head><title>Title</title></head>'
+                       '<body><div class="main"><p>one <b>bold</b> two</p><p>three</p></div>'
+                       '<ul><li>a</li><li>b</li><li>c</li></ul></body></html>')
+
+    def subtree(self, engine='tree', **kwargs):
+        return self.service.subtree(Schema__Graph__Subtree__Request(**kwargs), engine=engine)
+
+    def body_id(self, cache_key):
+        root = self.subtree(cache_key=cache_key, depth=1).tree
+        return root['children'][1]['id']
+
+    def test__init__(self):
+        with Html_Graph__Subtree__Service() as _:
+            assert type(_)         is Html_Graph__Subtree__Service
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.cache         is html_mgraph_cache                         # defaults to the shared cache
+
+    def test_subtree__root(self):
+        response = self.subtree(html=self.html, depth=1)
+        tree     = response.tree
+
+        assert type(response)            is Schema__Graph__Subtree__Response
+        assert response.cache_key        == self.service.cache.cache_key(self.html)
+        assert response.output_format    == 'nested_dict'
+        assert response.total_children   == 2
+        assert response.has_more         is False
+        assert response.node_count       == 3
+        assert response.edge_count       == 2
+        assert tree['tag']               == 'html'
+        assert [child['tag'        ] for child in tree['children']] == ['head', 'body']
+        assert [child['child_count'] for child in tree['children']] == [1, 2]
+        assert 'children' not in tree['children'][0]                            # depth limit reached
+
+    def test_subtree__from_cache_key(self):
+        cache_key = self.subtree(html=self.html).cache_key
+        hits      = self.service.cache.hits
+        body_id   = self.body_id(cache_key)
+        response  = self.subtree(cache_key=cache_key, node_id=body_id, depth=2)
+        div, ul   = response.tree['children']
+
+        assert self.service.cache.hits    > hits
+        assert response.node_id          == body_id
+        assert response.tree['tag']      == 'body'
+        assert div['attrs']              == {'class': 'main'}
+        assert [p ['tag'] for p  in div['children']] == ['p', 'p']
+        assert [li['tag'] for li in ul ['children']] == ['li', 'li', 'li']
+
+    def test_subtree__text_nodes_in_order(self):
+        cache_key = self.subtree(html=self.html).cache_key
+        body_id   = self.body_id(cache_key)
+        div_id    = self.subtree(cache_key=cache_key, node_id=body_id).tree['children'][0]['id']
+        p_id      = self.subtree(cache_key=cache_key, node_id=div_id ).tree['children'][0]['id']
+        children  = self.subtree(cache_key=cache_key, node_id=p_id   ).tree['children']
+
+        assert [child['type'] for child in children] == ['text', 'element', 'text']
+        assert children[1]['tag'] == 'b'
+
+    def test_subtree__paging(self):
+        cache_key = self.subtree(html=self.html).cache_key
+        body_id   = self.body_id(cache_key)
+        ul_id     = self.subtree(cache_key=cache_key, node_id=body_id).tree['children'][1]['id']
+        page_1    = self.subtree(cache_key=cache_key, node_id=ul_id, offset=0, limit=2)
+        page_2    = self.subtree(cache_key=cache_key, node_id=ul_id, offset=2, limit=2)
+
+        assert page_1.total_children == 3
+        assert page_1.has_more       is True
+        assert len(page_1.tree['children']) == 2
+        assert page_2.has_more       is False
+        assert len(page_2.tree['children']) == 1
+
+    def test_subtree__tree_text(self):
+        cache_key = self.subtree(html=self.html).cache_key
+        body_id   = self.body_id(cache_key)
+        response  = self.subtree(engine='tree_text', cache_key=cache_key, node_id=body_id, depth=1)
+
+        assert response.output_format == 'text'
+        assert response.tree          == ('body\n'
+                                          '├── div [+2]\n'
+                                          '└── ul [+3]')
+
+    def test_subtree__errors(self):
+        with self.assertRaises(ValueError) as context:
+            self.subtree(engine='dot', html=self.html)
+        assert 'Unknown subtree engine: dot' in str(context.exception)
+
+        with self.assertRaises(ValueError) as context:
+            self.subtree()
+        assert str(context.exception) == 'Either html or cache_key must be provided'
+
+        with self.assertRaises(ValueError) as context:
+            self.subtree(cache_key='abc')
+        assert 'Document not found in cache (key: abc)' in str(context.exception)
+
+        with self.assertRaises(ValueError) as context:
+            self.subtree(html=self.html, node_id='aaaa0000')
+        assert 'Node not found in body or head graphs: aaaa0000' in str(context.exception)
@@ -2,7 +2,7 @@ from unittest
 from osbot_utils.type_safe.Type_Safe                                                           import Type_Safe
 from osbot_utils.utils.Objects                                                                 import base_classes
 from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                              import Html_MGraph
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor      import Html_MGraph__Data__Extractor, Extracted__Node, Extracted__Edge
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor      import Html_MGraph__Data__Extractor, Extracted__Node, Extracted__Edge, Extracted__Node__Record, Extracted__Edge__Record
 from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Config              import Html_MGraph__Render__Config
 from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors              import Html_MGraph__Render__Colors
 from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Labels              import Html_MGraph__Render__Labels
@@ -220,6 +220,86 @@ class test_Html_MGraph__Data__Extractor(TestCase):
             text_nodes = [n for n in _.nodes if n.node_type == 'text']
             assert len(text_nodes) == 0                                                       # Text nodes should be filtered
 
+    def test__extract__hide_text_nodes__excludes_their_edges(self):                           # Hidden body text nodes take their edges with them
+        config = Html_MGraph__Render__Config()
+        config.show_text_nodes = False
+
+        with Html_MGraph__Data__Extractor(html_mgraph = self.html_mgraph_simple,
+                                          config      = config                 ) as _:
+            _.extract()
+            node_ids = {n.id for n in _.nodes if n.graph_source == 'body'}
+            for edge in _.edges:
+                if edge.graph_source == 'body':
+                    assert edge.source in node_ids
+                    assert edge.target in node_ids
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Single pass (records and lookups)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__extract__element_tags_and_categories(self):                                     # Tags come from the attrs graph index (one pass)
+        with Html_MGraph__Data__Extractor(html_mgraph=self.html_mgraph_complex) as _:
+            _.extract()
+            html_mgraph = self.html_mgraph_complex
+            elements    = [n for n in _.nodes if n.node_type == 'element' and n.graph_source == 'body']
+            assert len(elements) > 0
+            for node in elements:
+                tag = _._tags.get(node.id) or _._extract_tag(node.dom_path)
+                assert _._tags.get(node.id) == html_mgraph.get_tag(node.id)
+                assert node.category        == (_.colors.get_tag_category(tag) if tag else '')     # graph root has no tag
+                assert node.border_color    == _.colors.border_color(node.fill_color)
+
+    def test__extract__records(self):                                                         # Records are built first, Type_Safe objects match them
+        with Html_MGraph__Data__Extractor(html_mgraph=self.html_mgraph_complex) as _:
+            _.extract()
+            assert len(_.node_records) == len(_.nodes)
+            assert len(_.edge_records) == len(_.edges)
+            assert all(type(r) is Extracted__Node__Record for r in _.node_records)
+            assert all(type(r) is Extracted__Edge__Record for r in _.edge_records)
+            assert [r.to_node().json() for r in _.node_records] == [n.json() for n in _.nodes]
+            assert [r.to_edge().json() for r in _.edge_records] == [e.json() for e in _.edges]
+
+    def test__extract__records_only(self):                                                    # Internal consumers skip the Type_Safe objects
+        with Html_MGraph__Data__Extractor(html_mgraph=self.html_mgraph_complex, records_only=True) as _:
+            _.extract()
+            assert _.nodes             == []
+            assert _.edges             == []
+            assert len(_.node_records) > 0
+            assert len(_.edge_records) > 0
+            assert _.root_id           is not None
+
+            _.materialize()                                                                   # on demand, at the API boundary
+            assert [n.json() for n in _.nodes] == [r.to_node().json() for r in _.node_records]
+            assert [e.json() for e in _.edges] == [r.to_edge().json() for r in _.edge_records]
+
+    def test__Extracted__Node__Record(self):                                                  # __slots__ record, no instance dict
+        record = Extracted__Node__Record(id='n1', label='<div>', node_type='element', dom_path='html.div', graph_source='body',
+                                         fill_color='#EEEEEE', font_color='#333333', border_color='#d0d0d0', shape='box', depth=2)
+        assert hasattr(record, '__dict__') is False
+        assert record.value    is None
+        assert record.category == ''
+        with record.to_node() as _:
+            assert type(_)  is Extracted__Node
+            assert _.id     == 'n1'
+            assert _.depth  == 2
+            assert _.shape  == 'box'
+
+    def test__Extracted__Edge__Record(self):
+        record = Extracted__Edge__Record(id='e1', source='n1', target='n2', predicate='child', position=None,
+                                         graph_source='body', color='#333333', dashed=False)
+        assert hasattr(record, '__dict__') is False
+        with record.to_edge() as _:
+            assert type(_)     is Extracted__Edge
+            assert _.source    == 'n1'
+            assert _.position  is None
+
+    def test__extract__twice(self):                                                           # State is reset between runs
+        with Html_MGraph__Data__Extractor(html_mgraph=self.html_mgraph_complex) as _:
+            first_nodes = [n.json() for n in _.extract().nodes]
+            first_edges = [e.json() for e in _.edges]
+            assert [n.json() for n in _.extract().nodes] == first_nodes
+            assert [e.json() for e in _.edges]           == first_edges
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Utility Method Tests
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -253,14 +333,3 @@ class test_Html_MGraph__Data__Extractor(TestCase):
         with Html_MGraph__Data__Extractor(html_mgraph=self.html_mgraph_simple) as _:
             tag = _._extract_tag('html.body.div[0]')
             assert tag == 'div'
-
-    def test___darken__valid_hex(self):                                                       # Test color darkening
-        with Html_MGraph__Data__Extractor(html_mgraph=self.html_mgraph_simple) as _:
-            darker = _._darken('#FFFFFF')
-            assert darker.startswith('#')
-            assert darker != '#FFFFFF'
-
-    def test___darken__invalid_hex(self):                                                     # Test color darkening with invalid input
-        with Html_MGraph__Data__Extractor(html_mgraph=self.html_mgraph_simple) as _:
-            result = _._darken('invalid')
-            assert result == '#CCCCCC'                                                        # Should return default
\ No newline at end of file
@@ -4,7 +4,7 @@ from osbot_utils.utils.Objects
 from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                         import Html_MGraph
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Export__Base    import Html_MGraph__Export__Base
 from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__To__D3          import Html_MGraph__To__D3
-from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_MGraph__Data__Extractor import Extracted__Node, Extracted__Node__Record, Extracted__Edge__Record
 from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Config         import Html_MGraph__Render__Config
 
 
@@ -38,6 +38,17 @@ class test_Html_MGraph__To__D3(TestCase):
     # export Tests
     # ═══════════════════════════════════════════════════════════════════════════════
 
+    def test__export__uses_records(self):                                                     # Exporters read the extractor's records (no Type_Safe nodes / edges)
+        with Html_MGraph__To__D3(html_mgraph=self.html_mgraph_complex) as _:
+            result    = _.export()
+            extractor = _.extractor()
+            assert extractor.records_only is True
+            assert extractor.nodes        == []
+            assert all(type(node) is Extracted__Node__Record for node in _.nodes)
+            assert all(type(edge) is Extracted__Edge__Record for edge in _.edges)
+            assert result['nodes'] == _._convert_nodes([record.to_node() for record in _.nodes])     # same output as from the Type_Safe objects
+            assert result['links'] == _._convert_links([record.to_edge() for record in _.edges])
+
     def test__export__returns_dict(self):                                                     # Test export returns dict
         with Html_MGraph__To__D3(html_mgraph=self.html_mgraph_simple) as _:
             result = _.export()
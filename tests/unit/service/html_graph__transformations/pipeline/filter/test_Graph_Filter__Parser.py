@@ -0,0 +1,43 @@
+from unittest                                                                                                 import TestCase
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.filter.Graph_Filter__Parser import Graph_Filter__Parser
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.filter.Graph_Filter__Rule   import Graph_Filter__Rule
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors                        import Html_MGraph__Render__Colors
+
+
+class test_Graph_Filter__Parser(TestCase):
+
+    def setUp(self):
+        self.parser = Graph_Filter__Parser()
+
+    def test_parse(self):
+        rules = self.parser.parse(' drop tag=script,STYLE ; unwrap category=text ;; keep ')
+        assert [type(rule) for rule in rules]   == [Graph_Filter__Rule] * 3
+        assert [rule.action for rule in rules]  == ['drop', 'unwrap', 'keep']
+        assert rules[0].tags                    == {'script', 'style'}
+        assert rules[1].category_tags           == set(Html_MGraph__Render__Colors.TAG_CATEGORIES['text'])
+        assert rules[2].json()                  == Graph_Filter__Rule(action='keep').json()   # no matchers: every element
+
+    def test_parse__matchers(self):
+        rule = self.parser.parse_rule('drop path=body.div*,*.nav depth>=2 depth<5 attr=id,role:main class=nav,open')
+        assert rule.paths     == ['body.div*', '*.nav']
+        assert rule.depth_min == 2
+        assert rule.depth_max == 4
+        assert rule.attrs     == [('id', None), ('role', 'main')]
+        assert rule.classes   == ['nav', 'open']
+        assert rule.uses_attributes() is True
+
+    def test_parse__depth(self):
+        def depth(matcher):
+            rule = self.parser.parse_rule(f'drop {matcher}')
+            return rule.depth_min, rule.depth_max
+        assert depth('depth>2' ) == (3, None)
+        assert depth('depth>=2') == (2, None)
+        assert depth('depth<2' ) == (0, 1   )
+        assert depth('depth<=2') == (0, 2   )
+        assert depth('depth=2' ) == (2, 2   )
+
+    def test_parse__errors(self):
+        for expression in ('', ' ; ', 'hide tag=div', 'drop tag', 'drop tag=', 'drop colour=red',
+                           'drop category=not-a-category', 'drop depth>x', 'drop depth!=2'):
+            with self.assertRaises(ValueError):
+                self.parser.parse(expression)
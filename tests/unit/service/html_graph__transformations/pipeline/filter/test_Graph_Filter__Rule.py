@@ -0,0 +1,41 @@
+from unittest                                                                                             import TestCase
+from osbot_utils.type_safe.primitives.domains.identifiers.Node_Id                                       import Node_Id
+from osbot_utils.type_safe.primitives.domains.identifiers.Obj_Id                                        import Obj_Id
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.filter.Graph_Filter__Rule import Graph_Filter__Rule
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Attributes                   import Html_MGraph__Attributes
+
+
+class test_Graph_Filter__Rule(TestCase):
+
+    def test_matches_path(self):
+        with Graph_Filter__Rule(action='drop', tags={'p', 'div'}, depth_min=1, depth_max=2) as _:
+            assert _.matches_path('body.div'         , 'div' ) is True
+            assert _.matches_path('body.div[1].p'    , 'p'   ) is True
+            assert _.matches_path('body'             , 'body') is False             # tag (and depth 0)
+            assert _.matches_path('body.div.div.p'   , 'p'   ) is False             # depth 3
+            assert _.matches_path('body.span'        , 'span') is False
+        with Graph_Filter__Rule(action='drop', paths=['body.div*.p', '*.nav']) as _:
+            assert _.matches_path('body.div[2].p'    , 'p'   ) is True
+            assert _.matches_path('body.header.nav'  , 'nav' ) is True
+            assert _.matches_path('body.p'           , 'p'   ) is False
+
+    def test_bind__matches_node(self):
+        attrs = Html_MGraph__Attributes().setup()
+        div_1 = Node_Id(Obj_Id())
+        div_2 = Node_Id(Obj_Id())
+        attrs.register_element(div_1, 'div')
+        attrs.register_element(div_2, 'div')
+        attrs.add_attribute(div_1, 'class', 'nav open', position=0)
+        attrs.add_attribute(div_1, 'role' , 'main'    , position=1)
+        attrs.add_attribute(div_2, 'class', 'nav'     , position=0)
+
+        with Graph_Filter__Rule(action='drop', classes=['nav']) as _:
+            assert _.matches_node(div_1) is False                                   # not bound yet
+            assert _.bind(attrs)         is _
+            assert _._node_ids           == {div_1, div_2}
+        with Graph_Filter__Rule(action='drop', classes=['nav'], attrs=[('role', 'main')]).bind(attrs) as _:
+            assert _.matches_node(div_1) is True                                    # all the matchers
+            assert _.matches_node(div_2) is False
+        with Graph_Filter__Rule(action='drop', attrs=[('role', None)]).bind(attrs) as _:
+            assert _._node_ids == {div_1}
+        assert Graph_Filter__Rule(action='drop').matches_node(div_2) is True        # no attr / class matchers
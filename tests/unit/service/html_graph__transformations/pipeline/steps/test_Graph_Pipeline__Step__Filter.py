@@ -0,0 +1,63 @@
+from unittest                                                                                                    import TestCase
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Step             import Graph_Pipeline__Step, STEP__KEEP, STEP__UNWRAP, STEP__DROP
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Filter import Graph_Pipeline__Step__Filter
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                                               import Html_MGraph
+
+HTML = ('<html><body>'
+        '<div class="nav open"><p>Menu <b>item</b></p></div>'
+        '<div id="main"><p>Hello <b>big</b> world</p></div>'
+        '<script>var a = 1</script>'
+        '</body></html>')
+
+
+class test_Graph_Pipeline__Step__Filter(TestCase):
+
+    def setUp(self):
+        self.html_mgraph = Html_MGraph.from_html(HTML)
+        self.mgraph      = self.html_mgraph.body_graph.mgraph
+
+    def output(self, mgraph):                                                   # (node_paths of the elements, text values)
+        nodes = list(mgraph.graph.model.data.nodes.values())
+        paths = [str(node.node_path) for node in nodes if node.node_path and str(node.node_path) != 'text']
+        texts = [node.node_data.value for node in nodes if str(node.node_path) == 'text']
+        return paths, texts
+
+    def test__init__(self):
+        with Graph_Pipeline__Step__Filter(expression=' drop tag=script ;unwrap  tag=b ') as _:
+            assert isinstance(_, Graph_Pipeline__Step)
+            assert _.expression     == 'drop tag=script; unwrap  tag=b'
+            assert _.name           == 'filter(drop tag=script; unwrap  tag=b)'
+            assert len(_.rules)     == 2
+            assert _.per_node       is False
+            assert _.needs_document is False
+        with Graph_Pipeline__Step__Filter(expression='drop class=nav') as _:
+            assert _.per_node       is True
+            assert _.needs_document is True
+        with self.assertRaises(ValueError):
+            Graph_Pipeline__Step__Filter(expression='hide tag=b')
+
+    def test_path_action(self):
+        with Graph_Pipeline__Step__Filter(expression='keep tag=a; unwrap category=text; drop depth>3') as _:
+            assert _.path_action('body.div[1].p'       , 'p'  ) == STEP__UNWRAP
+            assert _.path_action('body.p.a'            , 'a'  ) == STEP__KEEP      # first match wins
+            assert _.path_action('body.div.div.div.div', 'div') == STEP__DROP
+            assert _.path_action('body.div'            , 'div') == STEP__KEEP      # no match
+            assert list(_._path_rules) == ['body.div[1].p', 'body.p.a', 'body.div.div.div.div', 'body.div']
+
+    def test_apply(self):
+        paths, texts = self.output(Graph_Pipeline__Step__Filter(expression='drop tag=script; unwrap tag=b').apply(self.mgraph))
+        assert paths == ['body', 'body.div[0]', 'body.div[0].p', 'body.div[1]', 'body.div[1].p']
+        assert texts == ['Menu ', 'item', 'Hello ', 'big', ' world']
+        assert self.output(self.mgraph)[0] != paths                             # input not changed
+
+    def test_apply__attributes(self):
+        step = Graph_Pipeline__Step__Filter(expression='drop class=nav; drop tag=script')
+        with self.assertRaises(ValueError):
+            step.apply(self.mgraph)                                             # needs the document
+        paths, texts = self.output(step.apply(self.mgraph, self.html_mgraph))
+        assert paths == ['body', 'body.div[1]', 'body.div[1].p', 'body.div[1].p.b']
+        assert texts == ['Hello ', 'big', ' world']
+
+        paths, _ = self.output(Graph_Pipeline__Step__Filter(expression='unwrap attr=id:main').apply(self.mgraph, self.html_mgraph))
+        assert 'body.div[1]'   not in paths
+        assert 'body.div[1].p' in     paths
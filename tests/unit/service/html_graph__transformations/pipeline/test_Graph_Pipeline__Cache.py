@@ -0,0 +1,76 @@
+from threading                                                                                          import Thread
+from unittest                                                                                           import TestCase
+from mgraph_db.mgraph.MGraph                                                                            import MGraph
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html                               import Safe_Str__Html
+from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
+from osbot_utils.utils.Misc                                                                             import str_sha256
+from osbot_utils.utils.Objects                                                                          import base_classes
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Cache    import Graph_Pipeline__Cache, graph_pipeline_cache, GRAPH_PIPELINE__CACHE__MAX_ENTRIES
+
+
+class test_Graph_Pipeline__Cache(TestCase):
+
+    def setUp(self):
+        self.cache        = Graph_Pipeline__Cache()
+        self.document_key = self.cache.cache_key('<p>Hello</p>')
+        self.pipeline     = ('body_only', 'strip_inline', 'collapse_text')
+
+    def test__init__(self):
+        with self.cache as _:
+            assert type(_)         is Graph_Pipeline__Cache
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.stats()       == {'size': 0, 'max_entries': GRAPH_PIPELINE__CACHE__MAX_ENTRIES, 'hits': 0, 'misses': 0}
+            assert _.cache_key('<p>Hello</p>') == str_sha256('<p>Hello</p>')
+            assert _.cache_key(Safe_Str__Html('<p>Hello</p>')) == str_sha256('<p>Hello</p>')  # route requests (str subclass)
+        assert type(graph_pipeline_cache) is Graph_Pipeline__Cache
+
+    def test_longest_prefix(self):
+        selected = MGraph()
+        filtered = MGraph()
+        with self.cache as _:
+            assert _.longest_prefix(self.document_key, self.pipeline) == (0, None)
+            _.add(self.document_key, self.pipeline[:1], selected)
+            assert _.longest_prefix(self.document_key, self.pipeline) == (1, selected)
+            _.add(self.document_key, self.pipeline[:2], filtered)
+            assert _.longest_prefix(self.document_key, self.pipeline) == (2, filtered)
+            assert _.longest_prefix('another-document', self.pipeline) == (0, None)
+            assert _.longest_prefix(self.document_key, ('head_only', 'strip_inline')) == (0, None)
+            assert _.stats() == {'size': 2, 'max_entries': GRAPH_PIPELINE__CACHE__MAX_ENTRIES, 'hits': 2, 'misses': 3}
+            assert _.longest_prefix(self.document_key, self.pipeline, min_length=2) == (2, filtered)
+            assert _.longest_prefix(self.document_key, self.pipeline, min_length=3) == (0, None)  # shorter prefixes are not usable
+
+    def test_add__evicts_least_recently_used(self):
+        mgraph = MGraph()
+        with Graph_Pipeline__Cache(max_entries=2) as _:
+            _.add('a', ('default',), mgraph)
+            _.add('b', ('default',), mgraph)
+            assert _.get('a', ('default',)) is mgraph                           # 'a' becomes most recent, so 'b' is the oldest
+            _.add('c', ('default',), mgraph)
+            assert list(_.entries) == [('a', ('default',)), ('c', ('default',))]
+
+    def test_clear(self):
+        with self.cache as _:
+            _.add(self.document_key, self.pipeline, MGraph())
+            _.longest_prefix(self.document_key, self.pipeline)
+            assert _.clear() is _
+            assert _.stats() == {'size': 0, 'max_entries': GRAPH_PIPELINE__CACHE__MAX_ENTRIES, 'hits': 0, 'misses': 0}
+
+    def test__concurrent(self):                                                 # get / longest_prefix / add from many threads (LRU reorder and evict under the lock)
+        mgraph = MGraph()
+        errors = []
+        with Graph_Pipeline__Cache(max_entries=2) as _:
+            def worker(thread_id):
+                try:
+                    for index in range(500):
+                        document_key = f'{(thread_id + index) % 6}'
+                        if _.longest_prefix(document_key, self.pipeline) == (0, None):
+                            _.add(document_key, self.pipeline[:1 + index % 3], mgraph)
+                        _.get(document_key, self.pipeline[:1])
+                except Exception as error:
+                    errors.append(error)
+            threads = [Thread(target=worker, args=(thread_id,)) for thread_id in range(8)]
+            for thread in threads: thread.start()
+            for thread in threads: thread.join()
+            assert errors            == []
+            assert _.size()          == 2
+            assert _.hits + _.misses == 8 * 500
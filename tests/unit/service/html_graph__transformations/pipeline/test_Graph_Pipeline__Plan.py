@@ -0,0 +1,79 @@
+from unittest                                                                                                   import TestCase
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Plan                 import Graph_Pipeline__Plan
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Step                 import STEP__KEEP, STEP__UNWRAP, STEP__DROP
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Collapse_Text import Graph_Pipeline__Step__Collapse_Text
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Strip_Inline  import Graph_Pipeline__Step__Strip_Inline
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Strip_Scripts import Graph_Pipeline__Step__Strip_Scripts
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.steps.Graph_Pipeline__Step__Strip_Text    import Graph_Pipeline__Step__Strip_Text
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                                                   import Html_MGraph
+from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Body                                      import Html_MGraph__Body
+
+HTML = '<html><body><div><p>Hello <b>big</b>   <span>world</span></p><script>var a = 1</script></div></body></html>'
+
+
+class test_Graph_Pipeline__Plan(TestCase):
+
+    def setUp(self):
+        self.body_graph = Html_MGraph.from_html(HTML).body_graph
+        self.mgraph     = self.body_graph.mgraph
+
+    def graph(self, mgraph) -> Html_MGraph__Body:                               # body graph view of a plan output
+        return Html_MGraph__Body(mgraph=mgraph, root_id=self.body_graph.root_id)
+
+    def texts(self, body_graph: Html_MGraph__Body, node_id) -> list:            # text values of an element, in order
+        return [body_graph.node_value(text_id) for text_id in body_graph.get_text_nodes(node_id)]
+
+    def test_element_action(self):                                              # DROP wins over UNWRAP, UNWRAP over KEEP
+        plan = Graph_Pipeline__Plan(steps=[Graph_Pipeline__Step__Strip_Inline(), Graph_Pipeline__Step__Strip_Scripts()])
+        assert plan.element_action('div'   ) == STEP__KEEP
+        assert plan.element_action('span'  ) == STEP__UNWRAP
+        assert plan.element_action('script') == STEP__DROP
+        assert plan._actions                 == {'div': STEP__KEEP, 'span': STEP__UNWRAP, 'script': STEP__DROP}
+        assert plan.element_action('body.div[1].span[2]') == STEP__UNWRAP       # tag without the sibling index
+
+    def test_node_tag(self):
+        assert Graph_Pipeline__Plan.node_tag('body.div[1].p' ) == 'p'
+        assert Graph_Pipeline__Plan.node_tag('body.div[1]'   ) == 'div'
+        assert Graph_Pipeline__Plan.node_tag('body'          ) == 'body'
+
+    def test_text_value(self):
+        assert Graph_Pipeline__Plan(steps=[Graph_Pipeline__Step__Collapse_Text()]).text_value('  a \n b ') == 'a b'
+        assert Graph_Pipeline__Plan(steps=[Graph_Pipeline__Step__Collapse_Text()]).text_value('   '      ) is None
+        assert Graph_Pipeline__Plan(steps=[Graph_Pipeline__Step__Strip_Inline ()])._text_steps            == []
+
+    def test_run__no_steps(self):                                               # same nodes and edges (shared schemas)
+        output = Graph_Pipeline__Plan().run(self.mgraph)
+        assert output                                  is not self.mgraph
+        assert set(output.graph.model.data.nodes)      == set(self.mgraph.graph.model.data.nodes)
+        assert set(output.graph.model.data.edges)      == set(self.mgraph.graph.model.data.edges)
+        for node_id, node in output.graph.model.data.nodes.items():
+            assert node is self.mgraph.graph.model.data.nodes[node_id]
+
+    def test_run__strip_inline(self):                                           # inline children move up to the paragraph, in order
+        nodes_before = len(self.mgraph.graph.model.data.nodes)
+        paragraph_id = self.body_graph.nodes_by_path('body.div.p')[0]
+        output       = Graph_Pipeline__Plan(steps=[Graph_Pipeline__Step__Strip_Inline()]).run(self.mgraph)
+        body_graph   = self.graph(output)
+        assert self.texts(self.body_graph, paragraph_id)          == ['Hello ']
+        assert self.texts(body_graph     , paragraph_id)          == ['Hello ', 'big', 'world']
+        assert body_graph.get_element_children(paragraph_id)      == []
+        assert body_graph.nodes_by_path('body.div.p.b')           == []
+        assert [str(edge.edge_path) for edge in body_graph.edge_schemas()
+                                    if edge.from_node_id == paragraph_id] == ['0', '1', '2']          # re-numbered, contiguous
+        assert len(self.mgraph.graph.model.data.nodes)            == nodes_before                     # input not modified
+
+    def test_run__fused_steps(self):                                            # one traversal for all the steps
+        steps  = [Graph_Pipeline__Step__Strip_Scripts(), Graph_Pipeline__Step__Strip_Inline(), Graph_Pipeline__Step__Collapse_Text()]
+        output = Graph_Pipeline__Plan(steps=steps).run(self.mgraph)
+        paths  = [str(node.node_path) for node in output.graph.model.data.nodes.values()]
+        texts  = [node.node_data.value for node in output.graph.model.data.nodes.values() if str(node.node_path) == 'text']
+        assert 'body.div.script' not in paths
+        assert 'var a = 1'       not in texts
+        assert all(text == ' '.join(text.split()) and text for text in texts)
+        assert 'Hello' in texts
+
+    def test_run__strip_text(self):
+        output = Graph_Pipeline__Plan(steps=[Graph_Pipeline__Step__Strip_Text()]).run(self.mgraph)
+        paths  = [str(node.node_path) for node in output.graph.model.data.nodes.values()]
+        assert 'text' not in paths
+        assert all(edge.to_node_id in output.graph.model.data.nodes for edge in output.graph.model.data.edges.values())
@@ -0,0 +1,116 @@
+from unittest                                                                                                   import TestCase
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Schemas                        import Schema__Graph__From_Html__Request
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service                        import Html_Graph__Export__Service
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Base                import Graph_Transformation__Base
+from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Body_Only import Graph_Transform__Body_Only
+from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Default   import Graph_Transform__Default
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Pipeline__Cache            import Graph_Pipeline__Cache, graph_pipeline_cache
+from mgraph_ai_service_html_graph.service.html_graph__transformations.pipeline.Graph_Transform__Pipeline        import Graph_Transform__Pipeline, PIPELINE__STEPS, PIPELINE__MAX_STEPS
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics                                 import html_graph_metrics
+
+HTML = '<html><body><div><p>Hello <b>big</b>   <span>world</span></p><script>var a = 1</script></div></body></html>'
+
+
+class test_Graph_Transform__Pipeline(TestCase):
+
+    def setUp(self):
+        self.cache = Graph_Pipeline__Cache()
+
+    def pipeline(self, spec: str, filter_expression: str = '') -> Graph_Transform__Pipeline:
+        return Graph_Transform__Pipeline(cache=self.cache).setup(spec, filter_expression)
+
+    def run_pipeline(self, pipeline: Graph_Transform__Pipeline):               # phases 1-3 (as Html_Graph__Export__Service.execute_pipeline)
+        html_mgraph = pipeline.html__to__html_mgraph(HTML)
+        mgraph      = pipeline.html_mgraph__to__mgraph(html_mgraph)
+        return pipeline.transform_mgraph(mgraph)
+
+    def test_setup(self):
+        with self.pipeline(' body_only + strip_inline+collapse_text ') as _:
+            assert isinstance(_, Graph_Transformation__Base)
+            assert type(_.transformation)          is Graph_Transform__Body_Only
+            assert [step.name for step in _.steps] == ['strip_inline', 'collapse_text']
+            assert _.name                          == 'body_only+strip_inline+collapse_text'
+            assert _.pipeline()                    == ('body_only', 'strip_inline', 'collapse_text')
+            assert _.cache_on                      is True
+            assert _.metrics_name()                == 'body_only'              # never the spec (request text)
+        with self.pipeline('strip_text+strip_scripts') as _:                   # starts with a step: from 'default'
+            assert type(_.transformation) is Graph_Transform__Default
+            assert _.name                 == 'default+strip_text+strip_scripts'
+        assert Graph_Transform__Pipeline().setup('body_only+strip_text').cache is graph_pipeline_cache
+        assert sorted(PIPELINE__STEPS) == ['collapse_text', 'strip_inline', 'strip_scripts', 'strip_text']
+
+    def test_setup__errors(self):
+        for spec in ('+', 'not-a-transformation+strip_text', 'body_only+not_a_step', 'body_only+head_only',
+                     'body_only+strip_text+strip_text', 'strip_text+strip_inline+strip_text',
+                     'body_only' + '+strip_text' * 100):
+            with self.assertRaises(ValueError):
+                self.pipeline(spec)
+        assert len(self.pipeline('+'.join(PIPELINE__STEPS)).steps) == PIPELINE__MAX_STEPS     # every step, once
+
+    def test_setup__not_cached(self):                                           # transformations that override transform_mgraph
+        assert self.pipeline('html-use-case-1+strip_inline').cache_on is False
+        assert self.pipeline('html-use-case-3+strip_inline').cache_on is True      # edits a Graph_Transformation__View (see mutates_mgraph)
+
+    def test_phases__prefix_cache(self):
+        mgraph_1 = self.run_pipeline(self.pipeline('body_only+strip_inline'))
+        assert self.cache.stats()['misses'] == 1
+        assert self.cache.size()             == 2                              # ('body_only',) and ('body_only', 'strip_inline')
+
+        pipeline = self.pipeline('body_only+strip_inline+collapse_text')        # only collapse_text runs
+        assert pipeline.html__to__html_mgraph(HTML) is None                    # no parse
+        assert pipeline._prefix_length              == 2
+        assert pipeline.html_mgraph__to__mgraph(None) is mgraph_1
+        mgraph_2 = pipeline.transform_mgraph(mgraph_1)
+        assert mgraph_2 is not mgraph_1
+        assert self.cache.size() == 3
+
+        assert self.run_pipeline(self.pipeline('body_only+strip_inline+collapse_text')) is mgraph_2    # full hit
+        assert self.cache.stats()['hits'] == 2
+
+    def test_setup__filter(self):
+        with self.pipeline('body_only', filter_expression='drop tag=script') as _:
+            assert [step.name for step in _.steps] == ['filter(drop tag=script)']
+            assert _.name                          == 'body_only+filter(drop tag=script)'
+            assert _.min_prefix_length()           == 1
+        with self.pipeline('body_only+strip_inline', filter_expression='drop class=nav') as _:
+            assert _.pipeline()          == ('body_only', 'strip_inline', 'filter(drop class=nav)')
+            assert _.min_prefix_length() == 3                                   # needs the document: only a full hit skips the parse
+        with self.assertRaises(ValueError):
+            self.pipeline('body_only', filter_expression='hide tag=script')
+
+    def test_phases__filter__attributes(self):
+        self.run_pipeline(self.pipeline('body_only+strip_inline'))              # caches ('body_only',) and ('body_only', 'strip_inline')
+        pipeline = self.pipeline('body_only+strip_inline', filter_expression='drop attr=id')
+        html_mgraph = pipeline.html__to__html_mgraph(HTML)
+        assert html_mgraph is not None                                          # the cached prefixes do not have the filter: parsed
+        mgraph   = pipeline.transform_mgraph(pipeline.html_mgraph__to__mgraph(html_mgraph))
+        assert pipeline.steps[-1].rules[0]._node_ids == set()                   # bound in phase 2 (no element has an id)
+        assert self.cache.get(pipeline._document_key, pipeline.pipeline()) is mgraph
+        assert self.run_pipeline(self.pipeline('body_only+strip_inline', filter_expression='drop attr=id')) is mgraph   # full hit
+
+    def test_phases__state_not_cached(self):                                    # full-document keeps the parsed document: every phase runs
+        pipeline = self.pipeline('full-document+strip_inline')
+        assert pipeline.cache_on is True
+        self.run_pipeline(pipeline)
+        assert pipeline.cache_on  is False
+        assert self.cache.size()  == 0
+
+    def test__export_service(self):
+        graph_service = Html_Graph__Export__Service()
+        request       = Schema__Graph__From_Html__Request(html=HTML)
+        default       = graph_service.to_dot(request, transformation='body_only')
+        stripped      = graph_service.to_dot(request, transformation='body_only+strip_inline+strip_scripts')
+        assert stripped.transformation == 'body_only+strip_inline+strip_scripts'
+        assert stripped.node_count     <  default.node_count
+        assert 'body.div.script'       in     default .dot
+        assert 'body.div.p.span'       in     default .dot
+        assert 'body.div.script'       not in stripped.dot
+        assert 'body.div.p.span'       not in stripped.dot
+        assert '"world"'               in     stripped.dot
+        labels = {dict(key[1]).get('transformation') for key in html_graph_metrics.counters}
+        assert 'body_only' in labels
+        assert all('+' not in label for label in labels if label)              # metrics_name: the spec is not a label
+
+        filtered = graph_service.to_dot(Schema__Graph__From_Html__Request(html=HTML, filter='drop tag=script'), transformation='body_only')
+        assert 'body.div.script'       not in filtered.dot
+        assert 'body.div.p.span'       in     filtered.dot
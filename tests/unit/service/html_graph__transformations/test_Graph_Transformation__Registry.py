@@ -0,0 +1,110 @@
+from unittest                                                                                                           import TestCase
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Base                        import Graph_Transformation__Base
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Registry                    import Graph_Transformation__Registry, transformation_registry, TRANSFORMATIONS__POOL_SIZE
+from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Default     import Graph_Transform__Default
+from mgraph_ai_service_html_graph.service.html_graph__transformations.core_transformations.Graph_Transform__Body_Only   import Graph_Transform__Body_Only
+
+
+class Custom_Transformation(Graph_Transformation__Base):
+    name        : str = 'a-custom-transformation'
+    label       : str = 'A Custom Transformation'
+    description : str = 'Registered by test_Graph_Transformation__Registry'
+
+
+class Stateful_Transformation(Graph_Transformation__Base):                                 # mutable default: never pooled
+    name  : str  = 'a-stateful-transformation'
+    items : list
+
+
+class test_Graph_Transformation__Registry(TestCase):
+
+    def test_names(self):
+        names = transformation_registry.names()
+        assert 'default'                         in names
+        assert 'full-document'                   in names
+        assert 'html-use-case-performance-stats' in names
+
+    def test_get(self):
+        assert type(transformation_registry.get('default'  )) is Graph_Transform__Default
+        assert type(transformation_registry.get('body_only')) is Graph_Transform__Body_Only
+        assert type(transformation_registry.get('unknown'  )) is Graph_Transform__Default       # fallback
+
+    def test_get_class(self):
+        assert transformation_registry.get_class('body_only') is Graph_Transform__Body_Only
+        assert transformation_registry.get_class('unknown'  ) is None
+        for name in transformation_registry.names():                                        # every registered module path resolves, to a class with that name
+            transform_class = transformation_registry.get_class(name)
+            assert issubclass(transform_class, Graph_Transformation__Base)
+            assert transform_class().name == name
+
+    def test_list_all(self):
+        transforms = transformation_registry.list_all()
+        assert [transform['name'] for transform in transforms] == transformation_registry.names()
+        assert transforms[4] == {'name'       : 'default'                           ,
+                                 'label'      : 'Default'                           ,
+                                 'description': 'Standard body graph visualization' }
+
+    def test_list_all__uses_cached_metadata(self):                                          # no transformation is constructed once the metadata is cached
+        registry = Graph_Transformation__Registry()
+        registry.list_all()
+        original_init = Graph_Transform__Default.__init__
+        def fail_init(*args, **kwargs):
+            raise AssertionError('list_all constructed a transformation')
+        Graph_Transform__Default.__init__ = fail_init
+        try:
+            transforms = registry.list_all()
+        finally:
+            Graph_Transform__Default.__init__ = original_init
+        transforms[4]['label'] = 'changed'                                                  # callers get copies
+        assert registry.list_all()[4]['label'] == 'Default'
+
+    def test_release(self):                                                                 # released instances are reset and handed out again
+        registry = Graph_Transformation__Registry()
+        transformation = registry.get('full-document')
+        transformation._extracted_nodes = ['a record']
+        transformation.an_extra_value   = 42
+        registry.release(transformation)
+        pooled = registry.get('full-document')
+        assert pooled                  is transformation
+        assert pooled._extracted_nodes is None                                              # back to the class defaults
+        assert 'an_extra_value'        not in pooled.__dict__
+        assert pooled.json()           == registry.get_class('full-document')().json()
+        assert registry.get('full-document') is not pooled                                  # pool is empty again
+
+    def test_release__pool_size(self):
+        registry        = Graph_Transformation__Registry()
+        transformations = [registry.get('default') for _ in range(TRANSFORMATIONS__POOL_SIZE + 2)]
+        for transformation in transformations:
+            registry.release(transformation)
+        assert len(registry._pool['default']) == TRANSFORMATIONS__POOL_SIZE
+
+    def test_release__not_poolable(self):                                                   # classes with mutable defaults are constructed on every get
+        registry = Graph_Transformation__Registry()
+        try:
+            registry.register(Stateful_Transformation)
+            transformation = registry.get('a-stateful-transformation')
+            registry.release(transformation)
+            assert registry.get('a-stateful-transformation') is not transformation
+            assert registry._defaults['a-stateful-transformation'] is None
+        finally:
+            del Graph_Transformation__Registry._transformations['a-stateful-transformation']
+
+    def test_get__pipeline(self):                                                           # specs with PIPELINE__SEPARATOR are pipelines (not pooled)
+        registry       = Graph_Transformation__Registry()
+        transformation = registry.get('body_only+strip_inline')
+        assert type(transformation).__name__ == 'Graph_Transform__Pipeline'
+        assert transformation.name           == 'body_only+strip_inline'
+        registry.release(transformation)
+        assert registry.get('body_only+strip_inline') is not transformation
+        with self.assertRaises(ValueError):
+            registry.get('body_only+not_a_step')
+
+    def test_register(self):
+        registry = Graph_Transformation__Registry()
+        try:
+            registry.register(Custom_Transformation)
+            assert 'a-custom-transformation' in registry.names()
+            assert registry.get_class('a-custom-transformation') is Custom_Transformation
+            assert type(registry.get('a-custom-transformation')) is Custom_Transformation
+        finally:
+            del Graph_Transformation__Registry._transformations['a-custom-transformation']   # class level registry (shared by transformation_registry)
@@ -0,0 +1,83 @@
+from unittest                                                                                         import TestCase
+from osbot_utils.type_safe.Type_Safe                                                                  import Type_Safe
+from osbot_utils.utils.Objects                                                                        import base_classes
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Base      import Graph_Transformation__Base
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__View      import Graph_Transformation__View
+from mgraph_ai_service_html_graph.service.html_graph__transformations.html_use_cases.Html_Use_Case__2 import Html_Use_Case__2
+from mgraph_ai_service_html_graph.service.html_graph__transformations.html_use_cases.Html_Use_Case__3 import Html_Use_Case__3
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                                     import Html_MGraph
+
+HTML = '<html><body><div><p>Hello <b>big</b> world</p></div></body></html>'
+
+
+class test_Graph_Transformation__View(TestCase):
+
+    def setUp(self):
+        self.body_graph = Html_MGraph.from_html(HTML).body_graph
+        self.mgraph     = self.body_graph.mgraph
+        self.before     = self.mgraph.json()
+        self.view       = Graph_Transformation__View(source=self.mgraph)
+
+    def tearDown(self):
+        assert self.mgraph.json() == self.before                                # the source is never modified
+
+    def test__init__(self):
+        with self.view as _:
+            assert type(_)         is Graph_Transformation__View
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.changed()     is False
+            assert _.mgraph()      is self.mgraph                               # nothing to apply: the source itself
+            assert len(_.nodes())  == len(self.mgraph.graph.model.data.nodes)
+
+    def test_relabel(self):
+        paragraph_id = self.body_graph.nodes_by_path('body.div.p')[0]
+        text_id      = [node.node_id for node in self.view.nodes() if getattr(node.node_data, 'value', None) == 'big'][0]
+        with self.view as _:
+            assert _.relabel(paragraph_id, 'P').relabel(text_id, 'BIG') is _
+            assert _.node_value(paragraph_id) == 'P'
+            assert _.node_value(text_id     ) == 'BIG'
+            mgraph = _.mgraph()
+        nodes  = mgraph.graph.model.data.nodes
+        source = self.mgraph.graph.model.data.nodes
+        assert mgraph                               is not self.mgraph
+        assert nodes [paragraph_id].node_data.value == 'P'
+        assert nodes [text_id     ].node_data.value == 'BIG'
+        assert nodes [text_id     ].node_path       == 'text'
+        assert source[text_id     ].node_data.value == 'big'
+        assert source[paragraph_id].node_data       is None
+        assert all(nodes[node_id] is node for node_id, node in source.items()   # unchanged schemas are shared
+                   if node_id not in (paragraph_id, text_id))
+        assert set(mgraph.graph.model.data.edges) == set(self.mgraph.graph.model.data.edges)
+
+    def test_hide(self):
+        paragraph_id = self.body_graph.nodes_by_path('body.div.p')[0]
+        with self.view.hide(paragraph_id) as _:
+            assert _.is_hidden(paragraph_id) is True
+            assert paragraph_id not in [node.node_id for node in _.nodes()]
+            mgraph = _.mgraph()
+        data = mgraph.graph.model.data
+        assert paragraph_id not in data.nodes
+        assert len(data.nodes) == len(self.mgraph.graph.model.data.nodes) - 1
+        assert all(paragraph_id not in (edge.from_node_id, edge.to_node_id) for edge in data.edges.values())
+
+    def test_add_node__add_edge__restyle(self):
+        paragraph_id = self.body_graph.nodes_by_path('body.div.p')[0]
+        with self.view as _:
+            node_id = _.add_node(node_path='text', value='added')
+            edge_id = _.add_edge(paragraph_id, node_id, predicate='text', edge_path='9')
+            _.restyle(node_id, fill_color='#FF0000').restyle(node_id, font_color='#FFFFFF')
+            assert _.style(node_id     ) == {'fill_color': '#FF0000', 'font_color': '#FFFFFF'}
+            assert _.style(paragraph_id) == {}
+            mgraph = _.mgraph()
+        data = mgraph.graph.model.data
+        assert data.nodes[node_id].node_data.value           == 'added'
+        assert data.edges[edge_id].from_node_id              == paragraph_id
+        assert str(data.edges[edge_id].edge_label.predicate) == 'text'
+        assert node_id not in self.mgraph.graph.model.data.nodes
+
+    def test__use_cases(self):                                                  # relabel through a view: the parsed graph can be shared
+        for use_case in (Html_Use_Case__2(), Html_Use_Case__3()):
+            assert use_case.mutates_mgraph() is False
+            use_case.transform_mgraph(self.mgraph)
+            assert 'body.div.p' in use_case.dot_code
+        assert Graph_Transformation__Base().mutates_mgraph() is False
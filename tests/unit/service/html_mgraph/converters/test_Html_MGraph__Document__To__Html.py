@@ -3,6 +3,8 @@ from unittest
 from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html_MGraph__Document__To__Html   import Html_MGraph__Document__To__Html
 from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Document             import Html_MGraph__Document
 from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html__To__Html_MGraph__Document   import Html__To__Html_MGraph__Document
+from mgraph_ai_service_html_graph.service.html_mgraph.converters.Html_MGraph__Document__To__Html_Dict import Html_MGraph__Document__To__Html_Dict
+from osbot_utils.helpers.html.transformers.Html_Dict__To__Html                          import Html_Dict__To__Html
 from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
 from osbot_utils.utils.Objects                                                          import base_classes
 
@@ -29,7 +31,7 @@ class test_Html_MGraph__Document__To__Html(TestCase):
     # Convert Tests
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def test_convert__adds_doctype(self):                                       # Test DOCTYPE is added by Html_Dict__To__Html
+    def test_convert__adds_doctype(self):                                       # Test DOCTYPE is added
         with Html_MGraph__Document().setup() as doc:
             doc.attrs_graph.register_element(doc.root_id, 'html')
             doc.attrs_graph.register_element(doc.head_graph.root_id, 'head')
@@ -739,4 +741,39 @@ class test_Html_MGraph__Document__To__Html(TestCase):
         <div data-id="123" data-type="widget" data-config='{"a":1}'></div>
     </body>
 </html>
-"""
\ No newline at end of file
+"""
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Streaming Tests (direct serializer, no intermediate Html_Dict)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test_iter_chunks(self):                                                 # Test HTML is produced as a stream of chunks
+        original = '<html><head><title>T</title></head><body><p>a <b>b</b></p></body></html>'
+
+        with Html__To__Html_MGraph__Document() as to_doc:
+            doc = to_doc.convert(original)
+
+            with Html_MGraph__Document__To__Html() as to_html:
+                chunks = list(to_html.iter_chunks(doc))
+                assert len(chunks)    > 1
+                assert chunks[0]      == '<!DOCTYPE html>\n'
+                assert ''.join(chunks) == to_html.convert(doc)
+
+    def test_convert__matches_html_dict_pipeline(self):                         # Test output is identical to Document → Html_Dict → HTML
+        original = ('<html lang="en"><head><meta charset="utf-8"><title>x</title><style>a {}</style>'
+                    '<script src="a.js"></script></head><body class="c"><p>a <b>b <i>c</i> d</b> e<br>f</p>'
+                    '<div><div><span>x</span></div></div><img src=\'a"b\' alt="it\'s"><input disabled value="">'
+                    '<script>var a = 1;</script><ul><li>1</li><li>2<ul><li>3</li></ul></li></ul></body></html>')
+
+        with Html__To__Html_MGraph__Document() as to_doc:
+            doc       = to_doc.convert(original)
+            html_dict = Html_MGraph__Document__To__Html_Dict().convert(doc)
+            expected  = Html_Dict__To__Html(root=html_dict).convert()
+
+            assert Html_MGraph__Document__To__Html().convert(doc) == expected
+
+    def test_convert__without_doctype(self):
+        with Html__To__Html_MGraph__Document() as to_doc:
+            doc = to_doc.convert('<html><body><p>Hi</p></body></html>')
+
+            with Html_MGraph__Document__To__Html(include_doctype=False) as to_html:
+                assert to_html.convert(doc) == '<html>\n    <body>\n        <p>Hi</p>\n    </body>\n</html>\n'
@@ -374,6 +374,27 @@ class test_Html_MGraph__Attributes(TestCase):
             assert div1 in elements
             assert div3 in elements
             assert div2 not in elements
+            assert _.get_elements_with_attribute('class', 'missing') == []
+            assert _.get_elements_with_attribute('missing'         ) == []
+
+    def test_get_elements_with_class(self):                                     # Test finding elements by class token
+        with Html_MGraph__Attributes().setup() as _:
+            div1 = Node_Id(Obj_Id())
+            div2 = Node_Id(Obj_Id())
+            div3 = Node_Id(Obj_Id())
+
+            _.register_element(div1, 'div')
+            _.register_element(div2, 'div')
+            _.register_element(div3, 'div')
+
+            _.add_attribute(div1, 'class', 'nav open', position=0)
+            _.add_attribute(div2, 'class', 'navbar'  , position=0)
+            _.add_attribute(div3, 'id'   , 'nav'     , position=0)              # Not a class
+
+            assert _.get_elements_with_class('nav'    ) == [div1]
+            assert _.get_elements_with_class('open'   ) == [div1]
+            assert _.get_elements_with_class('navbar' ) == [div2]
+            assert _.get_elements_with_class('missing') == []
 
     def test_get_elements_with_attribute__not_found(self):                      # Test finding elements with non-existent attribute
         with Html_MGraph__Attributes().setup() as _:
@@ -393,6 +414,54 @@ class test_Html_MGraph__Attributes(TestCase):
             elements = _.get_elements_with_attribute('class', 'expected')
             assert elements == []
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Columnar Store Tests
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test_attr_columns(self):                                                # Test columnar store is kept in sync by add_attribute
+        with Html_MGraph__Attributes().setup() as _:
+            div_1 = Node_Id(Obj_Id())
+            div_2 = Node_Id(Obj_Id())
+            _.register_element(div_1, 'div')
+            _.register_element(div_2, 'div')
+            _.add_attribute(div_1, 'class'   , 'a'  , position=0)
+            _.add_attribute(div_1, 'hidden'  , None , position=1)
+            _.add_attribute(div_2, 'class'   , 'a'  , position=1)
+            _.add_attribute(div_2, 'id'      , 'b'  , position=0)               # out of order
+
+            assert _.attr_strings         == ['class', 'a', 'hidden', 'id', 'b']   # names and values are interned
+            assert _.attr_columns[div_1]  == [(0, 0, 1), (1, 2, None)]
+            assert _.attr_columns[div_2]  == [(0, 3, 4), (1, 0, 1)]
+            assert _.get_attributes(div_2) == {'id': 'b', 'class': 'a'}
+            assert _.get_attribute (div_1, 'hidden') is None
+            assert _.get_attribute (div_1, 'id'    ) is None
+            assert _.get_attribute (div_2, 'id'    ) == 'b'
+
+    def test_get_attributes__matches_graph(self):                               # Test columnar store matches the three-node model
+        with Html_MGraph__Attributes().setup() as _:
+            node_id = Node_Id(Obj_Id())
+            _.register_element(node_id, 'input')
+            _.add_attribute(node_id, 'type'    , 'text', position=0)
+            _.add_attribute(node_id, 'required', None  , position=2)
+            _.add_attribute(node_id, 'value'   , ''    , position=1)
+
+            assert _.get_attributes(node_id) == _.get_attributes__from_graph(node_id)
+            assert _.get_attributes(node_id) == {'type': 'text', 'value': '', 'required': None}
+
+    def test_restore_caches__rebuilds_attr_columns(self):                       # Test columnar store is rebuilt from the graph
+        with Html_MGraph__Attributes().setup() as _:
+            node_id = Node_Id(Obj_Id())
+            _.register_element(node_id, 'a')
+            _.add_attribute(node_id, 'href', '/home', position=0)
+            _.add_attribute(node_id, 'rel' , 'next' , position=1)
+            attr_columns = dict(_.attr_columns)
+
+            _.attr_columns = {}
+            assert _.get_attributes(node_id) == {}
+            _.restore_caches()
+            assert _.attr_columns            == attr_columns
+            assert _.get_attributes(node_id) == {'href': '/home', 'rel': 'next'}
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Helper Method Tests
     # ═══════════════════════════════════════════════════════════════════════════
@@ -545,4 +614,30 @@ class test_Html_MGraph__Attributes(TestCase):
                                          root_id='c0000002')
                 assert stats.unique_tags     == 4
                 assert stats.registered_elements == 4
-                assert stats.total_attributes    == 4
\ No newline at end of file
+                assert stats.total_attributes    == 4
+
+    def test_freeze(self):                                                      # Test frozen tag / attribute lookups
+        with Html_MGraph__Attributes().setup() as _:
+            div_id  = Node_Id(Obj_Id())
+            p_id    = Node_Id(Obj_Id())
+            _.register_element(div_id, 'div')
+            _.register_element(p_id  , 'p'  )
+            _.add_attribute(div_id, 'class', 'nav', position=0)
+            _.add_attribute(div_id, 'id'   , 'top', position=1)
+
+            def reads():
+                return (_.get_tag(div_id), _.get_tag(p_id), _.get_tag(Node_Id(Obj_Id())),
+                        _.get_elements_by_tag('div'), _.get_elements_by_tag('span'),
+                        _.get_attributes(div_id), _.get_attribute(div_id, 'id'),
+                        _.get_elements_with_class('nav'), sorted(_.get_all_tags()))
+            before = reads()
+            assert _.freeze()         is _
+            assert reads()            == before
+            assert before[:3]         == ('div', 'p', None)
+            assert _.value_node_cache == {}                                     # build caches dropped
+            assert _.name_node_cache  == {}
+            assert type(_.attr_columns[div_id]) is tuple
+            with self.assertRaises(ValueError):
+                _.add_attribute(p_id, 'class', 'text', position=0)
+            with self.assertRaises(ValueError):
+                _.register_element(Node_Id(Obj_Id()), 'span')
@@ -450,6 +450,79 @@ class test_Html_MGraph__Base(TestCase):
 
             assert child.node_id in ordered                                     # Should still work with default position 0
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Freeze Tests
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test_freeze(self):                                                      # Test frozen reads match the mutable ones, and writes raise
+        with Html_MGraph__Base().setup() as _:
+            parent = _.new_element_node(node_path=Node_Path('parent'))
+            elem1  = _.new_element_node(node_path=Node_Path('elem'))
+            elem2  = _.new_element_node(node_path=Node_Path('elem'))
+            text1  = _.new_value_node(value='text1', node_path=Node_Path('text'))
+            _.new_edge(from_node_id=_.root_id     , to_node_id=parent.node_id)
+            _.new_edge(from_node_id=parent.node_id, to_node_id=elem2.node_id, predicate=Safe_Id('child'), edge_path=Edge_Path('2'))
+            _.new_edge(from_node_id=parent.node_id, to_node_id=text1.node_id, predicate=Safe_Id('text' ), edge_path=Edge_Path('1'))
+            _.new_edge(from_node_id=parent.node_id, to_node_id=elem1.node_id, predicate=Safe_Id('child'), edge_path=Edge_Path('0'))
+
+            def reads():
+                return (_.children_by_position(parent.node_id)                          ,
+                        _.get_children_ordered(parent.node_id)                          ,
+                        _.get_children_ordered(parent.node_id, predicate=Safe_Id('child')),
+                        _.get_children        (parent.node_id, predicate=Safe_Id('text')),
+                        sorted(_.get_children(parent.node_id))                          ,
+                        _.get_parent          (elem1.node_id)                           ,
+                        _.get_parent          (_.root_id)                               ,
+                        sorted(_.nodes_by_path(Node_Path('elem')))                      ,
+                        _.node_value          (text1.node_id)                           ,
+                        _.node_path           (elem1.node_id)                           ,
+                        sorted(edge.edge_id for edge in _.outgoing_edges(parent.node_id)) ,
+                        sorted(edge.edge_id for edge in _.incoming_edges(elem2 .node_id)) )
+            before = reads()
+            mgraph = _.mgraph
+            data   = _.mgraph.graph.model.data
+            assert _.frozen   is False
+            assert _.freeze() is _
+            assert _.frozen   is True
+            assert _.mgraph   is not mgraph                                     # index (and the MGraph__Edit holding it) released
+            assert _.mgraph.graph.model.data is data                            # same node / edge schemas
+            assert _.freeze() is _                                              # idempotent
+            assert reads()    == before
+            assert before[0]  == (('child', elem1.node_id), ('text', text1.node_id), ('child', elem2.node_id))
+
+            with self.assertRaises(ValueError):
+                _.new_element_node(node_path=Node_Path('other'))
+            with self.assertRaises(ValueError):
+                _.new_value_node(value='other')
+            with self.assertRaises(ValueError):
+                _.new_edge(from_node_id=parent.node_id, to_node_id=elem1.node_id)
+            assert len(_.node_schemas()) == 5
+
+    def test_restore_records(self):                                             # Test a snapshot-backed graph: frozen reads from the records, MGraph built on first use
+        with Html_MGraph__Base().setup() as source:
+            parent = source.new_element_node(node_path=Node_Path('parent'))
+            text1  = source.new_value_node(value='text1', node_path=Node_Path('text'))
+            source.new_edge(from_node_id=source.root_id , to_node_id=parent.node_id, predicate=Safe_Id('child'), edge_path=Edge_Path('0'))
+            source.new_edge(from_node_id=parent.node_id , to_node_id=text1.node_id , predicate=Safe_Id('text' ), edge_path=Edge_Path('0'))
+
+        node_records = {node.node_id: (node.node_path, getattr(node.node_data, 'value', None), None, hasattr(node.node_data, 'value'))
+                        for node in source.node_schemas()}
+        edge_records = list(source.edge_records())
+        with Html_MGraph__Base().setup__for_restore(str(source.root_id), with_mgraph=False) as _:
+            assert _.restore_records(node_records, edge_records) is _
+            assert _.frozen                               is True
+            assert _.get_children_ordered(parent.node_id) == [text1.node_id]
+            assert _.get_parent          (text1.node_id ) == parent.node_id
+            assert _.node_value          (text1.node_id ) == 'text1'
+            assert _.node_path           (parent.node_id) == 'parent'
+            assert _.node_values()                        == source.node_values() == {text1.node_id: 'text1'}
+            assert _.edge_records()                       is edge_records
+            assert _._mgraph                              is None                   # nothing read needed the MGraph
+            assert _.to_json()                            == source.to_json()       # .mgraph is built from the records
+            assert _._mgraph                              is not None
+            with self.assertRaises(ValueError):
+                _.new_value_node(value='other')
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Stats Tests
     # ═══════════════════════════════════════════════════════════════════════════
@@ -479,4 +479,33 @@ class test_Html_MGraph__Document__Methods(TestCase):
 
             json_string = json.dumps(json_data)                                 # Should not raise
             assert type(json_string) is str
-            assert len(json_string) > 0
\ No newline at end of file
+            assert len(json_string) > 0
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # freeze Tests
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test_freeze(self):                                                      # Test a frozen document reads the same as a mutable one
+        from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph import Html_MGraph
+        html        = ('<html><head><title>Title</title></head><body>'
+                       '<div class="a">Hello <b>big</b> world<p>one</p><p>two</p></div>'
+                       '<script>var a = 1</script></body></html>')
+        html_mgraph = Html_MGraph.from_html(html)
+        body_graph  = html_mgraph.body_graph
+
+        def reads():
+            return (html_mgraph.to_html()                                            ,
+                    html_mgraph.to_html_dict()                                       ,
+                    list(html_mgraph.walk_body())                                    ,
+                    body_graph.get_all_text_recursive(body_graph.root_id)            )
+        before = reads()
+        assert html_mgraph.frozen   is False
+        assert html_mgraph.freeze() is html_mgraph
+        assert all(graph.frozen for graph in html_mgraph.document.graphs().values())
+        assert reads()              == before
+        assert before[3]            == 'Hello big worldonetwo'
+
+        with self.assertRaises(ValueError):
+            body_graph.create_text('more', parent_id=body_graph.root_id)
+        with self.assertRaises(ValueError):
+            html_mgraph.document._link_component_graph('other', body_graph.root_id)
@@ -7,6 +7,7 @@ from mgraph_ai_service_html_graph.service.html_mgraph.graphs.Html_MGraph__Docume
 from mgraph_db.utils.testing.mgraph_test_ids                                                     import mgraph_test_ids
 from osbot_utils.testing.__                                                                      import __
 from osbot_utils.type_safe.Type_Safe                                                             import Type_Safe
+from osbot_utils.utils.Json                                                                      import json_dumps, json_loads
 from osbot_utils.utils.Objects                                                                   import base_classes
 
 
@@ -61,6 +62,35 @@ class test_Html_MGraph(TestCase):
         assert type(mgraph) is Html_MGraph
         assert mgraph.document is not None
 
+    def test_from_json(self):                                                   # Test restoring from to_json() output (no re-parse)
+        html     = '<html lang="en"><head><title>T</title><style>p {}</style></head><body><p class="a" hidden>Hi <b>there</b></p><script>x=1</script></body></html>'
+        mgraph1  = Html_MGraph.from_html(html)
+        json_1   = json_loads(json_dumps(mgraph1.to_json()))                     # make sure it survives a trip through a json string
+        mgraph2  = Html_MGraph.from_json(json_1)
+
+        assert type(mgraph2)           is Html_MGraph
+        assert mgraph2.to_json()       == json_1
+        assert mgraph2.to_html()       == mgraph1.to_html()
+        assert mgraph2.root_id()       == mgraph1.root_id()                     # shared node ids are kept
+        assert mgraph2.body_root_id()  == mgraph1.body_root_id()
+
+        p_id = mgraph2.get_body_children()[0]
+        assert mgraph2.get_tag       (p_id) == 'p'
+        assert mgraph2.get_attributes(p_id) == {'class': 'a', 'hidden': None}
+
+        attrs_1 = mgraph1.document.attrs_graph
+        attrs_2 = mgraph2.document.attrs_graph
+        assert dict(attrs_2.tag_node_cache  ) == dict(attrs_1.tag_node_cache  )
+        assert dict(attrs_2.name_node_cache ) == dict(attrs_1.name_node_cache )
+        assert dict(attrs_2.value_node_cache) == dict(attrs_1.value_node_cache)
+
+    def test_from_json__missing_graph(self):
+        data = Html_MGraph.from_html('<html><body></body></html>').to_json()
+        del data['styles']
+        with self.assertRaises(ValueError) as context:
+            Html_MGraph.from_json(data)
+        assert str(context.exception) == 'Missing graph in Html_MGraph json: styles'
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Export Method Tests
     # ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,82 @@
+from threading                                                              import Thread
+from unittest                                                               import TestCase
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html   import Safe_Str__Html
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.utils.Misc                                                 import str_sha256
+from osbot_utils.utils.Objects                                              import base_classes
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph           import Html_MGraph
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph__Cache    import Html_MGraph__Cache, html_mgraph_cache, HTML_MGRAPH__CACHE__MAX_ENTRIES
+
+
+class test_Html_MGraph__Cache(TestCase):
+
+    def setUp(self):
+        self.html  = '<html><body><p>Hello</p></body></html>'
+        self.cache = Html_MGraph__Cache()
+
+    def test__init__(self):
+        with self.cache as _:
+            assert type(_)         is Html_MGraph__Cache
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.max_entries   == HTML_MGRAPH__CACHE__MAX_ENTRIES
+            assert _.size()        == 0
+            assert _.stats()       == {'size': 0, 'max_entries': HTML_MGRAPH__CACHE__MAX_ENTRIES, 'hits': 0, 'misses': 0}
+        assert type(html_mgraph_cache) is Html_MGraph__Cache
+
+    def test_cache_key(self):
+        with self.cache as _:
+            assert _.cache_key(self.html) == str_sha256(self.html)
+            assert _.cache_key(self.html) == _.cache_key(self.html)
+            assert _.cache_key(self.html) != _.cache_key(self.html + ' ')
+            assert _.cache_key(Safe_Str__Html(self.html)) == str_sha256(self.html)   # route requests (str subclass)
+
+    def test_get_or_parse(self):
+        with self.cache as _:
+            cache_key_1, html_mgraph_1 = _.get_or_parse(self.html)
+            cache_key_2, html_mgraph_2 = _.get_or_parse(self.html)
+
+            assert type(html_mgraph_1) is Html_MGraph
+            assert cache_key_1         == cache_key_2
+            assert html_mgraph_1       is html_mgraph_2                         # second call is a cache hit
+            assert html_mgraph_1.frozen is True                                 # shared between requests: read-only
+            assert _.contains(cache_key_1)
+            assert _.stats()           == {'size': 1, 'max_entries': HTML_MGRAPH__CACHE__MAX_ENTRIES, 'hits': 1, 'misses': 1}
+            assert html_mgraph_1.to_html() == Html_MGraph.from_html(self.html).to_html()
+
+    def test_get__missing(self):
+        with self.cache as _:
+            assert _.get('not-a-key') is None
+            assert _.misses           == 1
+
+    def test_add__evicts_least_recently_used(self):
+        with Html_MGraph__Cache(max_entries=2) as _:
+            html_mgraph = Html_MGraph.from_html(self.html)
+            _.add('a', html_mgraph)
+            _.add('b', html_mgraph)
+            assert _.get('a') is html_mgraph                                    # 'a' becomes most recent, so 'b' is the oldest
+            _.add('c', html_mgraph)
+            assert list(_.entries.keys()) == ['a', 'c']
+            assert _.contains('b') is False
+
+    def test_clear(self):
+        with self.cache as _:
+            _.get_or_parse(self.html)
+            assert _.clear() is _
+            assert _.size()  == 0
+            assert _.hits    == 0
+            assert _.misses  == 0
+
+    def test_get__add__concurrent(self):                                        # LRU reorder / evict under the lock
+        html_mgraph = Html_MGraph.from_html(self.html)
+        with Html_MGraph__Cache(max_entries=4) as _:
+            def worker(thread_id):
+                for index in range(500):
+                    key = f'{(thread_id + index) % 8}'
+                    if _.get(key) is None:
+                        _.add(key, html_mgraph)
+            threads = [Thread(target=worker, args=(thread_id,)) for thread_id in range(8)]
+            for thread in threads: thread.start()
+            for thread in threads: thread.join()
+            assert _.size()             == 4
+            assert _.hits + _.misses    == 8 * 500
+            assert len(set(_.entries))  == 4
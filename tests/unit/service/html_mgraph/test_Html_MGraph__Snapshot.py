@@ -0,0 +1,98 @@
+from unittest                                                               import TestCase
+from osbot_utils.utils.Files                                                import temp_file, file_delete, file_exists
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph           import Html_MGraph
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph__Snapshot import Html_MGraph__Snapshot__Reader, Html_MGraph__Snapshot__Writer, SNAPSHOT__MAGIC, SNAPSHOT__HEADER
+
+
+class test_Html_MGraph__Snapshot(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.html        = ('<html><head><title>Test</title><style>p { color: red }</style></head>'
+                           '<body><div class="a b" id="main" hidden><p>Hello <b>World</b></p>'
+                           '<script>var x = 1;</script></div><p class="a b">Bye</p></body></html>')
+        cls.html_mgraph = Html_MGraph.from_html(cls.html)
+        cls.snapshot    = cls.html_mgraph.to_snapshot()
+
+    def test_write(self):
+        snapshot = Html_MGraph__Snapshot__Writer().write(self.html_mgraph.document)
+        assert snapshot                                      == self.snapshot       # deterministic
+        assert snapshot[:4]                                  == SNAPSHOT__MAGIC
+        assert SNAPSHOT__HEADER.unpack_from(snapshot, 0)[2]  == 6                   # document, head, body, attributes, scripts, styles
+
+    def test_read_index(self):
+        with Html_MGraph__Snapshot__Reader.from_bytes(self.snapshot) as _:
+            document = self.html_mgraph.document
+            assert _.graph_names()     == ['document', 'head', 'body', 'attributes', 'scripts', 'styles']
+            assert len(_.string_cache) == 6                                     # only the graph names were decoded
+            for name, graph in document.graphs().items():
+                assert _.root_id   (name) == str(graph.root_id)
+                assert _.node_count(name) == len(graph.node_schemas())
+                assert _.edge_count(name) == len(graph.edge_schemas())
+            assert _.column_count() == len(list(document.attrs_graph.columns_entries()))
+
+    def test_node_record__edge_record(self):
+        with Html_MGraph__Snapshot__Reader.from_bytes(self.snapshot) as _:
+            tags = [record['value'] for record in _.iter_nodes('attributes')
+                                    if record['is_value'] and record['node_path'].startswith('tag:')]
+            assert sorted(tags) == ['b', 'body', 'div', 'head', 'html', 'p', 'script', 'style', 'title']
+
+            edge = _.edge_record('body', 0)
+            assert list(edge) == ['edge_id', 'from_node_id', 'to_node_id', 'predicate', 'edge_path']
+
+            with self.assertRaises(IndexError):
+                _.node_record('body', _.node_count('body'))
+            with self.assertRaises(ValueError) as context:
+                _.node_count('aaa')
+            assert str(context.exception) == 'Graph not found in snapshot: aaa'
+
+    def test_read_index__bad_magic(self):
+        with self.assertRaises(ValueError) as context:
+            Html_MGraph__Snapshot__Reader.from_bytes(b'XXXX' + self.snapshot[4:])
+        assert str(context.exception) == "Not an Html_MGraph snapshot (magic: b'XXXX')"
+
+    def test_from_snapshot__bytes(self):
+        loaded = Html_MGraph.from_snapshot(self.snapshot)
+        assert loaded.to_html()   == self.html_mgraph.to_html()
+        assert loaded.to_json()   == self.html_mgraph.to_json()
+        assert loaded.root_id()   == self.html_mgraph.root_id()
+        assert loaded.to_snapshot() == self.snapshot                            # round-trip is stable
+
+        body_root = loaded.body_root_id()
+        assert loaded.get_tag(body_root) == 'body'
+        div_id    = loaded.get_body_children()[0]
+        assert loaded.get_attributes(div_id) == {'class': 'a b', 'id': 'main', 'hidden': None}
+
+    def test_from_snapshot__file(self):
+        path = temp_file(extension='.hmgs')
+        try:
+            assert self.html_mgraph.to_snapshot(path) == self.snapshot
+            assert file_exists(path)
+            loaded = Html_MGraph.from_snapshot(path)
+            assert loaded.to_html() == self.html_mgraph.to_html()
+        finally:
+            file_delete(path)
+
+    def test_from_snapshot__read_only(self):                                   # Loaded documents are frozen, and served from the snapshot records
+        original = self.html_mgraph.document
+        loaded   = Html_MGraph.from_snapshot(self.snapshot)
+        graphs   = loaded.document.graphs()
+        restored = loaded.document.attrs_graph
+        assert loaded.frozen                   is True
+        assert dict(restored.tag_node_cache)   == dict(original.attrs_graph.tag_node_cache)
+        assert restored.attr_strings           == original.attrs_graph.attr_strings     # columnar store read from the snapshot (not rebuilt)
+        assert restored.name_node_cache        == {}                                    # build caches are not restored
+        assert restored.value_node_cache       == {}
+
+        body_root = loaded.body_root_id()
+        assert loaded.get_tag(body_root)       == 'body'
+        assert list(loaded.walk_body())        == list(self.html_mgraph.walk_body())
+        assert loaded.to_html()                == self.html_mgraph.to_html()
+        assert [graph._mgraph for graph in graphs.values()] == [None] * 6       # no node / edge schemas created so far
+
+        assert len(restored.node_schemas())    == len(original.attrs_graph.node_schemas())  # .mgraph is built on first use
+        assert restored._mgraph                is not None
+        assert graphs['body']._mgraph          is None
+
+        with self.assertRaises(ValueError):
+            restored.register_element(restored.root_id, 'p')
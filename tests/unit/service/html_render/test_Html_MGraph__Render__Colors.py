@@ -3,6 +3,7 @@ from osbot_utils.type_safe.Type_Safe
 from osbot_utils.utils.Objects                                                      import base_classes
 from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors   import Html_MGraph__Render__Colors
 from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors   import Enum__Html_Render__Color_Scheme
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Colors   import TAG_CATEGORY_LOOKUP, TAG_STYLES, BORDER_COLORS, darken_hex, lighten_hex
 
 
 class test_Html_MGraph__Render__Colors(TestCase):
@@ -195,4 +196,50 @@ class test_Html_MGraph__Render__Colors(TestCase):
         with self.colors as _:
             assert _.get_font_color('unknown') == '#333333'
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Precomputed lookup tables
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__TAG_CATEGORY_LOOKUP(self):                                                    # Flat tag → category (same answer as scanning TAG_CATEGORIES)
+        for category, tags in Html_MGraph__Render__Colors.TAG_CATEGORIES.items():
+            for tag in tags:
+                assert TAG_CATEGORY_LOOKUP[tag] == category
+        assert len(TAG_CATEGORY_LOOKUP) == sum(len(tags) for tags in Html_MGraph__Render__Colors.TAG_CATEGORIES.values())
+
+    def test_tag_style(self):                                                               # (category, fill, border, font), one dict lookup
+        for scheme in Enum__Html_Render__Color_Scheme:
+            with Html_MGraph__Render__Colors(scheme=scheme) as _:
+                assert set(TAG_STYLES[scheme]) == set(TAG_CATEGORY_LOOKUP) | {'unknown'}
+                for tag in list(TAG_CATEGORY_LOOKUP) + ['DIV', 'custom-element', '']:
+                    category, fill, border, font = _.tag_style(tag)
+                    assert category == _.get_tag_category(tag)
+                    assert fill     == _._get_tag_category_colors().get(category, _._get_tag_category_colors()['unknown'])
+                    assert border   == darken_hex(fill)
+                    assert font     == _.get_font_color('tag')
+
+    def test_tag_style__values(self):
+        with self.colors as _:
+            assert _.tag_style('div')     == ('structural', '#4A90D9', '#2c72bb', '#FFFFFF')
+            assert _.tag_style('Table')   == ('table'     , '#F0AD4E', '#d28f30', '#FFFFFF')
+            assert _.tag_style('unknown') == ('unknown'   , '#777777', '#595959', '#FFFFFF')
+            assert _.tag_style('my-tag')  == ('unknown'   , '#777777', '#595959', '#FFFFFF')
+
+    def test_border_color(self):                                                            # Precomputed for the scheme colors, computed (and cached) for the rest
+        with self.colors as _:
+            assert BORDER_COLORS['#FFFFFF']  == '#e1e1e1'
+            assert _.border_color('#FFFFFF') == '#e1e1e1'
+            assert _.border_color('#E1BEE7') == darken_hex('#E1BEE7') == '#c3a0c9'
+            assert _.border_color('red')     == '#CCCCCC'
+        for fill in _.ELEMENT_COLORS_HIGH_CONTRAST + list(_.TEXT_COLORS.values()):
+            assert fill in BORDER_COLORS
+
+    def test_darken_hex__lighten_hex(self):
+        assert darken_hex ('#FFFFFF'    ) == '#e1e1e1'
+        assert darken_hex ('#101010'    ) == '#000000'                                      # clamped at 0
+        assert darken_hex ('#FFFFFF', 16) == '#efefef'
+        assert darken_hex ('#GGGGGG'    ) == '#CCCCCC'
+        assert darken_hex (''           ) == '#CCCCCC'
+        assert lighten_hex('#000000'    ) == '#1e1e1e'
+        assert lighten_hex('#F0F0F0'    ) == '#ffffff'                                      # clamped at 255
+        assert lighten_hex('invalid'    ) == '#FFFFFF'
 
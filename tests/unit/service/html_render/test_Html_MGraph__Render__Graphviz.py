@@ -0,0 +1,104 @@
+import pytest
+from unittest                                                                         import TestCase
+from osbot_utils.type_safe.Type_Safe                                                  import Type_Safe
+from osbot_utils.utils.Misc                                                           import str_sha256
+from osbot_utils.utils.Objects                                                        import base_classes
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                     import Html_MGraph
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Screenshot         import Html_MGraph__Screenshot
+from mgraph_ai_service_html_graph.service.html_render.Html_MGraph__Render__Graphviz   import (Html_MGraph__Render__Graphviz,
+                                                                                              graphviz_renderer             ,
+                                                                                              GRAPHVIZ__DEFAULT__MAX_WORKERS,
+                                                                                              GRAPHVIZ__DEFAULT__SFDP_NODES )
+
+DOT_CODE = 'digraph {\n  a [label="a"]\n  b [label="b"]\n  a -> b [label="child"]\n}'
+
+
+class test_Html_MGraph__Render__Graphviz(TestCase):
+
+    def setUp(self):
+        self.renderer = Html_MGraph__Render__Graphviz()
+
+    def test__init__(self):
+        with self.renderer as _:
+            assert type(_)            is Html_MGraph__Render__Graphviz
+            assert base_classes(_)    == [Type_Safe, object]
+            assert _.max_workers      == GRAPHVIZ__DEFAULT__MAX_WORKERS
+            assert _.sfdp_threshold   == GRAPHVIZ__DEFAULT__SFDP_NODES
+            assert _.stats()          == {'cache_size': 0, 'hits': 0, 'misses': 0, 'max_workers': GRAPHVIZ__DEFAULT__MAX_WORKERS}
+        assert type(graphviz_renderer) is Html_MGraph__Render__Graphviz
+
+    def test_layout_engine(self):
+        with Html_MGraph__Render__Graphviz(sfdp_threshold=100) as _:
+            assert _.layout_engine(10 ) == 'dot'
+            assert _.layout_engine(100) == 'dot'
+            assert _.layout_engine(101) == 'sfdp'
+
+    def test_estimate_node_count(self):
+        with self.renderer as _:
+            assert _.estimate_node_count(DOT_CODE)                                  == 2
+            assert _.estimate_node_count('digraph {\n node [shape=box]\n a [x=1]\n}') == 1
+
+    def test_cache(self):
+        with Html_MGraph__Render__Graphviz(cache_max_entries=2) as _:
+            key_png = _.cache_key('dot', 'png', DOT_CODE)
+            assert key_png == str_sha256(f'dot:png:{DOT_CODE}')
+            assert key_png != _.cache_key('dot' , 'svg', DOT_CODE)
+            assert key_png != _.cache_key('sfdp', 'png', DOT_CODE)
+
+            _.cache_add('a', b'1')
+            _.cache_add('b', b'2')
+            assert _.cache_get('a') == b'1'                                     # 'b' is now the least recently used
+            _.cache_add('c', b'3')
+            assert list(_.cache.keys()) == ['a', 'c']
+            assert _.cache_get('b')     is None
+            assert _.stats()            == {'cache_size': 2, 'hits': 1, 'misses': 1, 'max_workers': GRAPHVIZ__DEFAULT__MAX_WORKERS}
+            assert _.cache_clear().stats()['cache_size'] == 0
+
+    def test_render__cached_output_skips_subprocess(self):
+        with self.renderer as _:
+            cache_key = _.cache_key('dot', 'svg', DOT_CODE)
+            _.cache_add(cache_key, b'<svg/>')
+            assert _.render_svg(DOT_CODE) == '<svg/>'                           # served from the cache, even without graphviz installed
+            assert _.hits                 == 1
+
+    def test_render__unsupported_format(self):
+        with self.assertRaises(ValueError) as context:
+            self.renderer.render(DOT_CODE, output_format='pdf')
+        assert str(context.exception) == 'Unsupported graphviz output format: pdf'
+
+    def test_execute__binary_not_found(self):
+        with self.assertRaises(RuntimeError) as context:
+            self.renderer.execute('graphviz-binary-that-does-not-exist', 'png', DOT_CODE)
+        assert str(context.exception) == "graphviz 'graphviz-binary-that-does-not-exist' binary not found in PATH"
+
+
+class test_Html_MGraph__Render__Graphviz__local(TestCase):                       # Tests that need the graphviz binaries
+
+    @classmethod
+    def setUpClass(cls):
+        if Html_MGraph__Render__Graphviz().is_available() is False:
+            pytest.skip('skipping local graphviz tests, because the dot binary is not installed')
+
+    def test_render_png_and_svg(self):
+        with Html_MGraph__Render__Graphviz() as _:
+            png = _.render_png(DOT_CODE)
+            svg = _.render_svg(DOT_CODE)
+            assert png.startswith(b'\x89PNG')
+            assert '<svg' in svg
+            assert _.render_png(DOT_CODE) is png                                # second render comes from the cache
+            assert _.stats()['hits'] == 1
+
+    def test_execute__queue_full(self):
+        with Html_MGraph__Render__Graphviz(max_workers=1, queue_timeout=0.01) as _:
+            _._slots.acquire()                                                  # simulate a busy worker
+            try:
+                with self.assertRaises(TimeoutError):
+                    _.execute('dot', 'png', DOT_CODE)
+            finally:
+                _._slots.release()
+
+    def test_screenshot__render_svg(self):
+        html_mgraph = Html_MGraph.from_html('<div class="main">Hello</div>')
+        with Html_MGraph__Screenshot(html_mgraph=html_mgraph, renderer=Html_MGraph__Render__Graphviz()) as _:
+            assert '<svg'       in _.render_svg()
+            assert _.render().startswith(b'\x89PNG')
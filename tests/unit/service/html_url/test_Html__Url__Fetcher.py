@@ -2,6 +2,7 @@ from unittest
 from mgraph_ai_service_html_graph.schemas.routes.Schema__Html__From_Url__Request  import Schema__Html__From_Url__Request
 from mgraph_ai_service_html_graph.schemas.routes.Schema__Html__From_Url__Response import Schema__Html__From_Url__Response
 from mgraph_ai_service_html_graph.service.html_url.Html__Url__Fetcher             import Html__Url__Fetcher
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics     import html_graph_metrics, METRIC__URL_FETCH_ERRORS, METRIC__URL_FETCH_DURATION
 
 URL__DOCS_DINISCRUZ_AI = "https://docs.diniscruz.ai/"
 
@@ -35,4 +36,16 @@ class test_Html__Url__Fetcher(TestCase):
         with self.assertRaises(ValueError) as context:
             self.fetcher.fetch_html(request)
 
-        assert 'Connection error' in str(context.exception)
\ No newline at end of file
+        assert 'Connection error' in str(context.exception)
+
+    def test__fetch_html__connection_error__metrics(self):                              # Failed fetches are counted and timed
+        errors_key    = (METRIC__URL_FETCH_ERRORS  , (('reason', 'connection'),))
+        duration_key  = (METRIC__URL_FETCH_DURATION, ())
+        errors_before = html_graph_metrics.counters.get(errors_key, 0)
+        count_before  = html_graph_metrics.histograms.get(duration_key, [None, 0, 0])[2]
+
+        with self.assertRaises(ValueError):
+            self.fetcher.fetch_html(Schema__Html__From_Url__Request(url='https://unreachable'))
+
+        assert html_graph_metrics.counters  [errors_key  ]    == errors_before + 1
+        assert html_graph_metrics.histograms[duration_key][2] == count_before  + 1
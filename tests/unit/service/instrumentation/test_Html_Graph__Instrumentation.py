@@ -0,0 +1,88 @@
+from threading                                                                             import Event, Thread
+from unittest                                                                               import TestCase
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                              import Timestamp_Collector
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Objects                                                              import base_classes
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation       import Html_Graph__Instrumentation, html_graph_instrumentation, timestamp, timestamp_args, timestamp_block, TIMESTAMP_BLOCK__NO_OP
+
+
+class An_Instrumented_Class:
+    @timestamp(name='an.method')
+    def method(self, value):
+        with timestamp_block('an.block'):
+            return value * 2
+
+    @timestamp_args(name='an.method_args({kind})')
+    def method_args(self, kind):
+        return kind
+
+
+class test_Html_Graph__Instrumentation(TestCase):
+
+    def setUp(self):
+        self.target = An_Instrumented_Class()
+
+    def test__init__(self):
+        with Html_Graph__Instrumentation() as _:
+            assert type(_)         is Html_Graph__Instrumentation
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.enabled       is False
+            assert _.on            is False
+        assert html_graph_instrumentation.on is False                           # off by default
+
+    def test_enable__disable(self):
+        with Html_Graph__Instrumentation() as _:
+            assert _.enable ().on is True
+            assert _.disable().on is False
+
+    def test_active(self):                                                      # nested blocks restore the previous state
+        with Html_Graph__Instrumentation() as _:
+            with _.active():
+                assert _.on is True
+                with _.active():
+                    assert _.on is True
+                assert _.on is True
+            assert _.on is False
+
+    def test_active__other_threads(self):                                       # per request: a traced request does not switch on the others
+        with Html_Graph__Instrumentation() as _:
+            seen    = {}
+            started = Event()
+            release = Event()
+            def traced():
+                with _.active():
+                    seen['traced'] = _.on
+                    started.set()
+                    release.wait(5)
+            thread = Thread(target=traced)
+            thread.start()
+            started.wait(5)
+            seen['other'] = _.on                                                # while the traced request is still running
+            release.set()
+            thread.join()
+            assert seen == {'traced': True, 'other': False}
+            assert _.enable().on is True                                        # global switch: every thread
+
+    def test_timestamp_block__off(self):
+        assert timestamp_block('abc') is TIMESTAMP_BLOCK__NO_OP                 # shared no-op, nothing allocated
+
+    def test_decorators__off(self):                                             # collector is not used when instrumentation is off
+        _timestamp_collector_ = Timestamp_Collector(name='off')
+        with _timestamp_collector_:
+            assert self.target.method(21)          == 42
+            assert self.target.method_args('json') == 'json'
+        assert _timestamp_collector_.entry_count() == 0
+
+    def test_decorators__on(self):
+        _timestamp_collector_ = Timestamp_Collector(name='on')
+        with html_graph_instrumentation.active():
+            with _timestamp_collector_:
+                assert self.target.method(21)          == 42
+                assert self.target.method_args('json') == 'json'
+        names = {entry.name for entry in _timestamp_collector_.entries}
+        assert names == {'an.method', 'an.block', 'an.method_args(json)'}
+        assert html_graph_instrumentation.on is False
+
+    def test_timestamp_args__requires_placeholders(self):
+        with self.assertRaises(ValueError):
+            timestamp_args(name='no_placeholders')
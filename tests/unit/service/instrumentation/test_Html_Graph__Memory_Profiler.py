@@ -0,0 +1,83 @@
+import threading
+import tracemalloc
+from unittest                                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Objects                                                              import base_classes
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__Memory__Profile                import Schema__Memory__Profile
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics               import Html_Graph__Metrics, html_graph_metrics
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Memory_Profiler       import Html_Graph__Memory_Profiler, MEMORY__TOP_N
+
+
+class test_Html_Graph__Memory_Profiler(TestCase):
+
+    def setUp(self):
+        self.metrics = Html_Graph__Metrics()
+
+    def test__init__(self):
+        with Html_Graph__Memory_Profiler() as _:
+            assert type(_)         is Html_Graph__Memory_Profiler
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.top_n         == MEMORY__TOP_N
+            assert _.phases        == []
+
+    def test_profile(self):
+        profiler = Html_Graph__Memory_Profiler(name='test')
+        with profiler.profile(self.metrics):
+            assert self.metrics.observers == [profiler]
+            with self.metrics.phase('build', engine='', transformation=''):
+                kept = [bytearray(1024) for _ in range(100)]                    # ~100kb retained
+            with self.metrics.phase('spike', engine='', transformation=''):
+                spike = bytearray(1_000_000)                                    # ~1mb peak, freed inside the phase
+                del spike
+
+        assert self.metrics.observers == []                                     # observer removed
+        assert tracemalloc.is_tracing() is False                                # tracing only on during the profile
+
+        build, spike = profiler.phases
+        assert build.phase          == 'build'
+        assert build.retained_bytes >= 100 * 1024
+        assert spike.peak_bytes     >= 1_000_000
+        assert spike.retained_bytes <  1_000_000
+        assert profiler.peak_bytes - profiler.start_bytes >= 1_000_000
+        assert 0 < len(profiler.top_allocations) <= MEMORY__TOP_N
+        assert profiler.top_allocations[0].file.endswith('test_Html_Graph__Memory_Profiler.py')   # the bytearrays in kept
+        assert len(kept) == 100
+
+    def test_profile__ignores_other_threads(self):
+        profiler = Html_Graph__Memory_Profiler()
+
+        def other_request():
+            with self.metrics.phase('other', engine='', transformation=''):
+                pass
+
+        with profiler.profile(self.metrics):
+            thread = threading.Thread(target=other_request)
+            thread.start()
+            thread.join()
+        assert profiler.phases == []
+
+    def test_profile__default_metrics(self):                                    # the shared registry used by the export service
+        with Html_Graph__Memory_Profiler().profile() as profiler:
+            assert profiler in html_graph_metrics.observers
+        assert profiler not in html_graph_metrics.observers
+
+    def test_to_profile(self):
+        html     = '<html><body><p>a</p><br/><img src="x"></body></html>'
+        profiler = Html_Graph__Memory_Profiler(name='an-profile')
+        with profiler.profile(self.metrics):
+            with self.metrics.phase('parse', engine='', transformation=''):
+                kept = [bytearray(1000) for _ in range(5)]
+
+        profile = profiler.to_profile(html)
+        assert type(profile)            is Schema__Memory__Profile
+        assert profile.name             == 'an-profile'
+        assert profile.html_bytes       == len(html)
+        assert profile.element_count    == 5                                    # html, body, p, br, img
+        assert profile.parse_bytes      >= 5000
+        assert profile.bytes_per_element == round(profile.parse_bytes / 5, 1)
+        assert len(kept) == 5
+
+    def test_to_profile__no_elements(self):
+        profile = Html_Graph__Memory_Profiler().to_profile('')
+        assert profile.element_count     == 0
+        assert profile.bytes_per_element == 0.0
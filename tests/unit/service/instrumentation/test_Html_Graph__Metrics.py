@@ -0,0 +1,93 @@
+from unittest                                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Objects                                                              import base_classes
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics               import (Html_Graph__Metrics, METRICS__DEFAULT_BUCKETS, METRICS__DEFINITIONS,
+                                                                                                    METRIC__PHASE_DURATION, METRIC__ERRORS, METRIC__REQUESTS, METRIC__NODES,
+                                                                                                    METRIC__CACHE_HITS, PHASE__PARSE)
+
+
+class test_Html_Graph__Metrics(TestCase):
+
+    def setUp(self):
+        self.metrics = Html_Graph__Metrics(buckets=[0.1, 1.0])
+
+    def test__init__(self):
+        with Html_Graph__Metrics() as _:
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.buckets       == list(METRICS__DEFAULT_BUCKETS)
+            assert _.histograms    == {}
+            assert _.counters      == {}
+
+    def test_observe(self):
+        with self.metrics as _:
+            _.observe('a_histogram', 0.05, engine='dot')
+            _.observe('a_histogram', 0.1 , engine='dot')                        # le is inclusive
+            _.observe('a_histogram', 0.5 , engine='dot')
+            _.observe('a_histogram', 5.0 , engine='dot')                        # above the last bound (+Inf)
+            assert _.histograms == {('a_histogram', (('engine', 'dot'),)): [[2, 1, 1], 5.65, 4]}
+
+    def test_inc(self):
+        with self.metrics as _:
+            _.inc('a_counter',               engine='dot')
+            _.inc('a_counter', 10,           engine='dot')
+            _.inc('a_counter',               engine='d3' )
+            assert _.counters == {('a_counter', (('engine', 'dot'),)): 11,
+                                  ('a_counter', (('engine', 'd3' ),)): 1 }
+
+    def test_phase(self):
+        with self.metrics as _:
+            with _.phase(PHASE__PARSE, engine='dot', transformation='default'):
+                pass
+            with self.assertRaises(ValueError):
+                with _.phase(PHASE__PARSE, engine='dot', transformation='default'):
+                    raise ValueError('parse failed')
+            labels = (('phase', 'parse'), ('engine', 'dot'), ('transformation', 'default'))
+            assert _.histograms[(METRIC__PHASE_DURATION, labels)][2] == 2           # both calls are timed
+            assert _.counters  [(METRIC__ERRORS        , labels)]    == 1
+
+    def test_record_request(self):
+        with self.metrics as _:
+            _.record_request('dot', 'default', 0.5, dict(node_count=10, edge_count=9))
+            _.record_request('dot', 'default', 0.2, dict(node_count=5 , edge_count=4))
+            labels = (('engine', 'dot'), ('transformation', 'default'))
+            assert _.counters[(METRIC__REQUESTS, labels)] == 2
+            assert _.counters[(METRIC__NODES   , labels)] == 15
+
+    def test_reset(self):
+        with self.metrics as _:
+            _.inc('a_counter')
+            _.observe('a_histogram', 1)
+            assert _.reset()    is _
+            assert _.counters   == {}
+            assert _.histograms == {}
+
+    def test_render(self):
+        with self.metrics as _:
+            _.observe(METRIC__PHASE_DURATION, 0.5, phase='parse', engine='dot', transformation='default')
+            _.inc    (METRIC__ERRORS            , phase='parse', engine='dot', transformation='default')
+            text  = _.render(cache_stats={'html_mgraph': {'hits': 3, 'misses': 1, 'size': 1}})
+            lines = text.splitlines()
+            assert text.endswith('\n')
+            for name, (metric_type, _help) in METRICS__DEFINITIONS.items():         # every metric is declared
+                assert f'# TYPE {name} {metric_type}' in lines
+            labels = 'phase="parse",engine="dot",transformation="default"'
+            assert f'html_graph_phase_duration_seconds_bucket{{{labels},le="0.1"}} 0'  in lines
+            assert f'html_graph_phase_duration_seconds_bucket{{{labels},le="1"}} 1'    in lines
+            assert f'html_graph_phase_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in lines
+            assert f'html_graph_phase_duration_seconds_sum{{{labels}}} 0.5'            in lines
+            assert f'html_graph_phase_duration_seconds_count{{{labels}}} 1'            in lines
+            assert f'html_graph_errors_total{{{labels}}} 1'                            in lines
+            assert f'{METRIC__CACHE_HITS}{{cache="html_mgraph"}} 3'                   in lines
+            assert 'html_graph_cache_entries{cache="html_mgraph"} 1'                   in lines
+
+    def test_labels_text(self):
+        with self.metrics as _:
+            assert _.labels_text(()                          ) == ''
+            assert _.labels_text((('a', 'b'), ('c', 1))      ) == '{a="b",c="1"}'
+            assert _.labels_text((('a', 'x"y\\z\n'),)        ) == '{a="x\\"y\\\\z\\n"}'
+
+    def test_value_text(self):
+        with self.metrics as _:
+            assert _.value_text(1    ) == '1'
+            assert _.value_text(1.0  ) == '1'
+            assert _.value_text(0.025) == '0.025'
@@ -0,0 +1,86 @@
+import builtins
+import sys
+from unittest                                                                       import TestCase
+from osbot_utils.utils.Env                                                          import set_env, del_env
+from mgraph_ai_service_html_graph.schemas.startup.Schema__Startup__Report           import Schema__Startup__Report
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics       import html_graph_metrics
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Startup       import (Html_Graph__Startup                     ,
+                                                                                            ENV_NAME__HTML_GRAPH__PRE_WARM          ,
+                                                                                            ENV_NAME__HTML_GRAPH__STARTUP_REPORT    ,
+                                                                                            STEP__IMPORT                            ,
+                                                                                            STEP__LOAD_DEPENDENCIES                 ,
+                                                                                            STEP__PRE_WARM__SCHEMAS                 ,
+                                                                                            STEP__PRE_WARM__REGISTRY                ,
+                                                                                            STEP__PRE_WARM__PARSE                   )
+
+
+class test_Html_Graph__Startup(TestCase):
+
+    def test__init__(self):
+        with Html_Graph__Startup() as _:
+            assert _.engine         == 'dot'
+            assert _.transformation == 'default'
+            assert _.pre_warm_on    is True
+            assert _.print_report   is False
+            assert _.steps          == {}
+            assert _.imports        == {}
+
+    def test__init__from_env(self):
+        set_env(ENV_NAME__HTML_GRAPH__PRE_WARM      , 'false')
+        set_env(ENV_NAME__HTML_GRAPH__STARTUP_REPORT, 'true' )
+        try:
+            with Html_Graph__Startup() as _:
+                assert _.pre_warm_on  is False
+                assert _.print_report is True
+        finally:
+            del_env(ENV_NAME__HTML_GRAPH__PRE_WARM      )
+            del_env(ENV_NAME__HTML_GRAPH__STARTUP_REPORT)
+
+    def test_step(self):
+        with Html_Graph__Startup() as _:
+            with _.step(STEP__IMPORT):
+                pass
+            _.add_step(STEP__LOAD_DEPENDENCIES, 0.25)
+            assert list(_.steps)                    == [STEP__IMPORT, STEP__LOAD_DEPENDENCIES]
+            assert _.steps[STEP__LOAD_DEPENDENCIES] == 0.25
+
+    def test_import_timer(self):
+        original_import = builtins.__import__
+        sys.modules.pop('tabnanny', None)                                           # a (leaf) stdlib module, so the import below loads it
+        with Html_Graph__Startup() as _:
+            with _.import_timer():
+                assert builtins.__import__ == _.timed_import
+                with _.import_timer():                                              # nested blocks keep the outer timer
+                    assert builtins.__import__ == _.timed_import
+                import tabnanny
+            assert builtins.__import__ is original_import
+            assert 'tabnanny' in _.imports
+            assert all(seconds >= 0 for seconds in _.imports.values())
+
+    def test_module_name(self):
+        globals = {'__package__': 'mgraph_ai_service_html_graph.service.instrumentation'}
+        with Html_Graph__Startup() as _:
+            assert _.module_name('json'                   , None   , 0) == 'json'
+            assert _.module_name('Html_Graph__Metrics'    , globals, 1) == 'mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Metrics'
+            assert _.module_name('html_render'            , globals, 2) == 'mgraph_ai_service_html_graph.service.html_render'
+            assert _.module_name(''                       , globals, 1) == 'mgraph_ai_service_html_graph.service.instrumentation'
+
+    def test_pre_warm(self):
+        requests_before = dict(html_graph_metrics.counters)
+        with Html_Graph__Startup() as _:
+            assert _.pre_warm() is _
+            assert list(_.steps) == [STEP__PRE_WARM__SCHEMAS, STEP__PRE_WARM__REGISTRY, STEP__PRE_WARM__PARSE]
+        assert html_graph_metrics.counters == requests_before                       # the pre-warm is not recorded as a request
+
+    def test_report(self):
+        with Html_Graph__Startup(top_n=2) as _:
+            _.add_step(STEP__IMPORT, 0.5)
+            _.imports.update({'fastapi.openapi': 0.1, 'fastapi': 0.05, 'pydantic': 0.2, 'json': 0.001})
+            report = _.report()
+            assert type(report)       is Schema__Startup__Report
+            assert report.total_ms     == 500.0
+            assert report.steps        == {STEP__IMPORT: 500.0}
+            assert report.packages     == {'pydantic': 200.0, 'fastapi': 150.0}            # top_n, slowest first
+            assert report.modules      == {'pydantic': 200.0, 'fastapi.openapi': 100.0}
+            assert report.module_count == 4
+            assert _.report_text().splitlines()[0] == 'cold start: 500.0ms (4 modules imported)'
@@ -0,0 +1,84 @@
+from unittest                                                                                       import TestCase
+from osbot_utils.helpers.timestamp_capture.actions.Timestamp_Collector__Analysis                   import Timestamp_Collector__Analysis
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Full                      import Schema__Export_Full
+from osbot_utils.helpers.timestamp_capture.schemas.export.Schema__Export_Summary                   import Schema__Export_Summary
+from osbot_utils.utils.Json                                                                         import str_to_json
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation               import html_graph_instrumentation, timestamp
+from mgraph_ai_service_html_graph.service.instrumentation.Timestamp_Collector__Sampled              import Timestamp_Collector__Sampled
+from mgraph_ai_service_html_graph.service.instrumentation.Timestamp_Collector__Export__Sampled      import Timestamp_Collector__Export__Sampled
+
+
+class A_Traced_Class:
+    @timestamp(name='an.outer')
+    def outer(self, count):
+        for _ in range(count):
+            self.inner()
+
+    @timestamp(name='an.inner')
+    def inner(self):
+        return sum(range(1000))
+
+
+class test_Timestamp_Collector__Export__Sampled(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        _timestamp_collector_ = Timestamp_Collector__Sampled(name='sampled', sample_rate=4)
+        with html_graph_instrumentation.active():
+            with _timestamp_collector_:
+                A_Traced_Class().outer(40)
+        cls.collector = _timestamp_collector_
+
+    def setUp(self):
+        self.export = Timestamp_Collector__Export__Sampled(collector=self.collector)
+
+    def test_scaled_method_timings(self):
+        timings  = {mt.name: mt for mt in self.export.scaled_method_timings()}
+        recorded = Timestamp_Collector__Analysis(collector=self.collector).get_method_timings()
+        inner    = timings['an.inner']
+        outer    = timings['an.outer']
+        assert recorded['an.inner'].call_count == 10
+        assert inner.call_count                == 40                                # all calls, not just the 10 recorded
+        assert inner.total_ns                  == recorded['an.inner'].total_ns * 4 # scaled x4
+        assert outer.call_count                == 1
+        assert outer.total_ns                  == recorded['an.outer'].total_ns
+        assert outer.self_ns                   <  recorded['an.outer'].self_ns      # time in unrecorded inner calls is not outer's self time
+
+    def test_build_call_tree(self):
+        roots = self.export.build_call_tree()
+        assert len(roots)                  == 1
+        assert roots[0].name               == 'an.outer'
+        assert len(roots[0].children)      == 10
+        assert roots[0].self_ns            <  roots[0].duration_ns - sum(child.duration_ns for child in roots[0].children)
+
+    def test_to_export_full(self):
+        export_full    = self.export.to_export_full()
+        method_timings = {mt.name: mt for mt in export_full.method_timings}
+        assert type(export_full)                         is Schema__Export_Full
+        assert export_full.metadata.entry_count          == 22                      # recorded entries only
+        assert method_timings['an.inner'].call_count     == 40
+        assert method_timings['an.inner'].avg_ms         == method_timings['an.inner'].total_ns / 40 / 1_000_000
+
+    def test_to_export_summary(self):
+        summary  = self.export.to_export_summary()
+        hotspots = {hotspot.name: hotspot for hotspot in summary.hotspots}
+        assert type(summary)              is Schema__Export_Summary
+        assert summary.name               == 'sampled'
+        assert summary.method_count       == 2
+        assert summary.entry_count        == 22
+        assert hotspots['an.inner'].calls == 40
+
+    def test_to_speedscope_json(self):
+        speedscope = str_to_json(self.export.to_speedscope_json())
+        evented    = speedscope['profiles'][0]
+        scaled     = speedscope['profiles'][1]
+        frames     = [frame['name'] for frame in speedscope['shared']['frames']]
+        assert speedscope['$schema']            == 'https://www.speedscope.app/file-format-schema.json'
+        assert speedscope['activeProfileIndex'] == 1
+        assert evented['type']                  == 'evented'
+        assert len(evented['events'])           == 22
+        assert scaled['type']                   == 'sampled'
+        assert scaled['name']                   == 'sampled (scaled)'
+        assert len(scaled['samples'])           == len(scaled['weights'])
+        assert scaled['endValue']               == sum(scaled['weights'])
+        assert [frames[index] for index in scaled['samples'][-1]] == ['an.outer', 'an.inner']
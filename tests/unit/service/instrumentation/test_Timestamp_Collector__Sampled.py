@@ -0,0 +1,80 @@
+from unittest                                                                                       import TestCase
+from osbot_utils.helpers.timestamp_capture.Timestamp_Collector                                      import Timestamp_Collector
+from osbot_utils.utils.Objects                                                                      import base_classes
+from mgraph_ai_service_html_graph.service.instrumentation.Html_Graph__Instrumentation               import html_graph_instrumentation, timestamp
+from mgraph_ai_service_html_graph.service.instrumentation.Timestamp_Collector__Sampled              import Timestamp_Collector__Sampled, EXTRA__UNRECORDED_NS
+
+
+class A_Traced_Class:
+    @timestamp(name='an.outer')
+    def outer(self, count):
+        for _ in range(count):
+            self.inner()
+
+    @timestamp(name='an.inner')
+    def inner(self):
+        return 42
+
+
+class test_Timestamp_Collector__Sampled(TestCase):
+
+    def setUp(self):
+        self.target = A_Traced_Class()
+
+    def run_traced(self, _timestamp_collector_, count=20):
+        with html_graph_instrumentation.active():
+            with _timestamp_collector_:
+                self.target.outer(count)
+        return _timestamp_collector_
+
+    def test__init__(self):
+        with Timestamp_Collector__Sampled() as _:
+            assert base_classes(_)[0] is Timestamp_Collector
+            assert _.sample_rate      == 1
+            assert _.time_budget_ms   == 0.0
+            assert _.calls_seen       == {}
+            assert _.calls_recorded   == {}
+
+    def test__init__invalid(self):
+        with self.assertRaises(ValueError):
+            Timestamp_Collector__Sampled(sample_rate=0)
+        with self.assertRaises(ValueError):
+            Timestamp_Collector__Sampled(time_budget_ms=-1)
+
+    def test_sample_rate__all_calls(self):                                          # same entries as a full capture
+        collector = self.run_traced(Timestamp_Collector__Sampled())
+        assert collector.calls_seen     == {'an.outer': 1, 'an.inner': 20}
+        assert collector.calls_recorded == {'an.outer': 1, 'an.inner': 20}
+        assert collector.entry_count()  == 42
+        assert collector.scale('an.inner') == 1.0
+
+    def test_sample_rate(self):
+        collector = self.run_traced(Timestamp_Collector__Sampled(sample_rate=5))
+        assert collector.calls_seen             == {'an.outer': 1, 'an.inner': 20}
+        assert collector.calls_recorded         == {'an.outer': 1, 'an.inner': 4 }     # calls 1, 6, 11 and 16
+        assert collector.entry_count()          == 10
+        assert collector.scale('an.inner')      == 5.0
+        assert collector.scale('an.outer')      == 1.0
+        assert collector.total_calls_seen()     == 21
+        assert collector.total_calls_recorded() == 5
+        assert [entry.event for entry in collector.entries if entry.name == 'an.inner'] == ['enter', 'exit'] * 4
+
+    def test_sample_rate__unrecorded_time(self):                                    # time in unrecorded calls is stored on the recorded caller
+        collector   = self.run_traced(Timestamp_Collector__Sampled(sample_rate=5))
+        outer_enter = collector.entries[0]
+        assert outer_enter.name                    == 'an.outer'
+        assert outer_enter.extra[EXTRA__UNRECORDED_NS] > 0
+        assert collector._frames                   == []
+
+    def test_time_budget_ms(self):
+        collector = Timestamp_Collector__Sampled(time_budget_ms=0.000001)           # budget is used up before the first call
+        self.run_traced(collector)
+        assert collector.calls_seen     == {'an.outer': 1, 'an.inner': 20}
+        assert collector.calls_recorded == {}
+        assert collector.entry_count()  == 0
+        assert collector.budget_exceeded() is True
+
+    def test_time_budget_ms__not_exceeded(self):
+        collector = self.run_traced(Timestamp_Collector__Sampled(time_budget_ms=60_000))
+        assert collector.calls_recorded    == {'an.outer': 1, 'an.inner': 20}
+        assert collector.budget_exceeded() is False
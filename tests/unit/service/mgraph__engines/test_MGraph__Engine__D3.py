@@ -181,6 +181,23 @@ class test_MGraph__Engine__D3(TestCase):
             labels = [n['label'] for n in result['nodes']]
             assert 'Hello' in labels or 'World' in labels
 
+    def test__export__fixed_positions(self):                                     # Test server-side layout pins nodes
+        config = MGraph__Engine__Config__D3(fixed_positions=True, level_separation=50)
+        with MGraph__Engine__D3(mgraph=self.mgraph_simple, config=config) as _:
+            result = _.export()
+            nodes  = {node['label']: node for node in result['nodes']}
+
+            assert result['config']['fixedPositions'] is True
+            assert nodes['body.div']['depth'] == 1
+            assert nodes['body.div']['y'    ] == nodes['body.div']['fy'] == 50.0
+            assert nodes['body.div']['x'    ] == nodes['body.div']['fx']
+
+    def test__export__no_positions_by_default(self):                             # Test positions are opt-in
+        with MGraph__Engine__D3(mgraph=self.mgraph_simple) as _:
+            result = _.export()
+            assert 'fixedPositions' not in result['config']
+            assert 'fx'             not in result['nodes'][0]
+
     # ═══════════════════════════════════════════════════════════════════════════
     # export Tests - Links
     # ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,98 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test: MGraph__Engine__Layout
+#
+# Tests the server-side BFS depth + tidy tree layout, and its use by the
+# VisJs engine (fixed positions and real hierarchical levels).
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from unittest                                                                                   import TestCase
+from osbot_utils.type_safe.Type_Safe                                                            import Type_Safe
+from osbot_utils.utils.Objects                                                                  import base_classes
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                               import Html_MGraph
+from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Layout                import MGraph__Engine__Layout
+from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__VisJs                 import MGraph__Engine__VisJs
+from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__VisJs import MGraph__Engine__Config__VisJs
+
+
+class test_MGraph__Engine__Layout(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                                         #   r
+        cls.node_ids = ['r', 'a', 'b', 'c', 'd', 'e']                           #  / \
+        cls.edges    = [('r', 'b', '1'),                                         # a   b
+                        ('r', 'a', '0'),                                         #    /|\
+                        ('b', 'c', '0'),                                         #   c d e
+                        ('b', 'd', '1'),
+                        ('b', 'e', '2')]
+
+    def test__init__(self):
+        with MGraph__Engine__Layout() as _:
+            assert type(_)          is MGraph__Engine__Layout
+            assert base_classes(_)  == [Type_Safe, object]
+            assert _.direction        == 'UD'
+            assert _.level_separation == 150
+            assert _.node_spacing     == 100
+
+    def test_children_map(self):                                                 # children follow edge_path order
+        with MGraph__Engine__Layout() as _:
+            assert _.children_map(self.node_ids, self.edges) == {'r': ['a', 'b'], 'a': [], 'b': ['c', 'd', 'e'],
+                                                                 'c': []        , 'd': [], 'e': []             }
+
+    def test_layout(self):
+        with MGraph__Engine__Layout(level_separation=10, node_spacing=1) as _:
+            assert _.layout(self.node_ids, self.edges) == { 'r': (0, 1.0, 0.0 ),                 # centred over a and b
+                                                            'a': (1, 0.0, 10.0),
+                                                            'b': (1, 2.0, 10.0),                 # centred over c and e
+                                                            'c': (2, 1.0, 20.0),
+                                                            'd': (2, 2.0, 20.0),
+                                                            'e': (2, 3.0, 20.0)}
+
+    def test_layout__directions(self):
+        for direction, expected in [('DU', (2.0, -10.0)), ('LR', (10.0, 2.0)), ('RL', (-10.0, 2.0))]:
+            with MGraph__Engine__Layout(direction=direction, level_separation=10, node_spacing=1) as _:
+                assert _.layout(self.node_ids, self.edges)['b'][1:] == expected
+
+    def test_layout__cycles_and_disconnected(self):                              # every node gets a depth and a unique leaf slot
+        node_ids = ['x', 'y', 'z']
+        edges    = [('x', 'y', None), ('y', 'x', None)]
+        with MGraph__Engine__Layout(node_spacing=1) as _:
+            result = _.layout(node_ids, edges)                                   # z (no parents) is laid out first, then the x <-> y cycle from x
+            assert result == {'z': (0, 0.0, 0.0), 'x': (0, 1.0, 0.0), 'y': (1, 1.0, 150.0)}
+
+    def test_layout__deep_tree(self):                                            # no recursion limits on deep DOMs
+        node_ids = [f'n{i}' for i in range(5000)]
+        edges    = [(f'n{i}', f'n{i+1}', '0') for i in range(4999)]
+        with MGraph__Engine__Layout() as _:
+            result = _.layout(node_ids, edges)
+            assert result['n4999'] == (4999, 0.0, 4999 * 150.0)
+
+
+class test_MGraph__Engine__VisJs__Layout(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.html_mgraph = Html_MGraph.from_html('<html><body><div><p>a</p><p>b</p></div><span>c</span></body></html>')
+        cls.mgraph      = cls.html_mgraph.body_graph.mgraph
+
+    def test__export__levels_are_bfs_depth(self):
+        with MGraph__Engine__VisJs(mgraph=self.mgraph) as _:
+            levels = {node['label']: node['level'] for node in _.export()['nodes']}
+            assert levels['body'         ] == 0
+            assert levels['body.div'     ] == 1
+            assert levels['body.span'    ] == 1
+            assert levels['body.div.p[0]'] == 2
+            assert levels['c'            ] == 2
+            assert 'x' not in _.export()['nodes'][0]
+
+    def test__export__fixed_positions(self):
+        config = MGraph__Engine__Config__VisJs(fixed_positions=True)
+        with MGraph__Engine__VisJs(mgraph=self.mgraph, config=config) as _:
+            result = _.export()
+            nodes  = {node['label']: node for node in result['nodes']}
+
+            assert result['options']['physics'] == {'enabled': False}
+            assert result['options']['layout' ] == {'hierarchical': {'enabled': False}}
+            assert nodes['body.div']['y'] == 150.0
+            assert nodes['body'    ]['x'] == (nodes['body.div']['x'] + nodes['body.span']['x']) / 2
+            positions = [(node['x'], node['y']) for node in result['nodes']]
+            assert len(set(positions)) == len(positions)                         # no overlapping nodes
@@ -0,0 +1,65 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Test: MGraph__Engine__Tree
+#
+# Tests the tree (text / json / nested dict) rendering engine, and the children
+# index it builds once per export.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from unittest                                                                                   import TestCase
+from mgraph_db.utils.testing.mgraph_test_ids                                                    import mgraph_test_ids
+from mgraph_ai_service_html_graph.service.html_mgraph.Html_MGraph                               import Html_MGraph
+from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Base                  import MGraph__Engine__Base
+from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Tree                  import MGraph__Engine__Tree
+from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__Tree  import MGraph__Engine__Config__Tree
+
+
+class test_MGraph__Engine__Tree(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.html = '<html><body><div><p>Hello</p><span>World</span></div><p>Last</p></body></html>'
+        with mgraph_test_ids():
+            cls.html_mgraph = Html_MGraph.from_html(cls.html)
+            cls.mgraph      = cls.html_mgraph.body_graph.mgraph
+
+    def children__by_scan(self, engine, node):                                  # Reference: scan every edge (the pre-index implementation)
+        node_map = {engine.node_id_str(n): n for n in engine.nodes()}
+        return [node_map[engine.edge_to_id(edge)] for edge in engine.edges()
+                if engine.edge_from_id(edge) == engine.node_id_str(node) and engine.edge_to_id(edge) in node_map]
+
+    def test__init__(self):
+        with MGraph__Engine__Tree() as _:
+            assert type(_)        is MGraph__Engine__Tree
+            assert isinstance(_, MGraph__Engine__Base)
+            assert type(_.config) is MGraph__Engine__Config__Tree
+            assert _._children    is None
+
+    def test_export__text(self):
+        with MGraph__Engine__Tree(mgraph=self.mgraph) as _:
+            text = _.export()
+            for value in ('Hello', 'World', 'Last'):
+                assert value in text
+            assert text.index('Hello') < text.index('World') < text.index('Last')  # document order
+
+    def test_export__nested_dict(self):
+        config = MGraph__Engine__Config__Tree(output_format='nested_dict', include_stats=True)
+        with MGraph__Engine__Tree(mgraph=self.mgraph, config=config) as _:
+            tree = _.export()
+            assert 'body' in [root['label'] for root in tree['roots']]
+            assert tree['stats']['nodeCount'] == len(_.nodes())
+
+    def test__get_children(self):                                               # Same children (and order) as scanning every edge
+        with MGraph__Engine__Tree(mgraph=self.mgraph) as _:
+            for node in _.nodes():
+                children = _._get_children(node)
+                assert [_.node_id_str(child) for child in children] == [_.node_id_str(child) for child in self.children__by_scan(_, node)]
+
+    def test__get_children__index_built_once(self):
+        with MGraph__Engine__Tree(mgraph=self.mgraph) as _:
+            _.export()
+            index = _._children
+            assert type(index) is dict
+            _._get_children(_.nodes()[0])
+            assert _._children is index                                         # reused within the export
+            _.export()
+            assert _._children is not index                                     # rebuilt by the next export (the graph may have changed)
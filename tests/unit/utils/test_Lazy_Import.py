@@ -0,0 +1,33 @@
+from unittest                                                                                 import TestCase
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service      import Html_Graph__Export__Service
+from mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Dot                 import MGraph__Engine__Dot
+from mgraph_ai_service_html_graph.service.mgraph__engines.schemas.MGraph__Engine__Config__Dot import MGraph__Engine__Config__Dot
+from mgraph_ai_service_html_graph.utils.Lazy_Import                                           import lazy_class, resolve_class
+
+
+class test_Lazy_Import(TestCase):
+
+    def test_lazy_class(self):
+        module_name = 'mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Dot'
+        assert lazy_class(module_name) is MGraph__Engine__Dot
+        assert lazy_class(module_name) is lazy_class(module_name)                   # cached
+
+    def test_lazy_class__unknown_module(self):
+        with self.assertRaises(ModuleNotFoundError):
+            lazy_class('mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Unknown')
+
+    def test_resolve_class(self):
+        assert resolve_class(MGraph__Engine__Dot)                                                     is MGraph__Engine__Dot
+        assert resolve_class('mgraph_ai_service_html_graph.service.mgraph__engines.MGraph__Engine__Dot') is MGraph__Engine__Dot
+
+    def test__export_service__engine_registry(self):                                # ENGINES / ENGINE_CONFIGS hold module paths, resolved on first use
+        with Html_Graph__Export__Service() as _:
+            assert list(_.ENGINES)        == ['dot', 'd3', 'cytoscape', 'visjs', 'mermaid', 'tree']
+            assert list(_.ENGINE_CONFIGS) == list(_.ENGINES)
+            assert _.engine_class       ('dot'    ) is MGraph__Engine__Dot
+            assert _.engine_config_class('dot'    ) is MGraph__Engine__Config__Dot
+            assert _.engine_class       ('unknown') is None
+            assert _.engine_config_class('unknown') is None
+            for engine_name in _.ENGINES:
+                assert _.engine_class       (engine_name).__name__ == _.ENGINES       [engine_name].rsplit('.', 1)[-1]
+                assert _.engine_config_class(engine_name).__name__ == _.ENGINE_CONFIGS[engine_name].rsplit('.', 1)[-1]
@@ -0,0 +1,56 @@
+from unittest                                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Files                                                                import temp_file, file_delete, file_exists
+from osbot_utils.utils.Objects                                                              import base_classes
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Result               import Schema__Benchmark__Result
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Run                  import Schema__Benchmark__Run
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service    import Html_Graph__Export__Service
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html_Graph__Benchmark             import Html_Graph__Benchmark, BENCHMARK__REPEATS
+
+
+class test_Html_Graph__Benchmark(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.benchmark     = Html_Graph__Benchmark(engines=['dot', 'tree'], repeats=2)
+        cls.benchmark_run = cls.benchmark.run(shapes=['wide', 'deep'], sizes=[10])
+
+    def test__init__(self):
+        with Html_Graph__Benchmark() as _:
+            assert type(_)         is Html_Graph__Benchmark
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.engines       == list(Html_Graph__Export__Service.ENGINES)
+            assert _.repeats       == BENCHMARK__REPEATS
+            assert _.warmup        is True
+        with self.assertRaises(ValueError):
+            Html_Graph__Benchmark(repeats=0)
+
+    def test_run(self):
+        with self.benchmark_run as _:
+            assert type(_)           is Schema__Benchmark__Run
+            assert _.name            == 'html-graph-benchmark'
+            assert _.transformation  == 'default'
+            assert _.repeats         == 2
+            assert _.python_version  != ''
+            assert len(_.results)    == 2 * (3 + 2 * 2)                          # 2 documents x (3 pipeline phases + 2 engines x 2 phases)
+
+        keys = [result.key() for result in self.benchmark_run.results]
+        assert keys[:7] == ['wide.10.pipeline.parse'     , 'wide.10.pipeline.select', 'wide.10.pipeline.transform',
+                            'wide.10.dot.render'         , 'wide.10.dot.post_process',
+                            'wide.10.tree.render'        , 'wide.10.tree.post_process']
+        for result in self.benchmark_run.results:
+            assert type(result) is Schema__Benchmark__Result
+            assert 0 <= result.min_ms <= result.median_ms <= result.max_ms
+            assert result.html_bytes > 0
+        parse = self.benchmark_run.results[0]
+        assert parse.median_ms > 0
+
+    def test_save__load(self):
+        path = temp_file(extension='.json')
+        assert Html_Graph__Benchmark.save(self.benchmark_run, path) == path
+        assert file_exists(path)
+        loaded = Html_Graph__Benchmark.load(path)
+        assert type(loaded)      is Schema__Benchmark__Run
+        assert loaded.json()     == self.benchmark_run.json()
+        assert type(loaded.results[0]) is Schema__Benchmark__Result
+        file_delete(path)
@@ -0,0 +1,60 @@
+from unittest                                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Objects                                                              import base_classes
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Comparison           import Schema__Benchmark__Comparison
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Result               import Schema__Benchmark__Result
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Benchmark__Run                  import Schema__Benchmark__Run
+from mgraph_ai_service_html_graph.schemas.benchmark.enums.Enum__Benchmark__Status           import Enum__Benchmark__Status
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html_Graph__Benchmark__Compare    import Html_Graph__Benchmark__Compare, BENCHMARK__THRESHOLD, BENCHMARK__MIN_MS
+
+
+def benchmark_run(name, **medians):                                             # phase name -> median_ms
+    results = [Schema__Benchmark__Result(shape='wide', element_count=100, phase=phase, min_ms=median_ms, median_ms=median_ms, max_ms=median_ms)
+               for phase, median_ms in medians.items()]
+    return Schema__Benchmark__Run(name=name, results=results)
+
+
+class test_Html_Graph__Benchmark__Compare(TestCase):
+
+    def setUp(self):
+        self.compare = Html_Graph__Benchmark__Compare()
+
+    def test__init__(self):
+        with self.compare as _:
+            assert type(_)         is Html_Graph__Benchmark__Compare
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.threshold     == BENCHMARK__THRESHOLD
+            assert _.min_ms        == BENCHMARK__MIN_MS
+
+    def test_compare(self):
+        baseline   = benchmark_run('baseline', parse=100.0, select=10.0, transform=10.0, render=0.5 , removed=5.0)
+        current    = benchmark_run('current' , parse=130.0, select=5.0 , transform=11.0, render=0.9 , added  =5.0)
+        comparison = self.compare.compare(baseline, current)
+        statuses   = {row.key: row.status for row in comparison.rows}
+
+        assert type(comparison)          is Schema__Benchmark__Comparison
+        assert comparison.baseline_name  == 'baseline'
+        assert comparison.current_name   == 'current'
+        assert statuses == { 'wide.100.pipeline.added'    : Enum__Benchmark__Status.new         ,
+                             'wide.100.pipeline.parse'    : Enum__Benchmark__Status.regression  ,      # 30% slower
+                             'wide.100.pipeline.removed'  : Enum__Benchmark__Status.missing     ,
+                             'wide.100.pipeline.render'   : Enum__Benchmark__Status.ok          ,      # 80% slower, but below the noise floor
+                             'wide.100.pipeline.select'   : Enum__Benchmark__Status.improvement ,
+                             'wide.100.pipeline.transform': Enum__Benchmark__Status.ok          }      # 10% slower
+        assert [row.key for row in comparison.regressions()] == ['wide.100.pipeline.parse']
+        assert comparison.regressions()[0].ratio             == 1.3
+
+    def test_compare__threshold(self):
+        baseline = benchmark_run('baseline', parse=100.0)
+        current  = benchmark_run('current' , parse=130.0)
+        assert Html_Graph__Benchmark__Compare(threshold=0.5).compare(baseline, current).regressions() == []
+
+    def test_report(self):
+        baseline   = benchmark_run('baseline', parse=100.0, select=10.0)
+        current    = benchmark_run('current' , parse=200.0, select=10.0)
+        comparison = self.compare.compare(baseline, current)
+        report     = self.compare.report(comparison)
+        assert 'wide.100.pipeline.parse'  in report
+        assert 'wide.100.pipeline.select' not in report                         # ok rows only with all_rows
+        assert 'wide.100.pipeline.select' in self.compare.report(comparison, all_rows=True)
+        assert report.splitlines()[-1] == '  1 regression(s) in 2 measurements'
@@ -0,0 +1,65 @@
+from unittest                                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Objects                                                              import base_classes
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Complexity__Report              import Schema__Complexity__Report
+from mgraph_ai_service_html_graph.schemas.benchmark.Schema__Complexity__Result              import Schema__Complexity__Result
+from mgraph_ai_service_html_graph.service.html_graph__export.Html_Graph__Export__Service    import Html_Graph__Export__Service
+from mgraph_ai_service_html_graph.service.html_graph__transformations.Graph_Transformation__Registry import transformation_registry
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html_Graph__Complexity            import Html_Graph__Complexity, fit_exponent, COMPLEXITY__SIZES, COMPLEXITY__SHAPES, COMPLEXITY__MAX_EXPONENT, COMPLEXITY__MIN_MS
+
+
+class test_Html_Graph__Complexity(TestCase):
+
+    def test__init__(self):
+        with Html_Graph__Complexity() as _:
+            assert type(_)            is Html_Graph__Complexity
+            assert base_classes(_)    == [Type_Safe, object]
+            assert _.sizes            == COMPLEXITY__SIZES
+            assert _.shapes           == COMPLEXITY__SHAPES
+            assert _.transformations  == transformation_registry.names()
+            assert _.engines          == list(Html_Graph__Export__Service.ENGINES)
+            assert _.max_exponent     == COMPLEXITY__MAX_EXPONENT
+            assert _.min_ms           == COMPLEXITY__MIN_MS
+        with self.assertRaises(ValueError):
+            Html_Graph__Complexity(sizes=[100])
+
+    def test_fit_exponent(self):
+        sizes = [16, 32, 64, 128]
+        assert round(fit_exponent(sizes, [5.0            for n in sizes]), 3) == 0.0          # O(1)
+        assert round(fit_exponent(sizes, [n * 0.1        for n in sizes]), 3) == 1.0          # O(n)
+        assert round(fit_exponent(sizes, [n * n * 0.01   for n in sizes]), 3) == 2.0          # O(n²)
+        assert 1.2 < fit_exponent(sizes, [n * __import__('math').log(n) for n in sizes]) < COMPLEXITY__MAX_EXPONENT    # O(n log n) passes
+        assert fit_exponent([10, 10], [1.0, 2.0]) == 0.0
+
+    def test_result(self):
+        complexity = Html_Graph__Complexity(sizes=[16, 32, 64, 128])
+        linear     = complexity.result('linear'   , 'wide', [n * 0.001        for n in complexity.sizes])       # seconds
+        quadratic  = complexity.result('quadratic', 'wide', [n * n * 0.0001   for n in complexity.sizes])
+        tiny       = complexity.result('tiny'     , 'wide', [n * n * 0.0000001 for n in complexity.sizes])      # 1.6ms at the largest size
+
+        assert type(linear)                          is Schema__Complexity__Result
+        assert (linear   .exponent, linear   .checked, linear   .passed) == (1.0, True , True )
+        assert (quadratic.exponent, quadratic.checked, quadratic.passed) == (2.0, True , False)
+        assert (tiny     .exponent, tiny     .checked, tiny     .passed) == (2.0, False, True )     # below the noise floor
+        assert linear.durations_ms                   == [16.0, 32.0, 64.0, 128.0]
+
+        report = complexity.report([linear, quadratic, tiny])
+        assert type(report)                               is Schema__Complexity__Report
+        assert [result.name for result in report.failures()] == ['quadratic']
+
+    def test_check(self):                                                       # tiny sizes, so nothing is above the noise floor: just the shape of the report
+        complexity = Html_Graph__Complexity(sizes=[4, 8], shapes=['wide'], transformations=['default'], engines=['dot'], repeats=1)
+        report     = complexity.check()
+        names      = [result.name for result in report.results]
+        assert names == ['Html__To__Html_MGraph__Document.convert',
+                         'Html_MGraph__Data__Extractor.extract'   ,
+                         'Html_MGraph__Document__To__Html.convert',
+                         'default.parse'                          ,
+                         'default.select'                         ,
+                         'default.transform'                      ,
+                         'default.dot.render'                     ,
+                         'default.dot.post_process'               ]
+        for result in report.results:
+            assert result.sizes             == [4, 8]
+            assert len(result.durations_ms) == 2
+            assert result.durations_ms[0]   >= 0
@@ -0,0 +1,70 @@
+import re
+from html.parser                                                                            import HTMLParser
+from unittest                                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Objects                                                              import base_classes
+from mgraph_ai_service_html_graph.utils.testing.benchmark.Html__Synthetic__Corpus           import Html__Synthetic__Corpus, CORPUS__SHAPES, CORPUS__SIZES, CORPUS__DOCUMENT_ELEMENTS, DEEP__CHAIN_DEPTH
+
+
+class Element_Counter(HTMLParser):                                              # Counts start tags and the deepest nesting
+    def __init__(self):
+        super().__init__()
+        self.count     = 0
+        self.depth     = 0
+        self.max_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.count    += 1
+        self.depth    += 1
+        self.max_depth = max(self.max_depth, self.depth)
+
+    def handle_endtag(self, tag):
+        self.depth -= 1
+
+
+class test_Html__Synthetic__Corpus(TestCase):
+
+    def setUp(self):
+        self.corpus = Html__Synthetic__Corpus()
+
+    def count_elements(self, html):
+        counter = Element_Counter()
+        counter.feed(html)
+        return counter
+
+    def test__init__(self):
+        with self.corpus as _:
+            assert type(_)         is Html__Synthetic__Corpus
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.seed          == 0
+        assert CORPUS__SHAPES == ['wide', 'deep', 'attributes', 'text', 'scripts']
+        assert CORPUS__SIZES  == [100, 1_000, 10_000, 100_000]
+
+    def test_html__element_count(self):                                         # exactly element_count elements, for every shape
+        for shape in CORPUS__SHAPES:
+            for element_count in (CORPUS__DOCUMENT_ELEMENTS, 5, 17, 100, 1_000):
+                html = self.corpus.html(shape, element_count)
+                assert self.count_elements(html).count == element_count, (shape, element_count)
+
+    def test_html__deterministic(self):
+        for shape in CORPUS__SHAPES:
+            assert self.corpus.html(shape, 100) == Html__Synthetic__Corpus      ().html(shape, 100)
+            assert self.corpus.html(shape, 100) != Html__Synthetic__Corpus(seed=1).html(shape, 100)
+
+    def test_html__shapes(self):
+        assert self.count_elements(self.corpus.html('deep' , 1_000)).max_depth == DEEP__CHAIN_DEPTH + 2      # html > body > chain
+        assert self.count_elements(self.corpus.html('wide' , 1_000)).max_depth == 4                          # html > body > ul > li
+        assert len(re.findall(r'data-', self.corpus.html('attributes', 100))) >= 3 * 96
+        assert self.corpus.html('scripts', 100).count('<script>') == 32
+        assert self.corpus.html('scripts', 100).count('<style>' ) == 32
+
+    def test_html__bad_values(self):
+        with self.assertRaises(ValueError):
+            self.corpus.html('unknown', 100)
+        with self.assertRaises(ValueError):
+            self.corpus.html('wide', CORPUS__DOCUMENT_ELEMENTS - 1)
+
+    def test_documents(self):
+        documents = list(self.corpus.documents(shapes=['wide', 'text'], sizes=[10, 20]))
+        assert [(shape, size) for shape, size, _ in documents] == [('wide', 10), ('wide', 20), ('text', 10), ('text', 20)]
+        assert documents[0][2] == self.corpus.html('wide', 10)
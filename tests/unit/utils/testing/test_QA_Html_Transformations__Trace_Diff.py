@@ -0,0 +1,85 @@
+from unittest                                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.utils.Files                                                                import temp_folder, folder_delete_all, folder_exists, file_exists, path_combine
+from osbot_utils.utils.Json                                                                 import str_to_json
+from osbot_utils.utils.Objects                                                              import base_classes
+from mgraph_ai_service_html_graph.schemas.timestamps.Schema__QA__Traces__Diff               import Schema__QA__Traces__Diff
+from mgraph_ai_service_html_graph.utils.testing.QA_Create_Html_Transformations              import QA_Create_Html_Transformations
+from mgraph_ai_service_html_graph.utils.testing.QA_Html_Transformations__Trace_Diff         import QA_Html_Transformations__Trace_Diff
+from tests.unit.sample_html_files                                                           import generate__test_html
+
+HTML_TYPE = 'with_size__5'
+
+
+class test_QA_Html_Transformations__Trace_Diff(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                                        # Two stored runs of the same html (different configs)
+        cls.target_folder = temp_folder()
+        html              = generate__test_html(element_count=5)
+        for run_label, engine in (('run-dot', 'dot'), ('run-d3', 'd3')):
+            qa = QA_Create_Html_Transformations(target_folder=cls.target_folder, run_label=run_label, engine=engine)
+            qa.full__for__html      (html=html, html_type=HTML_TYPE)
+            qa.speedscope__for__html(html=html, html_type=HTML_TYPE)
+        cls.trace_diff = QA_Html_Transformations__Trace_Diff(target_folder=cls.target_folder)
+
+    @classmethod
+    def tearDownClass(cls):
+        folder_delete_all(cls.target_folder)
+
+    def test__init__(self):
+        with QA_Html_Transformations__Trace_Diff() as _:
+            assert type(_)         is QA_Html_Transformations__Trace_Diff
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.top_n         == 10
+
+    def test__trace_store(self):                                                # each run in its own folder
+        assert folder_exists(path_combine(self.target_folder, 'run-dot'))
+        assert folder_exists(path_combine(self.target_folder, 'run-d3' ))
+
+    def test_diff(self):
+        diff = self.trace_diff.diff('run-dot', 'run-d3', HTML_TYPE)
+        assert type(diff)           is Schema__QA__Traces__Diff
+        assert diff.baseline_label  == 'run-dot'
+        assert diff.current_label   == 'run-d3'
+        assert diff.baseline_total_ms > 0
+        assert diff.current_total_ms  > 0
+
+        names  = [method.name for method in diff.methods]
+        deltas = [method.delta_ms for method in diff.methods]
+        assert 'html_mgraph.convert.to-document' in names                       # in both runs
+        assert deltas == sorted(deltas, reverse=True)                            # largest delta first
+        for method in diff.methods:
+            assert method.delta_ms == method.current_self_ms - method.baseline_self_ms
+        for method in diff.top_regressions(3):
+            assert method.delta_ms > 0
+        for method in diff.top_improvements(3):
+            assert method.delta_ms < 0
+
+    def test_diff__missing_run(self):
+        with self.assertRaises(ValueError):
+            self.trace_diff.diff('run-dot', 'not-a-run', HTML_TYPE)
+
+    def test_report(self):
+        report = self.trace_diff.report(self.trace_diff.diff('run-dot', 'run-d3', HTML_TYPE))
+        assert report.splitlines()[0] == f'{HTML_TYPE}: run-d3 vs run-dot'
+        assert '  top regressions:'  in report
+        assert '  top improvements:' in report
+
+    def test_merged_speedscope(self):
+        merged   = str_to_json(self.trace_diff.merged_speedscope('run-dot', 'run-d3', HTML_TYPE))
+        frames   = [frame['name'] for frame in merged['shared']['frames']]
+        profiles = merged['profiles']
+        assert merged['$schema']                        == 'https://www.speedscope.app/file-format-schema.json'
+        assert len(frames)                              == len(set(frames))      # shared frames, no duplicates
+        assert [profile['name'] for profile in profiles] == ['[run-dot] default.dot', '[run-d3] default.d3']
+        for profile in profiles:
+            for event in profile['events']:
+                assert 0 <= event['frame'] < len(frames)
+
+    def test_compare(self):                                                     # single command: diff + merged speedscope, saved
+        diff   = self.trace_diff.compare('run-dot', 'run-d3', HTML_TYPE)
+        folder = path_combine(self.target_folder, 'run-dot__vs__run-d3')
+        assert type(diff) is Schema__QA__Traces__Diff
+        assert file_exists(path_combine(folder, f'diff_____________{HTML_TYPE}.json'))
+        assert file_exists(path_combine(folder, f'speedscope__diff_{HTML_TYPE}.json'))